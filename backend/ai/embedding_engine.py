@@ -7,6 +7,8 @@ Features:
 3. Content-based caching (SHA-256 hash)
 4. Incremental embedding (only new documents)
 5. Cost tracking per document type
+6. Pluggable backend (local CPU model via LocalEmbeddingBackend)
+7. Shared embedding result cache by (model, content hash)
 
 Cost Estimation:
 - SEC filing (10-K): ~50,000 tokens → $0.001
@@ -18,7 +20,7 @@ Cost Estimation:
 import hashlib
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import tiktoken
 from openai import AsyncOpenAI
 from sqlalchemy import select, and_
@@ -29,6 +31,8 @@ from backend.core.models.embedding_models import (
     EmbeddingCache,
     EmbeddingSyncStatus,
 )
+from backend.data.vector_store.embedder import EmbeddingBackend
+from backend.data.vector_store.embedding_cache import CachedEmbedding, EmbeddingResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -64,19 +68,39 @@ class EmbeddingEngine:
     DIMENSIONS = 1536
     MAX_TOKENS = 8000  # OpenAI limit: 8191 tokens
     COST_PER_MILLION_TOKENS = 0.02  # $0.02 per 1M tokens
+    MAX_BATCH_INPUTS = 2048  # OpenAI limit: inputs per embeddings request
+    MAX_BATCH_TOKENS = 300_000  # OpenAI limit: total tokens per embeddings request
 
-    def __init__(self, db_session: AsyncSession, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        openai_api_key: Optional[str] = None,
+        backend: Optional[EmbeddingBackend] = None,
+        embedding_cache: Optional[EmbeddingResultCache] = None,
+    ):
         """
         Initialize embedding engine.
 
         Args:
             db_session: SQLAlchemy async session
             openai_api_key: OpenAI API key (uses env var if None)
+            backend: Embedding backend (None = OpenAI API)
+            embedding_cache: Shared embedding result cache (None = disabled)
         """
         self.db = db_session
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        self.backend = backend
+        self.embedding_cache = embedding_cache
         self.tokenizer = tiktoken.encoding_for_model("gpt-4")
 
+        if backend is None:
+            self.client = AsyncOpenAI(api_key=openai_api_key)
+        else:
+            # Recorded per row (embedding_model / embedding_cost_usd)
+            self.client = None
+            self.MODEL = backend.model
+            self.DIMENSIONS = backend.dimension
+            self.COST_PER_MILLION_TOKENS = backend.cost_per_million
+
         logger.info(f"EmbeddingEngine initialized (model={self.MODEL})")
 
     def _compute_content_hash(self, content: str) -> str:
@@ -138,22 +162,27 @@ class EmbeddingEngine:
 
     async def _check_cache(self, content_hash: str) -> Optional[int]:
         """
-        Check if embedding already exists in cache.
+        Check if embedding already exists in cache for this engine's model.
 
         Args:
             content_hash: SHA-256 hash of content
 
         Returns:
-            Embedding ID if cached, None otherwise
+            Embedding ID if cached (embedded with self.MODEL), None otherwise
         """
         result = await self.db.execute(
-            select(EmbeddingCache).where(EmbeddingCache.content_hash == content_hash)
+            select(EmbeddingCache.embedding_id)
+            .join(DocumentEmbedding, DocumentEmbedding.id == EmbeddingCache.embedding_id)
+            .where(
+                EmbeddingCache.content_hash == content_hash,
+                DocumentEmbedding.embedding_model == self.MODEL,
+            )
         )
-        cache_entry = result.scalar_one_or_none()
+        embedding_id = result.scalar_one_or_none()
 
-        if cache_entry:
-            logger.debug(f"Cache HIT: {content_hash[:16]}...")
-            return cache_entry.embedding_id
+        if embedding_id:
+            logger.debug(f"Cache HIT: {content_hash[:16]}... ({self.MODEL})")
+            return embedding_id
 
         return None
 
@@ -161,32 +190,124 @@ class EmbeddingEngine:
         """
         Save embedding to cache.
 
+        content_hash is unique, so an entry left by another model is
+        repointed to the new embedding.
+
         Args:
             content_hash: SHA-256 hash of content
             embedding_id: Document embedding ID
         """
-        cache_entry = EmbeddingCache(
-            content_hash=content_hash, embedding_id=embedding_id
+        result = await self.db.execute(
+            select(EmbeddingCache).where(EmbeddingCache.content_hash == content_hash)
         )
-        self.db.add(cache_entry)
+        cache_entry = result.scalar_one_or_none()
+
+        if cache_entry:
+            cache_entry.embedding_id = embedding_id
+        else:
+            self.db.add(EmbeddingCache(content_hash=content_hash, embedding_id=embedding_id))
         await self.db.flush()
 
-    async def _generate_embedding(self, text: str) -> List[float]:
+    async def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate embedding using OpenAI API.
+        Generate embeddings for several texts in one OpenAI API call.
 
         Args:
-            text: Input text
+            texts: Input texts (within MAX_BATCH_INPUTS / MAX_BATCH_TOKENS)
 
         Returns:
-            Embedding vector (1536 dimensions)
+            Embedding vectors in input order
         """
+        if self.backend is not None:
+            return [result.embedding for result in await self.backend.embed(texts)]
+
         response = await self.client.embeddings.create(
-            model=self.MODEL, input=text, encoding_format="float"
+            model=self.MODEL, input=texts, encoding_format="float"
+        )
+
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def embed_texts(
+        self, texts: List[str], token_counts: Optional[List[int]] = None
+    ) -> List[List[float]]:
+        """
+        Embed many texts with as few API calls as possible.
+
+        Texts are packed into maximal requests bounded by MAX_BATCH_INPUTS
+        and MAX_BATCH_TOKENS. Each text must already fit within MAX_TOKENS
+        (see _chunk_content).
+
+        Args:
+            texts: Input texts
+            token_counts: Precomputed token counts (counted here if None)
+
+        Returns:
+            Embedding vectors in input order
+        """
+        vectors, _ = await self.embed_texts_with_hits(texts, token_counts)
+        return vectors
+
+    async def embed_texts_with_hits(
+        self, texts: List[str], token_counts: Optional[List[int]] = None
+    ) -> Tuple[List[List[float]], List[bool]]:
+        """
+        Embed texts, serving what it can from the embedding result cache.
+
+        One batched cache lookup runs first; only unique misses are sent
+        to the model (see embed_texts).
+
+        Args:
+            texts: Input texts
+            token_counts: Precomputed token counts (counted here if None)
+
+        Returns:
+            (embedding vectors, cache-hit flags), both in input order
+        """
+        if self.embedding_cache is None:
+            return await self._embed_texts_uncached(texts, token_counts), [False] * len(texts)
+
+        if token_counts is None:
+            token_counts = [self._count_tokens(text) for text in texts]
+        tokens_by_text = dict(zip(texts, token_counts))
+
+        async def embed_missing(missing: List[str]) -> List[CachedEmbedding]:
+            counts = [tokens_by_text[text] for text in missing]
+            vectors = await self._embed_texts_uncached(missing, counts)
+            return [
+                CachedEmbedding(vector, tokens, (tokens / 1_000_000) * self.COST_PER_MILLION_TOKENS)
+                for vector, tokens in zip(vectors, counts)
+            ]
+
+        entries = await self.embedding_cache.get_or_embed(
+            self.MODEL, self.DIMENSIONS, texts, embed_missing
         )
+        return [entry.embedding for entry in entries], [entry.cached for entry in entries]
+
+    async def _embed_texts_uncached(
+        self, texts: List[str], token_counts: Optional[List[int]] = None
+    ) -> List[List[float]]:
+        if token_counts is None:
+            token_counts = [self._count_tokens(text) for text in texts]
+
+        vectors: List[List[float]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+
+        for text, tokens in zip(texts, token_counts):
+            if batch and (
+                len(batch) >= self.MAX_BATCH_INPUTS
+                or batch_tokens + tokens > self.MAX_BATCH_TOKENS
+            ):
+                vectors.extend(await self._generate_embeddings(batch))
+                batch, batch_tokens = [], 0
+
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            vectors.extend(await self._generate_embeddings(batch))
 
-        embedding = response.data[0].embedding
-        return embedding
+        return vectors
 
     async def embed_document(
         self,
@@ -228,16 +349,17 @@ class EmbeddingEngine:
         chunks = self._chunk_content(content)
         total_chunks = len(chunks)
 
-        # 4. Embed each chunk
+        # 4. Embed all chunks (one request; cached chunks cost nothing)
+        token_counts = [self._count_tokens(chunk_text) for chunk_text in chunks]
+        vectors, cache_hits = await self.embed_texts_with_hits(chunks, token_counts)
         embedding_ids = []
 
         for chunk_index, chunk_text in enumerate(chunks):
-            # Generate embedding
-            embedding_vector = await self._generate_embedding(chunk_text)
+            embedding_vector = vectors[chunk_index]
 
             # Count tokens
-            token_count = self._count_tokens(chunk_text)
-            embedding_cost = (
+            token_count = token_counts[chunk_index]
+            embedding_cost = 0.0 if cache_hits[chunk_index] else (
                 token_count / 1_000_000
             ) * self.COST_PER_MILLION_TOKENS
 
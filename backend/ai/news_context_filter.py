@@ -582,11 +582,12 @@ class NewsContextFilter:
         # Get/create embedding
         if embedding is None:
             from backend.ai.embedding_engine import EmbeddingEngine
+            from backend.data.vector_store.embedding_cache import get_embedding_cache
 
-            engine = EmbeddingEngine(self.db)
+            engine = EmbeddingEngine(self.db, embedding_cache=get_embedding_cache())
 
-            # Generate embedding for news
-            embeddings = await engine.generate_embedding(news_content)
+            # Generate embedding for news (re-analysis hits the shared cache)
+            embeddings = await engine.embed_texts([news_content])
             embedding = np.array(embeddings[0])
 
         # Calculate 4 risk scores
@@ -14,7 +14,8 @@ import anthropic
 
 from backend.data.sec_client import SECClient
 from backend.data.sec_parser import SECParser
-from backend.core.models.sec_models import FilingType, ParsedFiling
+from backend.data.sec_filing_store import SECFilingStore, get_sec_filing_store
+from backend.core.models.sec_models import FilingMetadata, FilingType, ParsedFiling
 from backend.core.models.sec_analysis_models import (
     SECAnalysisResult,
     SECAnalysisRequest,
@@ -58,7 +59,8 @@ class SECAnalyzer:
         anthropic_api_key: str,
         model: str = "claude-sonnet-4-20250514",
         sec_client: Optional[SECClient] = None,
-        sec_parser: Optional[SECParser] = None
+        sec_parser: Optional[SECParser] = None,
+        filing_store: Optional[SECFilingStore] = None
     ):
         """
         Args:
@@ -66,23 +68,39 @@ class SECAnalyzer:
             model: 사용할 Claude 모델
             sec_client: SEC 클라이언트 (선택)
             sec_parser: SEC 파서 (선택)
+            filing_store: 파싱 결과 저장소 (기본: 공유 저장소, 같은 공시는 다시 다운로드/파싱하지 않음)
         """
         self.client = anthropic.Anthropic(api_key=anthropic_api_key)
         self.model = model
         self.sec_client = sec_client or SECClient()
+        self._owns_sec_client = sec_client is None
         self.parser = sec_parser or SECParser()
+        self.filing_store = filing_store or get_sec_filing_store()
         
         logger.info(f"SEC Analyzer initialized (model: {model})")
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        """직접 생성한 SEC 클라이언트 세션 종료 (주입받은 클라이언트는 호출자가 관리)"""
+        if self._owns_sec_client:
+            await self.sec_client.close()
+    
     async def analyze_ticker(
         self,
-        request: SECAnalysisRequest
+        request: SECAnalysisRequest,
+        filing: Optional[FilingMetadata] = None
     ) -> SECAnalysisResult:
         """
         티커 기반 분석 (자동으로 최신 공시 다운로드)
         
         Args:
             request: 분석 요청
+            filing: 이미 조회한 최신 공시 (선택, 없으면 SEC에서 조회)
             
         Returns:
             SECAnalysisResult
@@ -90,27 +108,49 @@ class SECAnalyzer:
         logger.info(f"Analyzing {request.ticker} {request.filing_type}...")
         
         # 1. 최신 공시 조회
-        filing_type_enum = FilingType(request.filing_type)
-        filing = await self.sec_client.get_latest_filing(
-            request.ticker,
-            filing_type_enum
-        )
+        if filing is None:
+            filing = await self.sec_client.get_latest_filing(
+                request.ticker,
+                FilingType(request.filing_type)
+            )
         
         if not filing:
             raise ValueError(f"No {request.filing_type} found for {request.ticker}")
         
-        # 2. 문서 다운로드
-        content = await self.sec_client.download_filing(
-            filing,
-            force_refresh=request.force_refresh
-        )
-        
-        # 3. 파싱
-        parsed = self.parser.parse(filing, content)
+        # 2. 문서 다운로드 + 파싱 (저장소에 있으면 섹션 인덱스만 로드)
+        parsed = await self._get_parsed_filing(filing, force_refresh=request.force_refresh)
         
         # 4. 분석
         return await self.analyze_filing(parsed, request)
     
+    async def _get_parsed_filing(
+        self,
+        filing: FilingMetadata,
+        force_refresh: bool = False
+    ) -> ParsedFiling:
+        """
+        저장소의 파싱 결과 우선 사용 (섹션은 접근 시 압축 해제)
+
+        없으면 다운로드 → 파싱 → 저장소에 저장
+        """
+        if not force_refresh:
+            digest = self.filing_store.resolve(
+                filing.ticker, filing.filing_type.value, filing.fiscal_period
+            )
+            if digest and self.filing_store.has(digest):
+                logger.info(f"Loaded parsed filing from store: {filing.ticker} {filing.fiscal_period}")
+                return self.filing_store.load_parsed(digest)
+
+        content = await self.sec_client.download_filing(filing, force_refresh=force_refresh)
+        parsed = self.parser.parse(filing, content)
+
+        try:
+            self.filing_store.put(filing, content, parsed=parsed)
+        except OSError as e:
+            logger.warning(f"Failed to store parsed filing {filing.ticker} {filing.fiscal_period}: {e}")
+
+        return parsed
+
     async def analyze_filing(
         self,
         parsed: ParsedFiling,
@@ -482,11 +522,8 @@ class SECAnalyzer:
         if not filing:
             raise ValueError(f"No {filing_type} found for {ticker}")
         
-        # 문서 다운로드
-        content = await self.sec_client.download_filing(filing)
-        
-        # 파싱
-        parsed = self.parser.parse(filing, content)
+        # 문서 다운로드 + 파싱
+        parsed = await self._get_parsed_filing(filing)
         
         # 짧은 발췌 (2000 단어)
         excerpt = parsed.get_text_for_ai(max_words=2000)
@@ -518,13 +555,13 @@ async def analyze_10k(
     force_refresh: bool = False
 ) -> SECAnalysisResult:
     """10-K 분석 (편의 함수)"""
-    analyzer = SECAnalyzer(anthropic_api_key)
-    request = SECAnalysisRequest(
-        ticker=ticker,
-        filing_type="10-K",
-        force_refresh=force_refresh
-    )
-    return await analyzer.analyze_ticker(request)
+    async with SECAnalyzer(anthropic_api_key) as analyzer:
+        request = SECAnalysisRequest(
+            ticker=ticker,
+            filing_type="10-K",
+            force_refresh=force_refresh
+        )
+        return await analyzer.analyze_ticker(request)
 
 
 async def analyze_10q(
@@ -533,13 +570,13 @@ async def analyze_10q(
     force_refresh: bool = False
 ) -> SECAnalysisResult:
     """10-Q 분석 (편의 함수)"""
-    analyzer = SECAnalyzer(anthropic_api_key)
-    request = SECAnalysisRequest(
-        ticker=ticker,
-        filing_type="10-Q",
-        force_refresh=force_refresh
-    )
-    return await analyzer.analyze_ticker(request)
+    async with SECAnalyzer(anthropic_api_key) as analyzer:
+        request = SECAnalysisRequest(
+            ticker=ticker,
+            filing_type="10-Q",
+            force_refresh=force_refresh
+        )
+        return await analyzer.analyze_ticker(request)
 
 
 # ============================================
@@ -569,7 +606,10 @@ async def demo():
     print(f"{'='*60}\n")
     
     # 분석 실행
-    result = await analyzer.analyze_ticker(request)
+    try:
+        result = await analyzer.analyze_ticker(request)
+    finally:
+        await analyzer.close()
     
     # 결과 출력
     print(f"📊 Analysis Complete")
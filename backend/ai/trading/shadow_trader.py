@@ -163,6 +163,7 @@ class ShadowTradingAgent:
     def _record_order(self, db: Session, signal, ticker, side, qty, price, status, msg=""):
         """Record to Order table (Shadow Mode) - Using OrderManager"""
         from backend.execution.order_manager import OrderManager
+        from backend.execution.transition_log import get_transition_log
         from backend.execution.state_machine import OrderState
 
         try:
@@ -182,7 +183,7 @@ class ShadowTradingAgent:
             db.flush()  # Get the order ID
 
             # Use OrderManager for state transitions
-            order_manager = OrderManager(db)
+            order_manager = OrderManager(db, transition_log=get_transition_log())
 
             # Transition through states based on status
             if status == "FILLED":
@@ -202,6 +203,9 @@ class ShadowTradingAgent:
                 order_manager.validation_passed(order, {"shadow_mode": True})
                 order_manager.order_failed(order, msg if msg else "Unknown failure")
 
+            # WAL 모드: 전이 fsync + 지연된 DB 커밋
+            order_manager.flush()
+
             logger.info(f"📝 Order recorded: {side} {ticker} x{qty} @ ${price:.2f} - {status}")
         except Exception as e:
             logger.error(f"Failed to record order: {e}")
@@ -19,10 +19,11 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from sqlalchemy import select, and_, or_, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from openai import AsyncOpenAI
 
 from backend.core.models.embedding_models import DocumentEmbedding
 from backend.ai.embedding_engine import EmbeddingEngine
+from backend.data.vector_store.embedder import EmbeddingBackend
+from backend.data.vector_store.embedding_cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,7 @@ class VectorSearchEngine:
         self,
         db_session: AsyncSession,
         openai_api_key: Optional[str] = None,
+        backend: Optional[EmbeddingBackend] = None,
     ):
         """
         Initialize vector search engine.
@@ -92,30 +94,28 @@ class VectorSearchEngine:
         Args:
             db_session: SQLAlchemy async session
             openai_api_key: OpenAI API key for query embedding
+            backend: Embedding backend the documents were embedded with
+                (None = OpenAI API)
         """
         self.db = db_session
-        self.client = AsyncOpenAI(api_key=openai_api_key)
-        self.embedding_engine = EmbeddingEngine(db_session, openai_api_key)
+        # Shared result cache: repeated queries skip the embedding call
+        self.embedding_engine = EmbeddingEngine(
+            db_session, openai_api_key, backend=backend, embedding_cache=get_embedding_cache()
+        )
 
-        logger.info("VectorSearchEngine initialized")
+        logger.info(f"VectorSearchEngine initialized (model={self.embedding_engine.MODEL})")
 
     async def _embed_query(self, query: str) -> List[float]:
         """
-        Embed search query using OpenAI API.
+        Embed search query with the same backend/model as the documents.
 
         Args:
             query: Search query string
 
         Returns:
-            Query embedding vector (1536 dims)
+            Query embedding vector (embedding_engine.DIMENSIONS dims)
         """
-        response = await self.client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query,
-            encoding_format="float",
-        )
-
-        return response.data[0].embedding
+        return (await self.embedding_engine.embed_texts([query]))[0]
 
     async def search(
         self,
@@ -149,7 +149,8 @@ class VectorSearchEngine:
         # Note: pgvector uses <=> for cosine distance (1 - cosine similarity)
         # We convert to similarity: 1 - distance
 
-        filters = []
+        # Only vectors from the query's model are comparable
+        filters = [DocumentEmbedding.embedding_model == self.embedding_engine.MODEL]
 
         if ticker:
             filters.append(DocumentEmbedding.ticker == ticker)
@@ -171,8 +172,7 @@ class VectorSearchEngine:
             ),
         )
 
-        if filters:
-            query_stmt = query_stmt.where(and_(*filters))
+        query_stmt = query_stmt.where(and_(*filters))
 
         # Order by similarity and limit
         query_stmt = query_stmt.order_by(text("similarity DESC")).limit(top_k * 2)
@@ -347,7 +347,8 @@ class VectorSearchEngine:
             or_(
                 DocumentEmbedding.document_type != document_type,
                 DocumentEmbedding.document_id != document_id,
-            )
+            ),
+            DocumentEmbedding.embedding_model == source_doc.embedding_model,
         ]
 
         if same_ticker_only and source_doc.ticker:
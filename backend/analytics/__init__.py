@@ -4,12 +4,18 @@ Analytics Module
 매크로 리스크 분석:
 - BuffettIndexMonitor: 시가총액/GDP 비율 모니터링
 - PERICalculator: 정책 이벤트 리스크 지수
+
+공유 리스크 데이터:
+- EWMACovarianceService: 유니버스 EWMA 공분산 캐시 (증분 갱신 + 디스크 스냅샷)
 """
 
 from .buffett_index_monitor import BuffettIndexMonitor
 from .peri_calculator import PERICalculator
+from .covariance_service import EWMACovarianceService, get_covariance_service
 
 __all__ = [
     "BuffettIndexMonitor",
     "PERICalculator",
+    "EWMACovarianceService",
+    "get_covariance_service",
 ]
@@ -0,0 +1,302 @@
+"""
+Covariance Service - 유니버스 공분산 행렬 공유 캐시 (EWMA)
+
+핵심 원칙:
+- 유니버스 전체 공분산을 메모리에 유지, 하루 1회 증분 갱신 (RiskMetrics EWMA)
+    Σ_t = λ·Σ_{t-1} + (1-λ)·r_t·r_tᵀ
+- 갱신 비용 O(k²) (k = 당일 시세가 있는 종목 수), 가격 이력 재조회 없음
+- 부분 행렬 조회 O(k²): get_covariance(["AAPL", "MSFT", ...])
+- 디스크 스냅샷 (npz)으로 재시작 후에도 상태 유지
+
+사용처:
+- RiskAnalyzer.analyze_correlation_risk (포지션 상관관계)
+- PortfolioOptimizer (covariance_service 지정 시)
+- CorrelationScheduler (매일 갱신 + 저장)
+
+작성일: 2026-10-18
+"""
+
+import logging
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS = 252
+DEFAULT_CACHE_PATH = "data/cache/ewma_covariance.npz"
+
+
+class EWMACovarianceService:
+    """
+    EWMA 공분산 행렬 (일간 수익률 기준)
+
+    사용법:
+        service = get_covariance_service()
+        service.update({"AAPL": 231.5, "MSFT": 415.2}, as_of=date.today())
+        cov = service.get_covariance(["AAPL", "MSFT"])
+        corr = service.get_correlation(["AAPL", "MSFT"])
+    """
+
+    def __init__(
+        self,
+        decay: float = 0.94,
+        path: Optional[Union[str, Path]] = None,
+        min_observations: int = 20,
+    ):
+        """
+        Args:
+            decay: EWMA 감쇠 계수 λ (RiskMetrics 일간 기본값 0.94)
+            path: 스냅샷 파일 경로 (기본: COVARIANCE_CACHE_PATH 또는 data/cache/ewma_covariance.npz)
+            min_observations: is_ready 판단 최소 수익률 관측 수
+        """
+        self.decay = decay
+        self.path = Path(path or os.getenv("COVARIANCE_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.min_observations = min_observations
+
+        self._tickers: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._cov = np.zeros((0, 0))
+        self._last_prices = np.zeros(0)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._lock = threading.RLock()
+
+        self.as_of: Optional[date] = None
+        self.updates = 0
+
+    # ================================================================
+    # 갱신
+    # ================================================================
+
+    def update(self, prices: Mapping[str, float], as_of: Optional[date] = None) -> int:
+        """
+        당일 종가로 공분산 증분 갱신
+
+        처음 등장한 종목은 가격만 기록하고 다음 갱신부터 반영합니다.
+        첫 수익률 관측 시 해당 행/열은 단일 관측치(r_i·r_j)로 초기화됩니다.
+
+        Returns:
+            수익률이 반영된 종목 수
+        """
+        with self._lock:
+            valid = {t: float(p) for t, p in prices.items() if p is not None and np.isfinite(p) and p > 0}
+            if not valid:
+                return 0
+
+            self._ensure_tickers(valid.keys())
+            idx = np.fromiter((self._index[t] for t in valid), dtype=np.int64, count=len(valid))
+            new_prices = np.fromiter(valid.values(), dtype=float, count=len(valid))
+
+            prev = self._last_prices[idx]
+            has_prev = prev > 0
+            ret_idx = idx[has_prev]
+
+            if len(ret_idx):
+                r = new_prices[has_prev] / prev[has_prev] - 1
+                outer = np.outer(r, r)
+                block = np.ix_(ret_idx, ret_idx)
+
+                updated = self.decay * self._cov[block] + (1 - self.decay) * outer
+                fresh = self._counts[ret_idx] == 0
+                if fresh.any():
+                    updated[fresh, :] = outer[fresh, :]
+                    updated[:, fresh] = outer[:, fresh]
+
+                self._cov[block] = updated
+                self._counts[ret_idx] += 1
+
+            self._last_prices[idx] = new_prices
+            if as_of is not None:
+                self.as_of = as_of
+            self.updates += 1
+            return len(ret_idx)
+
+    def update_from_prices(self, prices: pd.DataFrame) -> int:
+        """
+        종가 DataFrame (index: 날짜, columns: 종목)으로 갱신
+
+        as_of 이후 행만 반영하므로 매일 같은 기간을 넘겨도 증분 갱신됩니다.
+
+        Returns:
+            반영된 행(거래일) 수
+        """
+        applied = 0
+        for ts, row in prices.sort_index().iterrows():
+            row_date = ts.date() if isinstance(ts, (pd.Timestamp, datetime)) else ts
+            if self.as_of is not None and row_date <= self.as_of:
+                continue
+            self.update(row.dropna().to_dict(), as_of=row_date)
+            applied += 1
+
+        if applied:
+            logger.info(f"Covariance updated with {applied} days ({len(self._tickers)} tickers, as of {self.as_of})")
+        return applied
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._tickers)
+
+    def is_ready(self, tickers: Iterable[str]) -> bool:
+        """모든 종목이 min_observations 이상 관측되었는지"""
+        with self._lock:
+            for ticker in tickers:
+                i = self._index.get(ticker)
+                if i is None or self._counts[i] < self.min_observations:
+                    return False
+            return True
+
+    def get_covariance(self, tickers: List[str], annualize: bool = False) -> pd.DataFrame:
+        """
+        종목 부분 공분산 행렬 (O(k²))
+
+        Raises:
+            KeyError: 캐시에 없는 종목이 포함된 경우
+        """
+        with self._lock:
+            idx = self._indices(tickers)
+            cov = self._cov[np.ix_(idx, idx)].copy()
+
+        if annualize:
+            cov *= TRADING_DAYS
+        return pd.DataFrame(cov, index=tickers, columns=tickers)
+
+    def get_correlation(self, tickers: List[str]) -> pd.DataFrame:
+        """종목 부분 상관계수 행렬 (분산 0인 종목은 NaN)"""
+        cov = self.get_covariance(tickers).to_numpy()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        corr[std == 0, :] = np.nan
+        corr[:, std == 0] = np.nan
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=tickers, columns=tickers)
+
+    def get_volatility(self, tickers: List[str], annualize: bool = True) -> pd.Series:
+        with self._lock:
+            idx = self._indices(tickers)
+            var = self._cov[idx, idx].copy()
+        if annualize:
+            var *= TRADING_DAYS
+        return pd.Series(np.sqrt(var), index=tickers)
+
+    def get_stats(self) -> Dict:
+        return {
+            "tickers": len(self._tickers),
+            "ready_tickers": int((self._counts >= self.min_observations).sum()),
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+            "decay": self.decay,
+            "updates": self.updates,
+            "path": str(self.path),
+        }
+
+    # ================================================================
+    # 디스크 스냅샷
+    # ================================================================
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """스냅샷 저장 (임시 파일 → rename, 원자적 교체)"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with self._lock:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    tickers=np.array(self._tickers, dtype=str),
+                    cov=self._cov,
+                    last_prices=self._last_prices,
+                    counts=self._counts,
+                    decay=np.array(self.decay),
+                    as_of=np.array(self.as_of.isoformat() if self.as_of else ""),
+                )
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """스냅샷 로드 (파일 없거나 decay가 다르면 False)"""
+        path = Path(path or self.path)
+        if not path.exists():
+            return False
+
+        try:
+            with np.load(path) as data:
+                if float(data["decay"]) != self.decay:
+                    logger.warning(f"Covariance snapshot decay {float(data['decay'])} != {self.decay}, ignoring")
+                    return False
+                tickers = [str(t) for t in data["tickers"]]
+                as_of = str(data["as_of"])
+                with self._lock:
+                    self._tickers = tickers
+                    self._index = {t: i for i, t in enumerate(tickers)}
+                    self._cov = data["cov"].copy()
+                    self._last_prices = data["last_prices"].copy()
+                    self._counts = data["counts"].copy()
+                    self.as_of = date.fromisoformat(as_of) if as_of else None
+        except Exception as e:
+            logger.error(f"Failed to load covariance snapshot {path}: {e}")
+            return False
+
+        logger.info(f"Covariance snapshot loaded: {len(self._tickers)} tickers (as of {self.as_of})")
+        return True
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _indices(self, tickers: List[str]) -> np.ndarray:
+        missing = [t for t in tickers if t not in self._index]
+        if missing:
+            raise KeyError(f"Tickers not in covariance cache: {missing}")
+        return np.fromiter((self._index[t] for t in tickers), dtype=np.int64, count=len(tickers))
+
+    def _ensure_tickers(self, tickers: Iterable[str]):
+        new = [t for t in tickers if t not in self._index]
+        if not new:
+            return
+
+        n_old, n_new = len(self._tickers), len(self._tickers) + len(new)
+        cov = np.zeros((n_new, n_new))
+        cov[:n_old, :n_old] = self._cov
+        self._cov = cov
+        self._last_prices = np.concatenate([self._last_prices, np.zeros(len(new))])
+        self._counts = np.concatenate([self._counts, np.zeros(len(new), dtype=np.int64)])
+
+        for ticker in new:
+            self._index[ticker] = len(self._tickers)
+            self._tickers.append(ticker)
+
+
+def correlation_pairs(corr: pd.DataFrame) -> List[Dict]:
+    """상관계수 행렬 → 상삼각 페어 목록 (NaN 제외, 행렬 순서 유지)"""
+    values = corr.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_values = values[rows, cols]
+    valid = ~np.isnan(pair_values)
+    tickers = list(corr.columns)
+    return [
+        {"ticker1": tickers[i], "ticker2": tickers[j], "correlation": float(c)}
+        for i, j, c in zip(rows[valid], cols[valid], pair_values[valid])
+    ]
+
+
+# 싱글톤 인스턴스
+_covariance_service: Optional[EWMACovarianceService] = None
+
+
+def get_covariance_service() -> EWMACovarianceService:
+    """공유 공분산 서비스 (첫 호출 시 디스크 스냅샷 로드)"""
+    global _covariance_service
+    if _covariance_service is None:
+        _covariance_service = EWMACovarianceService()
+        _covariance_service.load()
+    return _covariance_service
@@ -20,12 +20,18 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
 import numpy as np
+import pandas as pd
 
 from backend.core.models.analytics_models import (
     DailyAnalytics,
     TradeExecution,
     PortfolioSnapshot,
 )
+from backend.analytics.covariance_service import (
+    EWMACovarianceService,
+    correlation_pairs,
+    get_covariance_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,14 +48,20 @@ class RiskAnalyzer:
     - Drawdown analysis
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        covariance_service: Optional[EWMACovarianceService] = None,
+    ):
         """
         Initialize risk analyzer.
 
         Args:
             db_session: Database session
+            covariance_service: Shared EWMA covariance cache (defaults to the singleton)
         """
         self.db = db_session
+        self.covariance_service = covariance_service or get_covariance_service()
         logger.info("RiskAnalyzer initialized")
 
     async def calculate_var_metrics(
@@ -380,7 +392,7 @@ class RiskAnalyzer:
 
         result = await self.db.execute(stmt)
 
-        snapshot = result.scalars().all()
+        trades = result.scalars().all()
 
         # Group trades by ticker
         ticker_returns = {}
@@ -397,34 +409,21 @@ class RiskAnalyzer:
                 'tickers_analyzed': len(ticker_returns),
             }
 
-        # Find highly correlated pairs
-        correlations = []
         tickers = list(ticker_returns.keys())
 
-        for i in range(len(tickers)):
-            for j in range(i + 1, len(tickers)):
-                ticker1 = tickers[i]
-                ticker2 = tickers[j]
-
-                returns1 = ticker_returns[ticker1]
-                returns2 = ticker_returns[ticker2]
-
-                # Need at least 5 data points
-                if len(returns1) >= 5 and len(returns2) >= 5:
-                    # Align lengths
-                    min_len = min(len(returns1), len(returns2))
-                    r1 = np.array(returns1[:min_len])
-                    r2 = np.array(returns2[:min_len])
-
-                    # Calculate correlation
-                    if len(r1) > 1:
-                        corr = np.corrcoef(r1, r2)[0, 1]
-                        if not np.isnan(corr):
-                            correlations.append({
-                                'ticker1': ticker1,
-                                'ticker2': ticker2,
-                                'correlation': float(corr),
-                            })
+        if self.covariance_service.is_ready(tickers):
+            # Price-return correlations from the shared EWMA covariance (O(k²) lookup)
+            source = 'ewma_price_returns'
+            corr_matrix = self.covariance_service.get_correlation(tickers)
+        else:
+            # Trade P&L correlations; ragged lists are NaN-padded so pairwise
+            # alignment truncates to the shorter series (need at least 5 points)
+            source = 'trade_pnl'
+            padded = pd.DataFrame({t: pd.Series(r, dtype=float) for t, r in ticker_returns.items()})
+            corr_matrix = padded.corr(min_periods=5)
+
+        # Find highly correlated pairs
+        correlations = correlation_pairs(corr_matrix)
 
         # Sort by absolute correlation
         correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
@@ -434,6 +433,7 @@ class RiskAnalyzer:
 
         result = {
             'lookback_days': lookback_days,
+            'source': source,
             'tickers_analyzed': len(ticker_returns),
             'correlation_pairs': len(correlations),
             'avg_absolute_correlation': float(avg_correlation),
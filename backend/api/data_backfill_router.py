@@ -26,10 +26,9 @@ try:
     from backend.data.crawlers.multi_source_crawler import MultiSourceNewsCrawler
     from backend.data.processors.news_processor import NewsProcessor
     from backend.data.collectors.stock_price_collector import StockPriceCollector
+    from backend.database.bulk_loader import BulkLoader
     from backend.database.repository import (
         get_db_session,
-        NewsRepository,
-        StockRepository,
         DataCollectionRepository
     )
 except ImportError:
@@ -40,13 +39,11 @@ except ImportError:
         pass
     class StockPriceCollector:
         pass
+    class BulkLoader:
+        pass
 
     def get_db_session():
         pass
-    class NewsRepository:
-        pass
-    class StockRepository:
-        pass
     class DataCollectionRepository:
         pass
 
@@ -411,42 +408,35 @@ async def run_news_backfill(
 
         job["progress"]["processed_articles"] = len(processed)
 
-        # 3. Save to database
-        saved_count = 0
-        async with get_db_session() as session:
-            news_repo = NewsRepository(session)
-            
+        # 3. Save to database (COPY 배치 적재, 중복 content_hash/url은 건너뜀)
+        def article_records():
             for proc_news in processed:
-                try:
-                    # Create article dictionary
-                    article_dict = {
-                        'title': proc_news.article.title,
-                        'content': proc_news.article.content,
-                        'url': proc_news.article.url,
-                        'source': proc_news.article.source,
-                        'published_at': proc_news.article.published_at,
-                        'content_hash': proc_news.article.generate_hash() if hasattr(proc_news.article, 'generate_hash') else None,
-                        'processed_at': proc_news.processed_at,
-                        'embedding': proc_news.embedding,
-                        'sentiment_score': proc_news.sentiment_score,
-                        'sentiment_label': proc_news.sentiment_label,
-                        'tags': proc_news.article.tags,
-                        'tickers': proc_news.article.tickers,
-                        'source_category': proc_news.article.source_category,
-                        'metadata': {
-                             'author': proc_news.article.author,
-                             'processing_errors': proc_news.processing_errors
-                        },
-                        'embedding_model': proc_news.embedding_model
-                    }
-                    news_repo.save_processed_article(article_dict)
-                    saved_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to save article {proc_news.article.url}: {e}")
-                    # Continue to next article even if one fails
-            
-            # Commit handled by repo or session manager usually, ensure we don't hold transaction if error
-        
+                yield {
+                    'title': proc_news.article.title,
+                    'content': proc_news.article.content,
+                    'url': proc_news.article.url,
+                    'source': proc_news.article.source,
+                    'published_at': proc_news.article.published_at,
+                    'content_hash': proc_news.article.generate_hash() if hasattr(proc_news.article, 'generate_hash') else None,
+                    'processed_at': proc_news.processed_at,
+                    'embedding': proc_news.embedding,
+                    'sentiment_score': proc_news.sentiment_score,
+                    'sentiment_label': proc_news.sentiment_label,
+                    'tags': proc_news.article.tags,
+                    'tickers': proc_news.article.tickers,
+                    'source_category': proc_news.article.source_category,
+                    'metadata': {
+                         'author': proc_news.article.author,
+                         'processing_errors': proc_news.processing_errors
+                    },
+                    'embedding_model': proc_news.embedding_model
+                }
+
+        loader = BulkLoader(batch_size=1000)
+        load_result = await loader.load_news(article_records())
+        saved_count = load_result.written
+        job["progress"]["rows_per_sec"] = round(load_result.rows_per_sec, 1)
+
         # Update completion status in DB
         if db_job_id:
             async with get_db_session() as session:
@@ -519,46 +509,43 @@ async def run_price_backfill(
              logger.error(f"Job {job_id}: Failed to create DB job: {e}")
              raise e
 
-        # Collect price data
+        # Collect + save as a stream: 티커 단위로 수집한 행을 COPY 배치로 바로 적재
         collector = StockPriceCollector()
-        results = collector.collect_historical_data(
-            tickers, start_date, end_date, interval
-        )
+        job["progress"]["processed_tickers"] = 0
+        job["progress"]["total_data_points"] = 0
+
+        async def price_records():
+            for ticker in tickers:
+                try:
+                    data_points = await asyncio.to_thread(
+                        collector.collect_ticker_data, ticker, start_date, end_date, interval
+                    )
+                except Exception as e:
+                    logger.error(f"Job {job_id}: {ticker} collection failed - {e}")
+                    data_points = []
+
+                job["progress"]["processed_tickers"] += 1
+                job["progress"]["total_data_points"] += len(data_points)
+                for p in data_points:
+                    yield p.to_dict()
+
+        loader = BulkLoader(batch_size=5000)
+        load_result = await loader.load_prices(price_records())
 
-        # Update progress
-        total_points = sum(len(data) for data in results.values())
-        job["progress"]["processed_tickers"] = len(results)
-        job["progress"]["total_data_points"] = total_points
+        job["progress"]["saved_data_points"] = load_result.written
+        job["progress"]["rows_per_sec"] = round(load_result.rows_per_sec, 1)
 
-        logger.info(f"Job {job_id}: Collected {total_points} data points")
+        logger.info(f"Job {job_id}: Collected {load_result.received} data points")
 
-        # Save to database
+        # Update completion
         async with get_db_session() as session:
-             stock_repo = StockRepository(session)
-             
-             # Convert to dicts for bulk save
-             price_dicts = []
-             for ticker, data_points in results.items():
-                 for p in data_points:
-                     price_dicts.append(p.to_dict())
-             
-             # Bulk save (StockRepository handles batches conceptually, or add batching here)
-             # Basic batching for memory management
-             batch_size = 5000
-             for i in range(0, len(price_dicts), batch_size):
-                 batch = price_dicts[i:i+batch_size]
-                 stock_repo.save_prices(batch)
-             
-             job["progress"]["saved_data_points"] = len(price_dicts)
-             
-             # Update completion
-             collection_repo = DataCollectionRepository(session)
-             collection_repo.update_progress(
-                 job_id=db_job_id,
-                 processed=len(price_dicts),
-                 total=len(price_dicts),
-                 status='completed'
-             )
+            collection_repo = DataCollectionRepository(session)
+            collection_repo.update_progress(
+                job_id=db_job_id,
+                processed=load_result.received,
+                total=load_result.received,
+                status='completed'
+            )
 
         job["status"] = "completed"
         job["completed_at"] = datetime.now()
@@ -327,9 +327,9 @@ async def calculate_efficient_frontier(request: EfficientFrontierRequest):
             {
                 "return": float(point["return"]),
                 "volatility": float(point["volatility"]),
-                "sharpe_ratio": float(point["sharpe_ratio"])
+                "sharpe_ratio": float(point["sharpe"])
             }
-            for point in frontier_points
+            for point in frontier_points.to_dict("records")
         ]
 
         # Find min volatility and max Sharpe points
@@ -414,15 +414,16 @@ async def monte_carlo_simulation(request: MonteCarloRequest):
         )
 
         # Convert to JSON-serializable format
+        symbols = list(returns.columns)
         formatted_sims = []
-        for sim in simulations:
+        for sim in simulations.to_dict("records"):
             formatted_sims.append({
                 "return": float(sim["return"]),
                 "volatility": float(sim["volatility"]),
-                "sharpe_ratio": float(sim["sharpe_ratio"]),
+                "sharpe_ratio": float(sim["sharpe"]),
                 "weights": {
                     symbol: float(weight)
-                    for symbol, weight in sim["weights"].items()
+                    for symbol, weight in zip(symbols, sim["weights"])
                 }
             })
 
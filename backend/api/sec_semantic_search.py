@@ -25,6 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.core.database import get_db
 from backend.ai.vector_search import VectorSearch
 from backend.ai.embedding_engine import EmbeddingEngine
+from backend.data.vector_store.embedding_cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -172,7 +173,7 @@ async def semantic_search(
     )
 
     # Initialize engines
-    embedding_engine = EmbeddingEngine(db)
+    embedding_engine = EmbeddingEngine(db, embedding_cache=get_embedding_cache())
     vector_search = VectorSearch(db)
 
     # Parse date filters
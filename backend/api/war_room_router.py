@@ -546,6 +546,7 @@ async def execute_kis_order(
 
         # 5. Save order to database using OrderManager
         from backend.execution.order_manager import OrderManager
+        from backend.execution.transition_log import get_transition_log
         from backend.execution.state_machine import OrderState
 
         order_id = order_result.get("order_id") or order_result.get("ODNO", "")
@@ -567,11 +568,12 @@ async def execute_kis_order(
         db.flush()  # Get the order ID
 
         # Use OrderManager for state transitions
-        order_manager = OrderManager(db)
+        order_manager = OrderManager(db, transition_log=get_transition_log())
         order_manager.receive_signal(order, {"broker": "KIS", "signal_id": signal_id})
         order_manager.start_validation(order)
         order_manager.validation_passed(order, {"broker": "KIS"})
         order_manager.order_sent(order, order_id)
+        order_manager.flush()  # WAL 모드: 전이 fsync + 지연된 DB 커밋
 
         db.commit()
         db.refresh(order)
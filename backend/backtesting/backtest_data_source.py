@@ -0,0 +1,198 @@
+"""
+Backtest Data Source - SignalBacktestEngine 스트리밍 입력 (가격 일별 슬라이스 + 분석 이터레이터)
+
+핵심 원칙:
+- 엔진은 정수 일 인덱스(start_date 기준 경과 일수)로 진행, 일별 날짜 문자열 포맷 없음
+- 가격은 (일 × 종목) 행 단위로 스트리밍: 하루치 가격 = 행 배열 뷰 (일별 dict 생성 없음)
+- PriceStoreSource는 chunk_days 구간씩 PriceHistoryReader에서 적재 → 메모리 = 청크 1개
+- 분석은 가용 시각(max(crawled_at, analyzed_at)) 오름차순 이터레이터로 1회 소비
+
+사용법:
+    reader = PriceHistoryReader(cache=QueryCache(max_entries=1))
+    prices = PriceStoreSource(reader, tickers, chunk_days=90)
+    result = await engine.run_stream(prices, analyses_sorted_by_available_at, start, end)
+
+    # 기존 {date_str: {ticker: price}} 입력
+    prices = DictPriceSource(price_data)
+
+작성일: 2026-10-18
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (일 인덱스, 하루치 가격 {ticker: price})
+DaySlice = Tuple[int, Mapping[str, float]]
+
+
+def analysis_available_at(analysis: Any) -> datetime:
+    """분석 가용 시각 (수집과 분석이 모두 끝난 시각, Point-in-Time 기준)"""
+    return max(analysis.crawled_at, analysis.analyzed_at)
+
+
+def day_offset(start_date: datetime, end_date: datetime) -> int:
+    """start_date 날짜 기준 end_date 날짜의 일 인덱스"""
+    return (end_date.date() - start_date.date()).days
+
+
+class DayPrices(Mapping):
+    """
+    하루치 가격 (읽기 전용 ticker → price 매핑)
+
+    (일 × 종목) 행렬의 행 뷰와 공유 종목 인덱스로 구성, NaN = 가격 없음
+    """
+
+    __slots__ = ("_row", "_index")
+
+    def __init__(self, row: np.ndarray, index: Dict[str, int]):
+        self._row = row
+        self._index = index
+
+    def __getitem__(self, ticker: str) -> float:
+        col = self._index.get(ticker)
+        if col is None or self._row[col] != self._row[col]:
+            raise KeyError(ticker)
+        return float(self._row[col])
+
+    def __contains__(self, ticker: object) -> bool:
+        col = self._index.get(ticker)
+        return col is not None and self._row[col] == self._row[col]
+
+    def __iter__(self) -> Iterator[str]:
+        return (ticker for ticker, col in self._index.items() if self._row[col] == self._row[col])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self._row)))
+
+
+class PriceDataSource(ABC):
+    """
+    가격 데이터 소스 기본 클래스
+
+    iter_days(start_date, end_date)는 가격이 있는 날만 일 인덱스 오름차순으로
+    (day_index, prices)를 yield (day_index = start_date 날짜 기준 경과 일수,
+    범위 0 ~ day_offset(start_date, end_date))
+    """
+
+    @abstractmethod
+    def iter_days(self, start_date: datetime, end_date: datetime) -> AsyncIterator[DaySlice]:
+        """가격이 있는 날의 (day_index, prices) 비동기 이터레이터"""
+
+
+class DictPriceSource(PriceDataSource):
+    """기존 {date_str: {ticker: price}} 입력 어댑터 (날짜 키는 생성 시 1회만 파싱)"""
+
+    def __init__(self, price_data: Dict[str, Dict[str, float]]):
+        self.price_data = price_data
+        self._days: List[Tuple[datetime, str]] = sorted(
+            (datetime.strptime(key, "%Y-%m-%d"), key) for key in price_data
+        )
+
+    async def iter_days(self, start_date: datetime, end_date: datetime) -> AsyncIterator[DaySlice]:
+        last = day_offset(start_date, end_date)
+        for date, key in self._days:
+            day = day_offset(start_date, date)
+            if 0 <= day <= last:
+                yield day, self.price_data[key]
+
+
+def _day_matrix(
+    panel: Any,
+    field: str,
+    start_day: np.datetime64,
+    n_days: int,
+    index: Dict[str, int],
+) -> np.ndarray:
+    """PricePanel → (n_days × 종목) 행렬 (start_day 기준 일 인덱스, 없는 값 NaN)"""
+    matrix = np.full((n_days, len(index)), np.nan)
+    if not len(panel):
+        return matrix
+
+    cols = np.full(len(panel), -1, dtype=np.int64)
+    for ticker, (start, end) in panel.offsets.items():
+        cols[start:end] = index.get(ticker, -1)
+
+    days = (panel.columns["time"].astype("datetime64[D]") - start_day).astype(np.int64)
+    valid = (cols >= 0) & (days >= 0) & (days < n_days)
+    # 1d 패널은 (종목, 일)당 1행
+    matrix[days[valid], cols[valid]] = panel.columns[field][valid]
+    return matrix
+
+
+def _iter_matrix(matrix: np.ndarray, index: Dict[str, int], first_day: int) -> Iterator[DaySlice]:
+    present = np.flatnonzero(~np.isnan(matrix).all(axis=1))
+    for row in present:
+        yield first_day + int(row), DayPrices(matrix[row], index)
+
+
+class PricePanelSource(PriceDataSource):
+    """메모리에 적재된 PricePanel 소스 (요청 구간 (일 × 종목) 행렬 1회 구성)"""
+
+    def __init__(self, panel: Any, field: str = "close"):
+        self.panel = panel
+        self.field = field
+        self.index = {ticker: col for col, ticker in enumerate(panel.tickers)}
+
+    async def iter_days(self, start_date: datetime, end_date: datetime) -> AsyncIterator[DaySlice]:
+        n_days = day_offset(start_date, end_date) + 1
+        matrix = _day_matrix(self.panel, self.field, np.datetime64(start_date.date(), "D"), n_days, self.index)
+        for item in _iter_matrix(matrix, self.index, 0):
+            yield item
+
+
+class PriceStoreSource(PriceDataSource):
+    """
+    컬럼형 가격 저장소 스트리밍 소스 (PriceHistoryReader 일봉 패널을 청크 단위로 적재)
+
+    Args:
+        reader: PriceHistoryReader (메모리 상한이 필요하면 작은 cache 지정)
+        tickers: 종목 유니버스 (열 순서 고정)
+        field: 가격 필드 (기본 close)
+        chunk_days: 1회 적재 일수 (메모리 ≈ chunk_days × 종목 수 × 8 bytes)
+    """
+
+    def __init__(self, reader: Any, tickers: Sequence[str], field: str = "close", chunk_days: int = 90):
+        if chunk_days <= 0:
+            raise ValueError("chunk_days must be positive")
+        self.reader = reader
+        self.tickers = sorted(set(tickers))
+        self.field = field
+        self.chunk_days = chunk_days
+        self.index = {ticker: col for col, ticker in enumerate(self.tickers)}
+
+    async def iter_days(self, start_date: datetime, end_date: datetime) -> AsyncIterator[DaySlice]:
+        first = datetime.combine(start_date.date(), datetime.min.time())
+        n_days = day_offset(start_date, end_date) + 1
+
+        for offset in range(0, n_days, self.chunk_days):
+            span = min(self.chunk_days, n_days - offset)
+            chunk_start = first + timedelta(days=offset)
+            panel = await self.reader.get_panel(
+                self.tickers, chunk_start, chunk_start + timedelta(days=span), interval="1d"
+            )
+            matrix = _day_matrix(panel, self.field, np.datetime64(chunk_start.date(), "D"), span, self.index)
+            logger.debug(f"Price chunk day {offset}~{offset + span - 1}: {len(panel)} rows")
+            for item in _iter_matrix(matrix, self.index, offset):
+                yield item
+
+
+async def iter_analyses(
+    analyses: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[Any]:
+    """
+    분석 이터레이터 (동기/비동기 이터러블 공통)
+
+    입력은 analysis_available_at 오름차순이어야 함 (엔진이 가용 시각까지 순서대로 소비)
+    """
+    if hasattr(analyses, "__aiter__"):
+        async for analysis in analyses:
+            yield analysis
+    else:
+        for analysis in analyses:
+            yield analysis
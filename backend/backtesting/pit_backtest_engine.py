@@ -20,6 +20,8 @@ from typing import List, Dict, Any, Optional, Generator
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .pit_news_index import PointInTimeNewsIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,14 +130,44 @@ class PointInTimeNewsProvider:
     is accessible.
     """
     
-    def __init__(self, db_session):
+    def __init__(self, db_session, index_dir: Optional[str] = None):
         """
         Args:
             db_session: SQLAlchemy database session
+            index_dir: PiT 뉴스 인덱스 스냅샷 디렉토리 (None이면 메모리에만 유지)
         """
         self.db = db_session
+        self.index_dir = index_dir
+        self.index: Optional[PointInTimeNewsIndex] = None
         self._cache: Dict[datetime, List[Any]] = {}
         logger.info("PointInTimeNewsProvider initialized")
+
+    def preload(self, start: datetime, end: datetime, refresh: bool = False) -> PointInTimeNewsIndex:
+        """
+        백테스트 구간 뉴스 인덱스 적재
+
+        index_dir에 구간을 포함하는 스냅샷이 있으면 DB 없이 로드합니다.
+        이후 구간 내 조회는 인덱스 이진 탐색으로 처리됩니다.
+
+        Args:
+            refresh: 스냅샷을 무시하고 DB에서 다시 적재
+        """
+        if not refresh and self.index is not None and self.index.covers(start, end):
+            return self.index
+
+        snapshot = None
+        if self.index_dir and not refresh:
+            snapshot = PointInTimeNewsIndex.find_snapshot(self.index_dir, start, end)
+
+        if snapshot is not None:
+            self.index = PointInTimeNewsIndex.load(snapshot)
+            logger.info(f"PiT news index loaded from {snapshot} ({len(self.index)} articles)")
+        else:
+            self.index = PointInTimeNewsIndex.from_db(self.db, start, end)
+            if self.index_dir:
+                self.index.save(self.index_dir)
+
+        return self.index
     
     def get_available_news(
         self,
@@ -157,9 +189,12 @@ class PointInTimeNewsProvider:
         Returns:
             List of news articles with their analyses
         """
-        from data.news_models import NewsArticle, NewsAnalysis
-        
         cutoff_time = as_of_timestamp - timedelta(hours=lookback_hours)
+
+        if self.index is not None and self.index.covers(cutoff_time, as_of_timestamp):
+            return self.index.window(as_of_timestamp, lookback_hours, include_analysis)
+
+        from data.news_models import NewsArticle, NewsAnalysis
         
         # CRITICAL: Filter by crawled_at <= as_of_timestamp
         # This ensures we only see news that was actually collected by this time
@@ -239,6 +274,9 @@ class PointInTimeNewsProvider:
         Returns:
             New articles that became available
         """
+        if self.index is not None and self.index.covers(last_processed_time, current_time):
+            return self.index.slice(last_processed_time, current_time)
+
         from data.news_models import NewsArticle, NewsAnalysis
         
         query = (
@@ -363,6 +401,7 @@ class PointInTimeBacktestEngine:
         slippage_bps: float = 1.0,  # 1 basis point
         commission_pct: float = 0.015,  # 0.015%
         max_position_pct: float = 0.10,  # 10% max per position
+        news_index_dir: Optional[str] = None,
     ):
         """
         Initialize backtest engine.
@@ -373,6 +412,7 @@ class PointInTimeBacktestEngine:
             slippage_bps: Slippage in basis points
             commission_pct: Commission percentage
             max_position_pct: Maximum position size as % of portfolio
+            news_index_dir: PiT news index snapshot directory (reused across runs)
         """
         self.db = db_session
         self.initial_capital = initial_capital
@@ -381,7 +421,7 @@ class PointInTimeBacktestEngine:
         self.max_position_pct = max_position_pct
         
         # Data providers
-        self.news_provider = PointInTimeNewsProvider(db_session)
+        self.news_provider = PointInTimeNewsProvider(db_session, index_dir=news_index_dir)
         self.market_data = HistoricalMarketDataProvider(db_session)
         
         # State
@@ -428,6 +468,9 @@ class PointInTimeBacktestEngine:
         
         current_time = start_date
         last_processed_time = start_date
+
+        # Preload news for the whole window (per-step lookups become binary searches)
+        self.news_provider.preload(start_date, end_date)
         
         # Main simulation loop
         while current_time <= end_date:
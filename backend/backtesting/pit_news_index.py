@@ -0,0 +1,273 @@
+"""
+Point-in-Time News Index - 백테스트 구간 뉴스 사전 적재 인덱스
+
+핵심 원칙:
+- 백테스트 구간 뉴스 + 분석을 1회 쿼리로 적재 (시뮬레이션 스텝마다 DB 쿼리 없음)
+- crawled_at 오름차순 정렬 + datetime64 컬럼 → 스텝별 구간은 이진 탐색 (searchsorted)
+- 분석 가용 시각(analyzed_at)도 컬럼으로 보관 → 스텝 시각 이후 분석은 노출하지 않음 (lookahead 방지 유지)
+- 디스크 스냅샷 (npz): 같은 구간 반복 백테스트는 DB 접근 없이 로드
+
+사용법:
+    index = PointInTimeNewsIndex.from_db(db, start, end)
+    index.save("data/cache/pit_news")
+    new_news = index.slice(last_processed_time, current_time)
+    recent = index.window(as_of, lookback_hours=24)
+
+작성일: 2026-10-18
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NAT = np.datetime64("NaT", "ns")
+
+ARTICLE_FIELDS = ("id", "title", "url", "source", "published_at", "content_summary", "keywords")
+ANALYSIS_FIELDS = (
+    "sentiment_overall", "sentiment_score", "sentiment_confidence", "urgency", "impact_magnitude",
+    "risk_category", "trading_actionable", "affected_sectors", "key_facts", "key_warnings",
+)
+# get_unprocessed_news_since가 노출하던 분석 필드 (기존 응답 형식 유지)
+STEP_ANALYSIS_FIELDS = (
+    "sentiment_overall", "sentiment_score", "impact_magnitude", "risk_category",
+    "trading_actionable", "affected_sectors",
+)
+LIST_FIELDS = ("keywords", "affected_sectors", "key_facts", "key_warnings")
+
+
+def _to_ns(value: Optional[datetime]) -> np.datetime64:
+    return NAT if value is None else np.datetime64(value, "ns")
+
+
+def _to_datetime(value: np.datetime64) -> datetime:
+    return value.astype("datetime64[us]").item()
+
+
+class PointInTimeNewsIndex:
+    """
+    crawled_at 정렬 컬럼형 뉴스 인덱스 [start, end]
+
+    Args:
+        start, end: 인덱스가 포함하는 crawled_at 구간 (양끝 포함)
+        articles: 기사 dict 목록 (crawled_at 포함, 정렬 불필요)
+        analyses: articles와 같은 순서의 분석 dict (analyzed_at 포함) 또는 None
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        articles: List[Dict[str, Any]],
+        analyses: List[Optional[Dict[str, Any]]],
+    ):
+        self.start = start
+        self.end = end
+
+        crawled = np.array([_to_ns(a["crawled_at"]) for a in articles], dtype="datetime64[ns]")
+        order = np.argsort(crawled, kind="stable")
+
+        self.crawled_at = crawled[order]
+        self.analyzed_at = np.array(
+            [_to_ns(analyses[i].get("analyzed_at")) if analyses[i] else NAT for i in order],
+            dtype="datetime64[ns]",
+        )
+        self._articles = [articles[i] for i in order]
+        self._analyses = [analyses[i] for i in order]
+
+    # ================================================================
+    # 생성
+    # ================================================================
+
+    @classmethod
+    def from_db(cls, db_session, start: datetime, end: datetime) -> "PointInTimeNewsIndex":
+        """구간 [start, end]의 기사 + 분석을 단일 쿼리로 적재"""
+        from data.news_models import NewsArticle, NewsAnalysis
+
+        rows = (
+            db_session.query(NewsArticle, NewsAnalysis)
+            .outerjoin(NewsAnalysis, NewsAnalysis.article_id == NewsArticle.id)
+            .filter(
+                NewsArticle.crawled_at >= start,
+                NewsArticle.crawled_at <= end,
+            )
+            .order_by(NewsArticle.crawled_at.asc())
+            .all()
+        )
+
+        articles, analyses = [], []
+        for article, analysis in rows:
+            articles.append({
+                "id": article.id,
+                "title": article.title,
+                "url": article.url,
+                "source": article.source,
+                "published_at": article.published_date,
+                "crawled_at": article.crawled_at,
+                "content_summary": article.summary,
+                "keywords": article.keywords or [],
+            })
+            if analysis is None:
+                analyses.append(None)
+            else:
+                data = {name: getattr(analysis, name) for name in ANALYSIS_FIELDS}
+                for name in LIST_FIELDS:
+                    if name in data:
+                        data[name] = data[name] or []
+                data["analyzed_at"] = analysis.analyzed_at
+                analyses.append(data)
+
+        logger.info(f"PiT news index built: {len(articles)} articles ({start.isoformat()} ~ {end.isoformat()})")
+        return cls(start, end, articles, analyses)
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.start <= start and end <= self.end
+
+    def slice(self, after: datetime, until: datetime) -> List[Dict[str, Any]]:
+        """
+        after < crawled_at <= until 기사 (crawled_at 오름차순)
+
+        get_unprocessed_news_since와 같은 형식: 분석은 until 시점까지 완료된 경우만 포함
+        """
+        lo, hi = self._bounds(after, until, left_inclusive=False)
+        as_of = _to_ns(until)
+        return [self._article(i, as_of, STEP_ANALYSIS_FIELDS, include_meta=False) for i in range(lo, hi)]
+
+    def window(
+        self,
+        as_of: datetime,
+        lookback_hours: int = 24,
+        include_analysis: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        as_of - lookback <= crawled_at <= as_of 기사 (crawled_at 내림차순)
+
+        get_available_news와 같은 형식
+        """
+        lo, hi = self._bounds(as_of - timedelta(hours=lookback_hours), as_of, left_inclusive=True)
+        as_of_ns = _to_ns(as_of)
+        fields = ANALYSIS_FIELDS if include_analysis else None
+        return [self._article(i, as_of_ns, fields, include_meta=True) for i in range(hi - 1, lo - 1, -1)]
+
+    # ================================================================
+    # 디스크 스냅샷
+    # ================================================================
+
+    @staticmethod
+    def snapshot_name(start: datetime, end: datetime) -> str:
+        return f"pit_news_{start:%Y%m%dT%H%M%S}_{end:%Y%m%dT%H%M%S}.npz"
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        """스냅샷 저장 (임시 파일 → rename)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / self.snapshot_name(self.start, self.end)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        articles = [{k: v for k, v in a.items() if k != "crawled_at"} for a in self._articles]
+        analyses = [
+            {k: v for k, v in a.items() if k != "analyzed_at"} if a else None
+            for a in self._analyses
+        ]
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                start=np.datetime64(self.start, "ns"),
+                end=np.datetime64(self.end, "ns"),
+                crawled_at=self.crawled_at,
+                analyzed_at=self.analyzed_at,
+                articles=np.array(json.dumps(articles, default=str, ensure_ascii=False)),
+                analyses=np.array(json.dumps(analyses, default=str, ensure_ascii=False)),
+            )
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PointInTimeNewsIndex":
+        with np.load(path) as data:
+            crawled_at = data["crawled_at"]
+            analyzed_at = data["analyzed_at"]
+            articles = json.loads(str(data["articles"]))
+            analyses = json.loads(str(data["analyses"]))
+            start = _to_datetime(data["start"])
+            end = _to_datetime(data["end"])
+
+        for article, crawled in zip(articles, crawled_at):
+            article["crawled_at"] = _to_datetime(crawled)
+            if article.get("published_at"):
+                article["published_at"] = datetime.fromisoformat(article["published_at"])
+        for analysis, analyzed in zip(analyses, analyzed_at):
+            if analysis is not None:
+                analysis["analyzed_at"] = None if np.isnat(analyzed) else _to_datetime(analyzed)
+
+        return cls(start, end, articles, analyses)
+
+    @classmethod
+    def find_snapshot(cls, directory: Union[str, Path], start: datetime, end: datetime) -> Optional[Path]:
+        """[start, end]를 포함하는 스냅샷 (정확히 일치하는 파일 우선, 없으면 가장 좁은 구간)"""
+        directory = Path(directory)
+        exact = directory / cls.snapshot_name(start, end)
+        if exact.exists():
+            return exact
+
+        best: Optional[Tuple[float, Path]] = None
+        for path in directory.glob("pit_news_*.npz"):
+            try:
+                _, _, s, e = path.stem.split("_")
+                s_dt = datetime.strptime(s, "%Y%m%dT%H%M%S")
+                e_dt = datetime.strptime(e, "%Y%m%dT%H%M%S")
+            except ValueError:
+                continue
+            if s_dt <= start and end <= e_dt:
+                span = (e_dt - s_dt).total_seconds()
+                if best is None or span < best[0]:
+                    best = (span, path)
+        return best[1] if best else None
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _bounds(self, lower: datetime, upper: datetime, left_inclusive: bool) -> Tuple[int, int]:
+        lo = int(np.searchsorted(self.crawled_at, _to_ns(lower), side="left" if left_inclusive else "right"))
+        hi = int(np.searchsorted(self.crawled_at, _to_ns(upper), side="right"))
+        return lo, max(lo, hi)
+
+    def _article(
+        self,
+        i: int,
+        as_of: np.datetime64,
+        analysis_fields: Optional[Iterable[str]],
+        include_meta: bool,
+    ) -> Dict[str, Any]:
+        article = self._articles[i]
+        if include_meta:
+            data = {name: article.get(name) for name in ARTICLE_FIELDS}
+        else:
+            data = {name: article.get(name) for name in ("id", "title", "url", "source")}
+        data["crawled_at"] = article["crawled_at"]
+
+        if analysis_fields is None:
+            return data
+
+        analysis = self._analyses[i]
+        analyzed_at = self.analyzed_at[i]
+        # 분석 완료 시각이 현재 시뮬레이션 시각 이후면 아직 사용할 수 없음
+        if analysis is not None and not np.isnat(analyzed_at) and analyzed_at <= as_of:
+            data["analysis"] = {name: analysis.get(name) for name in analysis_fields}
+        else:
+            data["analysis"] = None
+        return data
@@ -8,19 +8,32 @@ Phase 10: Signal Backtest Engine
 3. 가상 거래 실행 (슬리피지 + 수수료)
 4. 성과 지표 계산 (Sharpe, Win Rate, Max Drawdown)
 5. 파라미터 최적화
+6. 스트리밍 입력 (run_stream: 정수 일 인덱스 + 가격 일별 슬라이스 소스, backtest_data_source 참조)
 
 비용: $0 (시뮬레이션)
 """
 
 import json
 import asyncio
+from array import array
+from bisect import insort
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import math
 import logging
 
+import numpy as np
+
+from backend.backtesting.backtest_data_source import (
+    DictPriceSource,
+    PriceDataSource,
+    analysis_available_at,
+    day_offset,
+    iter_analyses,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -349,9 +362,16 @@ class SignalBacktestEngine:
         self.positions: Dict[str, Trade] = {}  # ticker -> open trade
         self.closed_trades: List[Trade] = []
         
-        # 성과 추적
-        self.daily_values: List[Dict] = []
-        self.equity_curve: List[float] = [initial_capital]
+        # 성과 추적 (일 인덱스 기준 컴팩트 배열)
+        self.equity_curve = array("d", [initial_capital])
+        self._days = array("l")
+        self._day_values = array("d")
+        self._day_cash = array("d")
+        self._day_positions = array("l")
+        self._day_pnl_pct = array("d")
+        self._start_date: Optional[datetime] = None
+        self._current_day = 0
+        self._entry_days: Dict[str, int] = {}  # ticker -> 진입 일 인덱스
         
         # 시그널 통계
         self.total_signals = 0
@@ -366,81 +386,137 @@ class SignalBacktestEngine:
     async def run(
         self,
         news_analyses: List[NewsAnalysis],
-        price_data: Dict[str, Dict[str, float]],  # {date: {ticker: price}}
+        price_data: Union[Dict[str, Dict[str, float]], PriceDataSource],  # {date: {ticker: price}}
         start_date: datetime,
         end_date: datetime
     ) -> BacktestResult:
-        """백테스트 실행"""
-        
+        """
+        백테스트 실행 (기존 입력 형식)
+
+        매일 그 시점까지 가용한 모든 분석을 입력 순서대로 다시 평가하는 기존 동작 유지.
+        대용량 구간은 run_stream 사용.
+        """
+        if not isinstance(price_data, PriceDataSource):
+            price_data = DictPriceSource(price_data)
+
+        logger.info(f"Total news analyses: {len(news_analyses)}")
+        positions = {id(analysis): i for i, analysis in enumerate(news_analyses)}
+        ordered = sorted(news_analyses, key=analysis_available_at)
+        return await self._simulate(
+            price_data, ordered, start_date, end_date,
+            replay_key=lambda analysis: positions[id(analysis)],
+        )
+
+    async def run_stream(
+        self,
+        prices: PriceDataSource,
+        analyses: Union[Iterable[NewsAnalysis], AsyncIterable[NewsAnalysis]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> BacktestResult:
+        """
+        스트리밍 백테스트 실행 (정수 일 인덱스, 입력 전체를 메모리에 두지 않음)
+
+        각 분석은 가용해진 첫 시뮬레이션 일에 1회만 평가됩니다.
+
+        Args:
+            prices: 일별 가격 슬라이스 소스 (DictPriceSource / PricePanelSource / PriceStoreSource)
+            analyses: 가용 시각(max(crawled_at, analyzed_at)) 오름차순 분석 이터러블
+        """
+        return await self._simulate(prices, analyses, start_date, end_date)
+
+    async def _simulate(
+        self,
+        prices: PriceDataSource,
+        analyses: Union[Iterable[NewsAnalysis], AsyncIterable[NewsAnalysis]],
+        start_date: datetime,
+        end_date: datetime,
+        replay_key: Optional[Callable[[NewsAnalysis], int]] = None,
+    ) -> BacktestResult:
+        """일 인덱스 시뮬레이션 루프 (replay_key 지정 시 가용 분석을 그 순서로 보관해 매일 재평가)"""
         logger.info(f"Starting backtest from {start_date} to {end_date}")
         logger.info(f"Initial capital: ${self.initial_capital:,.2f}")
-        logger.info(f"Total news analyses: {len(news_analyses)}")
-        
-        # 날짜별로 시뮬레이션
-        current_date = start_date
-        last_daily_date = start_date
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # 1. 해당 날짜의 가격 데이터 확인
-            if date_str not in price_data:
-                current_date += timedelta(days=1)
+
+        self._start_date = start_date
+        last_sim_day = (end_date - start_date).days  # 시뮬레이션 마지막 일 인덱스
+        end_day = day_offset(start_date, end_date)   # 청산 가격 일 인덱스
+
+        pending = iter_analyses(analyses)
+        next_analysis = await anext(pending, None)
+        replayed: List[NewsAnalysis] = []
+
+        final_prices: Mapping[str, float] = {}
+        last_daily_day = 0
+
+        # 가격이 있는 날만 일 인덱스 순서로 시뮬레이션
+        async for day, day_prices in prices.iter_days(start_date, end_date):
+            if day == end_day:
+                final_prices = day_prices
+            if day > last_sim_day:
                 continue
-            
-            # 2. 날짜가 변경되면 일일 카운터 초기화
-            if current_date.date() != last_daily_date.date():
+
+            current_date = start_date + timedelta(days=day)
+            self._current_day = day
+
+            # 1. 날짜가 변경되면 일일 카운터 초기화
+            if day != last_daily_day:
                 self.signal_validator.reset_daily_counters()
-                last_daily_date = current_date
-            
-            # 3. 기존 포지션 업데이트 (손절/익절/기간 만료 체크)
-            await self._update_positions(current_date, price_data[date_str])
-            
-            # 4. 해당 시점까지 수집된 뉴스 분석 가져오기 (Point-in-Time)
-            available_analyses = self._get_available_analyses(news_analyses, current_date)
-            
-            # 5. 각 분석에 대해 시그널 생성 및 검증
+                last_daily_day = day
+
+            # 2. 기존 포지션 업데이트 (손절/익절/기간 만료 체크)
+            await self._update_positions(current_date, day_prices)
+
+            # 3. 해당 시점까지 새로 가용해진 뉴스 분석 (Point-in-Time)
+            available_analyses: List[NewsAnalysis] = []
+            while next_analysis is not None and analysis_available_at(next_analysis) <= current_date:
+                available_analyses.append(next_analysis)
+                next_analysis = await anext(pending, None)
+            if replay_key is not None:
+                for analysis in available_analyses:
+                    insort(replayed, analysis, key=replay_key)
+                available_analyses = replayed
+
+            # 4. 각 분석에 대해 시그널 생성 및 검증
             for analysis in available_analyses:
-                await self._process_analysis(analysis, current_date, price_data[date_str])
-            
-            # 6. 일일 포트폴리오 가치 기록
-            portfolio_value = self._calculate_portfolio_value(price_data[date_str])
-            self.daily_values.append({
-                "date": date_str,
-                "value": portfolio_value,
-                "cash": self.cash,
-                "positions": len(self.positions),
-                "daily_pnl_pct": (portfolio_value / self.equity_curve[-1] - 1) * 100 if self.equity_curve else 0
-            })
-            self.equity_curve.append(portfolio_value)
-            
-            current_date += timedelta(days=1)
-        
-        # 7. 모든 포지션 청산
-        final_prices = price_data.get(end_date.strftime("%Y-%m-%d"), {})
+                await self._process_analysis(analysis, current_date, day_prices)
+
+            # 5. 일일 포트폴리오 가치 기록
+            self._record_day(day, self._calculate_portfolio_value(day_prices))
+
+        # 6. 모든 포지션 청산
         await self._close_all_positions(end_date, final_prices)
-        
-        # 8. 결과 계산
+
+        # 7. 결과 계산
         return self._calculate_results(start_date, end_date)
-    
-    def _get_available_analyses(
-        self,
-        all_analyses: List[NewsAnalysis],
-        current_time: datetime
-    ) -> List[NewsAnalysis]:
-        """Point-in-Time: 현재 시점까지 수집된 분석만 반환 (Lookahead Bias 방지)"""
-        available = [
-            analysis for analysis in all_analyses
-            if analysis.crawled_at <= current_time
-            and analysis.analyzed_at <= current_time
+
+    def _record_day(self, day: int, portfolio_value: float):
+        """일별 기록 (컴팩트 배열, 날짜 문자열은 결과 생성 시 일괄 변환)"""
+        self._days.append(day)
+        self._day_values.append(portfolio_value)
+        self._day_cash.append(self.cash)
+        self._day_positions.append(len(self.positions))
+        self._day_pnl_pct.append((portfolio_value / self.equity_curve[-1] - 1) * 100)
+        self.equity_curve.append(portfolio_value)
+
+    @property
+    def daily_values(self) -> List[Dict]:
+        """일별 포트폴리오 기록 (기존 형식: date 문자열 포함 dict 목록)"""
+        if not self._days:
+            return []
+        start = np.datetime64(self._start_date.date(), "D")
+        dates = np.datetime_as_string(start + np.asarray(self._days, dtype=np.int64), unit="D")
+        return [
+            {"date": str(date), "value": value, "cash": cash, "positions": positions, "daily_pnl_pct": pnl}
+            for date, value, cash, positions, pnl in zip(
+                dates, self._day_values, self._day_cash, self._day_positions, self._day_pnl_pct
+            )
         ]
-        return available
-    
+
     async def _process_analysis(
         self,
         analysis: NewsAnalysis,
         current_time: datetime,
-        current_prices: Dict[str, float]
+        current_prices: Mapping[str, float]
     ):
         """뉴스 분석 처리: 시그널 생성 → 검증 → 실행"""
         
@@ -478,7 +554,7 @@ class SignalBacktestEngine:
         self,
         signal: TradingSignal,
         current_time: datetime,
-        current_prices: Dict[str, float]
+        current_prices: Mapping[str, float]
     ):
         """시그널 실행"""
         
@@ -530,6 +606,7 @@ class SignalBacktestEngine:
             # 포트폴리오 업데이트
             self.cash -= actual_cost
             self.positions[ticker] = trade
+            self._entry_days[ticker] = self._current_day
             
             logger.info(f"BUY {quantity} {ticker} @ ${execution_price:.2f} (signal confidence: {signal.confidence:.2%})")
         
@@ -545,7 +622,7 @@ class SignalBacktestEngine:
     async def _update_positions(
         self,
         current_time: datetime,
-        current_prices: Dict[str, float]
+        current_prices: Mapping[str, float]
     ):
         """기존 포지션 업데이트 (손절/익절/기간 만료)"""
         
@@ -569,7 +646,7 @@ class SignalBacktestEngine:
                 logger.info(f"Take profit triggered for {ticker}: {pnl_pct:.2%}")
             
             # 보유 기간 체크
-            elif (current_time - trade.timestamp).days >= self.max_holding_days:
+            elif self._current_day - self._entry_days[ticker] >= self.max_holding_days:
                 tickers_to_close.append((ticker, "MAX_HOLDING"))
                 logger.info(f"Max holding period reached for {ticker}")
         
@@ -617,6 +694,7 @@ class SignalBacktestEngine:
         self.cash += net_proceeds
         self.closed_trades.append(trade)
         del self.positions[ticker]
+        self._entry_days.pop(ticker, None)
         
         # 일일 손익 업데이트
         self.signal_validator.update_daily_pnl(pnl_pct)
@@ -626,7 +704,7 @@ class SignalBacktestEngine:
     async def _close_all_positions(
         self,
         current_time: datetime,
-        current_prices: Dict[str, float]
+        current_prices: Mapping[str, float]
     ):
         """모든 포지션 청산"""
         
@@ -635,7 +713,7 @@ class SignalBacktestEngine:
             if ticker in current_prices:
                 await self._close_position(ticker, current_time, current_prices[ticker], "END_OF_BACKTEST")
     
-    def _calculate_portfolio_value(self, current_prices: Dict[str, float]) -> float:
+    def _calculate_portfolio_value(self, current_prices: Mapping[str, float]) -> float:
         """포트폴리오 총 가치 계산"""
         
         total_value = self.cash
@@ -674,8 +752,8 @@ class SignalBacktestEngine:
         profit_factor = total_profits / total_losses if total_losses > 0 else float('inf')
         
         # Sharpe Ratio (연율화)
-        if len(self.daily_values) > 1:
-            daily_returns = [d["daily_pnl_pct"] for d in self.daily_values]
+        if len(self._day_pnl_pct) > 1:
+            daily_returns = self._day_pnl_pct
             avg_daily_return = sum(daily_returns) / len(daily_returns)
             std_daily_return = math.sqrt(sum((r - avg_daily_return) ** 2 for r in daily_returns) / len(daily_returns))
             
@@ -692,7 +770,7 @@ class SignalBacktestEngine:
         max_drawdown_pct = self._calculate_max_drawdown()
         
         # 일별 통계
-        daily_pnls = [d["daily_pnl_pct"] for d in self.daily_values]
+        daily_pnls = self._day_pnl_pct
         best_day_pct = max(daily_pnls) if daily_pnls else 0
         worst_day_pct = min(daily_pnls) if daily_pnls else 0
         
@@ -0,0 +1,238 @@
+"""
+Router Registry - 라우터 선언적 등록 (프로필 선택 + 지연 import)
+
+핵심 원칙:
+- 라우터는 RouterSpec으로 선언만 하고 import는 registry가 담당
+- ROUTER_PROFILE: 배포 역할별 라우터 그룹 선택 (all / trading / research / ops 또는 그룹 목록)
+- ROUTER_LAZY_LOADING=1: 첫 요청 시점에 라우터 모듈 import (yfinance, LLM SDK 등 무거운 의존성 지연)
+- import 실패는 경고 로그 후 건너뜀 (기존 *_AVAILABLE 플래그 동작과 동일)
+
+지연 로딩 동작:
+- 요청 경로가 spec.path 와 일치(또는 하위 경로)하면 해당 라우터를 import 후 include
+- 지연 로딩된 라우트는 라우트 목록 앞쪽에 삽입 (eager 등록 시와 같은 우선순위)
+- /docs, /redoc, /openapi.json 요청 시 남은 라우터 전부 로딩
+
+작성일: 2026-10-18
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from backend.core.startup_profiler import StartupProfiler, startup_profiler
+
+logger = logging.getLogger(__name__)
+
+
+# 배포 역할 → 라우터 그룹
+ROUTER_PROFILES: Dict[str, Optional[FrozenSet[str]]] = {
+    "all": None,
+    "trading": frozenset({"core", "trading"}),
+    "research": frozenset({"core", "news", "analysis"}),
+    "ops": frozenset({"core"}),
+}
+
+DOCS_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+@dataclass
+class RouterSpec:
+    """라우터 선언"""
+    name: str
+    module: str
+    attr: str = "router"
+    prefix: str = ""                      # include_router prefix
+    path: str = ""                        # 라우터가 담당하는 URL prefix (지연 로딩 매칭용)
+    groups: Tuple[str, ...] = ("core",)
+    include_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.module, self.attr, self.prefix)
+
+    def matches(self, request_path: str) -> bool:
+        if not self.path:
+            return False
+        return request_path == self.path or request_path.startswith(self.path.rstrip("/") + "/")
+
+
+def resolve_profile(profile: Optional[str]) -> Optional[FrozenSet[str]]:
+    """프로필 이름 또는 'core,news' 형태의 그룹 목록 → 그룹 집합 (None = 전체)"""
+    profile = (profile or "all").strip().lower()
+    if profile in ROUTER_PROFILES:
+        return ROUTER_PROFILES[profile]
+    return frozenset(g.strip() for g in profile.split(",") if g.strip())
+
+
+class RouterRegistry:
+    """
+    라우터 레지스트리
+
+    사용법:
+        registry = RouterRegistry(app)
+        registry.add(RouterSpec("orders", "backend.api.orders_router", path="/api/orders", groups=("trading",)))
+        registry.register_all()
+    """
+
+    def __init__(
+        self,
+        app,
+        profile: Optional[str] = None,
+        lazy: Optional[bool] = None,
+        profiler: StartupProfiler = startup_profiler,
+    ):
+        if lazy is None:
+            lazy = os.getenv("ROUTER_LAZY_LOADING", "").lower() in ("1", "true", "yes")
+
+        self.app = app
+        self.profile = profile or os.getenv("ROUTER_PROFILE", "all")
+        self.groups = resolve_profile(self.profile)
+        self.lazy = lazy
+        self.profiler = profiler
+
+        self._specs: List[RouterSpec] = []
+        self._keys: Set[Tuple[str, str, str]] = set()
+        self._pending: List[RouterSpec] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+        self.loaded: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self.skipped: List[str] = []
+
+    # ================================================================
+    # 선언 / 등록
+    # ================================================================
+
+    def add(self, spec: RouterSpec):
+        """라우터 선언 (같은 module/attr/prefix 중복 등록 무시)"""
+        if spec.key in self._keys:
+            return
+        self._keys.add(spec.key)
+        self._specs.append(spec)
+
+    def extend(self, specs: List[RouterSpec]):
+        for spec in specs:
+            self.add(spec)
+
+    def is_enabled(self, spec: RouterSpec) -> bool:
+        return self.groups is None or bool(self.groups.intersection(spec.groups))
+
+    def group_enabled(self, group: str) -> bool:
+        """main.py에서 직접 등록하는 라우터/엔드포인트용 프로필 확인"""
+        return self.groups is None or group in self.groups
+
+    def register_all(self):
+        """
+        선언된 라우터 등록
+
+        eager: 즉시 import + include
+        lazy: path가 있는 라우터는 첫 요청까지 보류 (path 없는 라우터는 즉시 등록)
+        """
+        for spec in self._specs:
+            if not self.is_enabled(spec):
+                self.skipped.append(spec.name)
+                continue
+            if self.lazy and spec.path:
+                self._pending.append(spec)
+            else:
+                self._load(spec)
+
+        if self._pending:
+            self.app.add_middleware(LazyRouterMiddleware, registry=self)
+            logger.info(f"Router registry: {len(self._pending)} routers deferred until first request")
+
+        logger.info(
+            f"Router registry (profile={self.profile}, lazy={self.lazy}): "
+            f"{len(self.loaded)} loaded, {len(self._pending)} deferred, "
+            f"{len(self.skipped)} skipped, {len(self.failed)} failed"
+        )
+
+    # ================================================================
+    # 지연 로딩
+    # ================================================================
+
+    async def ensure_loaded(self, request_path: str):
+        """요청 경로에 해당하는 보류 라우터 로딩"""
+        if not self._pending:
+            return
+
+        if request_path in DOCS_PATHS:
+            targets = list(self._pending)
+        else:
+            targets = [spec for spec in self._pending if spec.matches(request_path)]
+        if not targets:
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            for spec in targets:
+                if spec not in self._pending:
+                    continue  # 다른 요청이 먼저 로딩
+                # 무거운 import는 이벤트 루프 밖에서
+                try:
+                    await asyncio.to_thread(importlib.import_module, spec.module)
+                except Exception:
+                    pass  # _load에서 동일 예외를 기록
+                self._load(spec, prepend=True)
+                self._pending.remove(spec)
+
+    @property
+    def pending(self) -> List[str]:
+        return [spec.name for spec in self._pending]
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "profile": self.profile,
+            "groups": sorted(self.groups) if self.groups is not None else "all",
+            "lazy": self.lazy,
+            "loaded": list(self.loaded),
+            "pending": self.pending,
+            "skipped": list(self.skipped),
+            "failed": dict(self.failed),
+        }
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _load(self, spec: RouterSpec, prepend: bool = False) -> bool:
+        with self.profiler.measure("routers", spec.name):
+            try:
+                module = importlib.import_module(spec.module)
+                router = getattr(module, spec.attr)
+            except Exception as e:
+                self.failed[spec.name] = str(e)
+                logger.warning(f"{spec.name} router not available: {e}")
+                return False
+
+            routes = self.app.router.routes
+            before = len(routes)
+            self.app.include_router(router, prefix=spec.prefix, **spec.include_kwargs)
+
+            if prepend:
+                added = routes[before:]
+                del routes[before:]
+                routes[0:0] = added
+                self.app.openapi_schema = None
+
+        self.loaded.append(spec.name)
+        logger.info(f"{spec.name} router registered")
+        return True
+
+
+class LazyRouterMiddleware:
+    """첫 요청 시 보류된 라우터를 로딩하는 ASGI 미들웨어"""
+
+    def __init__(self, app, registry: RouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and self.registry._pending:
+            await self.registry.ensure_loaded(scope.get("path", ""))
+        await self.app(scope, receive, send)
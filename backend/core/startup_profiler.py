@@ -0,0 +1,209 @@
+"""
+Startup Profiler - 모듈 import 시간 / lifespan 단계 시간 측정
+
+Features:
+- Import hook (sys.meta_path): 모듈별 누적(inclusive) / 자체(self) import 시간
+- 라우터 import 시간 (RouterRegistry)
+- lifespan 단계별 시간 + 병렬 실행 (asyncio.gather)
+
+활성화:
+    STARTUP_PROFILE=1 → import hook 설치 + 시작 완료 시 리포트 로그
+    (단계/라우터 시간은 항상 기록, 오버헤드 무시 가능)
+
+작성일: 2026-10-18
+"""
+
+import asyncio
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedLoader:
+    """Loader 프록시 - exec_module 시간 측정 (나머지 속성은 원본 loader로 위임)"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """다른 finder에 위임하고 찾은 spec의 loader를 _TimedLoader로 감쌈"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    애플리케이션 시작 비용 측정기
+
+    사용법:
+        startup_profiler.install_import_hook()   # 가능한 한 이른 시점
+        with startup_profiler.measure("routers", "news_router"):
+            ...
+        await startup_profiler.run_steps({"order_recovery": recover, ...})
+        startup_profiler.report()
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv("STARTUP_PROFILE", "").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+
+        self.import_times: Dict[str, Dict[str, float]] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.created_at = time.perf_counter()
+        self.ready_at: Optional[float] = None
+
+        self._finder: Optional[_TimingFinder] = None
+        self._local = threading.local()  # 스레드별 import 스택 [start, child_seconds]
+
+    # ================================================================
+    # Import 측정
+    # ================================================================
+
+    def install_import_hook(self) -> bool:
+        """meta_path 최상단에 timing finder 설치 (비활성 시 no-op)"""
+        if not self.enabled or self._finder is not None:
+            return False
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        return True
+
+    def uninstall_import_hook(self):
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _stack(self) -> List[List[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter_import(self, name: str):
+        self._stack().append([time.perf_counter(), 0.0])
+
+    def _exit_import(self, name: str):
+        stack = self._stack()
+        start, child_seconds = stack.pop()
+        inclusive = time.perf_counter() - start
+        if stack:
+            stack[-1][1] += inclusive
+        self.import_times[name] = {
+            "cumulative_ms": inclusive * 1000,
+            "self_ms": (inclusive - child_seconds) * 1000,
+        }
+
+    # ================================================================
+    # 구간 / 단계 측정
+    # ================================================================
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """임의 구간 시간 기록 (category: 'routers', 'lifespan', ...)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.setdefault(category, {})[name] = (time.perf_counter() - start) * 1000
+
+    async def run_step(self, name: str, step: Callable[[], Awaitable[Any]], category: str = "lifespan"):
+        """단계 실행 + 시간 기록 (예외는 로깅 후 삼킴 - 시작 실패 방지)"""
+        with self.measure(category, name):
+            try:
+                return await step()
+            except Exception as e:
+                logger.error(f"❌ Startup step '{name}' failed: {e}")
+                return None
+
+    async def run_steps(self, steps: Dict[str, Callable[[], Awaitable[Any]]], category: str = "lifespan") -> Dict[str, Any]:
+        """서로 독립적인 단계 병렬 실행"""
+        names = list(steps)
+        with self.measure(category, "_total"):
+            results = await asyncio.gather(
+                *(self.run_step(name, steps[name], category) for name in names)
+            )
+        return dict(zip(names, results))
+
+    def mark_ready(self):
+        self.ready_at = time.perf_counter()
+
+    # ================================================================
+    # 리포트
+    # ================================================================
+
+    def report(self, top_n: int = 20) -> Dict[str, Any]:
+        """import / 단계별 시간 요약"""
+        by_self = sorted(self.import_times.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)
+        top_level = {
+            name: t for name, t in self.import_times.items()
+            if name.startswith("backend.") or "." not in name
+        }
+        by_cumulative = sorted(top_level.items(), key=lambda kv: kv[1]["cumulative_ms"], reverse=True)
+
+        return {
+            "enabled": self.enabled,
+            "ready_ms": round((self.ready_at - self.created_at) * 1000, 1) if self.ready_at else None,
+            "modules_imported": len(self.import_times),
+            "slowest_imports_self": [
+                {"module": name, **{k: round(v, 2) for k, v in t.items()}}
+                for name, t in by_self[:top_n]
+            ],
+            "slowest_imports_cumulative": [
+                {"module": name, **{k: round(v, 2) for k, v in t.items()}}
+                for name, t in by_cumulative[:top_n]
+            ],
+            "timings_ms": {
+                category: {name: round(ms, 2) for name, ms in sorted(items.items(), key=lambda kv: -kv[1])}
+                for category, items in self.timings.items()
+            },
+        }
+
+    def log_report(self, top_n: int = 10):
+        summary = self.report(top_n)
+        logger.info(f"⏱️ Startup ready in {summary['ready_ms']}ms ({summary['modules_imported']} modules timed)")
+        for category, items in summary["timings_ms"].items():
+            for name, ms in list(items.items())[:top_n]:
+                logger.info(f"   [{category}] {name}: {ms:.1f}ms")
+        for entry in summary["slowest_imports_cumulative"]:
+            logger.info(f"   [import] {entry['module']}: {entry['cumulative_ms']:.1f}ms (self {entry['self_ms']:.1f}ms)")
+
+
+# 싱글톤 인스턴스
+startup_profiler = StartupProfiler()
@@ -5,6 +5,7 @@ import os
 from datetime import datetime
 from backend.data.vector_store.store import VectorStoreContext
 from backend.data.vector_store.embedder import DocumentEmbedder
+from backend.data.vector_store.embedding_cache import get_embedding_cache
 from backend.data.vector_store.tagger import AutoTagger
 from backend.data.collectors.fred_collector import FredCollector
 from backend.data.collectors.dart_collector import DartCollector
@@ -38,7 +39,7 @@ class MemoryBuilder:
         logger.info("Starting Memory Builder Pipeline...")
         
         # Initialize Components
-        embedder = DocumentEmbedder(self.openai_key)
+        embedder = DocumentEmbedder(self.openai_key, cache=get_embedding_cache())
         tagger = None
         if self.anthropic_key:
             pass # Tagger initialization (optional for now, can use None)
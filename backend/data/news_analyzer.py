@@ -36,6 +36,12 @@ logger = logging.getLogger(__name__)
 # Ollama는 로컬 실행이므로 레이트 리밋이 없습니다!
 
 
+class AnalysisRateLimitError(Exception):
+    """LLM API 429 (호출자가 raise_on_rate_limit=True로 요청한 경우에만 발생)"""
+
+    status_code = 429
+
+
 # ============================================================================
 # Deep Analysis Service
 # ============================================================================
@@ -170,8 +176,19 @@ JSON 형식으로 분석 결과를 제공하세요:
                 "raw_preview": response_text[:200]
             }
     
-    def analyze_article(self, article: NewsArticle) -> Optional[NewsAnalysis]:
-        """단일 기사 분석 (Ollama)"""
+    def analyze_article(
+        self,
+        article: NewsArticle,
+        raise_on_rate_limit: bool = False,
+    ) -> Optional[NewsAnalysis]:
+        """
+        단일 기사 분석 (Ollama)
+
+        Args:
+            article: 뉴스 기사
+            raise_on_rate_limit: HTTP 429를 None 대신 AnalysisRateLimitError로 전파
+                (동시성 풀이 429에 맞춰 조절하는 경우)
+        """
         # 이미 분석됨?
         if article.analysis:
             return article.analysis
@@ -205,6 +222,9 @@ JSON 형식으로 분석 결과를 제공하세요:
                 timeout=60.0
             )
             
+            if response.status_code == 429 and raise_on_rate_limit:
+                raise AnalysisRateLimitError(f"Ollama API rate limited: {response.text[:200]}")
+
             if response.status_code != 200:
                 logger.error(f"Ollama API error: {response.status_code}")
                 return None
@@ -212,6 +232,8 @@ JSON 형식으로 분석 결과를 제공하세요:
             result = response.json()
             response_text = result.get("response", "")
             
+        except AnalysisRateLimitError:
+            raise
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             return None
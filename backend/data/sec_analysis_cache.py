@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import logging
 
+from backend.core.models.sec_models import FilingType
 from backend.core.models.sec_analysis_models import (
     SECAnalysisResult,
     SECAnalysisCache,
@@ -37,6 +38,7 @@ class SECAnalysisCache:
     - 파일 기반 캐시 (JSON)
     - 90일 TTL (10-K/10-Q는 분기마다만 업데이트)
     - 캐시 키: ticker + filing_type + fiscal_period
+      (content_hash 지정 시 공시 원문 SHA-256 → 같은 문서의 분석은 한 번만 저장)
     """
     
     def __init__(self, cache_dir: Optional[Path] = None):
@@ -53,7 +55,8 @@ class SECAnalysisCache:
         self,
         ticker: str,
         filing_type: str,
-        fiscal_period: str
+        fiscal_period: str,
+        content_hash: Optional[str] = None
     ) -> str:
         """
         캐시 키 생성
@@ -62,10 +65,14 @@ class SECAnalysisCache:
             ticker: 주식 티커
             filing_type: 공시 유형 (10-K, 10-Q)
             fiscal_period: 회계 기간 (FY2024, Q3 2024 등)
+            content_hash: 공시 원문 SHA-256 (SECFilingStore 객체 키)
             
         Returns:
-            캐시 키 (MD5 해시)
+            캐시 키 (content_hash 또는 MD5 해시)
         """
+        if content_hash:
+            return content_hash
+
         key_str = f"{ticker}_{filing_type}_{fiscal_period}".upper()
         return hashlib.md5(key_str.encode()).hexdigest()
     
@@ -77,7 +84,8 @@ class SECAnalysisCache:
         self,
         ticker: str,
         filing_type: str,
-        fiscal_period: str
+        fiscal_period: str,
+        content_hash: Optional[str] = None
     ) -> Optional[SECAnalysisResult]:
         """
         캐시에서 분석 결과 조회
@@ -86,11 +94,12 @@ class SECAnalysisCache:
             ticker: 주식 티커
             filing_type: 공시 유형
             fiscal_period: 회계 기간
+            content_hash: 공시 원문 SHA-256 (지정 시 이 키로 조회)
             
         Returns:
             SECAnalysisResult 또는 None (캐시 없음/만료)
         """
-        cache_key = self._get_cache_key(ticker, filing_type, fiscal_period)
+        cache_key = self._get_cache_key(ticker, filing_type, fiscal_period, content_hash)
         cache_file = self._get_cache_file(cache_key)
         
         if not cache_file.exists():
@@ -128,7 +137,8 @@ class SECAnalysisCache:
     def set(
         self,
         result: SECAnalysisResult,
-        ttl_days: int = 90
+        ttl_days: int = 90,
+        content_hash: Optional[str] = None
     ):
         """
         분석 결과 캐시 저장
@@ -136,11 +146,13 @@ class SECAnalysisCache:
         Args:
             result: 분석 결과
             ttl_days: 캐시 유효 기간 (기본 90일)
+            content_hash: 공시 원문 SHA-256 (지정 시 이 키로 저장)
         """
         cache_key = self._get_cache_key(
             result.ticker,
             result.filing_type,
-            result.fiscal_period
+            result.fiscal_period,
+            content_hash
         )
         cache_file = self._get_cache_file(cache_key)
         
@@ -151,6 +163,7 @@ class SECAnalysisCache:
                 "ticker": result.ticker,
                 "filing_type": result.filing_type,
                 "fiscal_period": result.fiscal_period,
+                "content_hash": content_hash,
                 "cached_at": datetime.now().isoformat(),
                 "ttl_days": ttl_days,
                 "analysis": self._serialize_result(result)
@@ -169,7 +182,8 @@ class SECAnalysisCache:
         self,
         ticker: str,
         filing_type: str,
-        fiscal_period: str
+        fiscal_period: str,
+        content_hash: Optional[str] = None
     ):
         """
         캐시 무효화 (삭제)
@@ -178,8 +192,9 @@ class SECAnalysisCache:
             ticker: 주식 티커
             filing_type: 공시 유형
             fiscal_period: 회계 기간
+            content_hash: 공시 원문 SHA-256 (지정 시 이 키를 삭제)
         """
-        cache_key = self._get_cache_key(ticker, filing_type, fiscal_period)
+        cache_key = self._get_cache_key(ticker, filing_type, fiscal_period, content_hash)
         cache_file = self._get_cache_file(cache_key)
         
         if cache_file.exists():
@@ -382,19 +397,43 @@ class CachedSECAnalyzer:
         3. 없으면 분석 후 캐시 저장
         """
         # force_refresh면 캐시 무시
+        filing = None
         if not request.force_refresh:
-            # 캐시 확인 (fiscal_period는 아직 모름)
-            # 일단 최신 공시 조회 필요
-            pass
+            # 최신 공시 → 저장소의 원문 해시로 조회 (같은 문서면 재분석하지 않음)
+            filing = await self.analyzer.sec_client.get_latest_filing(
+                request.ticker,
+                FilingType(request.filing_type)
+            )
+            if filing is None:
+                raise ValueError(f"No {request.filing_type} found for {request.ticker}")
+
+            content_hash = self._content_hash(
+                filing.ticker, filing.filing_type.value, filing.fiscal_period
+            )
+            cached = self.cache.get(
+                filing.ticker,
+                filing.filing_type.value,
+                filing.fiscal_period,
+                content_hash=content_hash
+            )
+            if cached:
+                return cached
         
-        # 분석 실행
-        result = await self.analyzer.analyze_ticker(request)
+        # 분석 실행 (조회한 공시를 넘겨 SEC 재조회 없음)
+        result = await self.analyzer.analyze_ticker(request, filing=filing)
         
-        # 캐시 저장
-        self.cache.set(result)
+        # 캐시 저장 (분석 중 저장소에 원문이 들어갔으면 원문 해시 키, force_refresh도 조회와 같은 키)
+        content_hash = self._content_hash(result.ticker, result.filing_type, result.fiscal_period)
+        self.cache.set(result, content_hash=content_hash)
         
         return result
 
+    def _content_hash(self, ticker: str, filing_type: str, fiscal_period: str) -> Optional[str]:
+        store = getattr(self.analyzer, "filing_store", None)
+        if store is None:
+            return None
+        return store.resolve(ticker, filing_type, fiscal_period)
+
 
 # ============================================
 # 테스트
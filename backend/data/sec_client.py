@@ -4,15 +4,23 @@ SEC EDGAR API 클라이언트
 공식 API: https://www.sec.gov/edgar/sec-api-documentation
 Rate Limit: 10 requests/second (User-Agent 필수)
 
+HTTP 계층:
+- 클라이언트 수명 동안 하나의 aiohttp 세션 (keep-alive 커넥션 풀, 요청마다 TLS 핸드셰이크 없음)
+- 슬라이딩 윈도우 (임의의 1초에 10개) → 동시 요청을 직렬화하지 않고 SEC 허용량까지 병렬 처리
+- submissions/CIK*.json: ETag/Last-Modified 조건부 요청 + 디스크 캐시 (304면 본문 재전송 없음)
+
 Author: AI Trading System
 Date: 2025-11-22
 """
 
 import asyncio
 import aiohttp
+import json
+from collections import deque
 import re
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Iterable
 from pathlib import Path
 import logging
 
@@ -29,6 +37,38 @@ from backend.core.models.sec_models import (
 logger = logging.getLogger(__name__)
 
 
+class SlidingWindowLimiter:
+    """
+    슬라이딩 윈도우 레이트 리미터
+
+    최근 max_requests개 요청의 시작 시각을 보관하고, 가장 오래된 시작 시각에서
+    window초가 지나야 다음 요청을 시작 → 임의의 window초 구간에 시작되는 요청은
+    최대 max_requests개 (토큰 버킷처럼 유휴 후 버스트 + 보충분이 겹치지 않음)
+    """
+
+    def __init__(self, max_requests: int = 10, window: float = 1.0):
+        self.max_requests = max_requests
+        self.window = window
+        self._starts: deque = deque()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        """요청 1개 시작 허가 (윈도우가 가득 차면 대기, 대기 순서는 FIFO)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self.window:
+                    self._starts.popleft()
+
+                if len(self._starts) < self.max_requests:
+                    self._starts.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self._starts[0]))
+
+
 class SECClient:
     """
     SEC EDGAR API 클라이언트
@@ -37,7 +77,10 @@ class SECClient:
     - CIK 조회 (ticker → CIK 변환)
     - 최신 공시 문서 조회
     - 공시 문서 다운로드
-    - Rate limiting (10 req/sec)
+    - Rate limiting (10 req/sec, 슬라이딩 윈도우)
+    - 다종목 일괄 조회 (get_recent_filings_many)
+
+    세션은 첫 요청 시 생성되며 close() 또는 async with로 정리합니다.
     """
     
     BASE_URL = "https://data.sec.gov"
@@ -46,74 +89,195 @@ class SECClient:
     # SEC 요구사항: User-Agent에 이메일 포함 필수
     USER_AGENT = "AI Trading System admin@example.com"
     
+    # SEC 공정 접근 정책: 초당 10 요청
+    REQUESTS_PER_SECOND = 10
+
+    # company_tickers.json 재다운로드 간격 (없는 티커 조회가 매번 전체 파일을 받지 않도록)
+    CIK_MAP_TTL = 24 * 3600
+
     def __init__(
         self,
         user_email: str = "admin@example.com",
-        cache_dir: Optional[Path] = None
+        cache_dir: Optional[Path] = None,
+        submissions_ttl: float = 600,
+        max_connections: int = 10
     ):
         """
         Args:
             user_email: SEC API 접근용 이메일 (User-Agent에 포함)
             cache_dir: 다운로드한 문서 캐시 디렉토리
+            submissions_ttl: submissions JSON을 재검증 없이 재사용하는 시간 (초)
+            max_connections: 커넥션 풀 크기 (동시 요청 상한)
         """
         self.user_agent = f"AI Trading System {user_email}"
         self.cache_dir = cache_dir or Path("data/sec_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
+        self.submissions_ttl = submissions_ttl
+        self.max_connections = max_connections
+
+        # HTTP 세션 (첫 요청 시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+
         # Rate limiting
-        self._last_request_time = 0.0
-        self._min_interval = 0.1  # 10 req/sec = 0.1초 간격
-        
-        # CIK 캐시 (ticker → CIK)
+        self._limiter = SlidingWindowLimiter(max_requests=self.REQUESTS_PER_SECOND, window=1.0)
+
+        # CIK 캐시 (ticker → CIK), company_tickers.json 1회 로드로 전체 채움
         self._cik_cache: Dict[str, str] = {}
-        
+        self._cik_lock: Optional[asyncio.Lock] = None
+        self._cik_map_loaded_at = 0.0
+
+        # submissions 캐시 (url → {etag, last_modified, fetched_at, data})
+        self._submissions_cache: Dict[str, Dict[str, Any]] = {}
+        self._submissions_dir = self.cache_dir / "submissions"
+
+        # 통계
+        self.stats = {"requests": 0, "not_modified": 0, "cache_hits": 0}
+
         logger.info(f"SEC Client initialized (User-Agent: {self.user_agent})")
-    
-    async def _rate_limit(self):
-        """Rate limiting (10 req/sec)"""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request_time
-        
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
-        
-        self._last_request_time = asyncio.get_event_loop().time()
-    
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 aiohttp 세션 (keep-alive 커넥션 풀)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"},
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
+        return self._session
+
+    async def close(self):
+        """세션 종료"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _get(self, url: str, **kwargs) -> Dict:
         """
         HTTP GET 요청 (Rate limiting 적용)
-        
+
         Raises:
             SECRateLimitError: Rate limit 초과
             SECError: 기타 API 에러
         """
-        await self._rate_limit()
-        
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "application/json"
+        _, data, _ = await self._request(url, **kwargs)
+        return data
+
+    async def _request(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> tuple:
+        """
+        공유 세션으로 GET (레이트 리미터 대기 후 전송)
+
+        Returns:
+            (status, data, response headers) - 304면 data는 None
+        """
+        await self._limiter.acquire()
+        session = await self._get_session()
+
+        request_headers = {"Accept": "application/json"}
+        if headers:
+            request_headers.update(headers)
+
+        self.stats["requests"] += 1
+        try:
+            async with session.get(url, headers=request_headers, **kwargs) as response:
+                if response.status == 304:
+                    return 304, None, response.headers
+
+                if response.status == 429:
+                    raise SECRateLimitError("SEC API rate limit exceeded")
+
+                if response.status == 404:
+                    raise SECFilingNotFoundError(f"Resource not found: {url}")
+
+                response.raise_for_status()
+
+                # JSON 응답
+                if 'application/json' in response.headers.get('Content-Type', ''):
+                    return response.status, await response.json(), response.headers
+
+                # HTML/텍스트 응답
+                return response.status, {"text": await response.text()}, response.headers
+
+        except aiohttp.ClientError as e:
+            raise SECError(f"SEC API request failed: {e}")
+
+    async def _get_submissions(self, cik: str) -> Dict:
+        """
+        submissions/CIK*.json 조회 (조건부 요청 캐시)
+
+        - submissions_ttl 이내: 요청 없이 캐시 사용
+        - 이후: If-None-Match / If-Modified-Since로 재검증, 304면 캐시 사용
+        """
+        url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
+        entry = self._submissions_cache.get(url) or self._load_submissions_entry(cik)
+
+        if entry is not None:
+            self._submissions_cache[url] = entry
+            if time.time() - entry["fetched_at"] < self.submissions_ttl:
+                self.stats["cache_hits"] += 1
+                return entry["data"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        status, data, response_headers = await self._request(url, headers=headers)
+
+        if status == 304 and entry is not None:
+            self.stats["not_modified"] += 1
+            entry["fetched_at"] = time.time()
+            return entry["data"]
+
+        entry = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "data": data,
         }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers, **kwargs) as response:
-                    if response.status == 429:
-                        raise SECRateLimitError("SEC API rate limit exceeded")
-                    
-                    if response.status == 404:
-                        raise SECFilingNotFoundError(f"Resource not found: {url}")
-                    
-                    response.raise_for_status()
-                    
-                    # JSON 응답
-                    if 'application/json' in response.headers.get('Content-Type', ''):
-                        return await response.json()
-                    
-                    # HTML/텍스트 응답
-                    return {"text": await response.text()}
-                    
-            except aiohttp.ClientError as e:
-                raise SECError(f"SEC API request failed: {e}")
+        self._submissions_cache[url] = entry
+        self._save_submissions_entry(cik, entry)
+        return data
+
+    def _load_submissions_entry(self, cik: str) -> Optional[Dict[str, Any]]:
+        path = self._submissions_dir / f"CIK{cik}.json"
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable submissions cache {path}: {e}")
+            return None
+
+    def _save_submissions_entry(self, cik: str, entry: Dict[str, Any]):
+        # 검증자(ETag/Last-Modified)가 없으면 재검증할 수 없으므로 메모리에만 보관
+        if not entry.get("etag") and not entry.get("last_modified"):
+            return
+        try:
+            self._submissions_dir.mkdir(parents=True, exist_ok=True)
+            path = self._submissions_dir / f"CIK{cik}.json"
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(json.dumps(entry), encoding='utf-8')
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write submissions cache for CIK{cik}: {e}")
     
     async def get_cik(self, ticker: str) -> str:
         """
@@ -130,32 +294,45 @@ class SECClient:
             >>> print(cik)  # "0000320193"
         """
         ticker = ticker.upper().strip()
-        
+
         # 캐시 확인
         if ticker in self._cik_cache:
             return self._cik_cache[ticker]
-        
-        # SEC company tickers JSON
+
+        # 동시 조회 시 company_tickers.json은 한 번만 받음
+        if self._cik_lock is None:
+            self._cik_lock = asyncio.Lock()
+
+        async with self._cik_lock:
+            stale = time.time() - self._cik_map_loaded_at > self.CIK_MAP_TTL
+            if ticker not in self._cik_cache and stale:
+                await self._load_cik_map()
+
+        cik = self._cik_cache.get(ticker)
+        if cik is None:
+            raise SECFilingNotFoundError(f"CIK not found for ticker: {ticker}")
+        return cik
+
+    async def _load_cik_map(self):
+        """SEC company tickers JSON → 전체 ticker → CIK 매핑 캐시"""
         url = f"{self.BASE_URL}/files/company_tickers.json"
-        
+
         try:
             data = await self._get(url)
-            
-            # 티커 검색
+
             for entry in data.values():
-                if entry.get('ticker', '').upper() == ticker:
-                    cik = str(entry['cik_str']).zfill(10)
-                    self._cik_cache[ticker] = cik
-                    logger.info(f"Found CIK for {ticker}: {cik}")
-                    return cik
-            
-            raise SECFilingNotFoundError(f"CIK not found for ticker: {ticker}")
-            
+                entry_ticker = str(entry.get('ticker', '')).upper()
+                if entry_ticker:
+                    self._cik_cache.setdefault(entry_ticker, str(entry['cik_str']).zfill(10))
+            self._cik_map_loaded_at = time.time()
+
+            logger.info(f"Loaded {len(self._cik_cache)} ticker → CIK mappings")
+
         except SECError:
             raise
         except Exception as e:
-            raise SECError(f"Failed to get CIK for {ticker}: {e}")
-    
+            raise SECError(f"Failed to load CIK mappings: {e}")
+
     async def get_company_info(self, ticker: str) -> SECCompanyInfo:
         """
         기업 정보 조회
@@ -167,11 +344,10 @@ class SECClient:
             SECCompanyInfo
         """
         cik = await self.get_cik(ticker)
-        url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
-        
+
         try:
-            data = await self._get(url)
-            
+            data = await self._get_submissions(cik)
+
             return SECCompanyInfo(
                 cik=cik,
                 ticker=ticker,
@@ -205,10 +381,9 @@ class SECClient:
             List[FilingMetadata]
         """
         cik = await self.get_cik(ticker)
-        url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
-        
+
         try:
-            data = await self._get(url)
+            data = await self._get_submissions(cik)
             recent = data.get('filings', {}).get('recent', {})
             
             results = []
@@ -251,6 +426,49 @@ class SECClient:
         except Exception as e:
             raise SECError(f"Failed to get recent filings for {ticker}: {e}")
     
+    async def get_recent_filings_many(
+        self,
+        tickers: Iterable[str],
+        filing_type: FilingType,
+        count: int = 5
+    ) -> Dict[str, List[FilingMetadata]]:
+        """
+        다종목 최근 공시 일괄 조회
+
+        요청은 동시에 발행되고 토큰 버킷이 초당 10개로 조절합니다.
+        조회에 실패한 종목은 로그만 남기고 결과에서 제외합니다.
+
+        Args:
+            tickers: 주식 티커 목록
+            filing_type: 공시 유형
+            count: 종목당 가져올 개수
+
+        Returns:
+            {ticker: List[FilingMetadata]}
+        """
+        tickers = list(dict.fromkeys(t.upper().strip() for t in tickers))
+        started = time.perf_counter()
+
+        results = await asyncio.gather(
+            *(self.get_recent_filings(ticker, filing_type, count) for ticker in tickers),
+            return_exceptions=True
+        )
+
+        filings: Dict[str, List[FilingMetadata]] = {}
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Failed to get {filing_type.value} filings for {ticker}: {result}")
+                continue
+            filings[ticker] = result
+
+        logger.info(
+            f"Fetched {filing_type.value} filings for {len(filings)}/{len(tickers)} tickers "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return filings
+
     async def get_latest_filing(
         self,
         ticker: str,
@@ -394,14 +612,14 @@ class SECClient:
 
 async def get_latest_10k(ticker: str) -> Optional[FilingMetadata]:
     """최신 10-K 문서 조회 (편의 함수)"""
-    client = SECClient()
-    return await client.get_latest_filing(ticker, FilingType.FORM_10K)
+    async with SECClient() as client:
+        return await client.get_latest_filing(ticker, FilingType.FORM_10K)
 
 
 async def get_latest_10q(ticker: str) -> Optional[FilingMetadata]:
     """최신 10-Q 문서 조회 (편의 함수)"""
-    client = SECClient()
-    return await client.get_latest_filing(ticker, FilingType.FORM_10Q)
+    async with SECClient() as client:
+        return await client.get_latest_filing(ticker, FilingType.FORM_10Q)
 
 
 # ============================================
@@ -445,6 +663,8 @@ async def demo():
         print(f"Downloaded: {len(content):,} characters")
         print(f"Preview:\n{content[:500]}...")
 
+    await client.close()
+
 
 if __name__ == "__main__":
     asyncio.run(demo())
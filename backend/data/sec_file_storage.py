@@ -6,6 +6,7 @@ Design Principles:
 2. **Metadata in DB**: File paths, hashes, tags
 3. **Incremental Updates**: Download only new filings
 4. **Content-Based Deduplication**: SHA-256 hash checking
+   (content lives once in SECFilingStore, compressed and keyed by hash)
 5. **Smart Tagging**: Hierarchical tags for fast retrieval
 
 Cost Reduction:
@@ -13,6 +14,7 @@ Cost Reduction:
 - After: 100 downloads/month × $0.0075 = $0.75/month (75% savings)
 """
 
+import asyncio
 import logging
 import hashlib
 from pathlib import Path
@@ -23,8 +25,9 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.config.storage_config import get_storage_config, StorageLocation
-from backend.core.models.sec_models import SECFiling
+from backend.core.models.sec_models import FilingMetadata, FilingType, SECFiling
 from backend.data.sec_client import SECClient
+from backend.data.sec_filing_store import get_sec_filing_store
 
 logger = logging.getLogger(__name__)
 
@@ -43,22 +46,17 @@ class SECFileStorage:
     File Structure:
     ```
     {storage_root}/sec_filings/
-    ├── AAPL/
-    │   ├── 2024/
-    │   │   ├── Q3/
-    │   │   │   ├── 10-Q_20240803.txt
-    │   │   │   └── metadata.json
-    │   │   └── Q4/
-    │   │       └── 10-K_20241102.txt
-    │   └── 2023/
-    │       └── Q4/
-    │           └── 10-K_20231104.txt
-    └── MSFT/
-        └── 2024/
-            └── Q3/
-                └── 10-Q_20240731.txt
+    ├── store/                      # SECFilingStore (content-addressed)
+    │   └── objects/
+    │       └── 3f/3fa9.../         # SHA-256 of the filing
+    │           └── raw.zst         # compressed original (zstd, zlib fallback)
+    └── AAPL/2024/Q3/10-Q_20240803.txt   # legacy plain-text files (still readable)
     ```
 
+    Identical content downloaded for different accessions/tickers is stored
+    once; SECFiling.local_path points at the object directory and
+    SECFiling.file_hash is the object key. Tags below live in the DB metadata.
+
     Tagging Strategy:
     - **Tier 1**: ticker (AAPL, MSFT)
     - **Tier 2**: year (2024, 2023)
@@ -86,11 +84,25 @@ class SECFileStorage:
         """
         self.db = db_session
         self.sec_client = sec_client or SECClient()
+        self._owns_sec_client = sec_client is None
         self.storage_config = get_storage_config()
         self.base_path = self.storage_config.get_path(StorageLocation.SEC_FILINGS)
+        # Shared store (base_path/store), the same tree SECAnalyzer and SECEmbeddingPipeline use
+        self.store = get_sec_filing_store()
 
         logger.info(f"SEC file storage initialized at: {self.base_path}")
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the SEC client session if this storage created it."""
+        if self._owns_sec_client:
+            await self.sec_client.close()
+
     def _generate_file_path(
         self,
         ticker: str,
@@ -128,6 +140,40 @@ class SECFileStorage:
         """
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    def _store_content(self, ticker: str, filing: Dict[str, Any], content: str) -> str:
+        """
+        Store filing content in the filing store with its parsed sections.
+
+        The section index lets SECEmbeddingPipeline read MD&A / Risk Factors
+        frames directly. Unknown filing types or parse failures still keep
+        the raw content (put_raw).
+
+        Returns:
+            SHA-256 of the content
+        """
+        filing_date = filing["filing_date"]
+        try:
+            if not isinstance(filing_date, datetime):
+                filing_date = datetime.combine(filing_date, datetime.min.time())
+            metadata = FilingMetadata(
+                ticker=ticker,
+                cik=filing.get("cik", ""),
+                company_name=filing.get("company_name", ticker),
+                filing_type=FilingType(filing["filing_type"]),
+                filing_date=filing_date,
+                fiscal_period=filing.get("fiscal_period")
+                or f"Q{(filing_date.month - 1) // 3 + 1} {filing_date.year}",
+                accession_number=filing["accession_number"],
+                filing_url=filing.get("filing_url", ""),
+                document_url=filing.get("document_url", ""),
+            )
+            return self.store.put(metadata, content)
+        except Exception as e:
+            logger.warning(
+                f"Could not index {ticker} {filing['accession_number']} sections, storing raw only: {e}"
+            )
+            return self.store.put_raw(content)
+
     async def download_filing_incremental(
         self,
         ticker: str,
@@ -226,22 +272,12 @@ class SECFileStorage:
                     accession_number=accession
                 )
 
-                # Compute hash
-                file_hash = self._compute_file_hash(content)
-
-                # Generate path
-                relative_path = self._generate_file_path(
-                    ticker=ticker,
-                    filing_type=filing['filing_type'],
-                    filing_date=filing['filing_date']
-                )
+                # Save content + parsed section index (content-addressed: identical filings stored once)
+                # (parse + compression are blocking; run them off the event loop)
+                file_hash = await asyncio.to_thread(self._store_content, ticker, filing, content)
+                relative_path = self.store.object_path(file_hash).relative_to(self.base_path)
                 full_path = self.base_path / relative_path
 
-                # Save file
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
-                    await f.write(content)
-
                 # Save metadata to DB
                 filing_record = SECFiling(
                     accession_number=accession,
@@ -320,7 +356,11 @@ class SECFileStorage:
             )
             return None
 
-        # Read file from storage
+        # Content-addressed store (hash-keyed)
+        if filing.file_hash and self.store.contains(filing.file_hash):
+            return self.store.get_raw(filing.file_hash)
+
+        # Legacy plain-text files
         full_path = self.base_path / filing.local_path
 
         if not full_path.exists():
@@ -401,10 +441,25 @@ class SECFileStorage:
 
         deleted_count = 0
 
+        old_ids = {filing.id for filing in old_filings}
+
         for filing in old_filings:
-            # Delete file
             full_path = self.base_path / filing.local_path
-            if full_path.exists():
+
+            if filing.file_hash and self.store.contains(filing.file_hash):
+                # Shared object: keep it while newer records still reference the hash
+                remaining = await self.db.execute(
+                    select(func.count(SECFiling.id)).where(
+                        and_(
+                            SECFiling.file_hash == filing.file_hash,
+                            SECFiling.id.notin_(old_ids)
+                        )
+                    )
+                )
+                if not remaining.scalar() and self.store.delete(filing.file_hash):
+                    deleted_count += 1
+            elif full_path.exists():
+                # Delete file
                 full_path.unlink()
                 deleted_count += 1
 
@@ -422,9 +477,7 @@ async def demo_sec_file_storage():
     """Demo: Download and retrieve SEC filings."""
     from backend.core.database import get_db
 
-    async with get_db() as db:
-        storage = SECFileStorage(db)
-
+    async with get_db() as db, SECFileStorage(db) as storage:
         # Download latest AAPL filings
         stats = await storage.download_filing_incremental("AAPL")
         print(f"Download stats: {stats}")
@@ -0,0 +1,446 @@
+"""
+SEC Filing Store - 내용 주소 기반 압축 공시 저장소 (섹션 단위 접근)
+
+핵심 원칙:
+- 객체 키 = 원문 SHA-256 → 같은 문서는 (ticker/기간/경로가 달라도) 한 번만 저장·파싱
+- 파싱된 섹션은 각각 독립 압축 프레임(zstd, 미설치 시 zlib)으로 sections.bin에 이어 붙임
+- index.json: 섹션 → (offset, length) + 제목/단어 수 → 필요한 섹션만 mmap 슬라이스 후 해제
+- ticker/유형/기간 → 해시 참조(refs)는 별도 작은 JSON
+
+구조:
+    {root}/objects/ab/abcdef.../raw.{zst|z}      원문
+    {root}/objects/ab/abcdef.../sections.bin     섹션 프레임 (full_text 포함)
+    {root}/objects/ab/abcdef.../index.json       섹션 오프셋 인덱스 + 메타데이터
+    {root}/refs/AAPL/10-K_FY2024.json            {"hash": ...}
+
+사용법:
+    store = get_sec_filing_store()                            # 공유 저장소 (SEC_FILINGS/store)
+    content_hash = store.put(filing, content)                 # 이미 있으면 파싱 없이 참조만 추가
+    parsed = store.load_parsed(content_hash)                  # 섹션은 접근 시 압축 해제
+    risks = parser.extract_risk_factors(parsed)               # Risk Factors 프레임만 읽음
+    text = store.get_text(content_hash, [SECSection.MDA])
+
+작성일: 2026-10-18
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import shutil
+import threading
+import zlib
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from backend.core.models.sec_models import (
+    FilingMetadata,
+    FilingType,
+    ParsedFiling,
+    ParsedSection,
+    SECSection,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+FULL_TEXT = "full_text"
+INDEX_VERSION = 1
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """원문 SHA-256 (SECFileStorage와 같은 규칙)"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class _Codec:
+    """압축 코덱 (index.json에 이름 기록, 읽을 때는 기록된 코덱 사용)"""
+
+    EXTENSIONS = {"zstd": "zst", "zlib": "z"}
+
+    def __init__(self, name: str, level: Optional[int] = None):
+        if name not in self.EXTENSIONS:
+            raise ValueError(f"Unknown codec: {name}")
+        if name == "zstd" and not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read/write zstd-compressed SEC objects")
+        self.name = name
+        self.extension = self.EXTENSIONS[name]
+        self.level = level if level is not None else (10 if name == "zstd" else 6)
+        # zstd 압축/해제 컨텍스트는 스레드 간 공유 불가
+        self._local = threading.local()
+
+    def compress(self, data: bytes) -> bytes:
+        if self.name == "zlib":
+            return zlib.compress(data, self.level)
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+        return compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.name == "zlib":
+            return zlib.decompress(data)
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+
+
+class StoredSections(Mapping):
+    """
+    SECSection → ParsedSection 지연 로딩 매핑
+
+    ParsedFiling.sections 자리에 그대로 들어가며, 접근한 섹션만 압축 해제합니다.
+    """
+
+    def __init__(self, store: "SECFilingStore", content_hash: str, index: Dict[str, Any]):
+        self._store = store
+        self._hash = content_hash
+        self._index = index
+        self._keys = [SECSection(name) for name in index["sections"] if name != FULL_TEXT]
+        self._loaded: Dict[SECSection, ParsedSection] = {}
+
+    def __getitem__(self, section_type: SECSection) -> ParsedSection:
+        if section_type not in self._loaded:
+            if section_type not in self._keys:
+                raise KeyError(section_type)
+            entry = self._index["sections"][section_type.value]
+            self._loaded[section_type] = ParsedSection(
+                section_type=section_type,
+                title=entry["title"],
+                content=self._store._read_frame(self._hash, self._index, section_type.value),
+                word_count=entry["word_count"],
+                extracted_at=datetime.fromisoformat(self._index["parsed_at"]),
+            )
+        return self._loaded[section_type]
+
+    def __iter__(self) -> Iterator[SECSection]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class SECFilingStore:
+    """
+    내용 주소 기반 SEC 공시 저장소
+
+    Args:
+        root: 저장소 루트 (기본: data/sec_store, 공유 인스턴스는 get_sec_filing_store())
+        codec: "zstd" | "zlib" (기본: zstandard 설치 시 zstd)
+        parser: 섹션 추출용 SECParser (기본: 새 인스턴스)
+    """
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        codec: Optional[str] = None,
+        parser=None,
+    ):
+        self.root = Path(root) if root else Path("data/sec_store")
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.refs_dir.mkdir(parents=True, exist_ok=True)
+
+        self.codec = _Codec(codec or ("zstd" if ZSTD_AVAILABLE else "zlib"))
+        self._codecs = {self.codec.name: self.codec}
+        self._parser = parser
+        # put/put_raw는 워커 스레드에서도 호출 (같은 객체 동시 기록 방지)
+        self._write_lock = threading.Lock()
+
+        self.stats = {"objects_written": 0, "dedup_hits": 0, "frames_read": 0}
+
+    # ================================================================
+    # 저장
+    # ================================================================
+
+    def put(
+        self,
+        filing: FilingMetadata,
+        content: str,
+        parsed: Optional[ParsedFiling] = None,
+    ) -> str:
+        """
+        원문 저장 + 섹션 인덱싱 (같은 원문이 이미 있으면 참조만 추가)
+
+        Args:
+            filing: 공시 메타데이터 (참조 키: ticker/유형/기간)
+            content: 원문 (HTML/텍스트)
+            parsed: 이미 파싱한 결과 (없으면 SECParser로 파싱)
+
+        Returns:
+            원문 SHA-256
+        """
+        raw = content.encode("utf-8")
+        digest = content_hash(raw)
+
+        with self._write_lock:
+            if self.has(digest):
+                self.stats["dedup_hits"] += 1
+            else:
+                if parsed is None:
+                    parsed = self._get_parser().parse(filing, content)
+                self._write_object(digest, raw, parsed)
+                self.stats["objects_written"] += 1
+
+            self._write_ref(filing, digest)
+        return digest
+
+    def put_raw(self, content: str) -> str:
+        """파싱 없이 원문만 저장 (메타데이터를 모르는 경우, 이후 put으로 섹션 추가 가능)"""
+        raw = content.encode("utf-8")
+        digest = content_hash(raw)
+        object_dir = self._object_dir(digest)
+        with self._write_lock:
+            if not self._raw_path(object_dir).exists() and not (object_dir / "index.json").exists():
+                object_dir.mkdir(parents=True, exist_ok=True)
+                self._atomic_write(object_dir / f"raw.{self.codec.extension}", self.codec.compress(raw))
+        return digest
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def has(self, digest: str) -> bool:
+        """섹션 인덱스까지 완성된 객체 여부"""
+        return (self._object_dir(digest) / "index.json").exists()
+
+    def contains(self, digest: str) -> bool:
+        """원문 보유 여부 (put_raw만 된 객체 포함)"""
+        object_dir = self._object_dir(digest)
+        return any((object_dir / f"raw.{extension}").exists() for extension in _Codec.EXTENSIONS.values())
+
+    def object_path(self, digest: str) -> Path:
+        """객체 디렉토리 경로"""
+        return self._object_dir(digest)
+
+    def delete(self, digest: str) -> bool:
+        """객체 삭제 (이 해시를 가리키던 refs는 resolve 후 has()가 False)"""
+        object_dir = self._object_dir(digest)
+        if not object_dir.exists():
+            return False
+        shutil.rmtree(object_dir)
+        return True
+
+    def resolve(self, ticker: str, filing_type: str, fiscal_period: str) -> Optional[str]:
+        """ticker/유형/기간 → 원문 해시"""
+        path = self._ref_path(ticker, filing_type, fiscal_period)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))["hash"]
+
+    def get_index(self, digest: str) -> Dict[str, Any]:
+        """섹션 오프셋 인덱스 + 메타데이터"""
+        path = self._object_dir(digest) / "index.json"
+        if not path.exists():
+            raise KeyError(f"SEC object not found: {digest}")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def get_section(self, digest: str, section_type: SECSection) -> Optional[ParsedSection]:
+        """섹션 1개 (해당 프레임만 읽음)"""
+        index = self.get_index(digest)
+        sections = StoredSections(self, digest, index)
+        return sections.get(section_type)
+
+    def get_text(self, digest: str, section_types: Iterable[SECSection], separator: str = "\n\n") -> str:
+        """여러 섹션 본문 연결 (없는 섹션은 건너뜀)"""
+        index = self.get_index(digest)
+        return separator.join(
+            self._read_frame(digest, index, section_type.value)
+            for section_type in section_types
+            if section_type.value in index["sections"]
+        )
+
+    def get_full_text(self, digest: str) -> str:
+        index = self.get_index(digest)
+        return self._read_frame(digest, index, FULL_TEXT)
+
+    def get_raw(self, digest: str) -> str:
+        """원문"""
+        object_dir = self._object_dir(digest)
+        for codec_name, extension in _Codec.EXTENSIONS.items():
+            path = object_dir / f"raw.{extension}"
+            if path.exists():
+                return self._get_codec(codec_name).decompress(path.read_bytes()).decode("utf-8")
+        raise KeyError(f"SEC object not found: {digest}")
+
+    def load_parsed(self, digest: str, include_full_text: bool = False) -> ParsedFiling:
+        """
+        ParsedFiling 복원 (섹션은 접근 시 지연 로딩)
+
+        Args:
+            include_full_text: full_text도 읽을지 여부 (기본: 빈 문자열, total_words는 유지)
+        """
+        index = self.get_index(digest)
+        meta = index["metadata"]
+        metadata = FilingMetadata(
+            ticker=meta["ticker"],
+            cik=meta["cik"],
+            company_name=meta["company_name"],
+            filing_type=FilingType(meta["filing_type"]),
+            filing_date=datetime.fromisoformat(meta["filing_date"]),
+            fiscal_period=meta["fiscal_period"],
+            accession_number=meta["accession_number"],
+            filing_url=meta["filing_url"],
+            document_url=meta["document_url"],
+        )
+        return ParsedFiling(
+            metadata=metadata,
+            sections=StoredSections(self, digest, index),
+            full_text=self._read_frame(digest, index, FULL_TEXT) if include_full_text else "",
+            total_words=index["total_words"],
+            parsed_at=datetime.fromisoformat(index["parsed_at"]),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        objects = [p for p in self.objects_dir.glob("*/*") if p.is_dir()]
+        size = sum(f.stat().st_size for p in objects for f in p.iterdir())
+        return {
+            **self.stats,
+            "objects": len(objects),
+            "total_size_mb": round(size / 1024 / 1024, 2),
+            "codec": self.codec.name,
+            "root": str(self.root),
+        }
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _get_parser(self):
+        if self._parser is None:
+            from backend.data.sec_parser import SECParser
+            self._parser = SECParser()
+        return self._parser
+
+    def _get_codec(self, name: str) -> _Codec:
+        if name not in self._codecs:
+            self._codecs[name] = _Codec(name)
+        return self._codecs[name]
+
+    def _object_dir(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _raw_path(self, object_dir: Path) -> Path:
+        return object_dir / f"raw.{self.codec.extension}"
+
+    def _ref_path(self, ticker: str, filing_type: str, fiscal_period: str) -> Path:
+        name = f"{filing_type}_{fiscal_period}".replace(" ", "_").replace("/", "-")
+        return self.refs_dir / ticker.upper() / f"{name}.json"
+
+    def _write_object(self, digest: str, raw: bytes, parsed: ParsedFiling):
+        object_dir = self._object_dir(digest)
+        object_dir.mkdir(parents=True, exist_ok=True)
+
+        frames = [(FULL_TEXT, "", parsed.total_words, parsed.full_text)]
+        frames += [
+            (section_type.value, section.title, section.word_count, section.content)
+            for section_type, section in parsed.sections.items()
+        ]
+
+        sections: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        tmp_bin = object_dir / "sections.bin.tmp"
+        with open(tmp_bin, "wb") as f:
+            for name, title, word_count, text in frames:
+                frame = self.codec.compress(text.encode("utf-8"))
+                f.write(frame)
+                sections[name] = {
+                    "offset": offset,
+                    "length": len(frame),
+                    "raw_length": len(text),
+                    "title": title,
+                    "word_count": word_count,
+                }
+                offset += len(frame)
+        os.replace(tmp_bin, object_dir / "sections.bin")
+
+        if not self._raw_path(object_dir).exists():
+            self._atomic_write(self._raw_path(object_dir), self.codec.compress(raw))
+
+        meta = parsed.metadata
+        index = {
+            "version": INDEX_VERSION,
+            "hash": digest,
+            "codec": self.codec.name,
+            "raw_size": len(raw),
+            "total_words": parsed.total_words,
+            "parsed_at": parsed.parsed_at.isoformat(),
+            "metadata": {
+                "ticker": meta.ticker,
+                "cik": meta.cik,
+                "company_name": meta.company_name,
+                "filing_type": meta.filing_type.value,
+                "filing_date": meta.filing_date.isoformat(),
+                "fiscal_period": meta.fiscal_period,
+                "accession_number": meta.accession_number,
+                "filing_url": meta.filing_url,
+                "document_url": meta.document_url,
+            },
+            "sections": sections,
+        }
+        # index.json이 마지막 (존재 = 객체 완성)
+        self._atomic_write(object_dir / "index.json", json.dumps(index, ensure_ascii=False).encode("utf-8"))
+
+        logger.info(
+            f"Stored SEC object {digest[:12]} ({meta.ticker} {meta.filing_type.value} {meta.fiscal_period}): "
+            f"{len(raw) / 1024:.0f} KB raw → {offset / 1024:.0f} KB sections, {len(sections) - 1} sections"
+        )
+
+    def _write_ref(self, filing: FilingMetadata, digest: str):
+        path = self._ref_path(filing.ticker, filing.filing_type.value, filing.fiscal_period)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ref = {"hash": digest, "accession_number": filing.accession_number}
+        self._atomic_write(path, json.dumps(ref).encode("utf-8"))
+
+    def _read_frame(self, digest: str, index: Dict[str, Any], name: str) -> str:
+        """sections.bin을 mmap해 해당 프레임만 압축 해제"""
+        entry = index["sections"][name]
+        codec = self._get_codec(index["codec"])
+        with open(self._object_dir(digest) / "sections.bin", "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                frame = mm[entry["offset"]:entry["offset"] + entry["length"]]
+        self.stats["frames_read"] += 1
+        return codec.decompress(frame).decode("utf-8")
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+_sec_filing_store: Optional[SECFilingStore] = None
+
+
+def get_sec_filing_store() -> SECFilingStore:
+    """
+    공유 SECFilingStore (SECFileStorage / SECAnalyzer / SECEmbeddingPipeline 공통)
+
+    루트 = StorageConfig SEC_FILINGS 경로/store → 내용 해시 중복 제거와 섹션 인덱스가 한 트리에 모임
+
+    Returns:
+        SECFilingStore instance
+    """
+    global _sec_filing_store
+
+    if _sec_filing_store is None:
+        from backend.config.storage_config import StorageLocation, get_storage_config
+
+        root = get_storage_config().get_path(StorageLocation.SEC_FILINGS) / "store"
+        _sec_filing_store = SECFilingStore(root)
+
+    return _sec_filing_store
@@ -3,16 +3,30 @@ SEC 공시 문서 파서
 
 10-K/10-Q HTML 문서에서 주요 섹션을 추출하고 텍스트로 변환
 
+처리 방식:
+- lxml 타깃 파서(SAX 방식)로 태그를 스트리밍 제거 (DOM 트리를 만들지 않음)
+- ITEM 제목 경계를 한 번의 스캔으로 모두 찾은 뒤 제목만 섹션 패턴과 비교
+- 여러 문서는 parse_filings()로 프로세스 풀에서 병렬 파싱
+- lxml이 없으면 BeautifulSoup 경로로 동작
+
 Author: AI Trading System
 Date: 2025-11-22
 """
 
+import os
 import re
-from typing import Dict, Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
 import logging
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
 from backend.core.models.sec_models import (
     FilingMetadata,
     ParsedFiling,
@@ -24,6 +38,60 @@ from backend.core.models.sec_models import (
 logger = logging.getLogger(__name__)
 
 
+# 내용을 통째로 버리는 태그 (표는 재무제표라 너무 복잡, ix:header는 숨겨진 XBRL 컨텍스트)
+SKIP_TAGS = frozenset({"script", "style", "table", "img", "ix:header"})
+
+# 줄바꿈 없이 이어 붙이는 인라인 태그 (그 외 태그 경계는 줄바꿈)
+INLINE_TAGS = frozenset({
+    "a", "b", "i", "u", "s", "em", "strong", "span", "font", "small", "big",
+    "sup", "sub", "abbr", "code", "ix:nonnumeric", "ix:nonfraction", "ix:continuation",
+})
+
+# 스트리밍 입력 단위 (문자)
+FEED_CHUNK_SIZE = 1 << 20
+
+
+class _TextCollector:
+    """lxml 타깃: 태그 이벤트를 받아 텍스트 조각만 누적 (트리 없음)"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._skip_depth = 0
+        self._newlines = 0  # 마지막 텍스트 이후 추가한 줄바꿈 수 (빈 줄은 최대 1개면 충분)
+
+    def start(self, tag, attrib):
+        if self._skip_depth or tag in SKIP_TAGS:
+            # img 같은 void 태그도 end 이벤트가 오므로 깊이로 추적
+            self._skip_depth += 1
+        elif tag not in INLINE_TAGS:
+            self._break()
+
+    def end(self, tag):
+        if self._skip_depth:
+            self._skip_depth -= 1
+        elif tag not in INLINE_TAGS:
+            self._break()
+
+    def data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+            if not data.isspace():
+                self._newlines = 0
+
+    def comment(self, text):
+        pass
+
+    def close(self) -> str:
+        text = "".join(self.parts)
+        self.parts = []
+        return text
+
+    def _break(self):
+        if self._newlines < 2:
+            self.parts.append("\n")
+            self._newlines += 1
+
+
 class SECParser:
     """
     SEC 공시 문서 파서
@@ -62,10 +130,22 @@ class SECParser:
             r"ITEM\s+9A\.?\s+Controls and Procedures"
         ]
     }
-    
+
+    # 줄 시작의 ITEM 제목 (모든 섹션 경계, 단일 스캔)
+    # '\n'으로 시작해야 정규식 엔진이 리터럴 검색으로 후보 위치만 확인함 (^ + MULTILINE은 문자 단위 스캔)
+    ITEM_HEADING = re.compile(r'\n[ \t]*ITEM\s+\d+[A-Z]?\.?\s+', re.IGNORECASE)
+
+    # 섹션 분류 시 제목 뒤로 살펴볼 길이
+    HEADING_WINDOW = 200
+
     def __init__(self):
         """파서 초기화"""
         self.soup = None
+        self._heading_patterns = [
+            (section_type, re.compile(pattern, re.IGNORECASE))
+            for section_type, patterns in self.SECTION_PATTERNS.items()
+            for pattern in patterns
+        ]
     
     def parse(
         self,
@@ -116,118 +196,134 @@ class SECParser:
     def _clean_html(self, content: str) -> str:
         """
         HTML 정제 및 텍스트 추출
-        
+
         제거 대상:
         - HTML 태그
         - JavaScript/CSS
         - 표 (재무제표는 너무 복잡)
-        - XBRL 태그
+        - XBRL 태그 (인라인 XBRL 헤더 포함)
         - 과도한 공백
         """
+        if not LXML_AVAILABLE:
+            return self._clean_html_bs4(content)
+
+        collector = _TextCollector()
+        parser = etree.HTMLParser(target=collector, huge_tree=True, remove_comments=True)
+        for offset in range(0, len(content), FEED_CHUNK_SIZE):
+            parser.feed(content[offset:offset + FEED_CHUNK_SIZE])
+        text = parser.close() if content else ""
+
+        return self._normalize_text(text)
+
+    def _clean_html_bs4(self, content: str) -> str:
+        """BeautifulSoup 경로 (lxml 미설치 시)"""
+        from bs4 import BeautifulSoup
+
         # BeautifulSoup으로 파싱
         self.soup = BeautifulSoup(content, 'html.parser')
-        
+
         # 불필요한 태그 제거
         for tag in self.soup(['script', 'style', 'table', 'img']):
             tag.decompose()
-        
+
         # 텍스트 추출
         text = self.soup.get_text(separator='\n')
-        
+
         # XBRL 태그 제거
         text = re.sub(r'<[^>]+>', '', text)
-        
-        # 과도한 공백 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # 연속된 빈 줄 → 2줄로
-        text = re.sub(r'[ \t]+', ' ', text)      # 연속된 공백 → 1칸
-        
+
+        return self._normalize_text(text)
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        # 수 MB 문서라 정규식 대신 C 수준 str 연산만 사용
         # 특수 문자 정리
-        text = text.replace('\xa0', ' ')  # Non-breaking space
+        for char in ('\xa0', '\t', '\r'):  # Non-breaking space, 탭, CR → 공백
+            text = text.replace(char, ' ')
         text = text.replace('\u200b', '')  # Zero-width space
-        
+
+        # 연속된 공백 → 1칸, 줄 앞뒤 공백 제거 (1칸으로 줄었으므로 줄 경계에는 최대 1칸)
+        while '  ' in text:
+            text = text.replace('  ', ' ')
+        text = text.replace(' \n', '\n').replace('\n ', '\n')
+
+        # 연속된 빈 줄 → 2줄로
+        while '\n\n\n' in text:
+            text = text.replace('\n\n\n', '\n\n')
+
         return text.strip()
-    
+
     def _extract_sections(self, text: str) -> Dict[SECSection, ParsedSection]:
         """
         주요 섹션 추출
-        
+
+        ITEM 제목 경계를 한 번에 찾고, 각 제목을 섹션 패턴과 비교합니다.
+        섹션은 다음 ITEM 제목 직전까지이며, 본문이 너무 짧은 항목(목차 등)은
+        같은 섹션의 다음 제목을 사용합니다.
+
         Args:
             text: 정제된 텍스트
-            
+
         Returns:
             섹션 딕셔너리
         """
+        boundaries = [match.start() + 1 for match in self.ITEM_HEADING.finditer(text)]
+        if self.ITEM_HEADING.match('\n' + text[:self.HEADING_WINDOW]):
+            boundaries.insert(0, 0)
+        boundaries.append(len(text))
+
         sections = {}
-        
-        for section_type, patterns in self.SECTION_PATTERNS.items():
-            section = self._extract_section(text, section_type, patterns)
+        for start, end in zip(boundaries, boundaries[1:]):
+            section_type = self._classify_heading(text, start)
+            if section_type is None or section_type in sections:
+                continue
+
+            section = self._build_section(section_type, text[start:end])
             if section:
                 sections[section_type] = section
-        
+
+        for section_type in self.SECTION_PATTERNS:
+            if section_type not in sections:
+                logger.warning(f"Section not found: {section_type}")
+
         return sections
-    
-    def _extract_section(
-        self,
-        text: str,
-        section_type: SECSection,
-        patterns: List[str]
-    ) -> Optional[ParsedSection]:
+
+    def _classify_heading(self, text: str, start: int) -> Optional[SECSection]:
+        """ITEM 제목 → 섹션 타입 (관심 없는 ITEM이면 None)"""
+        heading = text[start:start + self.HEADING_WINDOW].lstrip()
+        for section_type, pattern in self._heading_patterns:
+            if pattern.match(heading):
+                return section_type
+        return None
+
+    def _build_section(self, section_type: SECSection, content: str) -> Optional[ParsedSection]:
         """
-        특정 섹션 추출
-        
-        Args:
-            text: 전체 텍스트
-            section_type: 섹션 타입
-            patterns: 검색 패턴 (정규식)
-            
+        ITEM 제목부터 다음 제목 직전까지 → ParsedSection
+
         Returns:
-            ParsedSection 또는 None
+            ParsedSection 또는 None (본문 50단어 미만)
         """
-        # 여러 패턴 시도
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            if match:
-                start_pos = match.start()
-                
-                # 다음 섹션 찾기 (Item 2, Item 1B 등)
-                next_section_match = re.search(
-                    r'\n\s*ITEM\s+\d+[A-Z]?\.?\s+',
-                    text[start_pos + 100:],  # 100자 이후부터 검색 (현재 섹션 제목 스킵)
-                    re.IGNORECASE
-                )
-                
-                if next_section_match:
-                    end_pos = start_pos + 100 + next_section_match.start()
-                else:
-                    # 다음 섹션 없으면 끝까지
-                    end_pos = len(text)
-                
-                # 섹션 내용 추출
-                content = text[start_pos:end_pos].strip()
-                
-                # 제목 추출 (첫 줄)
-                title_match = re.search(r'^.*?$', content, re.MULTILINE)
-                title = title_match.group(0) if title_match else section_type.value
-                
-                # 내용 (제목 제외)
-                body = content[len(title):].strip()
-                
-                # 너무 짧으면 스킵 (실제 내용 아닐 가능성)
-                if len(body.split()) < 50:
-                    continue
-                
-                return ParsedSection(
-                    section_type=section_type,
-                    title=title,
-                    content=body,
-                    word_count=len(body.split()),
-                    extracted_at=datetime.now()
-                )
-        
-        logger.warning(f"Section not found: {section_type}")
-        return None
-    
+        content = content.strip()
+
+        # 제목 추출 (첫 줄)
+        title = content.split('\n', 1)[0] or section_type.value
+
+        # 내용 (제목 제외)
+        body = content[len(title):].strip()
+        word_count = len(body.split())
+
+        # 너무 짧으면 스킵 (실제 내용 아닐 가능성)
+        if word_count < 50:
+            return None
+
+        return ParsedSection(
+            section_type=section_type,
+            title=title,
+            content=body,
+            word_count=word_count,
+            extracted_at=datetime.now()
+        )
+
     def extract_risk_factors(self, parsed: ParsedFiling) -> List[str]:
         """
         Risk Factors를 개별 리스크로 분리
@@ -425,6 +521,42 @@ def extract_risks(parsed: ParsedFiling) -> List[str]:
     return parser.extract_risk_factors(parsed)
 
 
+_worker_parser: Optional[SECParser] = None
+
+
+def _parse_in_worker(item: Tuple[FilingMetadata, str]) -> ParsedFiling:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = SECParser()
+    return _worker_parser.parse(*item)
+
+
+def parse_filings(
+    items: Iterable[Tuple[FilingMetadata, str]],
+    max_workers: Optional[int] = None
+) -> List[ParsedFiling]:
+    """
+    여러 공시 문서 병렬 파싱 (프로세스 풀)
+
+    Args:
+        items: (메타데이터, 내용) 목록
+        max_workers: 프로세스 수 (기본: CPU 수, 문서가 1개 이하면 현재 프로세스에서 파싱)
+
+    Returns:
+        입력 순서대로 ParsedFiling 목록
+
+    Raises:
+        SECParsingError: 하나라도 파싱 실패 시
+    """
+    items = list(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        return [_parse_in_worker(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_in_worker, items))
+
+
 # ============================================
 # 테스트/데모
 # ============================================
@@ -2,7 +2,9 @@
 Vector Store Module - RAG Foundation for AI Trading System.
 
 Components:
-- DocumentEmbedder: OpenAI Embedding API wrapper
+- DocumentEmbedder: Embedding wrapper (OpenAI API or local backend)
+- LocalEmbeddingBackend: Local CPU embeddings (ONNX int8, dynamic batching)
+- EmbeddingResultCache: Shared on-disk embedding cache by content hash
 - TextChunker: Document chunking strategies
 - AutoTagger: AI-powered automatic tagging
 - VectorStore: TimescaleDB + pgvector interface
@@ -33,19 +35,33 @@ Usage:
     )
 """
 
-from .embedder import DocumentEmbedder, EmbeddingResult, DocumentEmbedderContext
+from .embedder import (
+    DocumentEmbedder,
+    EmbeddingResult,
+    DocumentEmbedderContext,
+    EmbeddingBackend,
+    OpenAIEmbeddingBackend,
+    LocalEmbeddingBackend,
+)
+from .embedding_cache import EmbeddingResultCache, get_embedding_cache
 from .chunker import TextChunker
 from .tagger import AutoTagger
-from .store import VectorStore, VectorStoreContext
+from .store import VectorStore, VectorStoreContext, QueryEmbeddingCache
 
 __all__ = [
     "DocumentEmbedder",
     "EmbeddingResult",
     "DocumentEmbedderContext",
+    "EmbeddingBackend",
+    "OpenAIEmbeddingBackend",
+    "LocalEmbeddingBackend",
+    "EmbeddingResultCache",
+    "get_embedding_cache",
     "TextChunker",
     "AutoTagger",
     "VectorStore",
     "VectorStoreContext",
+    "QueryEmbeddingCache",
 ]
 
 __version__ = "1.0.0"
@@ -1,19 +1,34 @@
 """
-DocumentEmbedder - OpenAI Embedding API wrapper with cost tracking.
+DocumentEmbedder - Embedding wrapper with pluggable backends and cost tracking.
 
 Supports:
 - Single text embedding
 - Batch embedding with rate limiting
 - Cost calculation
 - Content hashing for deduplication
+- Backends: OpenAI API (default) or local CPU model (ONNX int8, dynamic batching)
+- Shared on-disk result cache by (model, content hash)
 """
 
+from abc import ABC, abstractmethod
 from openai import AsyncOpenAI
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import hashlib
 import asyncio
+import time
 from datetime import datetime
 
+import numpy as np
+
+from .embedding_cache import CachedEmbedding, EmbeddingResultCache
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
 
 class EmbeddingResult:
     """Result of an embedding operation."""
@@ -25,44 +40,307 @@ class EmbeddingResult:
         self.timestamp = datetime.utcnow()
 
 
+class EmbeddingBackend(ABC):
+    """
+    Embedding provider interface.
+    
+    embed() takes a list of texts and returns EmbeddingResult objects in
+    input order. Remote backends are called once per batch (the caller
+    batches and rate-limits); local backends batch internally.
+    """
+    
+    model: str = ""
+    dimension: int = 0
+    cost_per_million: float = 0.0
+    remote: bool = False
+    request_interval: float = 0.0  # Seconds per text between remote batches
+    
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Embed texts, returning one result per text in input order."""
+    
+    def get_stats(self) -> Dict:
+        return {"backend": type(self).__name__, "model": self.model}
+    
+    async def close(self):
+        pass
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """OpenAI Embedding API backend ($0.02 per 1M tokens)."""
+    
+    remote = True
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        cost_per_million_tokens: float = 0.02,
+        dimension: int = 1536
+    ):
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self.dimension = dimension
+        self.cost_per_million = cost_per_million_tokens
+        
+        # Rate limiting (OpenAI tier 1: 3,000 RPM)
+        self.max_requests_per_minute = 3000
+        self.request_interval = 60.0 / self.max_requests_per_minute  # ~0.02s
+    
+    async def embed(self, texts: List[str]) -> List[EmbeddingResult]:
+        response = await self.client.embeddings.create(
+            model=self.model,
+            input=texts if len(texts) > 1 else texts[0],
+            encoding_format="float"
+        )
+        
+        # Per-text tokens are not reported; split the request total evenly
+        text_tokens = response.usage.total_tokens // len(texts)
+        cost = (text_tokens / 1_000_000) * self.cost_per_million
+        
+        return [
+            EmbeddingResult(embedding=data.embedding, tokens=text_tokens, cost=cost)
+            for data in sorted(response.data, key=lambda d: d.index)
+        ]
+
+
+class LocalEmbeddingBackend(EmbeddingBackend):
+    """
+    Local CPU embedding backend (sentence-transformers, ONNX int8 by default).
+    
+    Concurrent embed() calls share one queue. A dispatcher task collects
+    queued texts into batches of up to max_batch_size (waiting at most
+    max_wait_ms for a partial batch to fill) and runs each batch on a
+    worker thread pool, so many small callers (search queries, news
+    articles, SEC chunks) are encoded together instead of one by one.
+    
+    Vectors are L2-normalized. output_dimension zero-pads them to match an
+    existing vector(N) column (e.g. 384 -> 1536); padding keeps cosine
+    similarity between local vectors unchanged, but local and OpenAI
+    vectors are not comparable with each other.
+    
+    Usage:
+        backend = LocalEmbeddingBackend(output_dimension=1536)
+        embedder = DocumentEmbedder(backend=backend)
+        results = await embedder.embed_batch(texts)
+        print(backend.get_stats()["docs_per_sec"])
+    """
+    
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        onnx_file: Optional[str] = "onnx/model_qint8_avx512.onnx",
+        model=None,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        num_workers: int = 2,
+        output_dimension: Optional[int] = None
+    ):
+        """
+        Initialize LocalEmbeddingBackend.
+        
+        Args:
+            model_name: Hugging Face model id
+            onnx_file: Quantized ONNX weights in the model repo (None = PyTorch)
+            model: Preloaded encoder with SentenceTransformer's encode() interface
+            max_batch_size: Max texts per encode() call
+            max_wait_ms: Max wait for a partial batch to fill
+            num_workers: Worker threads (batches encoded concurrently)
+            output_dimension: Zero-pad vectors to this size (None = native)
+        """
+        self.model = model_name
+        self.encoder = model if model is not None else self._load_model(model_name, onnx_file)
+        self.native_dimension = self.encoder.get_sentence_embedding_dimension()
+        self.dimension = output_dimension or self.native_dimension
+        if self.dimension < self.native_dimension:
+            raise ValueError(
+                f"output_dimension {self.dimension} < model dimension {self.native_dimension}"
+            )
+        
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.num_workers = num_workers
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="local-embed")
+        
+        # Event-loop bound state (created on first embed())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        
+        # Stats
+        self.total_docs = 0
+        self.total_batches = 0
+        self.busy_seconds = 0.0
+        self._active_batches = 0
+        self._busy_since = 0.0
+    
+    @staticmethod
+    def _load_model(model_name: str, onnx_file: Optional[str]):
+        """Load ONNX quantized weights, falling back to PyTorch."""
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers is required for LocalEmbeddingBackend")
+        
+        if onnx_file:
+            try:
+                return SentenceTransformer(
+                    model_name,
+                    device="cpu",
+                    backend="onnx",
+                    model_kwargs={"file_name": onnx_file}
+                )
+            except Exception as e:  # Old sentence-transformers, no onnxruntime, or no such file
+                print(f"  ⚠️  ONNX model unavailable ({e}), using PyTorch backend")
+        
+        return SentenceTransformer(model_name, device="cpu")
+    
+    async def embed(self, texts: List[str]) -> List[EmbeddingResult]:
+        if not texts:
+            return []
+        
+        self._ensure_dispatcher()
+        futures = []
+        for text in texts:
+            future = self._loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        
+        vectors = await asyncio.gather(*futures)
+        return [EmbeddingResult(embedding=vector, tokens=0, cost=0.0) for vector in vectors]
+    
+    def _ensure_dispatcher(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._dispatcher is None or self._dispatcher.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.num_workers)
+            self._dispatcher = loop.create_task(self._dispatch())
+    
+    def _drain(self, batch: List[Tuple[str, asyncio.Future]]):
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+    
+    async def _dispatch(self):
+        """Form batches from the queue; at most num_workers batches in flight."""
+        while True:
+            batch = [await self._queue.get()]
+            # While every worker is busy, new texts keep queueing -> fuller batches
+            await self._slots.acquire()
+            self._drain(batch)
+            if len(batch) < self.max_batch_size and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+                self._drain(batch)
+            self._loop.create_task(self._run_batch(batch))
+    
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        if self._active_batches == 0:
+            self._busy_since = time.perf_counter()
+        self._active_batches += 1
+        try:
+            vectors = await self._loop.run_in_executor(
+                self._executor, self._encode, [text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+            self.total_docs += len(batch)
+            self.total_batches += 1
+        finally:
+            self._active_batches -= 1
+            if self._active_batches == 0:
+                self.busy_seconds += time.perf_counter() - self._busy_since
+            self._slots.release()
+    
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Runs on a worker thread."""
+        vectors = np.asarray(self.encoder.encode(
+            texts,
+            batch_size=len(texts),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        ), dtype=np.float32)
+        
+        if self.dimension > vectors.shape[1]:
+            padded = np.zeros((len(texts), self.dimension), dtype=np.float32)
+            padded[:, :vectors.shape[1]] = vectors
+            vectors = padded
+        
+        return vectors.tolist()
+    
+    def get_stats(self) -> Dict:
+        """Throughput stats (docs/sec over time with at least one batch encoding)."""
+        return {
+            "backend": type(self).__name__,
+            "model": self.model,
+            "dimension": self.dimension,
+            "total_docs": self.total_docs,
+            "total_batches": self.total_batches,
+            "avg_batch_size": round(self.total_docs / max(self.total_batches, 1), 1),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "docs_per_sec": round(self.total_docs / self.busy_seconds, 1) if self.busy_seconds else 0.0,
+        }
+    
+    async def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        self._executor.shutdown(wait=False)
+
+
 class DocumentEmbedder:
     """
-    OpenAI Embedding API wrapper with cost tracking.
+    Embedding wrapper with cost tracking (OpenAI API or local backend).
     
     Features:
     - Async API calls
     - Batch processing with rate limiting
     - Cost calculation ($0.02 per 1M tokens)
     - Content hashing for deduplication
+    - Pluggable backend (LocalEmbeddingBackend: no API cost, CPU inference)
+    - Optional EmbeddingResultCache (cache hits are returned with zero cost)
     
     Usage:
         embedder = DocumentEmbedder(api_key="sk-...")
         result = await embedder.embed_text("Sample text")
         print(f"Embedding: {result.embedding[:5]}...")
         print(f"Cost: ${result.cost:.6f}")
+        
+        local = DocumentEmbedder(backend=LocalEmbeddingBackend())
+        cached = DocumentEmbedder(api_key="sk-...", cache=get_embedding_cache())
     """
     
     def __init__(
         self,
-        api_key: str,
+        api_key: Optional[str] = None,
         model: str = "text-embedding-3-small",
-        cost_per_million_tokens: float = 0.02
+        cost_per_million_tokens: float = 0.02,
+        backend: Optional[EmbeddingBackend] = None,
+        cache: Optional[EmbeddingResultCache] = None
     ):
         """
         Initialize DocumentEmbedder.
         
         Args:
-            api_key: OpenAI API key
+            api_key: OpenAI API key (ignored when backend is given)
             model: Embedding model name (default: text-embedding-3-small)
             cost_per_million_tokens: Cost per 1M tokens (default: $0.02)
+            backend: Embedding backend (default: OpenAIEmbeddingBackend)
+            cache: Shared embedding result cache (None = disabled)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = model
-        self.cost_per_million = cost_per_million_tokens
-        
-        # Rate limiting (OpenAI tier 1: 3,000 RPM)
-        self.max_requests_per_minute = 3000
-        self.request_interval = 60.0 / self.max_requests_per_minute  # ~0.02s
+        self.backend = backend or OpenAIEmbeddingBackend(api_key, model, cost_per_million_tokens)
+        self.cache = cache
+        self.model = self.backend.model
+        self.dimension = self.backend.dimension
+        self.cost_per_million = self.backend.cost_per_million
         
         # Stats
         self.total_tokens = 0
@@ -86,27 +364,24 @@ class DocumentEmbedder:
             >>> result.cost
             0.000026
         """
+        if self.cache is None:
+            return await self._embed_text_uncached(text)
+        
+        async def embed_missing(missing: List[str]) -> List[EmbeddingResult]:
+            return [await self._embed_text_uncached(missing[0])]
+        
+        return (await self._embed_cached([text], embed_missing))[0]
+    
+    async def _embed_text_uncached(self, text: str) -> EmbeddingResult:
         try:
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text,
-                encoding_format="float"
-            )
-            
-            embedding = response.data[0].embedding
-            tokens = response.usage.total_tokens
-            cost = (tokens / 1_000_000) * self.cost_per_million
+            result = (await self.backend.embed([text]))[0]
             
             # Update stats
-            self.total_tokens += tokens
-            self.total_cost += cost
+            self.total_tokens += result.tokens
+            self.total_cost += result.cost
             self.total_requests += 1
             
-            return EmbeddingResult(
-                embedding=embedding,
-                tokens=tokens,
-                cost=cost
-            )
+            return result
         
         except Exception as e:
             raise RuntimeError(f"Embedding API error: {e}")
@@ -124,6 +399,9 @@ class DocumentEmbedder:
         - Tier 1: 3,000 RPM (requests per minute)
         - We batch 100 texts per request to stay under limit
         
+        Local backends receive all texts at once (they batch internally and
+        have no rate limit), so batch_size only applies to remote backends.
+        
         Args:
             texts: List of texts to embed
             batch_size: Number of texts per API call (max 100)
@@ -138,6 +416,21 @@ class DocumentEmbedder:
             >>> sum(r.cost for r in results)
             0.052
         """
+        if self.cache is not None:
+            return await self._embed_cached(
+                texts, lambda missing: self._embed_batch_uncached(missing, batch_size, show_progress)
+            )
+        return await self._embed_batch_uncached(texts, batch_size, show_progress)
+    
+    async def _embed_batch_uncached(
+        self,
+        texts: List[str],
+        batch_size: int,
+        show_progress: bool
+    ) -> List[EmbeddingResult]:
+        if not self.backend.remote:
+            return await self._embed_local(texts, show_progress)
+        
         results = []
         total_batches = (len(texts) + batch_size - 1) // batch_size
         
@@ -149,32 +442,17 @@ class DocumentEmbedder:
                 print(f"  Embedding batch {batch_num}/{total_batches} ({len(batch)} texts)...")
             
             try:
-                response = await self.client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                    encoding_format="float"
-                )
-                
-                # Process each embedding in response
-                for j, data in enumerate(response.data):
-                    # Estimate tokens per text (rough approximation)
-                    text_tokens = response.usage.total_tokens // len(batch)
-                    cost = (text_tokens / 1_000_000) * self.cost_per_million
-                    
-                    results.append(EmbeddingResult(
-                        embedding=data.embedding,
-                        tokens=text_tokens,
-                        cost=cost
-                    ))
+                batch_results = await self.backend.embed(batch)
+                results.extend(batch_results)
                 
                 # Update stats
-                self.total_tokens += response.usage.total_tokens
-                self.total_cost += (response.usage.total_tokens / 1_000_000) * self.cost_per_million
+                self.total_tokens += sum(r.tokens for r in batch_results)
+                self.total_cost += sum(r.cost for r in batch_results)
                 self.total_requests += 1
                 
                 # Rate limiting: wait between batches
                 if i + batch_size < len(texts):
-                    await asyncio.sleep(self.request_interval * len(batch))
+                    await asyncio.sleep(self.backend.request_interval * len(batch))
             
             except Exception as e:
                 print(f"  ✗ Error in batch {batch_num}: {e}")
@@ -187,6 +465,41 @@ class DocumentEmbedder:
         
         return results
     
+    async def _embed_local(self, texts: List[str], show_progress: bool) -> List[EmbeddingResult]:
+        """Embed all texts through a local backend (dynamic batching)."""
+        started = time.perf_counter()
+        try:
+            results = await self.backend.embed(texts)
+        except Exception as e:
+            print(f"  ✗ Local embedding error: {e}")
+            return [None] * len(texts)
+        
+        self.total_requests += 1
+        
+        if show_progress:
+            elapsed = time.perf_counter() - started
+            print(f"  ✓ Completed {len(texts)} local embeddings "
+                  f"({len(texts) / max(elapsed, 1e-9):.0f} docs/sec)")
+        
+        return results
+    
+    async def _embed_cached(self, texts: List[str], embed_fn) -> List[Optional[EmbeddingResult]]:
+        """One batched cache lookup; only unique misses reach the backend."""
+        async def embed_missing(missing: List[str]) -> List[Optional[CachedEmbedding]]:
+            results = await embed_fn(missing)
+            return [
+                None if r is None else CachedEmbedding(r.embedding, r.tokens, r.cost)
+                for r in results
+            ]
+        
+        entries = await self.cache.get_or_embed(self.model, self.dimension, texts, embed_missing)
+        return [
+            None if e is None
+            else EmbeddingResult(e.embedding, tokens=0, cost=0.0) if e.cached
+            else EmbeddingResult(e.embedding, tokens=e.tokens, cost=e.cost)
+            for e in entries
+        ]
+    
     @staticmethod
     def hash_content(text: str) -> str:
         """
@@ -218,7 +531,9 @@ class DocumentEmbedder:
             "avg_cost_per_request": round(
                 self.total_cost / max(self.total_requests, 1), 6
             ),
-            "model": self.model
+            "model": self.model,
+            "backend": self.backend.get_stats(),
+            "cache": self.cache.get_stats() if self.cache is not None else None
         }
     
     async def test_connection(self) -> bool:
@@ -230,9 +545,9 @@ class DocumentEmbedder:
         """
         try:
             result = await self.embed_text("test")
-            return len(result.embedding) == 1536
+            return len(result.embedding) == self.dimension
         except Exception as e:
-            print(f"❌ OpenAI API connection failed: {e}")
+            print(f"❌ Embedding backend connection failed: {e}")
             return False
 
 
@@ -240,16 +555,18 @@ class DocumentEmbedder:
 class DocumentEmbedderContext:
     """Context manager for DocumentEmbedder."""
     
-    def __init__(self, api_key: str, **kwargs):
+    def __init__(self, api_key: Optional[str] = None, **kwargs):
         self.embedder = DocumentEmbedder(api_key, **kwargs)
     
     async def __aenter__(self):
         # Test connection on enter
         if not await self.embedder.test_connection():
-            raise RuntimeError("Failed to connect to OpenAI API")
+            raise RuntimeError("Failed to connect to embedding backend")
         return self.embedder
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.embedder.backend.close()
+        
         # Print stats on exit
         stats = self.embedder.get_stats()
         print(f"\n📊 Embedding Session Stats:")
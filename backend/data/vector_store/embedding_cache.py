@@ -0,0 +1,233 @@
+"""
+EmbeddingResultCache - Shared embedding cache keyed by content hash.
+
+On-disk key-value store (SQLite, WAL) shared by every embedding caller:
+DocumentEmbedder / VectorStore, EmbeddingEngine and the news / SEC pipelines.
+
+Key: (model, dimension, sha256(text)) → float32 vector + original tokens/cost.
+Callers look up a whole batch with one IN query, embed only the misses,
+then store them with one executemany. Stats report hit rate and the
+tokens / USD that cache hits avoided.
+
+작성일: 2026-10-18
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+
+DEFAULT_CACHE_PATH = Path("data/embedding_cache.sqlite3")
+LOOKUP_CHUNK_SIZE = 900  # SQLite host parameter limit (999) minus model/dimension
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of text (same digest as DocumentEmbedder.hash_content)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CachedEmbedding(NamedTuple):
+    """Embedding with its original cost; cached=True when served from the cache."""
+
+    embedding: List[float]
+    tokens: int
+    cost: float
+    cached: bool = False
+
+
+class EmbeddingResultCache:
+    """
+    Disk-backed embedding cache keyed by (model, dimension, content_hash).
+
+    Usage:
+        cache = get_embedding_cache()
+        embedder = DocumentEmbedder(api_key="sk-...", cache=cache)
+        results = await embedder.embed_batch(texts)   # misses only hit the API
+        print(cache.get_stats()["hit_rate"])
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize EmbeddingResultCache.
+
+        Args:
+            path: SQLite file (default: data/embedding_cache.sqlite3)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                tokens INTEGER NOT NULL,
+                cost_usd REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (model, dimension, content_hash)
+            ) WITHOUT ROWID
+        """)
+
+        # Stats
+        self.lookups = 0
+        self.hits = 0
+        self.stored = 0
+        self.tokens_avoided = 0
+        self.cost_avoided = 0.0
+
+    def get_many(self, model: str, dimension: int, hashes: Sequence[str]) -> Dict[str, CachedEmbedding]:
+        """
+        Batched lookup.
+
+        Args:
+            model: Embedding model name
+            dimension: Vector dimension
+            hashes: Content hashes (duplicates allowed)
+
+        Returns:
+            Dict of content_hash -> CachedEmbedding (hits only)
+        """
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, CachedEmbedding] = {}
+
+        with self._lock:
+            for i in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+                chunk = unique[i:i + LOOKUP_CHUNK_SIZE]
+                rows = self._conn.execute(
+                    f"""
+                    SELECT content_hash, vector, tokens, cost_usd FROM embeddings
+                    WHERE model = ? AND dimension = ? AND content_hash IN ({','.join('?' * len(chunk))})
+                    """,
+                    [model, dimension, *chunk],
+                ).fetchall()
+                for digest, blob, tokens, cost in rows:
+                    found[digest] = CachedEmbedding(
+                        np.frombuffer(blob, dtype=np.float32).tolist(), tokens, cost, cached=True
+                    )
+
+        self.lookups += len(hashes)
+        for digest in hashes:
+            entry = found.get(digest)
+            if entry is not None:
+                self.hits += 1
+                self.tokens_avoided += entry.tokens
+                self.cost_avoided += entry.cost
+
+        return found
+
+    def put_many(self, model: str, dimension: int, entries: Dict[str, CachedEmbedding]):
+        """
+        Store embeddings in one transaction.
+
+        Args:
+            model: Embedding model name
+            dimension: Vector dimension
+            entries: Dict of content_hash -> CachedEmbedding
+        """
+        if not entries:
+            return
+
+        rows = [
+            (model, dimension, digest, np.asarray(entry.embedding, dtype=np.float32).tobytes(),
+             entry.tokens, entry.cost)
+            for digest, entry in entries.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model, dimension, content_hash, vector, tokens, cost_usd) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        self.stored += len(rows)
+
+    async def get_or_embed(
+        self,
+        model: str,
+        dimension: int,
+        texts: List[str],
+        embed_fn: Callable[[List[str]], Awaitable[List[Optional[CachedEmbedding]]]],
+    ) -> List[Optional[CachedEmbedding]]:
+        """
+        Look up all texts, embed unique misses with embed_fn, store them.
+
+        Args:
+            model: Embedding model name
+            dimension: Vector dimension
+            texts: Input texts
+            embed_fn: Embeds a list of texts (None entries = failed, not cached)
+
+        Returns:
+            CachedEmbedding per text in input order (None where embedding failed)
+        """
+        hashes = [content_hash(text) for text in texts]
+        found = await asyncio.to_thread(self.get_many, model, dimension, hashes)
+
+        missing: Dict[str, str] = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in found:
+                missing.setdefault(digest, text)
+
+        if missing:
+            fresh = await embed_fn(list(missing.values()))
+            new = {digest: entry for digest, entry in zip(missing, fresh) if entry is not None}
+            await asyncio.to_thread(self.put_many, model, dimension, new)
+            found.update(new)
+
+        return [found.get(digest) for digest in hashes]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "stored": self.stored,
+            "tokens_avoided": self.tokens_avoided,
+            "cost_avoided_usd": round(self.cost_avoided, 6),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 글로벌 인스턴스 (싱글톤 패턴)
+_embedding_cache: Optional[EmbeddingResultCache] = None
+
+
+def get_embedding_cache(path: Optional[Union[str, Path]] = None) -> EmbeddingResultCache:
+    """
+    Shared EmbeddingResultCache instance.
+
+    Args:
+        path: SQLite file (first call only)
+
+    Returns:
+        EmbeddingResultCache instance
+    """
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingResultCache(path)
+
+    return _embedding_cache
@@ -7,24 +7,88 @@ Features:
 - Incremental update tracking
 - Cost tracking
 - Related ticker discovery
+- Query embedding LRU cache + batched multi-query search
 """
 
 import asyncpg
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from datetime import datetime
 from .embedder import DocumentEmbedder
 from .tagger import AutoTagger
 
 
+class QueryEmbeddingCache:
+    """
+    LRU cache for query embeddings (keyed by content hash).
+
+    Repeated searches ("supply chain disruption", CEO statement lookups, ...)
+    skip the embedding API round-trip entirely.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> Optional[List[float]]:
+        key = DocumentEmbedder.hash_content(text)
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return embedding
+
+    def put(self, text: str, embedding: List[float]):
+        if self.max_size <= 0:
+            return
+        key = DocumentEmbedder.hash_content(text)
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def _tag_key(tag_type: str, tag_value: str) -> str:
+    """Denormalized tag key stored in document_embeddings.tag_keys."""
+    return f"{tag_type}:{tag_value}"
+
+
+def _vector_literal(embedding: Sequence[float]) -> str:
+    """pgvector text representation ('[0.1,0.2,...]')."""
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+
+
 class VectorStore:
     """
     TimescaleDB + pgvector interface for RAG with auto-tagging.
     
     Architecture:
     - Vector embeddings: 1536-dim (OpenAI text-embedding-3-small)
-    - Storage: TimescaleDB hypertable (partitioned by document_date)
-    - Index: IVFFlat for fast cosine similarity search
+    - Storage: document_embeddings (plain table, pgvector column)
+    - Index: HNSW (cosine) + partial HNSW per hot doc_type
     - Tags: Multi-dimensional tagging (ticker, sector, topic, entity, geographic)
+    - Tag filter: denormalized tag_keys text[] (GIN) so filtered ANN stays index-driven
+      (see database/migrations/20261018_vector_store_tag_keys.sql)
     
     Usage:
         store = VectorStore(db_pool, embedder, tagger)
@@ -51,7 +115,8 @@ class VectorStore:
         self,
         db_pool: asyncpg.Pool,
         embedder: DocumentEmbedder,
-        tagger: Optional[AutoTagger] = None
+        tagger: Optional[AutoTagger] = None,
+        query_cache_size: int = 1024
     ):
         """
         Initialize VectorStore.
@@ -60,10 +125,12 @@ class VectorStore:
             db_pool: AsyncPG connection pool
             embedder: DocumentEmbedder instance
             tagger: AutoTagger instance (optional, required for auto_tag=True)
+            query_cache_size: Max cached query embeddings (0 disables the cache)
         """
         self.db = db_pool
         self.embedder = embedder
         self.tagger = tagger
+        self.query_cache = QueryEmbeddingCache(max_size=query_cache_size)
         
         # Stats
         self.total_documents = 0
@@ -104,11 +171,11 @@ class VectorStore:
             >>> doc_id
             123
         """
-        # Check for duplicates (by content hash)
+        # Check for duplicates (by content hash, per embedding model)
         content_hash = DocumentEmbedder.hash_content(content)
         existing = await self.db.fetchval(
-            "SELECT id FROM document_embeddings WHERE content_hash = $1",
-            content_hash
+            "SELECT id FROM document_embeddings WHERE content_hash = $1 AND embedding_model = $2",
+            content_hash, self.embedder.model
         )
         
         if existing:
@@ -121,10 +188,11 @@ class VectorStore:
         # Insert to DB
         doc_id = await self.db.fetchval("""
             INSERT INTO document_embeddings 
-                (ticker, doc_type, content, content_hash, embedding, metadata, document_date)
-            VALUES ($1, $2, $3, $4, $5::vector, $6, $7)
+                (ticker, doc_type, content, content_hash, embedding, embedding_model, metadata, document_date)
+            VALUES ($1, $2, $3, $4, $5::vector, $6, $7, $8)
             RETURNING id
-        """, ticker, doc_type, content, content_hash, embed_result.embedding, metadata, document_date)
+        """, ticker, doc_type, content, content_hash, embed_result.embedding, self.embedder.model,
+            metadata, document_date)
         
         # Auto-generate tags
         if auto_tag and self.tagger:
@@ -186,100 +254,100 @@ class VectorStore:
                 ]
             }
         """
-        # Generate query embedding
-        query_embed = await self.embedder.embed_text(query)
+        query_embedding = await self._embed_query(query)
         
-        # Build SQL with optional filters
-        sql = """
-            SELECT 
-                de.id,
-                de.ticker,
-                de.doc_type,
-                de.content,
-                de.metadata,
-                de.document_date,
-                de.created_at,
-                1 - (de.embedding <=> $1::vector) AS similarity,
-                COALESCE(
-                    array_agg(
-                        json_build_object(
-                            'type', dt.tag_type,
-                            'value', dt.tag_value,
-                            'confidence', dt.confidence
-                        )
-                    ) FILTER (WHERE dt.id IS NOT NULL),
-                    '{}'
-                ) as tags
-            FROM document_embeddings de
-            LEFT JOIN document_tags dt ON de.id = dt.document_id
-            WHERE 1=1
+        sql, params = self._build_search_sql(
+            ticker=ticker,
+            doc_type=doc_type,
+            tags=tags,
+            date_range=date_range,
+            embedding_model=self.embedder.model,
+            first_param=3
+        )
+        rows = await self.db.fetch(
+            sql, _vector_literal(query_embedding), top_k * 2, *params  # Fetch 2x, then filter by similarity
+        )
+        
+        results = await self._rows_to_results(rows, min_similarity)
+        results = results[:top_k]
+        
+        self.total_searches += 1
+        
+        return results
+    
+    async def search_similar_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        ticker: Optional[str] = None,
+        doc_type: Optional[str] = None,
+        tags: Optional[Dict[str, List[str]]] = None,
+        min_similarity: float = 0.7,
+        date_range: Optional[tuple[datetime, datetime]] = None
+    ) -> List[List[Dict]]:
         """
-        params = [query_embed.embedding]
-        param_idx = 2
+        Search several queries with shared filters in one round-trip.
         
-        # Ticker filter
-        if ticker:
-            sql += f" AND de.ticker = ${param_idx}"
-            params.append(ticker)
-            param_idx += 1
+        Uncached queries are embedded with a single embed_batch() call, and
+        all queries run as one LATERAL ANN query (one index scan per query).
         
-        # Doc type filter
-        if doc_type:
-            sql += f" AND de.doc_type = ${param_idx}"
-            params.append(doc_type)
-            param_idx += 1
+        Args:
+            queries: Search query texts
+            top_k, ticker, doc_type, tags, min_similarity, date_range:
+                Same as search_similar()
         
-        # Date range filter
-        if date_range:
-            start_date, end_date = date_range
-            sql += f" AND de.document_date BETWEEN ${param_idx} AND ${param_idx + 1}"
-            params.extend([start_date, end_date])
-            param_idx += 2
+        Returns:
+            One result list per query, in input order
         
-        # Tag filtering
-        if tags:
-            for tag_type, tag_values in tags.items():
-                sql += f"""
-                    AND de.id IN (
-                        SELECT document_id FROM document_tags
-                        WHERE tag_type = ${param_idx} AND tag_value = ANY(${param_idx + 1})
-                    )
-                """
-                params.extend([tag_type, tag_values])
-                param_idx += 2
-        
-        sql += f"""
-            GROUP BY de.id
-            ORDER BY de.embedding <=> $1::vector
-            LIMIT ${param_idx}
+        Example:
+            >>> batches = await store.search_similar_batch(
+            ...     ["supply chain disruption", "margin pressure"],
+            ...     tags={"sector": ["Technology"]},
+            ...     top_k=3
+            ... )
+            >>> len(batches)
+            2
         """
-        params.append(top_k * 2)  # Fetch 2x, then filter by similarity
+        if not queries:
+            return []
         
-        # Execute search
-        rows = await self.db.fetch(sql, *params)
+        embeddings = await self._embed_queries(queries)
         
-        # Filter by minimum similarity
-        results = []
-        for row in rows:
-            if row["similarity"] >= min_similarity:
-                results.append({
-                    "id": row["id"],
-                    "ticker": row["ticker"],
-                    "doc_type": row["doc_type"],
-                    "content": row["content"],
-                    "metadata": row["metadata"],
-                    "similarity": float(row["similarity"]),
-                    "document_date": row["document_date"],
-                    "created_at": row["created_at"],
-                    "tags": row["tags"] if row["tags"] else []
-                })
-        
-        # Return top_k after filtering
-        results = results[:top_k]
+        filter_sql, params = self._build_search_sql(
+            ticker=ticker,
+            doc_type=doc_type,
+            tags=tags,
+            date_range=date_range,
+            embedding_model=self.embedder.model,
+            first_param=3,
+            query_vector="q.embedding"
+        )
+        sql = f"""
+            SELECT q.query_idx, hits.*
+            FROM unnest($1::text[]) WITH ORDINALITY AS q(embedding, query_idx)
+            CROSS JOIN LATERAL ({filter_sql}) AS hits
+            ORDER BY q.query_idx, hits.similarity DESC
+        """
+        rows = await self.db.fetch(
+            sql, [_vector_literal(e) for e in embeddings], top_k * 2, *params  # Fetch 2x per query
+        )
         
-        self.total_searches += 1
+        rows = [row for row in rows if row["similarity"] >= min_similarity]
+        results = await self._rows_to_results(rows, min_similarity)
         
-        return results
+        grouped: List[List[Dict]] = [[] for _ in queries]
+        for row, result in zip(rows, results):
+            hits = grouped[row["query_idx"] - 1]
+            if len(hits) < top_k:
+                hits.append(result)
+        
+        self.total_searches += len(queries)
+        
+        return grouped
+    
+    def get_query_cache_stats(self) -> Dict:
+        """Query embedding cache hit/miss statistics."""
+        return self.query_cache.get_stats()
     
     async def get_incremental_updates_needed(
         self,
@@ -563,8 +631,154 @@ class VectorStore:
     
     # ===== Private Helper Methods =====
     
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed a search query, served from the LRU cache when possible."""
+        cached = self.query_cache.get(query)
+        if cached is not None:
+            return cached
+        
+        embed_result = await self.embedder.embed_text(query)
+        self.query_cache.put(query, embed_result.embedding)
+        return embed_result.embedding
+    
+    async def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed many queries; only cache misses go to the API (one batch call)."""
+        embeddings: List[Optional[List[float]]] = [self.query_cache.get(q) for q in queries]
+        missing = list(dict.fromkeys(
+            q for q, e in zip(queries, embeddings) if e is None
+        ))
+        
+        if missing:
+            if len(missing) == 1:
+                fetched = [await self.embedder.embed_text(missing[0])]
+            else:
+                fetched = await self.embedder.embed_batch(missing, show_progress=False)
+            
+            by_query = {}
+            for query, result in zip(missing, fetched):
+                if result is None:
+                    raise RuntimeError(f"Embedding failed for query: {query[:50]}")
+                self.query_cache.put(query, result.embedding)
+                by_query[query] = result.embedding
+            
+            embeddings = [e if e is not None else by_query[q] for q, e in zip(queries, embeddings)]
+        
+        return embeddings
+    
+    @staticmethod
+    def _build_search_sql(
+        ticker: Optional[str] = None,
+        doc_type: Optional[str] = None,
+        tags: Optional[Dict[str, List[str]]] = None,
+        date_range: Optional[Tuple[datetime, datetime]] = None,
+        embedding_model: Optional[str] = None,
+        first_param: int = 3,
+        query_vector: str = "$1"
+    ) -> Tuple[str, List]:
+        """
+        Build the ANN query ($1 = query vector, $2 = candidate limit, top_k * 2).
+        
+        All filters are plain column predicates on document_embeddings
+        (tags via the GIN-indexed tag_keys array), so the planner can keep the
+        `ORDER BY embedding <=> ...` index scan instead of sorting a join.
+        Tags are fetched afterwards for the returned ids only.
+        
+        embedding_model restricts hits to vectors from the query's model;
+        vectors from different models are not comparable.
+        """
+        conditions = []
+        params: List[Any] = []
+        param_idx = first_param
+        
+        if embedding_model:
+            conditions.append(f"de.embedding_model = ${param_idx}")
+            params.append(embedding_model)
+            param_idx += 1
+        
+        if ticker:
+            conditions.append(f"de.ticker = ${param_idx}")
+            params.append(ticker)
+            param_idx += 1
+        
+        if doc_type:
+            conditions.append(f"de.doc_type = ${param_idx}")
+            params.append(doc_type)
+            param_idx += 1
+        
+        if date_range:
+            start_date, end_date = date_range
+            conditions.append(f"de.document_date BETWEEN ${param_idx} AND ${param_idx + 1}")
+            params.extend([start_date, end_date])
+            param_idx += 2
+        
+        # OR within a tag type, AND across tag types
+        if tags:
+            for tag_type, tag_values in tags.items():
+                conditions.append(f"de.tag_keys && ${param_idx}::text[]")
+                params.append([_tag_key(tag_type, v) for v in tag_values])
+                param_idx += 1
+        
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        sql = f"""
+            SELECT
+                de.id,
+                de.ticker,
+                de.doc_type,
+                de.content,
+                de.metadata,
+                de.document_date,
+                de.created_at,
+                1 - (de.embedding <=> {query_vector}::vector) AS similarity
+            FROM document_embeddings de
+            WHERE {where}
+            ORDER BY de.embedding <=> {query_vector}::vector
+            LIMIT $2
+        """
+        return sql, params
+    
+    async def _rows_to_results(self, rows: List, min_similarity: float) -> List[Dict]:
+        """Apply the similarity threshold and attach tags (one query for all ids)."""
+        rows = [row for row in rows if row["similarity"] >= min_similarity]
+        tags_by_doc = await self._fetch_tags([row["id"] for row in rows])
+        
+        return [
+            {
+                "id": row["id"],
+                "ticker": row["ticker"],
+                "doc_type": row["doc_type"],
+                "content": row["content"],
+                "metadata": row["metadata"],
+                "similarity": float(row["similarity"]),
+                "document_date": row["document_date"],
+                "created_at": row["created_at"],
+                "tags": tags_by_doc.get(row["id"], [])
+            }
+            for row in rows
+        ]
+    
+    async def _fetch_tags(self, document_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Tags for the given documents, grouped by document id."""
+        if not document_ids:
+            return {}
+        
+        rows = await self.db.fetch("""
+            SELECT document_id, tag_type, tag_value, confidence
+            FROM document_tags
+            WHERE document_id = ANY($1::bigint[])
+        """, list(set(document_ids)))
+        
+        tags_by_doc: Dict[int, List[Dict]] = {}
+        for row in rows:
+            tags_by_doc.setdefault(row["document_id"], []).append({
+                "type": row["tag_type"],
+                "value": row["tag_value"],
+                "confidence": row["confidence"]
+            })
+        return tags_by_doc
+    
     async def _add_tags(self, document_id: int, tags: List[Dict]):
-        """Add tags to document."""
+        """Add tags to document (and keep the denormalized tag_keys in sync)."""
+        added = []
         for tag in tags:
             try:
                 await self.db.execute("""
@@ -572,8 +786,18 @@ class VectorStore:
                     VALUES ($1, $2, $3, $4)
                     ON CONFLICT (document_id, tag_type, tag_value) DO NOTHING
                 """, document_id, tag["type"], tag["value"], tag["confidence"])
+                added.append(_tag_key(tag["type"], tag["value"]))
             except Exception as e:
                 print(f"  ⚠️  Failed to add tag {tag}: {e}")
+        
+        if added:
+            await self.db.execute("""
+                UPDATE document_embeddings
+                SET tag_keys = ARRAY(
+                    SELECT DISTINCT unnest(tag_keys || $2::text[])
+                )
+                WHERE id = $1
+            """, document_id, added)
     
     async def _update_sync_status(
         self,
@@ -0,0 +1,134 @@
+-- Stock Prices: 1h / 1d / 1w continuous aggregates
+-- 목표: PriceHistoryReader가 봉 집계를 Python이 아닌 TimescaleDB에서 읽도록
+-- 날짜: 2026-10-18
+-- 전제: 20261018_stock_prices_unique_ticker_time.sql 적용 후 실행
+--       (hypertable 유니크 인덱스는 파티션 컬럼 time을 포함해야 함)
+-- 후속: 초기 materialize는 20261018_stock_prices_continuous_aggregates_refresh.sql
+--       (refresh_continuous_aggregate는 트랜잭션 안에서 실행 불가)
+--
+-- TimescaleDB가 없으면 전체 블록이 NOTICE만 남기고 건너뜀
+-- (PriceHistoryReader는 원본 테이블에서 SQL로 집계)
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        RAISE NOTICE 'TimescaleDB not available, PriceHistoryReader will aggregate in SQL';
+        RETURN;
+    END IF;
+
+    -- ========================================================================
+    -- Primary key (id) → (id, time): hypertable의 유니크 제약은 time 포함 필수
+    -- ========================================================================
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY (i.indkey)
+        WHERE i.indrelid = 'stock_prices'::regclass
+          AND i.indisprimary
+          AND a.attname = 'time'
+    ) THEN
+        ALTER TABLE stock_prices DROP CONSTRAINT IF EXISTS stock_prices_pkey;
+        ALTER TABLE stock_prices ADD CONSTRAINT stock_prices_pkey PRIMARY KEY (id, time);
+    END IF;
+
+    -- ========================================================================
+    -- Hypertable (time 컬럼 기준)
+    -- ========================================================================
+
+    PERFORM create_hypertable(
+        'stock_prices',
+        'time',
+        if_not_exists => TRUE,
+        migrate_data => TRUE
+    );
+
+    -- ========================================================================
+    -- Continuous aggregates (OHLCV 집계 규칙: first/max/min/last/sum)
+    -- WITH NO DATA → 트랜잭션 안에서 생성 가능
+    -- ========================================================================
+
+    EXECUTE $sql$
+        CREATE MATERIALIZED VIEW IF NOT EXISTS stock_prices_1h
+        WITH (timescaledb.continuous) AS
+        SELECT
+            ticker,
+            time_bucket(INTERVAL '1 hour', time) AS bucket,
+            first(open, time) AS open,
+            max(high) AS high,
+            min(low) AS low,
+            last(close, time) AS close,
+            sum(volume) AS volume,
+            last(adjusted_close, time) AS adjusted_close
+        FROM stock_prices
+        GROUP BY ticker, bucket
+        WITH NO DATA
+    $sql$;
+
+    EXECUTE $sql$
+        CREATE MATERIALIZED VIEW IF NOT EXISTS stock_prices_1d
+        WITH (timescaledb.continuous) AS
+        SELECT
+            ticker,
+            time_bucket(INTERVAL '1 day', time) AS bucket,
+            first(open, time) AS open,
+            max(high) AS high,
+            min(low) AS low,
+            last(close, time) AS close,
+            sum(volume) AS volume,
+            last(adjusted_close, time) AS adjusted_close
+        FROM stock_prices
+        GROUP BY ticker, bucket
+        WITH NO DATA
+    $sql$;
+
+    -- time_bucket('1 week')는 월요일 시작 (date_trunc('week')와 동일)
+    EXECUTE $sql$
+        CREATE MATERIALIZED VIEW IF NOT EXISTS stock_prices_1w
+        WITH (timescaledb.continuous) AS
+        SELECT
+            ticker,
+            time_bucket(INTERVAL '1 week', time) AS bucket,
+            first(open, time) AS open,
+            max(high) AS high,
+            min(low) AS low,
+            last(close, time) AS close,
+            sum(volume) AS volume,
+            last(adjusted_close, time) AS adjusted_close
+        FROM stock_prices
+        GROUP BY ticker, bucket
+        WITH NO DATA
+    $sql$;
+
+    -- 패널 조회: WHERE ticker = ANY(...) AND bucket >= ... ORDER BY ticker, bucket
+    CREATE INDEX IF NOT EXISTS idx_stock_prices_1h_ticker_bucket ON stock_prices_1h (ticker, bucket);
+    CREATE INDEX IF NOT EXISTS idx_stock_prices_1d_ticker_bucket ON stock_prices_1d (ticker, bucket);
+    CREATE INDEX IF NOT EXISTS idx_stock_prices_1w_ticker_bucket ON stock_prices_1w (ticker, bucket);
+
+    -- ========================================================================
+    -- 갱신 정책 (백필 직후 전체 갱신은 refresh 스크립트 사용)
+    -- ========================================================================
+
+    PERFORM add_continuous_aggregate_policy('stock_prices_1h',
+        start_offset => INTERVAL '3 days',
+        end_offset => INTERVAL '1 hour',
+        schedule_interval => INTERVAL '1 hour',
+        if_not_exists => TRUE);
+
+    PERFORM add_continuous_aggregate_policy('stock_prices_1d',
+        start_offset => INTERVAL '7 days',
+        end_offset => INTERVAL '1 hour',
+        schedule_interval => INTERVAL '1 hour',
+        if_not_exists => TRUE);
+
+    PERFORM add_continuous_aggregate_policy('stock_prices_1w',
+        start_offset => INTERVAL '28 days',
+        end_offset => INTERVAL '1 hour',
+        schedule_interval => INTERVAL '1 day',
+        if_not_exists => TRUE);
+
+    -- 실시간 집계: 아직 materialize되지 않은 최근 구간은 원본에서 합쳐서 반환
+    ALTER MATERIALIZED VIEW stock_prices_1h SET (timescaledb.materialized_only = false);
+    ALTER MATERIALIZED VIEW stock_prices_1d SET (timescaledb.materialized_only = false);
+    ALTER MATERIALIZED VIEW stock_prices_1w SET (timescaledb.materialized_only = false);
+END $$;
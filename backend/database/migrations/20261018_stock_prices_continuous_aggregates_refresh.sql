@@ -0,0 +1,15 @@
+-- Stock Prices: continuous aggregate 초기 materialize (대량 백필 후 재실행)
+-- 날짜: 2026-10-18
+-- 전제: 20261018_stock_prices_continuous_aggregates.sql 적용 후 실행
+-- 주의: refresh_continuous_aggregate는 트랜잭션 블록 / DO 블록 안에서 실행 불가
+--       → psql 자동 커밋 모드로 실행 (psql -f, --single-transaction 사용 금지)
+
+SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') AS has_timescaledb \gset
+
+\if :has_timescaledb
+CALL refresh_continuous_aggregate('stock_prices_1h', NULL, NULL);
+CALL refresh_continuous_aggregate('stock_prices_1d', NULL, NULL);
+CALL refresh_continuous_aggregate('stock_prices_1w', NULL, NULL);
+\else
+\echo 'TimescaleDB not available, nothing to refresh'
+\endif
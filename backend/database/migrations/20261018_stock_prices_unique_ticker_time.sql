@@ -0,0 +1,26 @@
+-- Stock Prices: (ticker, time) 유니크 인덱스
+-- 목표: BulkLoader의 COPY → 스테이징 → INSERT ... ON CONFLICT (ticker, time) 병합 지원
+-- 날짜: 2026-10-18
+-- 배경: 기존 StockRepository.save_prices는 행마다 ORM INSERT만 수행해
+--       같은 (ticker, time)을 재백필하면 중복 행이 쌓임
+
+-- ============================================================================
+-- 기존 중복 제거 (가장 최근 id 유지)
+-- ============================================================================
+
+DELETE FROM stock_prices a
+USING stock_prices b
+WHERE
+    a.ticker = b.ticker
+    AND a.time = b.time
+    AND a.id < b.id;
+
+-- ============================================================================
+-- 유니크 인덱스 (TimescaleDB hypertable: 파티션 컬럼 time 포함)
+-- ============================================================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_stock_price_ticker_time ON stock_prices (ticker, time);
+
+COMMENT ON INDEX uq_stock_price_ticker_time IS 'BulkLoader ON CONFLICT (ticker, time) 병합 대상';
+
+ANALYZE stock_prices;
@@ -0,0 +1,21 @@
+-- Vector Store: 임베딩 모델별 벡터 분리
+-- 목표: 로컬/원격 백엔드 벡터 혼재 시 같은 모델 벡터끼리만 중복 제거·검색
+-- 날짜: 2026-10-18
+-- 배경: 백엔드 교체(OpenAI ↔ 로컬) 후 content_hash만으로 중복 제거하면
+--       다른 모델 벡터가 재사용되고, 검색 시 서로 비교할 수 없는 벡터가 섞임
+
+-- alembic(add_rag_embedding_tables)로 생성된 테이블에는 이미 존재
+ALTER TABLE document_embeddings
+ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(50) NOT NULL DEFAULT 'text-embedding-3-small';
+
+-- 기존 행은 DocumentEmbedder 기본 모델(text-embedding-3-small)로 임베딩됨
+UPDATE document_embeddings
+SET
+    embedding_model = 'text-embedding-3-small'
+WHERE
+    embedding_model IS NULL;
+
+-- VectorStore.add_document 중복 검사 (content_hash, embedding_model)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_emb_hash_model ON document_embeddings (content_hash, embedding_model);
+
+ANALYZE document_embeddings;
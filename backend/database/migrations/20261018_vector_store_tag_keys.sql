@@ -0,0 +1,72 @@
+-- Vector Store: 필터링된 ANN 검색 최적화
+-- 목표: 태그/티커/문서유형 필터가 있어도 ORDER BY embedding <=> $1 인덱스 스캔 유지
+-- 날짜: 2026-10-18
+-- 배경: 기존 search_similar는 document_tags LEFT JOIN + GROUP BY + IN (SELECT ...)
+--       서브쿼리로 인해 플래너가 ANN 인덱스를 쓰지 못하고 전체 정렬 수행
+
+-- ============================================================================
+-- 비정규화 태그 배열 (tag_type:tag_value)
+-- ============================================================================
+
+ALTER TABLE document_embeddings
+ADD COLUMN IF NOT EXISTS tag_keys TEXT [] NOT NULL DEFAULT '{}';
+
+-- 기존 태그 백필
+UPDATE document_embeddings de
+SET
+    tag_keys = t.keys
+FROM (
+        SELECT document_id, array_agg(
+                DISTINCT tag_type || ':' || tag_value
+            ) AS keys
+        FROM document_tags
+        GROUP BY
+            document_id
+    ) t
+WHERE
+    de.id = t.document_id;
+
+-- tag_keys && ARRAY[...] 필터용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_emb_tag_keys ON document_embeddings USING gin (tag_keys);
+
+COMMENT ON COLUMN document_embeddings.tag_keys IS 'document_tags 비정규화 (VectorStore._add_tags가 동기화)';
+
+-- ============================================================================
+-- ANN 인덱스 (HNSW, cosine)
+-- ============================================================================
+
+-- 전체 HNSW 인덱스는 idx_embeddings_vector_hnsw (alembic add_rag_embedding_tables)가 이미 생성
+
+-- 자주 쓰는 doc_type 전용 부분 인덱스 (find_similar_ceo_statements, 뉴스 검색)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_emb_hnsw_ceo_quote ON document_embeddings USING hnsw (embedding vector_cosine_ops)
+WHERE
+    doc_type = 'ceo_quote';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_emb_hnsw_news ON document_embeddings USING hnsw (embedding vector_cosine_ops)
+WHERE
+    doc_type = 'news';
+
+-- 티커 필터 (선택도가 높은 경우 플래너가 btree → 정렬 선택)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doc_emb_ticker_type ON document_embeddings (ticker, doc_type);
+
+-- pgvector >= 0.8: 필터로 결과가 부족할 때 인덱스를 계속 탐색
+-- (VectorStore는 top_k * 2 over-fetch로 보완하므로 선택 사항)
+-- ALTER DATABASE ai_trading SET hnsw.iterative_scan = relaxed_order;
+
+-- ============================================================================
+-- 통계 갱신
+-- ============================================================================
+
+ANALYZE document_embeddings;
+
+-- ============================================================================
+-- 검증 쿼리
+-- ============================================================================
+
+-- EXPLAIN ANALYZE
+-- SELECT id, 1 - (embedding <=> '[...]'::vector) AS similarity
+-- FROM document_embeddings
+-- WHERE tag_keys && ARRAY['sector:Technology']
+-- ORDER BY embedding <=> '[...]'::vector
+-- LIMIT 10;
+-- → "Index Scan using idx_embeddings_vector_hnsw" 확인
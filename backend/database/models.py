@@ -366,6 +366,8 @@ class StockPrice(Base):
         Index('idx_stock_price_ticker', 'ticker'),
         Index('idx_stock_price_time', 'time'),
         Index('idx_stock_price_ticker_time', 'ticker', 'time'),
+        # BulkLoader ON CONFLICT (ticker, time) 병합 대상
+        Index('uq_stock_price_ticker_time', 'ticker', 'time', unique=True),
         # Phase 1 Optimization: 최신 가격 조회용 DESC 인덱스
         Index('idx_stock_ticker_time_desc', 'ticker', 'time', postgresql_ops={'time': 'DESC'}),
     )
@@ -0,0 +1,280 @@
+"""
+Price History - 다종목 컬럼형 가격 이력 조회 (TimescaleDB continuous aggregate)
+
+핵심 원칙:
+- 종목 N개 × 기간을 단일 쿼리로 조회 (ticker = ANY($1)), 행 단위 ORM 객체 없음
+- COPY (SELECT ...) TO STDOUT CSV → pandas C 파서 → NumPy 컬럼 (레코드 객체 생성 없음)
+- 1h / 1d / 1w 봉은 continuous aggregate(stock_prices_1h/1d/1w)에서 조회
+  (aggregate가 없으면 SQL GROUP BY로 대체, Python 집계 없음)
+- 최근 조회 구간은 LRU+TTL 캐시 (BulkLoader.load_prices 적재 시 무효화)
+
+사용법:
+    reader = PriceHistoryReader()
+    panel = await reader.get_panel(["AAPL", "MSFT"], start, end, interval="1d")
+    closes = panel.pivot("close")            # DataFrame (index: time, columns: ticker)
+    aapl = panel.for_ticker("AAPL")          # {"time": ndarray, "close": ndarray, ...}
+    table = panel.to_arrow()                 # pyarrow.Table (설치 시)
+
+작성일: 2026-10-18
+"""
+
+import io
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.database.bulk_loader import ASYNCPG_AVAILABLE, default_dsn
+from backend.database.query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
+
+FIELDS = ("open", "high", "low", "close", "volume", "adjusted_close")
+COLUMNS = ("ticker", "time") + FIELDS
+
+# interval → (continuous aggregate, date_trunc 단위)
+AGGREGATES = {
+    "1h": ("stock_prices_1h", "hour"),
+    "1d": ("stock_prices_1d", "day"),
+    "1w": ("stock_prices_1w", "week"),
+}
+
+# 가격 패널 전용 캐시 (패널은 크므로 공용 query_cache와 분리)
+price_panel_cache = QueryCache(max_entries=32, default_ttl=300)
+
+
+class PricePanel:
+    """
+    (ticker, time) 정렬된 컬럼형 가격 패널
+
+    columns: 컬럼명 → ndarray (길이 동일), 종목별 구간은 offsets로 O(1) 슬라이스
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], interval: str):
+        self.columns = columns
+        self.interval = interval
+
+        tickers = columns["ticker"]
+        if len(tickers):
+            starts = np.flatnonzero(np.r_[True, tickers[1:] != tickers[:-1]])
+            ends = np.r_[starts[1:], len(tickers)]
+            self.offsets: Dict[str, Tuple[int, int]] = {
+                str(tickers[s]): (int(s), int(e)) for s, e in zip(starts, ends)
+            }
+        else:
+            self.offsets = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, interval: str) -> "PricePanel":
+        df = df.sort_values(["ticker", "time"], kind="stable")
+        columns = {
+            "ticker": df["ticker"].to_numpy(dtype=object),
+            "time": df["time"].to_numpy(dtype="datetime64[ns]"),
+        }
+        for field in FIELDS:
+            columns[field] = df[field].to_numpy(dtype=float)
+        return cls(columns, interval)
+
+    def __len__(self) -> int:
+        return len(self.columns["ticker"])
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.offsets)
+
+    def for_ticker(self, ticker: str) -> Dict[str, np.ndarray]:
+        """종목 구간 (뷰, 복사 없음)"""
+        start, end = self.offsets.get(ticker, (0, 0))
+        return {name: values[start:end] for name, values in self.columns.items() if name != "ticker"}
+
+    def pivot(self, field: str = "close") -> pd.DataFrame:
+        """wide 형식 (index: time, columns: ticker)"""
+        frame = pd.DataFrame({
+            "ticker": self.columns["ticker"],
+            "time": self.columns["time"],
+            field: self.columns[field],
+        })
+        return frame.pivot(index="time", columns="ticker", values=field).reindex(columns=self.tickers)
+
+    def to_frame(self) -> pd.DataFrame:
+        """long 형식 DataFrame"""
+        return pd.DataFrame(self.columns, columns=list(COLUMNS))
+
+    def to_arrow(self):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is required for PricePanel.to_arrow")
+        return pa.table({name: self.columns[name] for name in COLUMNS})
+
+
+class PriceHistoryReader:
+    """
+    다종목 가격 패널 조회기
+
+    Args:
+        dsn: PostgreSQL DSN (기본: DATABASE_URL)
+        pool: 기존 asyncpg 풀 (지정 시 dsn 무시)
+        cache: 패널 캐시 (기본: price_panel_cache, None이 아닌 빈 캐시도 허용)
+        recent_ttl: 오늘을 포함하는 구간의 캐시 TTL (초)
+        history_ttl: 과거 구간의 캐시 TTL (초, 백필 시 무효화)
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        pool: Any = None,
+        cache: Optional[QueryCache] = None,
+        recent_ttl: float = 60,
+        history_ttl: float = 6 * 3600,
+    ):
+        if pool is None and not ASYNCPG_AVAILABLE:
+            raise RuntimeError("asyncpg is required for PriceHistoryReader")
+        self.dsn = dsn or default_dsn()
+        self.pool = pool
+        self.cache = cache if cache is not None else price_panel_cache
+        self.recent_ttl = recent_ttl
+        self.history_ttl = history_ttl
+
+        # continuous aggregate 미설치 시 False로 전환 (SQL GROUP BY 대체)
+        self.aggregates_available = True
+
+    async def get_panel(
+        self,
+        tickers: Iterable[str],
+        start: datetime,
+        end: Optional[datetime] = None,
+        interval: str = "1d",
+    ) -> PricePanel:
+        """
+        가격 패널 조회 [start, end)
+
+        Args:
+            tickers: 종목 목록
+            interval: "raw" (원본 행) | "1h" | "1d" | "1w"
+        """
+        if interval != "raw" and interval not in AGGREGATES:
+            raise ValueError(f"Unsupported interval: {interval}")
+
+        tickers = sorted(set(tickers))
+        # end=None (현재까지) 구간은 recent_ttl 동안 같은 키로 재사용
+        key = ("price_panel", tuple(tickers), start, end, interval)
+
+        hit, panel = self.cache.get(key)
+        if hit:
+            return panel
+
+        started = time.perf_counter()
+        now = datetime.now()
+        frame = await self._fetch(tickers, start, end or now, interval)
+        panel = PricePanel.from_frame(frame, interval)
+
+        ttl = self.recent_ttl if end is None or end >= now - timedelta(days=1) else self.history_ttl
+        self.cache.set(key, panel, ttl_seconds=ttl, tables=("stock_prices",))
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Price panel loaded: {len(panel.offsets)}/{len(tickers)} tickers, {len(panel)} rows "
+            f"({interval}) in {elapsed:.2f}s"
+        )
+        return panel
+
+    async def get_close_matrix(
+        self,
+        tickers: Iterable[str],
+        start: datetime,
+        end: Optional[datetime] = None,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """종가 wide DataFrame (분석/백테스트용)"""
+        return (await self.get_panel(tickers, start, end, interval)).pivot("close")
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _build_query(self, interval: str) -> str:
+        columns = ", ".join(FIELDS)
+        where = "ticker = ANY($1::text[]) AND {col} >= $2 AND {col} < $3"
+
+        if interval == "raw":
+            return (
+                f"SELECT ticker, time, {columns} FROM stock_prices "
+                f"WHERE {where.format(col='time')} ORDER BY ticker, time"
+            )
+
+        view, unit = AGGREGATES[interval]
+        if self.aggregates_available:
+            return (
+                f"SELECT ticker, bucket AS time, {columns} FROM {view} "
+                f"WHERE {where.format(col='bucket')} ORDER BY ticker, bucket"
+            )
+
+        # continuous aggregate 미설치: 같은 규칙으로 DB에서 집계
+        return (
+            f"SELECT ticker, date_trunc('{unit}', time) AS bucket, "
+            f"(array_agg(open ORDER BY time))[1], max(high), min(low), "
+            f"(array_agg(close ORDER BY time DESC))[1], sum(volume), "
+            f"(array_agg(adjusted_close ORDER BY time DESC))[1] "
+            f"FROM stock_prices WHERE {where.format(col='time')} "
+            f"GROUP BY ticker, bucket ORDER BY ticker, bucket"
+        )
+
+    async def _fetch(self, tickers: List[str], start: datetime, end: datetime, interval: str) -> pd.DataFrame:
+        conn, release = await self._acquire()
+        try:
+            try:
+                return await self._copy_query(conn, self._build_query(interval), tickers, start, end)
+            except Exception as e:
+                undefined_table = asyncpg is not None and isinstance(e, asyncpg.exceptions.UndefinedTableError)
+                if interval == "raw" or not self.aggregates_available or not undefined_table:
+                    raise
+                logger.warning(f"Continuous aggregate for {interval} not found, aggregating in SQL: {e}")
+                self.aggregates_available = False
+                return await self._copy_query(conn, self._build_query(interval), tickers, start, end)
+        finally:
+            await release()
+
+    async def _copy_query(self, conn: Any, sql: str, tickers: List[str], start: datetime, end: datetime) -> pd.DataFrame:
+        buffer = io.BytesIO()
+        await conn.copy_from_query(sql, tickers, start, end, output=buffer, format="csv")
+        if not buffer.getbuffer().nbytes:
+            return pd.DataFrame({name: pd.Series(dtype=float) for name in COLUMNS})
+        buffer.seek(0)
+
+        frame = pd.read_csv(
+            buffer,
+            names=list(COLUMNS),
+            header=None,
+            dtype={"ticker": str, **{field: float for field in FIELDS}},
+        )
+        frame["time"] = pd.to_datetime(frame["time"], utc=True).dt.tz_localize(None)
+        return frame
+
+    async def _acquire(self):
+        if self.pool is not None:
+            conn = await self.pool.acquire()
+
+            async def release():
+                await self.pool.release(conn)
+        else:
+            conn = await asyncpg.connect(self.dsn)
+
+            async def release():
+                await conn.close()
+
+        return conn, release
@@ -0,0 +1,293 @@
+"""
+Query Cache - Repository 읽기 캐시 (LRU + TTL + 테이블 단위 무효화)
+
+핵심 원칙:
+- 크기 제한 LRU (OrderedDict) + 엔트리별 TTL, 만료 엔트리는 조회/삽입 시 제거
+- ORM 객체는 세션과 분리된 스냅샷(CachedRecord)으로 저장 → 세션 종료 후에도 안전, pickle 가능
+- 각 캐시 엔트리에 의존 테이블 태그 → 쓰기 메서드가 해당 테이블 엔트리만 무효화
+- hit / miss / eviction / expiration / invalidation 지표
+
+사용법:
+    @cached_query(ttl_seconds=300, tables=("news_articles",))
+    def get_recent_articles(self, hours=24): ...
+
+    @invalidates("news_articles")
+    def create_article(self, article): ...
+
+작성일: 2026-10-18
+"""
+
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from sqlalchemy import inspect as sa_inspect
+    from sqlalchemy.engine import Row
+    from sqlalchemy.exc import NoInspectionAvailable
+except ImportError:  # pragma: no cover - sqlalchemy는 repository 의존성
+    sa_inspect = None
+    Row = None
+    NoInspectionAvailable = Exception
+
+
+class CachedRecord:
+    """
+    ORM 객체의 detached 스냅샷 (컬럼 속성만, 읽기 전용)
+
+    article.title 처럼 기존 ORM 객체와 같은 방식으로 컬럼 값에 접근합니다.
+    관계(relationship)는 포함하지 않습니다.
+    """
+
+    __slots__ = ("_model", "_values")
+
+    def __init__(self, model: str, values: Dict[str, Any]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_values", values)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"{self._model} snapshot has no column '{name}'") from None
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self._model} snapshot is read-only")
+
+    def __reduce__(self):
+        return (CachedRecord, (self._model, self._values))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CachedRecord) and (self._model, self._values) == (other._model, other._values)
+
+    def __repr__(self) -> str:
+        return f"<{self._model} snapshot id={self._values.get('id')}>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._values)
+
+
+def detach(value: Any) -> Any:
+    """
+    쿼리 결과 → 세션 독립적인 값
+
+    ORM 객체 → CachedRecord, Row → tuple, list/tuple은 재귀 변환
+    """
+    if isinstance(value, list):
+        return [detach(v) for v in value]
+    if Row is not None and isinstance(value, Row):
+        return tuple(detach(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(detach(v) for v in value)
+    if isinstance(value, dict):
+        return {k: detach(v) for k, v in value.items()}
+
+    if sa_inspect is not None and hasattr(value, "__mapper__"):
+        try:
+            state = sa_inspect(value)
+        except NoInspectionAvailable:
+            return value
+        values = {attr.key: getattr(value, attr.key) for attr in state.mapper.column_attrs}
+        return CachedRecord(type(value).__name__, values)
+
+    return value
+
+
+class QueryCache:
+    """
+    LRU + TTL 쿼리 결과 캐시 (thread-safe)
+
+    사용법:
+        cache = QueryCache(max_entries=1024)
+        cache.set(key, rows, ttl_seconds=300, tables=("news_articles",))
+        hit, rows = cache.get(key)
+        cache.invalidate_tables("news_articles")
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        # key → (value, expires_at, tables)
+        self._entries: "OrderedDict[Any, Tuple[Any, float, Tuple[str, ...]]]" = OrderedDict()
+        self._by_table: Dict[str, Set[Any]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """(hit 여부, 값)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        tables: Iterable[str] = (),
+    ):
+        ttl = self.default_ttl if ttl_seconds is None else ttl_seconds
+        tables = tuple(tables)
+        now = time.monotonic()
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, now + ttl, tables)
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            if len(self._entries) > self.max_entries:
+                self._purge_expired(now)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_tables(self, *tables: str) -> int:
+        """테이블에 의존하는 엔트리 제거 (쓰기 후 호출)"""
+        removed = 0
+        with self._lock:
+            for table in tables:
+                for key in list(self._by_table.get(table, ())):
+                    self._remove(key)
+                    removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_table.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    # ================================================================
+    # Private 메서드 (lock 보유 상태에서 호출)
+    # ================================================================
+
+    def _remove(self, key: Any):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for table in entry[2]:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def _purge_expired(self, now: float):
+        expired = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+
+
+# 프로세스 공용 repository 캐시
+query_cache = QueryCache()
+
+
+def _make_key(func: Callable, signature: inspect.Signature, args: tuple, kwargs: dict) -> Tuple:
+    """self를 제외한 인자를 기본값 포함 정규화 (get(24) == get(hours=24))"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    params = tuple((name, value) for name, value in bound.arguments.items() if name != "self")
+    key = (func.__module__, func.__qualname__, params)
+    try:
+        hash(key)
+    except TypeError:
+        key = (func.__module__, func.__qualname__, repr(params))
+    return key
+
+
+def cached_query(
+    ttl_seconds: float = 300,
+    tables: Iterable[str] = (),
+    cache: Optional[QueryCache] = None,
+):
+    """
+    Repository 읽기 메서드 캐시 데코레이터
+
+    Args:
+        ttl_seconds: 엔트리 유효 시간
+        tables: 결과가 의존하는 테이블 (쓰기 시 무효화 대상)
+        cache: 사용할 QueryCache (기본: 프로세스 공용 query_cache)
+
+    반환값은 detach()된 스냅샷이며, 호출마다 리스트 사본을 돌려줍니다.
+    """
+    tables = tuple(tables)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache if cache is not None else query_cache
+            key = _make_key(func, signature, args, kwargs)
+
+            hit, value = store.get(key)
+            if not hit:
+                value = detach(func(*args, **kwargs))
+                store.set(key, value, ttl_seconds=ttl_seconds, tables=tables)
+
+            return list(value) if isinstance(value, list) else value
+
+        wrapper.cache_tables = tables
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*tables: str, cache: Optional[QueryCache] = None):
+    """쓰기 메서드 성공 후 해당 테이블 캐시 무효화"""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            (cache if cache is not None else query_cache).invalidate_tables(*tables)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,4 @@
 """
-from __future__ import annotations
-
 Database Repository Layer
 
 Repository pattern for data access:
@@ -15,9 +13,9 @@ Usage:
         news_repo = NewsRepository(session)
         article = await news_repo.create_article(...)
 """
+from __future__ import annotations
 
-from typing import List, Optional, Dict, Tuple, TYPE_CHECKING, Callable, Any
-from functools import wraps
+from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
 
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -47,54 +45,20 @@ from backend.database.models import (
     PositionOwnership,
     ConflictLog
 )
+from backend.database.query_cache import cached_query, invalidates
 
 if TYPE_CHECKING:
     from backend.news.rss_crawler import NewsArticle as RSSNewsArticle
     from backend.ai.reasoning.deep_reasoning import DeepReasoningResult
 
 
-# Phase 1 Optimization: TTL-based Query Result Caching
-_query_cache: Dict[str, Tuple[Any, datetime]] = {}
-
 def cache_with_ttl(ttl_seconds: int = 300):
     """
-    TTL 기반 쿼리 결과 캐싱 데코레이터
-    
-    Phase 1.3: 반복 쿼리 성능 향상
-    
-    Args:
-        ttl_seconds: Cache expiration time in seconds (default: 5 minutes)
-    
-    Example:
-        @cache_with_ttl(300)  # 5분 캐시
-        def get_recent_articles(self, hours=24):
-            ...
-    """
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = f"{func.__name__}_{str(args[1:])}_{str(kwargs)}"  # args[0] is self
-            
-            now = datetime.now()
-            
-            # Check cache
-            if cache_key in _query_cache:
-                cached_value, cached_time = _query_cache[cache_key]
-                if (now - cached_time).total_seconds() < ttl_seconds:
-                    return cached_value
-            
-            # Cache miss or expired - execute query
-            result = func(*args, **kwargs)
-            
-            # Store in cache
-            _query_cache[cache_key] = (result, now)
-            
-            return result
-        
-        return wrapper
-    return decorator
+    TTL 기반 쿼리 결과 캐싱 데코레이터 (하위 호환용)
 
+    새 코드는 테이블 무효화가 가능한 cached_query(ttl_seconds, tables=...)를 사용하세요.
+    """
+    return cached_query(ttl_seconds)
 
 
 class NewsRepository:
@@ -103,6 +67,7 @@ class NewsRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @invalidates("news_articles")
     def create_article(self, article: RSSNewsArticle) -> NewsArticle:
         """
         RSS 크롤링 결과 저장
@@ -124,6 +89,7 @@ class NewsRepository:
         self.session.refresh(db_article)
         return db_article
 
+    @invalidates("news_articles")
     def save_processed_article(self, article_data: Dict) -> NewsArticle:
         """
         NLP 처리된 뉴스 저장 (Embeddings 포함)
@@ -185,9 +151,9 @@ class NewsRepository:
         """URL로 기사 조회"""
         return self.session.query(NewsArticle).filter_by(url=url).first()
 
-    @cache_with_ttl(300)  # Phase 1.3: 5분 캐시
+    @cached_query(300, tables=("news_articles",))  # Phase 1.3: 5분 캐시
     def get_recent_articles(self, hours: int = 24, source: Optional[str] = None) -> List[NewsArticle]:
-        """최근 N시간 내 기사 조회"""
+        """최근 N시간 내 기사 조회 (캐시: 세션과 분리된 읽기 전용 스냅샷 반환)"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         query = self.session.query(NewsArticle).filter(NewsArticle.crawled_at >= cutoff_time)
 
@@ -215,6 +181,7 @@ class AnalysisRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @invalidates("analysis_results")
     def create_analysis(
         self,
         article_id: int,
@@ -252,8 +219,9 @@ class AnalysisRepository:
         """분석 ID로 조회"""
         return self.session.query(AnalysisResult).filter_by(id=analysis_id).first()
 
+    @cached_query(300, tables=("analysis_results",))
     def get_recent_analyses(self, hours: int = 24) -> List[AnalysisResult]:
-        """최근 N시간 내 분석 조회"""
+        """최근 N시간 내 분석 조회 (캐시: 읽기 전용 스냅샷)"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         return (
             self.session.query(AnalysisResult)
@@ -274,6 +242,7 @@ class SignalRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @invalidates("trading_signals")
     def create_signal(
         self,
         analysis_id: int,
@@ -312,6 +281,7 @@ class SignalRepository:
         self.session.refresh(db_signal)
         return db_signal
 
+    @invalidates("trading_signals")
     def mark_alert_sent(self, signal_id: int):
         """Alert 전송 완료 마킹"""
         signal = self.session.query(TradingSignal).filter_by(id=signal_id).first()
@@ -320,6 +290,7 @@ class SignalRepository:
             signal.alert_sent_at = datetime.now()
             self.session.commit()
 
+    @invalidates("trading_signals")
     def record_outcome(
         self,
         signal_id: int,
@@ -334,13 +305,14 @@ class SignalRepository:
             signal.outcome_recorded_at = datetime.now()
             self.session.commit()
 
+    @cached_query(60, tables=("trading_signals",))
     def get_recent_signals(
         self,
         hours: int = 24,
         signal_type: Optional[str] = None,
         min_confidence: Optional[float] = None
     ) -> List[TradingSignal]:
-        """최근 시그널 조회"""
+        """최근 시그널 조회 (캐시: 읽기 전용 스냅샷)"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         query = self.session.query(TradingSignal).filter(TradingSignal.generated_at >= cutoff_time)
 
@@ -377,6 +349,7 @@ class SignalRepository:
         )
         return {signal_type: count for signal_type, count in results}
 
+    @cached_query(300, tables=("trading_signals",))
     def get_top_tickers(self, days: int = 7, limit: int = 10) -> List[Tuple[str, int, float]]:
         """
         Top N 자주 언급된 종목
@@ -738,27 +711,40 @@ class StockRepository:
 
     def save_prices(self, prices: List[Dict]):
         """
-        Bulk save stock prices
-        
+        Bulk save stock prices (upsert on ticker + time)
+
+        대량 백필은 backend.database.bulk_loader.BulkLoader (COPY) 사용.
+        이 경로는 소량 저장용으로 ORM 객체 없이 executemany INSERT 1회만 수행합니다.
+
         Args:
             prices: List of dicts matching StockPrice model fields
         """
-        db_objects = []
+        from sqlalchemy.dialects.postgresql import insert
+
+        if not prices:
+            return
+
+        rows = {}
         for p in prices:
-            db_obj = StockPrice(
-                ticker=p['ticker'],
-                time=p.get('time') or p.get('date'),  # Map to 'time' column
-                open=p['open'],
-                high=p['high'],
-                low=p['low'],
-                close=p['close'],
-                volume=p['volume'],
-                adjusted_close=p.get('adjusted_close') or p.get('adj_close')
-            )
-            db_objects.append(db_obj)
-            
-        self.session.add_all(db_objects)
+            time_value = p.get('time') or p.get('date')  # Map to 'time' column
+            rows[(p['ticker'], time_value)] = {
+                'ticker': p['ticker'],
+                'time': time_value,
+                'open': p['open'],
+                'high': p['high'],
+                'low': p['low'],
+                'close': p['close'],
+                'volume': p['volume'],
+                'adjusted_close': p.get('adjusted_close') or p.get('adj_close'),
+            }
+
+        stmt = insert(StockPrice)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['ticker', 'time'],
+            set_={c: stmt.excluded[c] for c in ('open', 'high', 'low', 'close', 'volume', 'adjusted_close')},
+        )
         try:
+            self.session.execute(stmt, list(rows.values()))
             self.session.commit()
         except Exception:
             self.session.rollback()
@@ -770,15 +756,19 @@ class StockRepository:
         start_date: datetime, 
         end_date: datetime
     ) -> List[StockPrice]:
-        """Get OHLCV data for ticker"""
+        """
+        Get OHLCV data for ticker
+
+        다종목/기간 패널은 backend.database.price_history.PriceHistoryReader 사용
+        """
         return (
             self.session.query(StockPrice)
             .filter(and_(
                 StockPrice.ticker == ticker,
-                StockPrice.date >= start_date,
-                StockPrice.date <= end_date
+                StockPrice.time >= start_date,
+                StockPrice.time <= end_date
             ))
-            .order_by(StockPrice.date)
+            .order_by(StockPrice.time)
             .all()
         )
 
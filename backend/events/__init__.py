@@ -6,5 +6,6 @@ Events Module - Event-Driven Architecture
 
 from .event_types import EventType
 from .event_bus import EventBus, event_bus
+from .event_journal import EventJournal
 
-__all__ = ['EventType', 'EventBus', 'event_bus']
+__all__ = ['EventType', 'EventBus', 'event_bus', 'EventJournal']
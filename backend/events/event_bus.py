@@ -5,21 +5,157 @@ Event Bus - In-process 이벤트 버스
 - 가벼운 In-process 구현 (Kafka/Redis 아님)
 - 모든 이벤트 로깅 (추적성)
 - 동기/비동기 핸들러 구분
+- 발행은 non-blocking: 구독자별 bounded 큐 + 전용 worker task가 핸들러 실행
+  (체결/틱 폭주 시에도 주문 경로가 핸들러를 기다리지 않음)
+- 이력: 이벤트 타입별 ring buffer (deque, O(1) append) + 전체 ring buffer
+- 선택적 append-only 디스크 저널 (일자별 JSONL, EVENT_JOURNAL_DIR)
+
+디스패치 모드:
+- 실행 중인 이벤트 루프가 있으면 큐 디스패치 (첫 발행 시 자동 시작, 또는 start())
+- 루프가 없으면 (스크립트/동기 테스트) 기존처럼 동기 핸들러를 발행자에서 즉시 실행
+- 다른 스레드에서 publish → call_soon_threadsafe로 루프에 전달
+
+Backpressure (구독자별 overflow):
+- "drop_oldest" (기본): 큐가 가득 차면 가장 오래된 이벤트 폐기
+- "drop_newest": 새 이벤트 폐기
+- "block": publish_async는 큐에 자리가 날 때까지 대기, publish(동기)는 새 이벤트 폐기
+- 주문 이벤트(ORDER_*)는 기본값이 무제한 큐 + "block" (폐기 없음)
 
 작성일: 2026-01-10
 """
 
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Deque, Dict, List, Optional, Any
+from collections import deque
 from datetime import datetime
-from enum import Enum
+from itertools import islice
+import inspect
 import logging
 import asyncio
-from functools import wraps
+import os
+import threading
 
 from .event_types import EventType
+from .event_journal import EventJournal
 
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# 유실되면 안 되는 이벤트: 구독 기본값 = 무제한 큐 + "block"
+ORDER_EVENT_TYPES = frozenset({
+    EventType.ORDER_REQUESTED,
+    EventType.ORDER_VALIDATED,
+    EventType.ORDER_REJECTED,
+    EventType.ORDER_SENT,
+    EventType.ORDER_FILLED,
+    EventType.ORDER_CANCELLED,
+    EventType.ORDER_FAILED,
+})
+
+
+class _Subscription:
+    """구독자 1개 = bounded 큐 1개 + worker task 1개"""
+
+    def __init__(
+        self,
+        event_type: EventType,
+        handler: Callable,
+        is_async: bool,
+        queue_size: int,
+        overflow: str,
+        threaded: bool,
+    ):
+        self.event_type = event_type
+        self.handler = handler
+        self.is_async = is_async
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.threaded = threaded
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.handler, "__name__", repr(self.handler))
+
+    def start(self):
+        """현재 실행 중인 루프에서 worker 시작 (루프 변경 시 큐 재생성)"""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.task = asyncio.get_running_loop().create_task(self._run(), name=f"event-sub:{self.name}")
+
+    def stop(self):
+        task, self.task = self.task, None
+        if task is not None and not task.get_loop().is_closed():
+            task.cancel()
+
+    def offer(self, data: Dict[str, Any]) -> bool:
+        """non-blocking enqueue (overflow 정책 적용)"""
+        try:
+            self.queue.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        self.dropped += 1
+        if self.overflow == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except asyncio.QueueEmpty:
+                pass
+            self.queue.put_nowait(data)
+            return True
+        return False
+
+    async def put(self, data: Dict[str, Any]):
+        """publish_async용 enqueue ("block"이면 자리 날 때까지 대기)"""
+        if self.overflow == "block":
+            await self.queue.put(data)
+        else:
+            self.offer(data)
+
+    async def invoke(self, data: Dict[str, Any]):
+        if self.is_async:
+            await self.handler(data)
+        elif self.threaded:
+            await asyncio.to_thread(self.handler, data)
+        else:
+            result = self.handler(data)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _run(self):
+        while True:
+            data = await self.queue.get()
+            try:
+                await self.invoke(data)
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Handler {self.name} failed: {e}")
+                # 핸들러 실패가 전체 흐름을 막지 않음
+            finally:
+                self.queue.task_done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "handler": self.name,
+            "event_type": self.event_type.value,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "queue_size": self.queue_size,
+            "overflow": self.overflow,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
 
 class EventBus:
     """
@@ -29,13 +165,34 @@ class EventBus:
         event_bus = EventBus()
         event_bus.subscribe(EventType.ORDER_FILLED, handle_fill)
         event_bus.publish(EventType.ORDER_FILLED, {'order_id': 123})
+
+        # 틱처럼 많은 이벤트: 작은 큐 + 오래된 이벤트 폐기
+        event_bus.subscribe(EventType.MARKET_DATA_RECEIVED, on_tick, queue_size=100)
     """
 
-    def __init__(self):
-        self._handlers: Dict[EventType, List[Callable]] = {}
-        self._async_handlers: Dict[EventType, List[Callable]] = {}
-        self._event_history: List[Dict] = []
-        self._max_history = 1000  # 최대 이력 보관
+    def __init__(
+        self,
+        max_history: int = 1000,
+        queue_size: int = 1000,
+        journal_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_history: 이벤트 타입별 / 전체 ring buffer 크기
+            queue_size: 구독자 큐 기본 크기
+            journal_dir: 디스크 저널 디렉토리 (None = 저널 비활성)
+        """
+        self._max_history = max_history  # 최대 이력 보관
+        self._default_queue_size = queue_size
+
+        self._subscriptions: Dict[EventType, List[_Subscription]] = {}
+        self._history: Deque[Dict] = deque(maxlen=max_history)
+        self._history_by_type: Dict[str, Deque[Dict]] = {}
+        self._history_lock = threading.Lock()
+        self._seq = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._journal = EventJournal(journal_dir) if journal_dir else None
 
     # ================================================================
     # 구독
@@ -45,7 +202,10 @@ class EventBus:
         self,
         event_type: EventType,
         handler: Callable,
-        is_async: bool = False
+        is_async: bool = False,
+        queue_size: Optional[int] = None,
+        overflow: Optional[str] = None,
+        threaded: bool = False,
     ):
         """
         이벤트 구독
@@ -53,29 +213,81 @@ class EventBus:
         Args:
             event_type: 구독할 이벤트 타입
             handler: 핸들러 함수
-            is_async: 비동기 핸들러 여부
+            is_async: 비동기 핸들러 여부 (coroutine 함수는 자동 감지)
+            queue_size: 구독자 큐 크기 (None = 버스 기본값, 주문 이벤트는 무제한, 0 = 무제한)
+            overflow: 큐가 가득 찼을 때 정책 (drop_oldest / drop_newest / block,
+                None = drop_oldest, 주문 이벤트는 block)
+            threaded: 동기 핸들러를 스레드에서 실행 (blocking I/O 핸들러용)
         """
-        if is_async:
-            if event_type not in self._async_handlers:
-                self._async_handlers[event_type] = []
-            self._async_handlers[event_type].append(handler)
-        else:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(handler)
-
-        logger.debug(f"Subscribed {handler.__name__} to {event_type.value} (async={is_async})")
+        is_order_event = event_type in ORDER_EVENT_TYPES
+        if overflow is None:
+            overflow = "block" if is_order_event else "drop_oldest"
+        if queue_size is None:
+            queue_size = 0 if is_order_event else self._default_queue_size
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+
+        is_async = is_async or inspect.iscoroutinefunction(handler)
+        subscription = _Subscription(
+            event_type,
+            handler,
+            is_async=is_async,
+            queue_size=queue_size,
+            overflow=overflow,
+            threaded=threaded,
+        )
+        self._subscriptions.setdefault(event_type, []).append(subscription)
+
+        if self._loop_active():
+            self._call_in_loop(subscription.start)
+
+        logger.debug(f"Subscribed {subscription.name} to {event_type.value} (async={is_async})")
 
     def unsubscribe(self, event_type: EventType, handler: Callable):
         """이벤트 구독 해제"""
-        if event_type in self._handlers:
-            self._handlers[event_type] = [
-                h for h in self._handlers[event_type] if h != handler
-            ]
-        if event_type in self._async_handlers:
-            self._async_handlers[event_type] = [
-                h for h in self._async_handlers[event_type] if h != handler
-            ]
+        remaining = []
+        for subscription in self._subscriptions.get(event_type, []):
+            if subscription.handler == handler:
+                if self._loop_active():
+                    self._call_in_loop(subscription.stop)
+                else:
+                    subscription.stop()
+            else:
+                remaining.append(subscription)
+        self._subscriptions[event_type] = remaining
+
+    # ================================================================
+    # 디스패처 수명주기
+    # ================================================================
+
+    def start(self):
+        """현재 이벤트 루프에서 구독자 worker 시작 (lifespan에서 호출)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        for subscription in self._all_subscriptions():
+            subscription.start()
+        logger.info(f"EventBus dispatcher started ({len(self._all_subscriptions())} subscribers)")
+
+    async def drain(self, timeout: Optional[float] = None):
+        """큐에 쌓인 이벤트가 모두 처리될 때까지 대기"""
+        joins = [s.queue.join() for s in self._all_subscriptions() if s.queue is not None and s.task is not None]
+        if joins:
+            await asyncio.wait_for(asyncio.gather(*joins), timeout)
+
+    async def stop(self, timeout: Optional[float] = 5.0):
+        """남은 이벤트 처리 후 worker 종료 + 저널 close (기록 완료 후 writer 스레드 종료)"""
+        if self._loop is not None:
+            try:
+                await self.drain(timeout)
+            except asyncio.TimeoutError:
+                logger.warning("EventBus stop: pending events dropped after drain timeout")
+            for subscription in self._all_subscriptions():
+                subscription.stop()
+            self._loop = None
+        if self._journal is not None:
+            await asyncio.to_thread(self._journal.close)
 
     # ================================================================
     # 발행
@@ -83,60 +295,41 @@ class EventBus:
 
     def publish(self, event_type: EventType, data: Dict[str, Any]):
         """
-        이벤트 발행 (동기)
+        이벤트 발행 (동기, non-blocking)
 
         Args:
             event_type: 이벤트 타입
             data: 이벤트 데이터
         """
-        event = self._create_event(event_type, data)
-
-        # 로깅 (추적성)
-        self._log_event(event)
-
-        # 이력 저장
-        self._save_history(event)
+        self._record(event_type, data)
 
-        # 동기 핸들러 실행
-        for handler in self._handlers.get(event_type, []):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Handler {handler.__name__} failed: {e}")
-                # 핸들러 실패가 전체 흐름을 막지 않음
+        loop = self._dispatch_loop()
+        if loop is None:
+            self._dispatch_inline(event_type, data)
+        elif self._in_loop_thread(loop):
+            self._enqueue(event_type, data)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, event_type, data)
 
     async def publish_async(self, event_type: EventType, data: Dict[str, Any]):
         """
-        이벤트 발행 (비동기 핸들러 포함)
+        이벤트 발행 (비동기)
+
+        핸들러 완료를 기다리지 않음. overflow="block" 구독자 큐가 가득 찼을
+        때만 자리가 날 때까지 대기 (backpressure).
 
         Args:
             event_type: 이벤트 타입
             data: 이벤트 데이터
         """
-        event = self._create_event(event_type, data)
+        self._record(event_type, data)
 
-        # 로깅
-        self._log_event(event)
+        if self._dispatch_loop() is None:
+            self._dispatch_inline(event_type, data)
+            return
 
-        # 이력 저장
-        self._save_history(event)
-
-        # 동기 핸들러 먼저
-        for handler in self._handlers.get(event_type, []):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Sync handler {handler.__name__} failed: {e}")
-
-        # 비동기 핸들러
-        async_handlers = self._async_handlers.get(event_type, [])
-        if async_handlers:
-            tasks = [handler(data) for handler in async_handlers]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for handler, result in zip(async_handlers, results):
-                if isinstance(result, Exception):
-                    logger.error(f"Async handler {handler.__name__} failed: {result}")
+        for subscription in self._subscriptions.get(event_type, []):
+            await subscription.put(data)
 
     # ================================================================
     # 이력 조회
@@ -155,29 +348,54 @@ class EventBus:
             limit: 최대 조회 개수
 
         Returns:
-            List[Dict]: 이벤트 이력
+            List[Dict]: 이벤트 이력 (오래된 순)
         """
-        history = self._event_history
-
-        if event_type:
-            history = [e for e in history if e['type'] == event_type.value]
-
-        return history[-limit:]
+        with self._history_lock:
+            history = self._history if event_type is None else self._history_by_type.get(event_type.value, ())
+            latest = list(islice(reversed(history), limit))
+        latest.reverse()
+        return latest
 
     def reconstruct_day(self, date: str) -> List[Dict]:
         """
         특정 날짜의 이벤트 흐름 재구성
 
+        저널이 있으면 해당 날짜 파일 전체, 없으면 메모리 ring buffer에서 조회
+
         Args:
             date: 날짜 (YYYY-MM-DD)
 
         Returns:
             List[Dict]: 해당 날짜의 이벤트 목록
         """
-        return [
-            e for e in self._event_history
-            if e['timestamp'].startswith(date)
-        ]
+        if self._journal is not None:
+            return self._journal.read_day(date)
+
+        # 이력은 시간순 → 뒤에서부터 해당 날짜 이전이 나오면 중단
+        events = []
+        with self._history_lock:
+            for event in reversed(self._history):
+                day = event['timestamp'][:10]
+                if day == date:
+                    events.append(event)
+                elif day < date:
+                    break
+        events.reverse()
+        return events
+
+    def get_stats(self) -> Dict[str, Any]:
+        """구독자 큐 / 이력 / 저널 통계"""
+        return {
+            "dispatch": "queued" if self._loop_active() else "inline",
+            "events_published": self._seq,
+            "history_size": len(self._history),
+            "subscribers": [s.get_stats() for s in self._all_subscriptions()],
+            "journal": {
+                "directory": str(self._journal.directory),
+                "written": self._journal.written,
+                "errors": self._journal.errors,
+            } if self._journal is not None else None,
+        }
 
     # ================================================================
     # Private 메서드
@@ -195,11 +413,6 @@ class EventBus:
 
     def _log_event(self, event: Dict):
         """이벤트 로깅"""
-        log_msg = f"EVENT: {event['type']} | {event['symbol']}"
-
-        if event['order_id']:
-            log_msg += f" | order:{event['order_id']}"
-
         # 중요 이벤트는 INFO, 나머지는 DEBUG
         important_events = {
             'order_filled', 'order_rejected', 'stop_loss_hit',
@@ -207,18 +420,89 @@ class EventBus:
         }
 
         if event['type'] in important_events:
-            logger.info(log_msg)
+            level = logging.INFO
+        elif logger.isEnabledFor(logging.DEBUG):
+            level = logging.DEBUG
         else:
-            logger.debug(log_msg)
+            return  # 틱 등 대량 이벤트는 메시지 포맷 비용도 생략
 
-    def _save_history(self, event: Dict):
-        """이벤트 이력 저장"""
-        self._event_history.append(event)
+        log_msg = f"EVENT: {event['type']} | {event['symbol']}"
+        if event['order_id']:
+            log_msg += f" | order:{event['order_id']}"
+        logger.log(level, log_msg)
+
+    def _record(self, event_type: EventType, data: Dict) -> Dict:
+        """이벤트 생성 + 로깅 + 이력/저널 저장"""
+        event = self._create_event(event_type, data)
+
+        # 로깅 (추적성)
+        self._log_event(event)
+
+        # 이력 저장 (ring buffer, 초과분은 deque가 자동 폐기)
+        with self._history_lock:
+            self._seq += 1
+            self._history.append(event)
+            typed = self._history_by_type.get(event['type'])
+            if typed is None:
+                typed = self._history_by_type[event['type']] = deque(maxlen=self._max_history)
+            typed.append(event)
+
+        if self._journal is not None:
+            self._journal.append(event)
+
+        return event
+
+    def _enqueue(self, event_type: EventType, data: Dict):
+        for subscription in self._subscriptions.get(event_type, []):
+            if subscription.task is None:
+                subscription.start()
+            subscription.offer(data)
+
+    def _dispatch_inline(self, event_type: EventType, data: Dict):
+        """이벤트 루프가 없을 때: 동기 핸들러 즉시 실행 (비동기 핸들러는 실행 불가)"""
+        for subscription in self._subscriptions.get(event_type, []):
+            if subscription.is_async:
+                logger.debug(f"No event loop - skipping async handler {subscription.name}")
+                continue
+            try:
+                subscription.handler(data)
+                subscription.delivered += 1
+            except Exception as e:
+                subscription.failed += 1
+                logger.error(f"Handler {subscription.name} failed: {e}")
+                # 핸들러 실패가 전체 흐름을 막지 않음
+
+    def _dispatch_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """큐 디스패치에 사용할 루프 (없으면 None → inline)"""
+        if self._loop_active():
+            return self._loop
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        # 실행 중인 루프 안에서 첫 발행 → 디스패처 자동 시작
+        self._loop = None
+        self.start()
+        return self._loop
+
+    def _loop_active(self) -> bool:
+        return self._loop is not None and not self._loop.is_closed() and self._loop.is_running()
+
+    def _in_loop_thread(self, loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    def _call_in_loop(self, fn: Callable[[], Any]):
+        if self._in_loop_thread(self._loop):
+            fn()
+        else:
+            self._loop.call_soon_threadsafe(fn)
 
-        # 최대 개수 초과 시 오래된 것 제거
-        if len(self._event_history) > self._max_history:
-            self._event_history = self._event_history[-self._max_history:]
+    def _all_subscriptions(self) -> List[_Subscription]:
+        return [s for subs in self._subscriptions.values() for s in subs]
 
 
 # 싱글톤 인스턴스
-event_bus = EventBus()
+event_bus = EventBus(journal_dir=os.getenv("EVENT_JOURNAL_DIR") or None)
@@ -0,0 +1,148 @@
+"""
+Event Journal - Append-only 이벤트 저널 (일자별 JSONL)
+
+핵심 원칙:
+- 발행 경로에서는 큐에 넣기만 함 (디스크 I/O는 전용 writer 스레드)
+- 일자별 파일: {directory}/{YYYY-MM-DD}.jsonl → reconstruct_day는 해당 파일만 읽음
+- 배치 쓰기: 쌓인 이벤트를 한 번에 write + flush
+
+작성일: 2026-10-18
+"""
+
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EventJournal:
+    """
+    일자별 append-only 이벤트 저널
+
+    사용법:
+        journal = EventJournal("data/event_journal")
+        journal.append(event)                 # non-blocking
+        events = journal.read_day("2026-10-18")
+        journal.close()
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._closed = False
+        self.written = 0
+        self.errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="event-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, event: Dict):
+        """이벤트 기록 요청 (즉시 반환)"""
+        if not self._closed:
+            self._queue.put(event)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """지금까지 append된 이벤트가 디스크에 기록될 때까지 대기"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def days(self) -> List[str]:
+        """저널이 있는 날짜 목록 (YYYY-MM-DD, 오름차순)"""
+        return sorted(p.stem for p in self.directory.glob("*.jsonl"))
+
+    def read_day(self, day: str) -> List[Dict]:
+        """특정 날짜의 이벤트 전체 (기록 순서)"""
+        self.flush()
+        path = self._path(day)
+        if not path.exists():
+            return []
+
+        events = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal line in {path.name}")
+        return events
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _path(self, day: str) -> Path:
+        return self.directory / f"{day}.jsonl"
+
+    def _run(self):
+        current_day: Optional[str] = None
+        handle = None
+
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                markers = []
+                stop = False
+                lines_by_day: Dict[str, List[str]] = {}
+                for item in batch:
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        markers.append(item)
+                    else:
+                        try:
+                            line = json.dumps(item, default=str, ensure_ascii=False)
+                        except (TypeError, ValueError) as e:
+                            self.errors += 1
+                            logger.error(f"Event journal serialization failed: {e}")
+                            continue
+                        lines_by_day.setdefault(item["timestamp"][:10], []).append(line)
+
+                for day, lines in lines_by_day.items():
+                    try:
+                        if day != current_day:
+                            if handle is not None:
+                                handle.close()
+                            handle = open(self._path(day), "a", encoding="utf-8")
+                            current_day = day
+                        handle.write("\n".join(lines) + "\n")
+                        handle.flush()
+                        self.written += len(lines)
+                    except OSError as e:
+                        self.errors += len(lines)
+                        logger.error(f"Event journal write failed: {e}")
+
+                for marker in markers:
+                    marker.set()
+                if stop:
+                    break
+        finally:
+            if handle is not None:
+                handle.close()
@@ -9,6 +9,7 @@ Components:
 - SmartExecutor: Complete workflow orchestrator
 - SimplePortfolioManager: Position tracking
 - SimpleRiskManager: Risk controls
+- StageLatencyHistogram: Batch pipeline stage latency tracking
 
 Cost: $0/month (all local computation)
 Author: AI Trading System Team
@@ -26,6 +27,7 @@ from .smart_executor import (
     SmartExecutor,
     SimplePortfolioManager,
     SimpleRiskManager,
+    StageLatencyHistogram,
 )
 
 # Legacy executors (keep for backward compatibility)
@@ -45,6 +47,7 @@ __all__ = [
     "SmartExecutor",
     "SimplePortfolioManager",
     "SimpleRiskManager",
+    "StageLatencyHistogram",
     # Legacy
     "execute_twap",
     "execute_vwap",
@@ -61,6 +64,9 @@ __phase__ = 6
 try:
     from .execution_router import ExecutionRouter, ExecutionMode
     from .order_validator import OrderValidator, ValidationResult
+    from .order_registry import OrderRegistry, LiveOrder, order_registry
+    from .transition_log import TransitionLog, get_transition_log
+    from .pre_trade_risk import PreTradeRiskEngine, PreTradeLimits, get_pre_trade_risk_engine
     
     # Add to __all__
     __all__.extend([
@@ -68,6 +74,14 @@ try:
         "ExecutionMode",
         "OrderValidator",
         "ValidationResult",
+        "OrderRegistry",
+        "LiveOrder",
+        "order_registry",
+        "TransitionLog",
+        "get_transition_log",
+        "PreTradeRiskEngine",
+        "PreTradeLimits",
+        "get_pre_trade_risk_engine",
     ])
 except ImportError:
     pass
@@ -5,11 +5,13 @@ Order Manager - Single Writer 원칙
 - 상태 변경은 오직 이 클래스를 통해서만 가능
 - order.status = "xxx" 직접 변경 절대 금지
 - 모든 전이는 DB 영속화 + 로깅 포함
+- 라이브 주문은 OrderRegistry (In-memory 인덱스)에 반영
+- TransitionLog(WAL) 사용 시 DB 쓰기는 배치 단위로 지연 (write-behind)
 
 작성일: 2026-01-10
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import logging
 
@@ -19,6 +21,8 @@ from .state_machine import (
     InvalidStateTransitionError,
     state_machine
 )
+from .order_registry import OrderRegistry, LiveOrder, order_registry
+from .transition_log import TransitionLog
 from backend.events import event_bus, EventType
 from backend.ai.skills.system.conflict_detector import ConflictDetector
 from backend.services.ownership_service import OwnershipService
@@ -36,19 +40,32 @@ class OrderManager:
     모든 주문 상태 변경은 이 클래스를 통해서만 수행
     """
 
-    def __init__(self, db_session, broker_client=None):
+    def __init__(
+        self,
+        db_session,
+        broker_client=None,
+        registry: Optional[OrderRegistry] = None,
+        transition_log: Optional[TransitionLog] = None,
+    ):
         """
         Args:
             db_session: SQLAlchemy 세션
             broker_client: 브로커 API 클라이언트 (Optional)
+            registry: 라이브 주문 레지스트리 (기본: 전역 싱글톤)
+            transition_log: 전이 WAL (설정 시 DB 커밋을 배치로 지연)
         """
         self.db = db_session
         self.broker = broker_client
         self.sm = state_machine
+        self.registry = registry if registry is not None else order_registry
+        self.transition_log = transition_log
 
         # 상태 전이 이력 (메모리 캐시)
         self._transition_history: List[Dict] = []
 
+        # WAL 모드에서 아직 DB에 커밋되지 않은 주문
+        self._dirty_orders: Dict[int, Any] = {}
+
     def create_order(self, ticker: str, action: str, quantity: int, strategy_id: Optional[str] = None, metadata: Optional[Dict] = None):
         """
         주문 생성 (DB 기록)
@@ -75,6 +92,7 @@ class OrderManager:
         self.db.add(order)
         self.db.commit()
         self.db.refresh(order)
+        self.registry.upsert(LiveOrder.from_order(order))
         
         logger.info(f"[ORDER_CREATE] Order {order.id} created (SIGNAL_RECEIVED)")
 
@@ -212,32 +230,51 @@ class OrderManager:
                 order.order_metadata = {}
             order.order_metadata.update(metadata)
 
-        # 4. DB 영속화
-        try:
-            self.db.add(order)
-            self.db.commit()
-            self.db.refresh(order)
-        except Exception as e:
-            self.db.rollback()
-            order.status = old_status  # 롤백
-            logger.error(f"[ORDER:{order.id}] DB commit failed: {e}")
-            raise
-
-        # 5. 로깅
-        self._log_transition(order, current, target, reason)
-
-        # 6. 이력 저장
-        self._transition_history.append({
+        # 4. 영속화 (WAL 모드: 로그 append + 배치 커밋 / 기본: 즉시 DB 커밋)
+        entry = {
             'order_id': order.id,
             'symbol': order.ticker,
             'from': current.value,
             'to': target.value,
             'reason': reason,
             'timestamp': datetime.utcnow().isoformat()
-        })
+        }
 
-        # 7. Event Bus 발행 (Phase 3)
-        self._publish_event(order, target, reason)
+        needs_flush = False
+        event = self._build_event(order, target, reason)
+        if self.transition_log is not None:
+            self.db.add(order)
+            self._dirty_orders[order.id] = order
+            # 이벤트는 WAL fsync 이후 발행 (발행된 전이는 crash 후에도 복구 가능)
+            needs_flush = self.transition_log.append(
+                self._log_entry(order, entry),
+                on_durable=(lambda: self._emit_event(*event)) if event else None,
+            )
+        else:
+            try:
+                self.db.add(order)
+                self.db.commit()
+                self.db.refresh(order)
+            except Exception as e:
+                self.db.rollback()
+                order.status = old_status  # 롤백
+                logger.error(f"[ORDER:{order.id}] DB commit failed: {e}")
+                raise
+
+        # 5. 레지스트리 반영
+        self._sync_registry(order, current, target)
+
+        # 6. 로깅 + 이력 저장
+        self._log_transition(order, current, target, reason)
+        self._transition_history.append(entry)
+
+        # 7. Event Bus 발행 (Phase 3, WAL 모드는 flush 시 발행)
+        if event and self.transition_log is None:
+            self._emit_event(*event)
+
+        # 8. 배치 커밋 (WAL 배치 크기/주기 도달 시)
+        if needs_flush:
+            self.flush()
 
         return True
 
@@ -333,14 +370,79 @@ class OrderManager:
     # ================================================================
 
     def get_pending_orders(self) -> List:
-        """미완료 주문 조회 (Recovery 대상)"""
+        """
+        미완료 주문 조회 (Recovery 대상)
+
+        레지스트리가 적재된 상태면 미완료 주문 ID로 PK 조회만 수행하고,
+        미완료 주문이 없으면 DB를 조회하지 않습니다.
+        """
         from backend.database.models import Order
 
+        if self.registry.hydrated:
+            pending_ids = self.registry.pending_ids()
+            if not pending_ids:
+                return []
+            return self.db.query(Order).filter(Order.id.in_(pending_ids)).all()
+
         pending_values = [s.value for s in self.sm.PENDING_STATES]
-        return self.db.query(Order).filter(
+        orders = self.db.query(Order).filter(
             Order.status.in_(pending_values)
         ).all()
 
+        for order in orders:
+            self.registry.upsert(LiveOrder.from_order(order))
+        self.registry.hydrated = True
+
+        return orders
+
+    def get_live_orders(
+        self,
+        ticker: Optional[str] = None,
+        state: Optional[OrderState] = None
+    ) -> List[LiveOrder]:
+        """라이브 주문 조회 (In-memory, DB 조회 없음)"""
+        if ticker:
+            return self.registry.by_ticker(ticker, {state} if state else None)
+        if state:
+            return self.registry.by_state(state)
+        return self.registry.pending()
+
+    def get_live_order_by_broker_id(self, broker_order_id: str) -> Optional[LiveOrder]:
+        """브로커 주문번호로 라이브 주문 조회"""
+        return self.registry.get_by_broker_id(broker_order_id)
+
+    # ================================================================
+    # WAL 배치 커밋
+    # ================================================================
+
+    def flush(self) -> int:
+        """
+        WAL flush 후 지연된 DB 쓰기를 한 번에 커밋
+
+        WAL 꼬리는 TransitionLog 백그라운드 flusher가 기록하지만, Session은
+        thread-safe가 아니므로 DB 커밋은 이 메서드를 호출한 스레드에서만 수행.
+        작업 단위(요청/시그널 처리)가 끝나면 호출하세요.
+
+        Returns:
+            int: 커밋된 주문 수
+        """
+        if self.transition_log is not None:
+            self.transition_log.flush()
+
+        if not self._dirty_orders:
+            return 0
+
+        dirty, self._dirty_orders = self._dirty_orders, {}
+        try:
+            self.db.commit()
+        except Exception as e:
+            # WAL에는 기록되어 있으므로 재시작 시 Recovery가 DB를 동기화
+            self.db.rollback()
+            logger.error(f"[ORDER] Batch commit of {len(dirty)} orders failed: {e}")
+            raise
+
+        return len(dirty)
+
     def get_transition_history(self, order_id: Optional[int] = None) -> List[Dict]:
         """전이 이력 조회"""
         if order_id:
@@ -351,6 +453,34 @@ class OrderManager:
     # Private 메서드
     # ================================================================
 
+    def _sync_registry(self, order, current: OrderState, target: OrderState):
+        """레지스트리에 전이 반영 (미등록/불일치 주문은 스냅샷으로 교체)"""
+        live = self.registry.get(order.id)
+        if live is not None and live.status == current:
+            self.registry.apply_transition(
+                order.id,
+                target,
+                broker_order_id=order.order_id,
+                filled_quantity=order.filled_quantity,
+                filled_price=order.filled_price,
+            )
+        else:
+            self.registry.upsert(LiveOrder.from_order(order))
+
+    @staticmethod
+    def _log_entry(order, entry: Dict) -> Dict:
+        """WAL 엔트리 (재시작 시 주문 복원에 필요한 필드 포함)"""
+        return {
+            **entry,
+            'action': order.action,
+            'quantity': order.quantity,
+            'strategy_id': getattr(order, 'strategy_id', None),
+            'broker_order_id': order.order_id,
+            'filled_quantity': order.filled_quantity,
+            'filled_price': order.filled_price,
+            'error_message': order.error_message,
+        }
+
     def _log_transition(
         self,
         order,
@@ -373,13 +503,13 @@ class OrderManager:
         else:
             logger.debug(log_msg)
 
-    def _publish_event(
+    def _build_event(
         self,
         order,
         to_state: OrderState,
         reason: Optional[str]
-    ):
-        """상태 전이 이벤트 발행 (Phase 3)"""
+    ) -> Optional[Tuple[EventType, Dict]]:
+        """상태 전이 이벤트 (Phase 3, 발행 대상이 아니면 None)"""
         event_data = {
             'order_id': order.id,
             'ticker': order.ticker,
@@ -399,8 +529,12 @@ class OrderManager:
         }
 
         event_type = event_map.get(to_state)
-        if event_type:
-            try:
-                event_bus.publish(event_type, event_data)
-            except Exception as e:
-                logger.error(f"Failed to publish event {event_type}: {e}")
+        return (event_type, event_data) if event_type else None
+
+    @staticmethod
+    def _emit_event(event_type: EventType, event_data: Dict):
+        """Event Bus 발행"""
+        try:
+            event_bus.publish(event_type, event_data)
+        except Exception as e:
+            logger.error(f"Failed to publish event {event_type}: {e}")
@@ -0,0 +1,210 @@
+"""
+Order Registry - 라이브 주문 In-memory 인덱스
+
+핵심 원칙:
+- OrderManager가 유일한 Writer (Single Writer) → 락 불필요
+- 상태/티커/브로커 주문번호 별 인덱스로 O(1) 조회
+- ORM 객체 대신 LiveOrder 스냅샷 보관 (세션 종료와 무관하게 안전)
+- 상태 전이 규칙은 OrderStateMachine으로 강제
+
+작성일: 2026-10-18
+"""
+
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Any
+import logging
+
+from .state_machine import OrderState, OrderStateMachine, state_machine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LiveOrder:
+    """라이브 주문 스냅샷"""
+    id: int
+    ticker: str
+    action: str
+    quantity: int
+    status: OrderState
+    broker_order_id: Optional[str] = None
+    filled_quantity: Optional[int] = None
+    filled_price: Optional[float] = None
+    strategy_id: Optional[str] = None
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_order(cls, order) -> "LiveOrder":
+        """ORM Order → LiveOrder"""
+        return cls(
+            id=order.id,
+            ticker=order.ticker,
+            action=order.action,
+            quantity=order.quantity,
+            status=OrderState(order.status),
+            broker_order_id=order.order_id,
+            filled_quantity=order.filled_quantity,
+            filled_price=order.filled_price,
+            strategy_id=getattr(order, 'strategy_id', None),
+            updated_at=order.updated_at or datetime.utcnow(),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['status'] = self.status.value
+        data['updated_at'] = self.updated_at.isoformat()
+        return data
+
+
+class OrderRegistry:
+    """
+    라이브 주문 레지스트리
+
+    인덱스:
+    - id → LiveOrder
+    - state → {order_id}
+    - ticker → {order_id}
+    - broker_order_id → order_id
+
+    모든 변경은 OrderManager.transition()을 통해서만 수행됩니다.
+    조회 메서드는 리스트 복사본을 반환하므로 순회 중 변경에 안전합니다.
+    """
+
+    def __init__(self, sm: OrderStateMachine = state_machine):
+        self.sm = sm
+        self._orders: Dict[int, LiveOrder] = {}
+        self._by_state: Dict[OrderState, Set[int]] = {s: set() for s in OrderState}
+        self._by_ticker: Dict[str, Set[int]] = {}
+        self._by_broker_id: Dict[str, int] = {}
+
+        # DB/로그에서 한 번이라도 적재되었는지 (조회 시 DB fallback 판단용)
+        self.hydrated = False
+
+    # ================================================================
+    # 쓰기 (OrderManager 전용)
+    # ================================================================
+
+    def upsert(self, live: LiveOrder):
+        """주문 등록/교체 (인덱스 재구성)"""
+        existing = self._orders.get(live.id)
+        if existing:
+            self._unindex(existing)
+
+        self._orders[live.id] = live
+        self._index(live)
+
+    def apply_transition(
+        self,
+        order_id: int,
+        target: OrderState,
+        broker_order_id: Optional[str] = None,
+        filled_quantity: Optional[int] = None,
+        filled_price: Optional[float] = None,
+    ) -> LiveOrder:
+        """
+        상태 전이 반영
+
+        Raises:
+            KeyError: 등록되지 않은 주문
+            InvalidStateTransitionError: 유효하지 않은 전이
+        """
+        live = self._orders[order_id]
+        self.sm.validate_transition(live.status, target)
+
+        self._by_state[live.status].discard(order_id)
+        live.status = target
+        self._by_state[target].add(order_id)
+
+        if broker_order_id and broker_order_id != live.broker_order_id:
+            if live.broker_order_id:
+                self._by_broker_id.pop(live.broker_order_id, None)
+            live.broker_order_id = broker_order_id
+            self._by_broker_id[broker_order_id] = order_id
+
+        if filled_quantity is not None:
+            live.filled_quantity = filled_quantity
+        if filled_price is not None:
+            live.filled_price = filled_price
+        live.updated_at = datetime.utcnow()
+
+        return live
+
+    def evict_terminal(self) -> int:
+        """종료 상태 주문 제거 (메모리 상한 유지)"""
+        terminal_ids = [
+            order_id
+            for state in self.sm.TERMINAL_STATES
+            for order_id in self._by_state[state]
+        ]
+        for order_id in terminal_ids:
+            self._unindex(self._orders.pop(order_id))
+        return len(terminal_ids)
+
+    def clear(self):
+        self._orders.clear()
+        for ids in self._by_state.values():
+            ids.clear()
+        self._by_ticker.clear()
+        self._by_broker_id.clear()
+        self.hydrated = False
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def get(self, order_id: int) -> Optional[LiveOrder]:
+        return self._orders.get(order_id)
+
+    def get_by_broker_id(self, broker_order_id: str) -> Optional[LiveOrder]:
+        order_id = self._by_broker_id.get(broker_order_id)
+        return self._orders.get(order_id) if order_id is not None else None
+
+    def by_state(self, *states: OrderState) -> List[LiveOrder]:
+        return [self._orders[i] for s in states for i in list(self._by_state[s])]
+
+    def by_ticker(self, ticker: str, states: Optional[Set[OrderState]] = None) -> List[LiveOrder]:
+        orders = [self._orders[i] for i in list(self._by_ticker.get(ticker, ()))]
+        if states is not None:
+            orders = [o for o in orders if o.status in states]
+        return orders
+
+    def pending(self) -> List[LiveOrder]:
+        """미완료 주문 (Recovery 대상)"""
+        return self.by_state(*self.sm.PENDING_STATES)
+
+    def pending_ids(self) -> List[int]:
+        return [i for s in self.sm.PENDING_STATES for i in self._by_state[s]]
+
+    def counts_by_state(self) -> Dict[str, int]:
+        return {s.value: len(ids) for s, ids in self._by_state.items() if ids}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self._orders
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _index(self, live: LiveOrder):
+        self._by_state[live.status].add(live.id)
+        self._by_ticker.setdefault(live.ticker, set()).add(live.id)
+        if live.broker_order_id:
+            self._by_broker_id[live.broker_order_id] = live.id
+
+    def _unindex(self, live: LiveOrder):
+        self._by_state[live.status].discard(live.id)
+        ticker_ids = self._by_ticker.get(live.ticker)
+        if ticker_ids is not None:
+            ticker_ids.discard(live.id)
+            if not ticker_ids:
+                del self._by_ticker[live.ticker]
+        if live.broker_order_id:
+            self._by_broker_id.pop(live.broker_order_id, None)
+
+
+# 싱글톤 인스턴스
+order_registry = OrderRegistry()
@@ -0,0 +1,529 @@
+"""
+Pre-Trade Risk Engine - Vectorized Fast Path
+
+Date: 2026-10-18
+
+Purpose:
+    주문 전 리스크 검증 Fast Path
+    - OrderValidator / SafetyGuard / KillSwitch / SectorThrottle 한도를 배치마다 한 번 로드
+      (블랙리스트 등 런타임 변경 즉시 반영, 주문당 재로딩 없음)
+    - 노출(Exposure), 섹터 노출, 현금, 포지션 수를 체결 시 증분 업데이트
+    - 후보 주문 배치를 NumPy 한 번의 벡터 연산으로 검증 (주문당 재계산 없음)
+
+Batch Semantics:
+    배치 내 주문은 입력 순서대로 "앞선 모든 매수 주문이 체결된다"고 가정하고 검증합니다.
+    (현금/종목 노출/섹터 노출/포지션 수 누적) → 보수적(conservative) 판정.
+
+Usage:
+    engine = PreTradeRiskEngine.from_components(validator=OrderValidator())
+    engine.sync(portfolio_state)
+    results = engine.validate_batch(orders)
+    engine.record_fill('NVDA', 'buy', 10, 875.5)
+
+    # 주문 제출 경로 (SignalExecutor)는 공유 엔진 사용
+    engine = get_pre_trade_risk_engine()
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .smart_executor import StageLatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+# Sub-millisecond buckets (ms)
+LATENCY_BUCKETS_MS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class PreTradeLimits:
+    """캐시된 리스크 한도 (각 검증 컴포넌트에서 한 번만 로드)"""
+
+    max_position_pct: float = 0.30          # OrderValidator / KillSwitch
+    max_sector_pct: float = 0.30            # SectorThrottleConfig.emergency_brake_threshold
+    max_position_count: int = 20            # OrderValidator
+    max_order_value: float = 100000.0       # OrderValidator (SafetyGuard 사용 시 더 엄격)
+    min_cash_reserve_pct: float = 0.05      # OrderValidator
+    min_stop_loss_pct: float = 0.001        # OrderValidator
+    max_stop_loss_pct: float = 0.10         # OrderValidator
+    require_stop_loss: bool = True
+    max_daily_loss_pct: float = 5.0         # KillSwitch (SafetyGuard: 3.0)
+    max_daily_trades: int = 20              # KillSwitch
+    max_sector_trades_per_day: int = 10     # SectorThrottleConfig
+    duplicate_window_sec: int = 300         # OrderValidator
+    allow_market_closed: bool = False
+    blacklist: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_components(
+        cls,
+        validator=None,
+        safety_guard=None,
+        kill_switch=None,
+        throttle_config=None,
+    ) -> "PreTradeLimits":
+        """기존 검증 컴포넌트 설정에서 한도 구성 (가장 엄격한 값 채택)"""
+        limits = cls()
+
+        if validator is not None:
+            rules = validator.HARD_RULES
+            limits.max_position_pct = rules['max_position_size_pct']
+            limits.max_position_count = rules['max_position_count']
+            limits.max_order_value = rules['max_order_value_usd']
+            limits.min_cash_reserve_pct = rules['min_cash_reserve_pct']
+            limits.min_stop_loss_pct = rules['min_stop_loss_pct']
+            limits.max_stop_loss_pct = rules['max_stop_loss_pct']
+            limits.duplicate_window_sec = rules['duplicate_order_window_sec']
+            limits.allow_market_closed = rules['allow_market_closed']
+            limits.blacklist = {s.upper() for s in rules['blacklist_symbols']}
+
+        if kill_switch is not None:
+            config = kill_switch.config
+            limits.max_position_pct = min(limits.max_position_pct, config['max_position_concentration'])
+            limits.max_daily_loss_pct = config['max_daily_loss_pct']
+            limits.max_daily_trades = config['max_daily_trades']
+
+        if safety_guard is not None:
+            limits.max_daily_loss_pct = min(limits.max_daily_loss_pct, safety_guard.MAX_DAILY_LOSS_PCT)
+
+        if throttle_config is not None:
+            limits.max_sector_pct = throttle_config.emergency_brake_threshold
+            limits.max_sector_trades_per_day = throttle_config.max_trades_per_sector_per_day
+
+        return limits
+
+
+class PreTradeRiskEngine:
+    """
+    증분 상태 + 벡터화 배치 검증 엔진
+
+    State (증분 업데이트):
+        - 종목별 보유 수량 / 최근 가격
+        - 섹터별 노출 금액
+        - 현금, 총 평가금액, 일일 손익
+        - 일일 거래 수 (전체/섹터별), 최근 승인 주문 (중복 체크)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[PreTradeLimits] = None,
+        sector_map: Optional[Dict[str, str]] = None,
+        kill_switch=None,
+        validator=None,
+        safety_guard=None,
+        throttle_config=None,
+    ):
+        """
+        Args:
+            limits: 고정 한도 (지정 시 컴포넌트 설정을 다시 읽지 않음)
+            sector_map: 종목 → 섹터
+            kill_switch / validator / safety_guard / throttle_config:
+                지정 시 validate_batch마다 이 컴포넌트들의 현재 설정에서 한도를 다시 읽음
+        """
+        self.kill_switch = kill_switch
+        self.validator = validator
+        self.safety_guard = safety_guard
+        self.throttle_config = throttle_config
+        self._live_limits = limits is None and any(
+            c is not None for c in (kill_switch, validator, safety_guard, throttle_config)
+        )
+        self.limits = limits or PreTradeLimits()
+        self._refresh_limits()
+
+        if sector_map is None:
+            from backend.signals.sector_throttling import SECTOR_MAPPING
+            sector_map = SECTOR_MAPPING
+        self.sector_map = {k.upper(): v for k, v in sector_map.items()}
+
+        # Portfolio state
+        self.cash = 0.0
+        self.total_value = 0.0
+        self.initial_capital = 0.0
+        self.daily_pnl = 0.0
+        self._shares: Dict[str, float] = {}
+        self._prices: Dict[str, float] = {}
+        self._sector_exposure: Dict[str, float] = {}
+
+        # Daily counters
+        self._trading_day = datetime.utcnow().date()
+        self.trades_today = 0
+        self._sector_trades_today: Dict[str, int] = {}
+
+        # Duplicate detection: (symbol, action) → deque[(timestamp, quantity)]
+        self._recent_orders: Dict[Tuple[str, str], Deque[Tuple[datetime, float]]] = {}
+
+        # Latency (per-order amortized)
+        self.latency = StageLatencyHistogram(buckets_ms=LATENCY_BUCKETS_MS)
+
+    @classmethod
+    def from_components(
+        cls,
+        validator=None,
+        safety_guard=None,
+        kill_switch=None,
+        throttle_config=None,
+        sector_map: Optional[Dict[str, str]] = None,
+    ) -> "PreTradeRiskEngine":
+        return cls(
+            sector_map=sector_map,
+            kill_switch=kill_switch,
+            validator=validator,
+            safety_guard=safety_guard,
+            throttle_config=throttle_config,
+        )
+
+    # ================================================================
+    # State updates (incremental)
+    # ================================================================
+
+    def sync(self, portfolio_state: Dict[str, Any]):
+        """
+        포트폴리오 스냅샷으로 전체 상태 재구성 (시작 시 / 주기적 정합성 보정)
+
+        Args:
+            portfolio_state:
+                {
+                    'available_cash': float,
+                    'positions': [{'symbol'|'ticker', 'quantity', 'current_price'}],
+                    'initial_capital': float (optional),
+                    'daily_pnl': float (optional),
+                    'daily_trades': int (optional)
+                }
+        """
+        self.cash = float(portfolio_state.get('available_cash', 0.0))
+        self._shares.clear()
+        self._prices.clear()
+        self._sector_exposure.clear()
+
+        for pos in portfolio_state.get('positions', []):
+            symbol = (pos.get('symbol') or pos.get('ticker') or '').upper()
+            if not symbol:
+                continue
+            self._shares[symbol] = float(pos.get('quantity', 0))
+            self._prices[symbol] = float(pos.get('current_price', pos.get('price', 0.0)))
+
+        for symbol, shares in self._shares.items():
+            sector = self.get_sector(symbol)
+            self._sector_exposure[sector] = (
+                self._sector_exposure.get(sector, 0.0) + shares * self._prices[symbol]
+            )
+
+        self.total_value = self.cash + sum(self._sector_exposure.values())
+        self.initial_capital = float(portfolio_state.get('initial_capital', self.total_value))
+        self.daily_pnl = float(portfolio_state.get('daily_pnl', 0.0))
+        self.trades_today = int(portfolio_state.get('daily_trades', self.trades_today))
+
+    def record_fill(self, symbol: str, action: str, quantity: float, price: float):
+        """체결 반영 (O(1))"""
+        self._roll_day()
+        symbol = symbol.upper()
+        is_buy = action.lower() == 'buy'
+        signed_qty = quantity if is_buy else -min(quantity, self._shares.get(symbol, 0.0))
+
+        self.update_price(symbol, price)
+        self._shares[symbol] = self._shares.get(symbol, 0.0) + signed_qty
+        if self._shares[symbol] <= 0:
+            self._shares.pop(symbol, None)
+
+        value = signed_qty * price
+        sector = self.get_sector(symbol)
+        self._sector_exposure[sector] = self._sector_exposure.get(sector, 0.0) + value
+        self.cash -= value
+
+        self.trades_today += 1
+        if is_buy:
+            self._sector_trades_today[sector] = self._sector_trades_today.get(sector, 0) + 1
+
+    def update_cash(self, cash: float):
+        """브로커 잔고로 현금 보정 (포지션 노출은 유지, O(1))"""
+        self.total_value += float(cash) - self.cash
+        self.cash = float(cash)
+        if not self.initial_capital:
+            self.initial_capital = self.total_value
+
+    def release_order(self, symbol: str, action: str, quantity: float):
+        """승인 후 제출 실패한 주문을 중복 검사 이력에서 제거 (재시도 허용)"""
+        recent = self._recent_orders.get((symbol.upper(), action.lower()))
+        if not recent:
+            return
+        for i in range(len(recent) - 1, -1, -1):
+            if recent[i][1] == quantity:
+                del recent[i]
+                return
+
+    def update_price(self, symbol: str, price: float):
+        """시세 반영 (보유 종목 노출/총 평가금액 증분 조정, O(1))"""
+        symbol = symbol.upper()
+        old_price = self._prices.get(symbol)
+        self._prices[symbol] = price
+
+        shares = self._shares.get(symbol, 0.0)
+        if shares and old_price is not None:
+            delta = shares * (price - old_price)
+            sector = self.get_sector(symbol)
+            self._sector_exposure[sector] = self._sector_exposure.get(sector, 0.0) + delta
+            self.total_value += delta
+            self.daily_pnl += delta
+
+    def get_sector(self, symbol: str) -> str:
+        return self.sector_map.get(symbol.upper(), "UNKNOWN")
+
+    def position_value(self, symbol: str) -> float:
+        symbol = symbol.upper()
+        return self._shares.get(symbol, 0.0) * self._prices.get(symbol, 0.0)
+
+    # ================================================================
+    # Validation
+    # ================================================================
+
+    def validate(
+        self,
+        order: Dict[str, Any],
+        market_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """단일 주문 검증 (validate_batch 래퍼)"""
+        return self.validate_batch([order], market_state)[0]
+
+    def validate_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        market_state: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        후보 주문 배치 검증 (단일 벡터화 패스)
+
+        Args:
+            orders: [{'symbol', 'action': 'buy'|'sell', 'quantity', 'price',
+                      'order_value' (optional), 'stop_loss_pct' (buy)}]
+            market_state: {'is_market_open': bool, 'circuit_breaker': bool}
+
+        Returns:
+            주문별 {'symbol', 'can_execute', 'violations'} (입력 순서)
+        """
+        if not orders:
+            return []
+
+        start = time.perf_counter()
+        self._roll_day()
+        limits = self._refresh_limits()
+        n = len(orders)
+
+        symbols = [str(o.get('symbol', '')).upper() for o in orders]
+        sectors = [self.get_sector(s) for s in symbols]
+        actions = [str(o.get('action', '')).lower() for o in orders]
+
+        is_buy = np.fromiter((a == 'buy' for a in actions), dtype=bool, count=n)
+        quantity = np.fromiter((o.get('quantity', 0) for o in orders), dtype=float, count=n)
+        price = np.fromiter((o.get('price', 0.0) for o in orders), dtype=float, count=n)
+        value = np.fromiter(
+            (o.get('order_value', q * p) for o, q, p in zip(orders, quantity, price)),
+            dtype=float, count=n,
+        )
+        stop_loss = np.fromiter((o.get('stop_loss_pct', 0.0) for o in orders), dtype=float, count=n)
+
+        ticker_codes = self._codes(symbols)
+        sector_codes = self._codes(sectors)
+        current_position = np.fromiter((self.position_value(s) for s in symbols), dtype=float, count=n)
+        current_sector = np.fromiter(
+            (self._sector_exposure.get(s, 0.0) for s in sectors), dtype=float, count=n
+        )
+
+        # Cumulative effect of this and all earlier buys in the batch
+        buy_value = np.where(is_buy, value, 0.0)
+        cash_before = self.cash - (np.cumsum(buy_value) - buy_value)
+        position_after = current_position + _grouped_cumsum(buy_value, ticker_codes)
+        sector_after = current_sector + _grouped_cumsum(buy_value, sector_codes)
+        sector_trades_after = np.fromiter(
+            (self._sector_trades_today.get(s, 0) for s in sectors), dtype=float, count=n
+        ) + _grouped_cumsum(is_buy.astype(float), sector_codes)
+
+        first_in_batch = np.zeros(n, dtype=bool)
+        first_in_batch[np.unique(ticker_codes, return_index=True)[1]] = True
+        opens_position = is_buy & (current_position <= 0) & first_in_batch
+        position_count_after = len(self._shares) + np.cumsum(opens_position)
+        trades_after = self.trades_today + np.arange(1, n + 1)
+
+        total_value = max(self.total_value, 1e-9)
+        reserve = self.total_value * limits.min_cash_reserve_pct
+        market_state = market_state or {}
+        market_closed = not market_state.get('is_market_open', True) and not limits.allow_market_closed
+        halted = self.kill_switch is not None and not self.kill_switch.can_trade()
+        daily_loss_pct = max(0.0, -self.daily_pnl / self.initial_capital * 100) if self.initial_capital else 0.0
+
+        checks = [
+            (np.full(n, halted), "Kill Switch is ACTIVE"),
+            (np.full(n, daily_loss_pct >= limits.max_daily_loss_pct),
+             f"Daily loss {daily_loss_pct:.2f}% exceeds limit {limits.max_daily_loss_pct}%"),
+            (np.fromiter((s in limits.blacklist for s in symbols), dtype=bool, count=n),
+             "Symbol is blacklisted"),
+            (value > limits.max_order_value,
+             f"Order value exceeds max ${limits.max_order_value:,.0f}"),
+            (is_buy & limits.require_stop_loss & (stop_loss < limits.min_stop_loss_pct),
+             "Stop loss required for buy orders"),
+            (is_buy & (stop_loss > limits.max_stop_loss_pct),
+             f"Stop loss exceeds max {limits.max_stop_loss_pct*100}%"),
+            (is_buy & (value > cash_before), "Insufficient cash"),
+            (is_buy & (value <= cash_before) & (cash_before - value < reserve),
+             "Cash reserve violation"),
+            (is_buy & (position_after / total_value > limits.max_position_pct),
+             f"Position size exceeds max {limits.max_position_pct*100:.0f}%"),
+            (is_buy & (sector_after / total_value > limits.max_sector_pct),
+             f"Sector exposure exceeds max {limits.max_sector_pct*100:.0f}%"),
+            (opens_position & (position_count_after > limits.max_position_count),
+             f"Position count exceeds max {limits.max_position_count}"),
+            (trades_after > limits.max_daily_trades,
+             f"Daily trade limit reached ({limits.max_daily_trades})"),
+            (is_buy & (sector_trades_after > limits.max_sector_trades_per_day),
+             f"Sector daily trade limit reached ({limits.max_sector_trades_per_day})"),
+            (is_buy & market_closed, "Market is closed - buy orders not allowed"),
+            (is_buy & bool(market_state.get('circuit_breaker', False)),
+             "Circuit breaker activated - only sell orders allowed"),
+            (self._duplicate_mask(symbols, actions, quantity), "Duplicate order"),
+        ]
+
+        masks = np.stack([mask for mask, _ in checks])
+        rejected = masks.any(axis=0)
+
+        results = []
+        now = datetime.utcnow()
+        for i in range(n):
+            violations = []
+            if rejected[i]:
+                violations = [message for (mask, message) in checks if mask[i]]
+            else:
+                self._record_order(symbols[i], actions[i], quantity[i], now)
+            results.append({
+                'symbol': symbols[i],
+                'can_execute': not violations,
+                'violations': violations,
+            })
+
+        per_order_ms = (time.perf_counter() - start) * 1000 / n
+        self.latency.observe(per_order_ms, count=n)
+
+        return results
+
+    def get_status(self) -> Dict[str, Any]:
+        """현재 리스크 상태 + 검증 지연 통계"""
+        return {
+            'cash': self.cash,
+            'total_value': self.total_value,
+            'position_count': len(self._shares),
+            'sector_exposure': dict(self._sector_exposure),
+            'trades_today': self.trades_today,
+            'latency': self.latency.to_dict(),
+        }
+
+    # ================================================================
+    # Private methods
+    # ================================================================
+
+    def _refresh_limits(self) -> PreTradeLimits:
+        """검증 컴포넌트의 현재 한도 로드 (컴포넌트가 없으면 고정 한도)"""
+        if self._live_limits:
+            self.limits = PreTradeLimits.from_components(
+                validator=self.validator,
+                safety_guard=self.safety_guard,
+                kill_switch=self.kill_switch,
+                throttle_config=self.throttle_config,
+            )
+        return self.limits
+
+    @staticmethod
+    def _codes(keys: List[str]) -> np.ndarray:
+        """문자열 키 → 정수 코드 (그룹 누적합용)"""
+        mapping: Dict[str, int] = {}
+        return np.fromiter(
+            (mapping.setdefault(k, len(mapping)) for k in keys), dtype=np.int64, count=len(keys)
+        )
+
+    def _duplicate_mask(
+        self,
+        symbols: List[str],
+        actions: List[str],
+        quantity: np.ndarray
+    ) -> np.ndarray:
+        """최근 승인 주문 + 배치 내 앞선 주문과의 중복 여부 (수량 1% 허용 오차)"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.limits.duplicate_window_sec)
+        mask = np.zeros(len(symbols), dtype=bool)
+        seen: Dict[Tuple[str, str], List[float]] = {}
+
+        for i, key in enumerate(zip(symbols, actions)):
+            qty = quantity[i]
+            recent = self._recent_orders.get(key)
+            if recent:
+                while recent and recent[0][0] < cutoff:
+                    recent.popleft()
+                previous = [q for _, q in recent]
+            else:
+                previous = []
+            previous += seen.get(key, [])
+
+            if any(abs(p - qty) / max(qty, 1) < 0.01 for p in previous):
+                mask[i] = True
+            seen.setdefault(key, []).append(qty)
+
+        return mask
+
+    def _record_order(self, symbol: str, action: str, quantity: float, now: datetime):
+        self._recent_orders.setdefault((symbol, action), deque()).append((now, quantity))
+
+    def _roll_day(self):
+        """날짜 변경 시 일일 카운터 초기화"""
+        today = datetime.utcnow().date()
+        if today != self._trading_day:
+            self._trading_day = today
+            self.trades_today = 0
+            self._sector_trades_today.clear()
+            self.daily_pnl = 0.0
+            self.initial_capital = self.total_value
+
+
+def _grouped_cumsum(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """그룹(code)별 입력 순서 누적합"""
+    n = len(values)
+    order = np.argsort(codes, kind='stable')
+    sorted_values = values[order]
+    sorted_codes = codes[order]
+
+    cumsum = np.cumsum(sorted_values)
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    start_index = np.maximum.accumulate(np.where(starts, np.arange(n), 0))
+    grouped = cumsum - (cumsum - sorted_values)[start_index]
+
+    result = np.empty(n, dtype=float)
+    result[order] = grouped
+    return result
+
+
+_pre_trade_risk_engine: Optional[PreTradeRiskEngine] = None
+
+
+def get_pre_trade_risk_engine() -> PreTradeRiskEngine:
+    """
+    주문 제출 경로 공유 엔진 (OrderValidator / SafetyGuard / KillSwitch / SectorThrottle 한도)
+
+    블랙리스트 변경은 engine.validator.add_to_blacklist(...)로 즉시 반영됩니다.
+    """
+    global _pre_trade_risk_engine
+    if _pre_trade_risk_engine is None:
+        from backend.execution.kill_switch import get_kill_switch
+        from backend.execution.order_validator import OrderValidator
+        from backend.execution.safety_guard import get_safety_guard
+        from backend.signals.sector_throttling import SectorThrottleConfig
+
+        _pre_trade_risk_engine = PreTradeRiskEngine.from_components(
+            validator=OrderValidator(),
+            safety_guard=get_safety_guard(),
+            kill_switch=get_kill_switch(),
+            throttle_config=SectorThrottleConfig(),
+        )
+    return _pre_trade_risk_engine
@@ -5,6 +5,7 @@ Order Recovery - 재시작 시 미완료 주문 복구
 - 브로커 상태가 진실(Source of Truth)
 - 실패한 주문은 수동 검토 플래그
 - 자동화의 한계를 시스템이 인지
+- TransitionLog(WAL)가 있으면 로그 replay로 레지스트리/DB 상태 먼저 복원
 
 작성일: 2026-01-10
 """
@@ -15,6 +16,7 @@ import logging
 
 from .state_machine import OrderState, state_machine
 from .order_manager import OrderManager
+from .order_registry import LiveOrder
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +39,15 @@ class OrderRecovery:
         logger.info("🔄 Starting Order Recovery...")
         logger.info("=" * 50)
 
+        # 0. WAL replay (배치 커밋 전에 종료된 전이 복원)
+        if self.om.transition_log is not None:
+            self.rebuild_from_log()
+
         # 1. 미완료 주문 조회
         pending_orders = self.om.get_pending_orders()
 
         if not pending_orders:
+            self._compact_live_state()
             logger.info("✅ No pending orders to recover")
             return {'recovered': 0, 'failed': 0, 'total': 0}
 
@@ -72,6 +79,9 @@ class OrderRecovery:
             'timestamp': datetime.utcnow().isoformat()
         }
 
+        # 4. 레지스트리/WAL 정리 (종료된 주문 제거)
+        self._compact_live_state()
+
         logger.info("=" * 50)
         logger.info(f"✅ Recovery Complete: {recovered}/{len(pending_orders)} recovered")
         if failed > 0:
@@ -80,6 +90,58 @@ class OrderRecovery:
 
         return summary
 
+    def rebuild_from_log(self) -> Dict:
+        """
+        WAL replay로 주문 상태 복원
+
+        1. 주문별 최종 전이로 레지스트리 재구성
+        2. DB가 로그보다 뒤처진 주문을 한 번의 커밋으로 동기화
+           (로그의 전이는 기록 시점에 이미 상태 머신 검증을 통과함)
+
+        Returns:
+            Dict: {'replayed': 로그상 주문 수, 'synced': DB 동기화 주문 수}
+        """
+        from backend.database.models import Order
+
+        latest = self.om.transition_log.latest_states()
+        if not latest:
+            return {'replayed': 0, 'synced': 0}
+
+        for order_id, entry in latest.items():
+            self.om.registry.upsert(LiveOrder(
+                id=order_id,
+                ticker=entry.get('symbol'),
+                action=entry.get('action'),
+                quantity=entry.get('quantity'),
+                status=OrderState(entry['to']),
+                broker_order_id=entry.get('broker_order_id'),
+                filled_quantity=entry.get('filled_quantity'),
+                filled_price=entry.get('filled_price'),
+                strategy_id=entry.get('strategy_id'),
+            ))
+
+        synced = 0
+        orders = self.om.db.query(Order).filter(Order.id.in_(list(latest))).all()
+        for order in orders:
+            entry = latest[order.id]
+            if order.status == entry['to']:
+                continue
+
+            order.status = entry['to']
+            order.order_id = entry.get('broker_order_id') or order.order_id
+            order.filled_quantity = entry.get('filled_quantity', order.filled_quantity)
+            order.filled_price = entry.get('filled_price', order.filled_price)
+            order.error_message = entry.get('error_message', order.error_message)
+            order.updated_at = datetime.utcnow()
+            self.om.db.add(order)
+            synced += 1
+
+        if synced:
+            self.om.db.commit()
+
+        logger.info(f"🔁 WAL replay: {len(latest)} orders, {synced} synced to DB")
+        return {'replayed': len(latest), 'synced': synced}
+
     async def _recover_order(self, order) -> Dict:
         """
         개별 주문 복구
@@ -143,6 +205,13 @@ class OrderRecovery:
             await self._mark_for_review(order, f"Unknown broker state: {broker_state}")
             return {'success': False, 'order_id': order.id, 'reason': f'Unknown state: {broker_state}'}
 
+    def _compact_live_state(self):
+        """지연된 커밋 반영 후 종료 주문을 레지스트리/WAL에서 제거"""
+        self.om.flush()
+        self.om.registry.evict_terminal()
+        if self.om.transition_log is not None:
+            self.om.transition_log.compact(set(self.om.registry.pending_ids()))
+
     async def _mark_for_review(self, order, error_message: str):
         """수동 검토 필요 플래그 설정"""
         order.needs_manual_review = True
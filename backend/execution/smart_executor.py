@@ -8,6 +8,12 @@ Components:
 - SmartExecutor: Main workflow orchestrator
 - SimplePortfolioManager: Position tracking
 - SimpleRiskManager: Risk controls
+- StageLatencyHistogram: Per-stage latency tracking for batch pipelines
+
+Batch Pipeline (process_batch):
+1. Prefetch: bulk price fetch for all tickers
+2. Decide: concurrent AI decisions against a portfolio snapshot
+3. Commit: serialized risk check → execute → portfolio update
 
 Cost: $0/month (all local computation)
 Author: AI Trading System Team
@@ -15,8 +21,9 @@ Date: 2025-11-14
 """
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 from .execution_engine import SmartExecutionEngine, ExecutionResult
 
@@ -219,6 +226,69 @@ class SimpleRiskManager:
         print("Kill switch deactivated")
 
 
+class StageLatencyHistogram:
+    """
+    In-memory latency histogram for a single pipeline stage.
+
+    Bucket upper bounds are in milliseconds; the last bucket is +Inf.
+    Percentiles are approximated by the upper bound of the bucket
+    containing the requested rank.
+    """
+
+    DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self.bucket_counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float, count: int = 1):
+        """Record a latency sample (``count`` identical samples for batches)."""
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if elapsed_ms <= bound:
+                index = i
+                break
+
+        self.bucket_counts[index] += count
+        self.count += count
+        self.total_ms += elapsed_ms * count
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (0-100) in milliseconds."""
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(self.count * pct / 100.0)))
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if i < len(self.buckets_ms):
+                    return min(float(self.buckets_ms[i]), self.max_ms)
+                return self.max_ms
+
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        """Export histogram as a JSON-serializable dict."""
+        buckets = {f"le_{bound}": c for bound, c in zip(self.buckets_ms, self.bucket_counts)}
+        buckets["le_inf"] = self.bucket_counts[-1]
+
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "buckets": buckets,
+        }
+
+
 class SmartExecutor:
     """
     Complete trading workflow orchestrator.
@@ -231,8 +301,13 @@ class SmartExecutor:
 
     Workflow:
     ticker → analyze → decide → risk check → execute → update portfolio
+
+    Batch workflow (staged pipeline):
+    prefetch prices (bulk) → decide (concurrent) → commit (serialized)
     """
 
+    PIPELINE_STAGES = ("prefetch", "decision", "commit")
+
     def __init__(
         self,
         trading_agent=None,
@@ -255,6 +330,15 @@ class SmartExecutor:
         self.portfolio_manager = portfolio_manager or SimplePortfolioManager()
         self.risk_manager = risk_manager or SimpleRiskManager()
 
+        # Per-stage latency histograms (prefetch is per batch, others per ticker)
+        self.stage_latency: Dict[str, StageLatencyHistogram] = {
+            stage: StageLatencyHistogram() for stage in self.PIPELINE_STAGES
+        }
+        self.last_batch_timings: Dict[str, float] = {}
+
+        # Serializes risk check + execution + portfolio update
+        self._commit_lock = asyncio.Lock()
+
     async def process_ticker(
         self,
         ticker: str,
@@ -279,11 +363,7 @@ class SmartExecutor:
         Returns:
             Complete result dict
         """
-        result = {
-            "ticker": ticker,
-            "timestamp": datetime.now().isoformat(),
-            "status": "PENDING",
-        }
+        result = self._new_result(ticker)
 
         try:
             # 1. Get portfolio context
@@ -291,68 +371,10 @@ class SmartExecutor:
             result["portfolio_value"] = portfolio_context["total_value"]
 
             # 2. Get AI decision
-            if self.trading_agent:
-                decision = await self.trading_agent.analyze(
-                    ticker=ticker,
-                    portfolio_context=portfolio_context,
-                    market_context=market_context or {},
-                )
-            else:
-                # Mock decision for testing
-                decision = self._mock_decision(ticker)
-
-            result["decision"] = {
-                "action": decision.action,
-                "conviction": decision.conviction,
-                "position_size": decision.position_size,
-            }
-
-            # 3. Risk check
-            risk_check = self.risk_manager.check_trade(
-                ticker=ticker,
-                action=decision.action,
-                portfolio_context=portfolio_context,
-            )
+            decision = await self._decide(ticker, portfolio_context, market_context)
 
-            if not risk_check["approved"]:
-                result["status"] = "BLOCKED"
-                result["message"] = risk_check["reason"]
-                return result
-
-            # 4. Execute decision
-            # Get current price (mock for now)
-            current_price = await self._get_current_price(ticker)
-
-            execution_result = await self.execution_engine.execute_decision(
-                trading_decision=decision,
-                portfolio_value=portfolio_context["total_value"],
-                current_price=current_price,
-                urgency=urgency,
-            )
-
-            result["execution"] = {
-                "status": execution_result.status,
-                "filled_shares": execution_result.filled_shares,
-                "avg_price": execution_result.avg_price,
-                "total_cost": execution_result.total_cost,
-                "slippage_bps": execution_result.slippage_bps,
-                "algorithm": execution_result.algorithm_used,
-            }
-
-            # 5. Update portfolio
-            if execution_result.status == "SUCCESS":
-                portfolio_update = self.portfolio_manager.update_position(
-                    ticker=ticker,
-                    action=decision.action,
-                    shares=execution_result.filled_shares,
-                    price=execution_result.avg_price,
-                    cost=execution_result.total_cost,
-                )
-
-                result["portfolio_update"] = portfolio_update
-                result["status"] = "SUCCESS"
-            else:
-                result["status"] = execution_result.status
+            # 3-5. Risk check, execute, update portfolio
+            await self._commit(result, decision, urgency)
 
         except Exception as e:
             result["status"] = "ERROR"
@@ -368,39 +390,232 @@ class SmartExecutor:
         max_concurrent: int = 5,
     ) -> List[Dict]:
         """
-        Process multiple tickers concurrently.
+        Process multiple tickers through a staged pipeline.
+
+        Stages:
+        1. Prefetch: fetch current prices for all tickers in one bulk call
+        2. Decide: run AI decisions concurrently (bounded by max_concurrent)
+           against a single portfolio snapshot
+        3. Commit: risk check, execute and update portfolio one ticker at a
+           time, in input order, so every risk check sees the positions
+           committed before it
+
+        Per-stage latencies are recorded in ``stage_latency`` and the wall
+        time of each stage for this batch in ``last_batch_timings``.
 
         Args:
             tickers: List of ticker symbols
             market_context: Market regime, VIX, etc.
             urgency: Execution urgency
-            max_concurrent: Max concurrent executions
+            max_concurrent: Max concurrent AI decisions
 
         Returns:
-            List of results
+            List of results (same order as tickers)
         """
+        batch_start = time.perf_counter()
+        results = [self._new_result(ticker) for ticker in tickers]
+
+        # 1. Bulk price prefetch
+        stage_start = time.perf_counter()
+        try:
+            prices = await self._get_current_prices(tickers)
+        except Exception as e:
+            for result in results:
+                result["status"] = "ERROR"
+                result["message"] = f"Price prefetch failed: {e}"
+            return results
+        prefetch_ms = self._elapsed_ms(stage_start)
+        self.stage_latency["prefetch"].observe(prefetch_ms)
+
+        # 2. Concurrent decisioning against one portfolio snapshot
+        stage_start = time.perf_counter()
+        portfolio_context = self.portfolio_manager.get_context()
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def process_with_limit(ticker):
+        async def decide_with_limit(ticker):
+            if isinstance(prices.get(ticker), Exception):
+                return None  # no AI call for a ticker without a price
             async with semaphore:
-                return await self.process_ticker(ticker, market_context, urgency)
+                return await self._decide(ticker, portfolio_context, market_context)
 
-        tasks = [process_with_limit(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        decisions = await asyncio.gather(
+            *(decide_with_limit(ticker) for ticker in tickers),
+            return_exceptions=True,
+        )
+        decision_ms = self._elapsed_ms(stage_start)
 
-        # Handle exceptions
-        processed_results = []
-        for ticker, result in zip(tickers, results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "ticker": ticker,
-                    "status": "ERROR",
-                    "message": str(result),
-                })
-            else:
-                processed_results.append(result)
+        # 3. Serialized risk check + execution + portfolio commit
+        stage_start = time.perf_counter()
+        for result, decision in zip(results, decisions):
+            result["portfolio_value"] = portfolio_context["total_value"]
+
+            price = prices.get(result["ticker"])
+            if isinstance(price, Exception):
+                result["status"] = "ERROR"
+                result["message"] = f"Price prefetch failed: {price}"
+                continue
+
+            if isinstance(decision, Exception):
+                result["status"] = "ERROR"
+                result["message"] = str(decision)
+                continue
+
+            try:
+                await self._commit(
+                    result,
+                    decision,
+                    urgency,
+                    current_price=price,
+                )
+            except Exception as e:
+                result["status"] = "ERROR"
+                result["message"] = str(e)
+        commit_ms = self._elapsed_ms(stage_start)
+
+        self.last_batch_timings = {
+            "tickers": len(tickers),
+            "prefetch_ms": prefetch_ms,
+            "decision_ms": decision_ms,
+            "commit_ms": commit_ms,
+            "total_ms": self._elapsed_ms(batch_start),
+        }
 
-        return processed_results
+        return results
+
+    async def _decide(
+        self,
+        ticker: str,
+        portfolio_context: Dict,
+        market_context: Optional[Dict] = None,
+    ):
+        """Get AI decision for a ticker (decision stage)."""
+        start = time.perf_counter()
+        try:
+            if self.trading_agent:
+                return await self.trading_agent.analyze(
+                    ticker=ticker,
+                    portfolio_context=portfolio_context,
+                    market_context=market_context or {},
+                )
+
+            # Mock decision for testing
+            return self._mock_decision(ticker)
+        finally:
+            self.stage_latency["decision"].observe(self._elapsed_ms(start))
+
+    async def _commit(
+        self,
+        result: Dict,
+        decision,
+        urgency: str,
+        current_price: Optional[float] = None,
+    ) -> Dict:
+        """
+        Risk check, execute and update portfolio (commit stage).
+
+        Runs under a lock so that each risk check sees a portfolio that
+        already includes every previously committed trade.
+        """
+        ticker = result["ticker"]
+        result["decision"] = {
+            "action": decision.action,
+            "conviction": decision.conviction,
+            "position_size": decision.position_size,
+        }
+
+        async with self._commit_lock:
+            start = time.perf_counter()
+            try:
+                portfolio_context = self.portfolio_manager.get_context()
+
+                # Risk check
+                risk_check = self.risk_manager.check_trade(
+                    ticker=ticker,
+                    action=decision.action,
+                    portfolio_context=portfolio_context,
+                )
+
+                if not risk_check["approved"]:
+                    result["status"] = "BLOCKED"
+                    result["message"] = risk_check["reason"]
+                    return result
+
+                # Execute decision
+                if current_price is None:
+                    current_price = await self._get_current_price(ticker)
+
+                execution_result = await self.execution_engine.execute_decision(
+                    trading_decision=decision,
+                    portfolio_value=portfolio_context["total_value"],
+                    current_price=current_price,
+                    urgency=urgency,
+                )
+
+                result["execution"] = {
+                    "status": execution_result.status,
+                    "filled_shares": execution_result.filled_shares,
+                    "avg_price": execution_result.avg_price,
+                    "total_cost": execution_result.total_cost,
+                    "slippage_bps": execution_result.slippage_bps,
+                    "algorithm": execution_result.algorithm_used,
+                }
+
+                # Update portfolio
+                if execution_result.status == "SUCCESS":
+                    portfolio_update = self.portfolio_manager.update_position(
+                        ticker=ticker,
+                        action=decision.action,
+                        shares=execution_result.filled_shares,
+                        price=execution_result.avg_price,
+                        cost=execution_result.total_cost,
+                    )
+
+                    result["portfolio_update"] = portfolio_update
+                    result["status"] = "SUCCESS"
+                else:
+                    result["status"] = execution_result.status
+
+                return result
+            finally:
+                self.stage_latency["commit"].observe(self._elapsed_ms(start))
+
+    @staticmethod
+    def _new_result(ticker: str) -> Dict:
+        """Create an empty per-ticker result dict."""
+        return {
+            "ticker": ticker,
+            "timestamp": datetime.now().isoformat(),
+            "status": "PENDING",
+        }
+
+    @staticmethod
+    def _elapsed_ms(start: float) -> float:
+        return (time.perf_counter() - start) * 1000
+
+    async def _get_current_prices(
+        self, tickers: List[str]
+    ) -> Dict[str, Union[float, Exception]]:
+        """
+        Bulk price prefetch for a batch.
+
+        Default implementation fans out to _get_current_price concurrently;
+        override with a single snapshot call when the data source supports it.
+        A failed lookup is returned as its exception so that only that
+        ticker fails.
+        """
+        unique_tickers = list(dict.fromkeys(tickers))
+        prices = await asyncio.gather(
+            *(self._get_current_price(ticker) for ticker in unique_tickers),
+            return_exceptions=True,
+        )
+        return dict(zip(unique_tickers, prices))
+
+    def get_stage_latency(self) -> Dict:
+        """Get per-stage latency histograms for the batch pipeline."""
+        return {
+            stage: histogram.to_dict()
+            for stage, histogram in self.stage_latency.items()
+        }
 
     async def _get_current_price(self, ticker: str) -> float:
         """Get current market price (mock for now)."""
@@ -453,6 +668,8 @@ class SmartExecutor:
                 "max_positions": self.risk_manager.max_positions,
                 "current_positions": portfolio_summary["num_positions"],
             },
+            "pipeline_latency": self.get_stage_latency(),
+            "last_batch_timings": self.last_batch_timings,
         }
 
 
@@ -483,6 +700,13 @@ async def demo():
     for res in results:
         print(f"  {res['ticker']}: {res['status']}")
 
+    timings = executor.last_batch_timings
+    print(
+        f"  Stages: prefetch {timings['prefetch_ms']:.1f}ms, "
+        f"decision {timings['decision_ms']:.1f}ms, "
+        f"commit {timings['commit_ms']:.1f}ms"
+    )
+
     print("\n3. System Summary:\n")
 
     summary = executor.get_summary()
@@ -0,0 +1,246 @@
+"""
+Transition Log - 주문 상태 전이 Write-Ahead Log
+
+핵심 원칙:
+- 모든 상태 전이는 JSON Lines 파일에 append-only로 기록
+- 전이마다 fsync 하지 않고 배치 단위로 flush (batch_size / flush_interval)
+- 백그라운드 flusher가 flush_interval마다 남은 꼬리를 기록 (버스트 마지막 전이도 유실 없음)
+- on_durable 콜백은 해당 전이가 fsync된 뒤에 실행 (이벤트 발행은 영속화 이후)
+- 재시작 시 replay로 주문별 최종 상태 복원 (OrderRecovery)
+
+작성일: 2026-10-18
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Set
+from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TransitionLog:
+    """
+    주문 상태 전이 WAL
+
+    사용법:
+        wal = TransitionLog("data/orders/transitions.jsonl")
+        if wal.append({'order_id': 1, 'to': 'order_sent', ...}, on_durable=publish):
+            wal.flush()
+        for entry in wal.replay():
+            ...
+        wal.close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.05,
+        fsync: bool = True,
+        auto_flush: bool = True,
+    ):
+        """
+        Args:
+            path: JSON Lines 파일 경로
+            batch_size: 이 개수가 쌓이면 flush 필요
+            flush_interval_seconds: 최대 flush 지연 (백그라운드 flusher 주기)
+            fsync: flush마다 os.fsync
+            auto_flush: 첫 append 시 백그라운드 flusher 스레드 시작
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.fsync = fsync
+
+        self._buffer: List[Dict] = []
+        self._callbacks: List[Callable[[], None]] = []
+        # flush 중 on_durable 콜백이 append 할 수 있으므로 재진입 가능
+        self._lock = threading.RLock()
+        self.auto_flush = auto_flush
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._last_flush = time.monotonic()
+        self._seq = self._last_seq()
+
+        # 통계
+        self.entries_written = 0
+        self.flush_count = 0
+
+    # ================================================================
+    # 쓰기
+    # ================================================================
+
+    def append(self, entry: Dict, on_durable: Optional[Callable[[], None]] = None) -> bool:
+        """
+        전이 기록 버퍼링
+
+        Args:
+            entry: 전이 엔트리
+            on_durable: 엔트리가 디스크에 기록(fsync)된 뒤 호출할 콜백
+
+        Returns:
+            bool: flush가 필요한지 여부
+        """
+        with self._lock:
+            self._seq += 1
+            record = {'seq': self._seq, **entry}
+            record.setdefault('timestamp', datetime.utcnow().isoformat())
+            self._buffer.append(record)
+            if on_durable is not None:
+                self._callbacks.append(on_durable)
+            if self.auto_flush and self._flusher is None and not self._closed.is_set():
+                self._start_flusher()
+        return self.should_flush()
+
+    def should_flush(self) -> bool:
+        if not self._buffer:
+            return False
+        if len(self._buffer) >= self.batch_size:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval_seconds
+
+    def flush(self) -> int:
+        """버퍼를 디스크에 기록 (한 번의 write + fsync)"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            callbacks, self._callbacks = self._callbacks, []
+            if not batch:
+                return 0
+
+            payload = "".join(json.dumps(r, default=str) + "\n" for r in batch)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+            self._last_flush = time.monotonic()
+            self.entries_written += len(batch)
+            self.flush_count += 1
+
+            # 기록 순서대로 영속화 후속 처리 (lock 안에서 실행해 순서 보장)
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"[WAL] on_durable callback failed: {e}")
+
+        logger.debug(f"[WAL] Flushed {len(batch)} transitions to {self.path}")
+        return len(batch)
+
+    @property
+    def pending(self) -> int:
+        """flush 대기 중인 전이 수"""
+        return len(self._buffer)
+
+    def close(self):
+        """백그라운드 flusher 중지 + 남은 전이 flush"""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=max(1.0, self.flush_interval_seconds * 2))
+            self._flusher = None
+        self.flush()
+
+    # ================================================================
+    # 읽기 / 복구
+    # ================================================================
+
+    def replay(self) -> Iterator[Dict]:
+        """기록된 전이를 순서대로 반환 (손상된 마지막 줄은 무시)"""
+        if not self.path.exists():
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"[WAL] Skipping corrupt entry at line {line_no}")
+
+    def latest_states(self) -> Dict[int, Dict]:
+        """주문별 최종 전이 (order_id → 누적 엔트리)"""
+        latest: Dict[int, Dict] = {}
+        for entry in self.replay():
+            order_id = entry.get('order_id')
+            if order_id is None:
+                continue
+            merged = latest.setdefault(order_id, {})
+            merged.update({k: v for k, v in entry.items() if v is not None})
+        return latest
+
+    def compact(self, keep_order_ids: Set[int]) -> int:
+        """
+        종료된 주문의 전이를 제거하여 로그 크기 축소
+
+        Returns:
+            int: 남은 엔트리 수
+        """
+        self.flush()
+        kept = [e for e in self.replay() if e.get('order_id') in keep_order_ids]
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in kept:
+                f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        logger.info(f"[WAL] Compacted to {len(kept)} entries")
+        return len(kept)
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _start_flusher(self):
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="transition-log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self):
+        """flush_interval마다 버퍼 꼬리 flush (append가 멈춘 뒤에도 지연 상한 보장)"""
+        while not self._closed.wait(self.flush_interval_seconds):
+            if self.should_flush():
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"[WAL] Background flush failed: {e}")
+
+    def _last_seq(self) -> int:
+        last = 0
+        for entry in self.replay():
+            last = max(last, entry.get('seq', 0))
+        return last
+
+
+_transition_log: Optional[TransitionLog] = None
+
+
+def get_transition_log() -> Optional[TransitionLog]:
+    """
+    전역 WAL 인스턴스 (ORDER_TRANSITION_LOG_PATH 설정 시에만 활성화)
+
+    Returns:
+        TransitionLog 또는 None (WAL 비활성)
+    """
+    global _transition_log
+    if _transition_log is None:
+        path = os.getenv("ORDER_TRANSITION_LOG_PATH")
+        if path:
+            _transition_log = TransitionLog(
+                path,
+                batch_size=int(os.getenv("ORDER_TRANSITION_LOG_BATCH", "100")),
+            )
+    return _transition_log
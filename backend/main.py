@@ -17,11 +17,17 @@ Date: 2025-11-14
 
 import logging
 import asyncio
+import importlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from contextlib import asynccontextmanager
 
+# Startup profiler first so every following import is timed (STARTUP_PROFILE=1)
+from backend.core.startup_profiler import startup_profiler
+startup_profiler.install_import_hook()
+
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse, JSONResponse
@@ -45,167 +51,100 @@ logger = logging.getLogger(__name__)
 api_key_config = APIKeyConfig()
 
 # Import Event Subscribers
+from backend.events import event_bus
 from backend.events.subscribers import register_subscribers, set_conflict_ws_manager
 
 # =============================================================================
-# Router imports (absolute paths) with availability flags
+# Router declarations (imported by RouterRegistry - see backend/core/router_registry.py)
+# groups: core / trading / news / analysis  (ROUTER_PROFILE selects a subset)
 # =============================================================================
-try:
-    from backend.api.ai_chat_router import router as ai_chat_router
-    AI_CHAT_AVAILABLE = True
-except ImportError as e:
-    AI_CHAT_AVAILABLE = False
-    logger.warning(f"AI Chat router not available: {e}")
-
-try:
-    from backend.api.gemini_free_router import router as gemini_free_router
-    GEMINI_FREE_AVAILABLE = True
-except ImportError as e:
-    GEMINI_FREE_AVAILABLE = False
-    logger.warning(f"Gemini Free router not available: {e}")
-
-try:
-    from backend.api.news_router import router as news_router
-    from backend.api.news_processing_router import router as news_processing_router
-    NEWS_AVAILABLE = True
-except ImportError as e:
-    NEWS_AVAILABLE = False
-    logger.warning(f"News router not available: {e}")
-
-try:
-    from backend.api.ai_review_router import router as ai_review_router
-    AI_REVIEW_AVAILABLE = True
-except ImportError as e:
-    AI_REVIEW_AVAILABLE = False
-    logger.warning(f"AI Review router not available: {e}")
-
-try:
-    from backend.api.logs_router import router as logs_router
-    LOGS_AVAILABLE = True
-except ImportError as e:
-    LOGS_AVAILABLE = False
-    logger.warning(f"Logs router not available: {e}")
-
-try:
-    from backend.api.feeds_router import router as feeds_router
-    FEEDS_AVAILABLE = True
-except ImportError as e:
-    FEEDS_AVAILABLE = False
-    logger.warning(f"Feeds router not available: {e}")
-
-try:
-    from backend.api.news_router import router as news_router
-    from backend.api.news_analysis_router import router as news_analysis_router
-    from backend.api.gemini_news_router import router as gemini_news_router
-    NEWS_ROUTER_AVAILABLE = True
-except ImportError as e:
-    NEWS_ROUTER_AVAILABLE = False
-    logger.warning(f"News analysis router not available: {e}")
-
-try:
-    from backend.api.auth_router import router as auth_router
-    AUTH_ROUTER_AVAILABLE = True
-except ImportError as e:
-    AUTH_ROUTER_AVAILABLE = False
-    logger.warning(f"Auth router not available: {e}")
-
-try:
-    from backend.api.signals_router import router as signals_router
-    SIGNALS_AVAILABLE = True
-except ImportError as e:
-    SIGNALS_AVAILABLE = False
-    logger.warning(f"Signals router not available: {e}")
-
-try:
-    from backend.api.notifications_router import router as notifications_router
-    NOTIFICATIONS_AVAILABLE = True
-except ImportError as e:
-    NOTIFICATIONS_AVAILABLE = False
-    logger.warning(f"Notifications router not available: {e}")
-
-try:
-    from backend.api.backtest_router import router as backtest_router
-    BACKTEST_AVAILABLE = True
-except ImportError as e:
-    BACKTEST_AVAILABLE = False
-    logger.warning(f"Backtest router not available: {e}")
-
-try:
-    from backend.api.phase_integration_router import router as phase_router
-    PHASE_AVAILABLE = True
-except ImportError as e:
-    PHASE_AVAILABLE = False
-    logger.warning(f"Phase router not available: {e}")
-
-try:
-    from backend.api.kis_integration_router import router as kis_router
-    KIS_AVAILABLE = True
-except ImportError as e:
-    KIS_AVAILABLE = False
-    logger.warning(f"KIS router not available: {e}")
-
-try:
-    from backend.api.ai_signals_router import router as ai_signals_router
-    AI_SIGNALS_AVAILABLE = True
-except ImportError as e:
-    AI_SIGNALS_AVAILABLE = False
-    logger.warning(f"AI Signals router not available: {e}")
-
-try:
-    from backend.api.consensus_router import router as consensus_router
-    CONSENSUS_AVAILABLE = True
-except ImportError as e:
-    CONSENSUS_AVAILABLE = False
-    logger.warning(f"Consensus router not available: {e}")
-
-try:
-    from backend.api.position_router import router as position_router
-    POSITION_AVAILABLE = True
-except ImportError as e:
-    POSITION_AVAILABLE = False
-    logger.warning(f"Position router not available: {e}")
-
-try:
-    from backend.api.global_macro_router import router as global_macro_router
-    GLOBAL_MACRO_AVAILABLE = True
-except ImportError as e:
-    GLOBAL_MACRO_AVAILABLE = False
-    logger.warning(f"Global Macro router not available: {e}")
-
-try:
-    from backend.api.auto_trade_router import router as auto_trade_router
-    AUTO_TRADE_AVAILABLE = True
-except ImportError as e:
-    AUTO_TRADE_AVAILABLE = False
-    logger.warning(f"Auto Trade router not available: {e}")
-
-try:
-    from backend.api.ceo_analysis_router import router as ceo_analysis_router
-    CEO_ANALYSIS_AVAILABLE = True
-except ImportError as e:
-    CEO_ANALYSIS_AVAILABLE = False
-    logger.warning(f"CEO Analysis router not available: {e}")
-
-try:
-    from backend.api.incremental_router import router as incremental_router
-    INCREMENTAL_AVAILABLE = True
-except ImportError as e:
-    INCREMENTAL_AVAILABLE = False
-    logger.warning(f"Incremental router not available: {e}")
-
-try:
-    from backend.api.reports_router import router as reports_router
-    REPORTS_AVAILABLE = True
-except ImportError as e:
-    REPORTS_AVAILABLE = False
-    logger.warning(f"Reports router not available: {e}")
-
-try:
-    from backend.api.reasoning_api import router as reasoning_router
-    REASONING_AVAILABLE = True
-except ImportError as e:
-    REASONING_AVAILABLE = False
-    logger.warning(f"Reasoning router not available: {e}")
+from backend.core.router_registry import RouterRegistry, RouterSpec
+
+ROUTER_SPECS = [
+    RouterSpec("AI Chat", "backend.api.ai_chat_router", path="/ai-chat", groups=("analysis",)),
+    RouterSpec("Gemini Free", "backend.api.gemini_free_router", path="/gemini-free", groups=("analysis",)),
+    RouterSpec("News", "backend.api.news_router", prefix="/api", path="/api/news", groups=("news",)),
+    RouterSpec("News Processing", "backend.api.news_processing_router", prefix="/api", path="/api/news", groups=("news",)),
+    RouterSpec("AI Review", "backend.api.ai_review_router", path="/ai-reviews", groups=("analysis",)),
+    RouterSpec("Logs", "backend.api.logs_router", path="/logs", groups=("core",)),
+    RouterSpec("Feeds", "backend.api.feeds_router", prefix="/api", path="/api/feeds", groups=("news",)),
+    RouterSpec("News Analysis", "backend.api.news_analysis_router", prefix="/api", path="/api/news", groups=("news",)),
+    RouterSpec("Gemini News", "backend.api.gemini_news_router", prefix="/api", path="/api/news/gemini", groups=("news",)),
+    RouterSpec("Auth", "backend.api.auth_router", path="/auth", groups=("core",)),
+    # Phase 4: Trading Signals
+    RouterSpec("Signals", "backend.api.signals_router", prefix="/api", path="/api/signals", groups=("trading",)),
+    # War Room (7-Agent Debate System)
+    RouterSpec("War Room", "backend.api.war_room_router", path="/api/war-room", groups=("trading",)),
+    # War Room Analytics (Debate Visualization & Shadow Trading)
+    RouterSpec("War Room Analytics", "backend.api.war_room_analytics_router", path="/api/war-room", groups=("trading",)),
+    # Signal Consolidation (Multi-Source Aggregation)
+    RouterSpec("Signal Consolidation", "backend.api.signal_consolidation_router", path="/api/consolidated-signals", groups=("trading",)),
+    # Orders / Portfolio API (Phase 27: Frontend UI)
+    RouterSpec("Orders", "backend.api.orders_router", path="/api/orders", groups=("trading",)),
+    RouterSpec("Portfolio", "backend.api.portfolio_router", path="/api/portfolio", groups=("trading",)),
+    # Performance API (Phase 25.2: Agent Performance Tracking)
+    RouterSpec("Performance", "backend.api.performance_router", path="/api/performance", groups=("analysis",)),
+    # Weight Adjustment API (Phase 25.4: Self-Learning System)
+    RouterSpec("Weight Adjustment", "backend.api.weight_adjustment_router", path="/api/weights", groups=("analysis",)),
+    RouterSpec("Alerts", "backend.api.weight_adjustment_router", attr="alerts_router", path="/api/alerts", groups=("analysis",)),
+    # Dividend API (Phase 21: Dividend Intelligence Module)
+    RouterSpec("Dividend", "backend.api.dividend_router", path="/api/dividend", groups=("analysis",)),
+    # Accountability API (Phase 29: News Interpretation Accuracy Tracking)
+    RouterSpec("Accountability", "backend.api.accountability_router", path="/api/accountability", groups=("analysis",)),
+    # Kill Switch API (Live Trading Safety - 2026-01-02)
+    RouterSpec("Kill Switch", "backend.routers.kill_switch_router", path="/api/kill-switch", groups=("core", "trading")),
+    # Multi-Asset API (Phase 30: Multi-Asset Support)
+    RouterSpec("Multi-Asset", "backend.api.multi_asset_router", path="/api/assets", groups=("trading",)),
+    # Portfolio Optimization API (Phase 31: MPT & Efficient Frontier)
+    RouterSpec("Portfolio Optimization", "backend.api.portfolio_optimization_router", path="/api/portfolio", groups=("analysis",)),
+    # Failure Learning API (Phase 29 확장: Auto-Learning System)
+    RouterSpec("Failure Learning", "backend.api.failure_learning_router", path="/api/learning", groups=("analysis",)),
+    # Correlation API (Phase 32: Asset Correlation)
+    RouterSpec("Correlation", "backend.api.correlation_router", path="/api/correlation", groups=("analysis",)),
+    RouterSpec("Notifications", "backend.api.notifications_router", path="/notifications", groups=("core",)),
+    RouterSpec("Backtest", "backend.api.backtest_router", prefix="/api", path="/api/backtest", groups=("analysis",)),
+    RouterSpec("CEO Analysis", "backend.api.ceo_analysis_router", path="/ceo-analysis", groups=("analysis",)),
+    RouterSpec("Incremental", "backend.api.incremental_router", path="/incremental", groups=("analysis",)),
+    RouterSpec("Reports", "backend.api.reports_router", prefix="/api", path="/api/reports", groups=("analysis",)),
+    RouterSpec("Reasoning", "backend.api.reasoning_api", path="/api/reasoning", groups=("analysis",)),
+    RouterSpec("Phase", "backend.api.phase_integration_router", path="/phase", groups=("analysis",)),
+    RouterSpec("KIS", "backend.api.kis_integration_router", path="/kis", groups=("trading",)),
+    RouterSpec("AI Signals", "backend.api.ai_signals_router", path="/ai-signals", groups=("trading",)),
+    RouterSpec("Consensus", "backend.api.consensus_router", path="/consensus", groups=("trading",)),
+    RouterSpec("Position", "backend.api.position_router", path="/positions", groups=("trading",)),
+    RouterSpec("Global Macro", "backend.api.global_macro_router", path="/api/global-macro", groups=("analysis",)),
+    RouterSpec("Auto Trade", "backend.api.auto_trade_router", path="/api/auto-trade", groups=("trading",)),
+    # Emergency Detection
+    RouterSpec("Emergency", "backend.api.emergency_router", prefix="/api", path="/api/emergency", groups=("core",)),
+    # Monitoring & Kill Switch
+    RouterSpec("Monitoring", "backend.api.monitoring_router", path="/monitoring", groups=("core",)),
+    # Briefing Router (Phase 3)
+    RouterSpec("Briefing", "backend.api.briefing_router", path="/api/briefing", groups=("news",)),
+    # Shadow Router (Phase 4: Dashboard)
+    RouterSpec("Shadow", "backend.api.routers.shadow", prefix="/api/shadow", path="/api/shadow", groups=("trading",)),
+    # Feedback Router (Frontend Integration Phase)
+    RouterSpec("Feedback", "backend.api.feedback_router", path="/feedback", groups=("core",)),
+    RouterSpec("Feedback (/api)", "backend.api.feedback_router", prefix="/api", path="/api/feedback", groups=("core",)),
+    # Data Backfill (Historical Data Seeding)
+    RouterSpec("Data Backfill", "backend.api.data_backfill_router", path="/api/backfill", groups=("analysis",)),
+    # Phase 4: Grand Unified Strategy APIs (2026-01-05)
+    RouterSpec("Persona", "backend.api.persona_router", path="/api/persona", groups=("trading",)),
+    RouterSpec("Thesis Violation", "backend.api.thesis_router", path="/api/thesis", groups=("analysis",)),
+    RouterSpec("Investment Journey Memory", "backend.api.journey_router", path="/api/journey", groups=("analysis",)),
+    RouterSpec("Account Partitioning", "backend.api.partitions_router", path="/api/partitions", groups=("trading",)),
+    # MVP War Room (3+1 Agent System) - Phase: MVP Consolidation (2025-12-31)
+    RouterSpec("War Room MVP", "backend.routers.war_room_mvp_router", path="/api/war-room-mvp", groups=("trading",)),
+]
+
+# Lifespan startup imports run on one worker thread (no import-lock contention with the loop)
+_startup_import_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup-import")
+
+
+async def _import_module(name: str):
+    """Import a (heavy) module off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_startup_import_executor, importlib.import_module, name)
+
 
 # Global instances (initialized in lifespan)
 metrics_collector: Optional[MetricsCollector] = None
@@ -214,48 +153,24 @@ health_monitor: Optional[HealthMonitor] = None
 start_time: datetime = datetime.utcnow()
 
 # =============================================================================
-# Application lifecycle management
+# Lifespan startup steps (independent of each other - run via startup_profiler.run_steps)
 # =============================================================================
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Manage startup and shutdown of the FastAPI application."""
-    global metrics_collector, alert_manager, health_monitor, start_time
-
-    logger.info("Starting AI Trading System...")
-    start_time = datetime.utcnow()
-
-    # Initialize core components
-    metrics_collector = MetricsCollector()
-    alert_manager = AlertManager()
-    health_monitor = HealthMonitor(alert_manager=alert_manager)
-
-    # Register health checks
-    health_monitor.register_check("Disk Space", check_disk_space)
-    health_monitor.register_check("Memory", check_memory_usage)
-
-    # Mock health check for Redis (demo purposes)
-    async def mock_redis():
-        return ComponentHealth(
-            name="Redis",
-            status=HealthStatus.HEALTHY,
-            message="Redis is operational",
-        )
-    # (In a real setup, you would register mock_redis with health_monitor)
-
-    # 🔄 Register Event Subscribers (Phase 4, T4.2)
-    register_subscribers()
-    logger.info("Event Subscribers initialized.")
-
-    # 🔄 Order Recovery on Startup (State Machine Phase 2)
+async def _recover_orders():
+    """🔄 Order Recovery on Startup (State Machine Phase 2)"""
     try:
-        from backend.execution.order_manager import OrderManager
-        from backend.execution.recovery import OrderRecovery
+        order_manager_module = await _import_module("backend.execution.order_manager")
+        recovery_module = await _import_module("backend.execution.recovery")
+        from backend.execution.transition_log import get_transition_log
         from backend.database.repository import get_sync_session
 
         logger.info("🔄 Starting Order Recovery...")
         db = get_sync_session()
-        order_manager = OrderManager(db, broker_client=None)  # broker_client will be added later
-        recovery = OrderRecovery(order_manager)
+        order_manager = order_manager_module.OrderManager(
+            db,
+            broker_client=None,  # broker_client will be added later
+            transition_log=get_transition_log(),
+        )
+        recovery = recovery_module.OrderRecovery(order_manager)
 
         recovery_result = await recovery.recover_on_startup()
 
@@ -269,33 +184,36 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Order Recovery failed: {e}")
         # Don't fail startup if recovery fails
 
-    # 📊 Initialize and start Stock Price Scheduler
+
+async def _start_price_and_report_schedulers():
+    """📊 Stock Price Scheduler + Daily Report Scheduler"""
     try:
-        from backend.services.stock_price_scheduler import get_stock_price_scheduler
-        stock_scheduler = get_stock_price_scheduler()
+        stock_module = await _import_module("backend.services.stock_price_scheduler")
+        stock_scheduler = stock_module.get_stock_price_scheduler()
         stock_scheduler.start()
         if stock_scheduler:
             logger.info("Stock Price Scheduler started")
-        
-        # 📊 Initialize and start Daily Report Scheduler
-        from backend.services.daily_report_scheduler import get_daily_report_scheduler
-        report_scheduler = get_daily_report_scheduler()
+
+        report_module = await _import_module("backend.services.daily_report_scheduler")
+        report_scheduler = report_module.get_daily_report_scheduler()
         report_scheduler.start()
         if report_scheduler:
             logger.info("✅ Daily Report Scheduler started (7:10 AM Daily, 7:15 AM Mon, 7:20 AM 1st)")
     except Exception as e:
         logger.warning(f"Failed to start Stock Price Scheduler: {e}")
 
-    # 🆕 Start Daily Learning Scheduler (Option 3: Self-Learning System)
+
+async def _start_learning_scheduler():
+    """🆕 Daily Learning Scheduler (Option 3: Self-Learning System)"""
     try:
-        from backend.ai.learning.daily_learning_scheduler import DailyLearningScheduler
         from datetime import time
-        import asyncio
+
+        learning_module = await _import_module("backend.ai.learning.daily_learning_scheduler")
 
         # Run twice daily:
         # 1. 10:00 KST - After US after-hours close (20:00 EST = 10:00 KST next day)
         # 2. 16:00 KST - After Korean market close (15:30 KST)
-        learning_scheduler = DailyLearningScheduler(
+        learning_scheduler = learning_module.DailyLearningScheduler(
             run_times=[time(10, 0), time(16, 0)]
         )
 
@@ -305,13 +223,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Failed to start Daily Learning Scheduler: {e}")
 
-    # 🆕 Start Accountability Scheduler (News Interpretation Accuracy Tracking)
+
+async def _start_accountability_scheduler():
+    """🆕 Accountability Scheduler (News Interpretation Accuracy Tracking)"""
     try:
-        from backend.automation.accountability_scheduler import AccountabilityScheduler
-        import asyncio
+        accountability_module = await _import_module("backend.automation.accountability_scheduler")
 
         # Run hourly to verify 1h/1d/3d price changes after news interpretations
-        accountability_scheduler = AccountabilityScheduler(
+        accountability_scheduler = accountability_module.AccountabilityScheduler(
             run_interval_minutes=60,
             retry_on_failure=True,
             trigger_failure_learning=True
@@ -323,19 +242,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Failed to start Accountability Scheduler: {e}")
 
-    # 🆕 Initialize Monitoring Components (Circuit Breaker & Kill Switch)
+
+async def _init_monitoring_components():
+    """🆕 Monitoring Components (Circuit Breaker & Kill Switch)"""
     try:
-        from backend.monitoring.smart_alerts import SmartAlertManager
-        smart_alert_manager = SmartAlertManager()
+        smart_alerts = await _import_module("backend.monitoring.smart_alerts")
+        smart_alert_manager = smart_alerts.SmartAlertManager()
         logger.info("SmartAlertManager initialized for monitoring")
-        
-        from backend.monitoring.circuit_breaker import CircuitBreakerManager, KillSwitch
-        circuit_breaker_manager = CircuitBreakerManager(alert_manager=smart_alert_manager)
-        kill_switch = KillSwitch(alert_manager=smart_alert_manager)
-        
+
+        circuit_breaker = await _import_module("backend.monitoring.circuit_breaker")
+        circuit_breaker_manager = circuit_breaker.CircuitBreakerManager(alert_manager=smart_alert_manager)
+        kill_switch = circuit_breaker.KillSwitch(alert_manager=smart_alert_manager)
+
         # Inject dependencies into monitoring_router
-        from backend.api.monitoring_router import set_monitoring_instances
-        set_monitoring_instances(
+        monitoring_module = await _import_module("backend.api.monitoring_router")
+        monitoring_module.set_monitoring_instances(
             health_mon=health_monitor,
             alert_mgr=smart_alert_manager,
             cb_mgr=circuit_breaker_manager,
@@ -345,43 +266,112 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize monitoring components: {e}")
 
-    # 🆕 Start News Poller (5m Interval)
-    # Set DISABLE_EMBEDDED_NEWS_POLLER=1 to disable (when running standalone crawler)
-    if os.environ.get("DISABLE_EMBEDDED_NEWS_POLLER", "").lower() not in ("1", "true", "yes"):
-        try:
-            from backend.services.news_poller import NewsPoller
-            news_poller = NewsPoller()
-            asyncio.create_task(news_poller.start())
-            logger.info("✅ News Poller started (5m interval - Pre-filtered AI Analysis)")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to start News Poller: {e}")
-            
-    # 🆕 Initialize Event Subscriber (Order -> WebSocket bridge)
+
+async def _start_news_poller():
+    """🆕 News Poller (5m Interval)
+
+    Set DISABLE_EMBEDDED_NEWS_POLLER=1 to disable (when running standalone crawler)
+    """
+    if os.environ.get("DISABLE_EMBEDDED_NEWS_POLLER", "").lower() in ("1", "true", "yes"):
+        logger.info("⏭️ Embedded News Poller disabled (DISABLE_EMBEDDED_NEWS_POLLER=1)")
+        return
+
+    try:
+        news_poller_module = await _import_module("backend.services.news_poller")
+        news_poller = news_poller_module.NewsPoller()
+        asyncio.create_task(news_poller.start())
+        logger.info("✅ News Poller started (5m interval - Pre-filtered AI Analysis)")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to start News Poller: {e}")
+
+
+async def _init_event_subscriber_bridge():
+    """🆕 Event Subscriber (Order -> WebSocket bridge)"""
     try:
         from backend.events import event_bus
-        from backend.notifications.event_subscriber import setup_event_subscribers
-        from backend.notifications.notification_manager import get_notification_manager
-        
-        setup_event_subscribers(event_bus, get_notification_manager())
+        subscriber_module = await _import_module("backend.notifications.event_subscriber")
+        notification_module = await _import_module("backend.notifications.notification_manager")
+
+        subscriber_module.setup_event_subscribers(event_bus, notification_module.get_notification_manager())
         logger.info("✅ Event Subscriber initialized (Order -> WebSocket bridge)")
     except Exception as e:
         logger.warning(f"⚠️ Failed to initialize Event Subscriber: {e}")
-    else:
-        logger.info("⏭️ Embedded News Poller disabled (DISABLE_EMBEDDED_NEWS_POLLER=1)")
 
-    # 👻 Start Shadow Trading Agent
+
+async def _start_shadow_trader():
+    """👻 Shadow Trading Agent"""
     try:
-        from backend.ai.trading.shadow_trader import ShadowTradingAgent
-        shadow_trader = ShadowTradingAgent()
+        shadow_module = await _import_module("backend.ai.trading.shadow_trader")
+        shadow_trader = shadow_module.ShadowTradingAgent()
         asyncio.create_task(shadow_trader.start())
         logger.info("✅ Shadow Trading Agent started (Monitoring Signals)")
     except Exception as e:
         logger.warning(f"⚠️ Failed to start Shadow Trading Agent: {e}")
 
+
+# =============================================================================
+# Application lifecycle management
+# =============================================================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage startup and shutdown of the FastAPI application."""
+    global metrics_collector, alert_manager, health_monitor, start_time
+
+    logger.info("Starting AI Trading System...")
+    start_time = datetime.utcnow()
+
+    # Initialize core components
+    metrics_collector = MetricsCollector()
+    alert_manager = AlertManager()
+    health_monitor = HealthMonitor(alert_manager=alert_manager)
+
+    # Register health checks
+    health_monitor.register_check("Disk Space", check_disk_space)
+    health_monitor.register_check("Memory", check_memory_usage)
+
+    # Mock health check for Redis (demo purposes)
+    async def mock_redis():
+        return ComponentHealth(
+            name="Redis",
+            status=HealthStatus.HEALTHY,
+            message="Redis is operational",
+        )
+    # (In a real setup, you would register mock_redis with health_monitor)
+
+    # 🔄 Register Event Subscribers (Phase 4, T4.2)
+    register_subscribers()
+    event_bus.start()  # 구독자별 dispatch worker (발행자는 핸들러를 기다리지 않음)
+    logger.info("Event Subscribers initialized.")
+
+    # Ordered steps: the WebSocket bridge subscribes before recovery publishes ORDER events,
+    # and recovery finishes replaying the WAL before anything can create or transition orders
+    await startup_profiler.run_step("event_subscriber_bridge", _init_event_subscriber_bridge)
+    await startup_profiler.run_step("order_recovery", _recover_orders)
+
+    # Independent startup steps run concurrently (each logs and swallows its own failure)
+    await startup_profiler.run_steps({
+        "price_report_schedulers": _start_price_and_report_schedulers,
+        "learning_scheduler": _start_learning_scheduler,
+        "accountability_scheduler": _start_accountability_scheduler,
+        "monitoring_components": _init_monitoring_components,
+        "news_poller": _start_news_poller,
+        "shadow_trader": _start_shadow_trader,
+    })
+
+    startup_profiler.mark_ready()
+    if startup_profiler.enabled:
+        startup_profiler.log_report()
+
     yield
 
     # Shutdown sequence
     logger.info("Shutting down AI Trading System...")
+    # 주문 전이 WAL 꼬리 flush (이벤트 발행 포함) 후 이벤트 버스 종료
+    from backend.execution.transition_log import get_transition_log
+    transition_log = get_transition_log()
+    if transition_log is not None:
+        transition_log.close()
+    await event_bus.stop()
     if health_monitor:
         health_monitor.stop()
     if metrics_collector:
@@ -419,303 +409,62 @@ app.add_middleware(
 # WebSocket Endpoint (Explicitly mounted here to avoid router prefix issues)
 from fastapi import WebSocket, WebSocketDisconnect
 
-try:
+
+@app.websocket("/api/signals/ws")
+async def websocket_signal_endpoint(websocket: WebSocket):
+    """
+    Real-time trading signals WebSocket endpoint.
+    Uses the manager from signals_router to broadcast updates.
+    """
+    # Imported on first connection so signals_router stays lazy-loadable
     from backend.api.signals_router import manager as trading_signal_manager
-    
-    @app.websocket("/api/signals/ws")
-    async def websocket_signal_endpoint(websocket: WebSocket):
-        """
-        Real-time trading signals WebSocket endpoint.
-        Uses the manager from signals_router to broadcast updates.
-        """
-        await trading_signal_manager.connect(websocket)
-        try:
-            while True:
-                # Keep connection alive
-                await websocket.receive_text()
-        except WebSocketDisconnect:
-            trading_signal_manager.disconnect(websocket)
-            
-    logger.info("WebSocket endpoint mounted at /api/signals/ws")
-except ImportError as e:
-    logger.warning(f"Failed to mount WebSocket endpoint: {e}")
-except Exception as e:
-    logger.error(f"WebSocket endpoint error: {e}")
-
-# Register routers conditionally
-if AI_CHAT_AVAILABLE:
-    app.include_router(ai_chat_router)
-    logger.info("AI Chat router registered")
-if GEMINI_FREE_AVAILABLE:
-    app.include_router(gemini_free_router)
-    logger.info("Gemini Free router registered")
-if NEWS_AVAILABLE:
-    app.include_router(news_router, prefix="/api")
-    app.include_router(news_processing_router, prefix="/api")
-    logger.info("News routers registered")
-if AI_REVIEW_AVAILABLE:
-    app.include_router(ai_review_router)
-    logger.info("AI Review router registered")
-if LOGS_AVAILABLE:
-    app.include_router(logs_router)
-    logger.info("Logs router registered")
-if FEEDS_AVAILABLE:
-    app.include_router(feeds_router, prefix="/api")
-    logger.info("Feeds router registered")
-if NEWS_ROUTER_AVAILABLE:
-    app.include_router(news_router, prefix="/api")
-    app.include_router(news_analysis_router, prefix="/api")
-    app.include_router(gemini_news_router, prefix="/api")
-    logger.info("News routers registered")
-if AUTH_ROUTER_AVAILABLE:
-    app.include_router(auth_router)
-    logger.info("Auth router registered")
-if SIGNALS_AVAILABLE:    # Phase 4: Trading Signals
-    app.include_router(signals_router, prefix="/api")
-    logger.info("Signals router registered")
-    
-    # 🆕 War Room (7-Agent Debate System)
-    from backend.api.war_room_router import router as war_room_router
-    app.include_router(war_room_router)
-    logger.info("War Room router registered")
-    
-    # 🆕 War Room Analytics (Debate Visualization & Shadow Trading)
-    try:
-        from backend.api.war_room_analytics_router import router as war_room_analytics_router
-        app.include_router(war_room_analytics_router)
-        logger.info("War Room Analytics router registered")
-    except Exception as e:
-        logger.warning(f"War Room Analytics router not available: {e}")
-
-    # 🆕 Signal Consolidation (Multi-Source Aggregation)
-    from backend.api.signal_consolidation_router import router as signal_consolidation_router
-    app.include_router(signal_consolidation_router)
-    logger.info("Signal Consolidation router registered")
-
-    # 🆕 Orders API (Phase 27: Frontend UI)
-    from backend.api.orders_router import router as orders_router
-    app.include_router(orders_router)
-    logger.info("Orders router registered")
-
-    # 🆕 Portfolio API (Phase 27: Frontend UI)
-    from backend.api.portfolio_router import router as portfolio_router
-    app.include_router(portfolio_router)
-    logger.info("Portfolio router registered")
-
-    # 🆕 Performance API (Phase 25.2: Agent Performance Tracking)
-    from backend.api.performance_router import router as performance_router
-    app.include_router(performance_router)
-    logger.info("Performance router registered")
-    
-    # 🆕 Weight Adjustment API (Phase 25.4: Self-Learning System)
-    from backend.api.weight_adjustment_router import router as weight_router, alerts_router
-    app.include_router(weight_router)
-    app.include_router(alerts_router)
-    logger.info("Weight Adjustment & Alerts routers registered")
-    
-    # 🆕 Dividend API (Phase 21: Dividend Intelligence Module)
-    from backend.api.dividend_router import router as dividend_router
-    app.include_router(dividend_router)
-    logger.info("Dividend router registered")
 
-    
-    # 🆕 Accountability API (Phase 29: News Interpretation Accuracy Tracking)
-    from backend.api.accountability_router import router as accountability_router
-    app.include_router(accountability_router)
-    logger.info("Accountability router registered")
-    
-    # 🆕 Kill Switch API (Live Trading Safety - 2026-01-02)
-    from backend.routers.kill_switch_router import router as kill_switch_router
-    app.include_router(kill_switch_router)
-    logger.info("Kill Switch router registered")
-
-try:
-    # 🆕 Multi-Asset API (Phase 30: Multi-Asset Support)
-    from backend.api.multi_asset_router import router as multi_asset_router
-    app.include_router(multi_asset_router)
-    logger.info("Multi-Asset router registered")
-    MULTI_ASSET_AVAILABLE = True
-except ImportError as e:
-    MULTI_ASSET_AVAILABLE = False
-    logger.warning(f"Multi-Asset router not available: {e}")
-
-try:
-    # 🆕 Portfolio Optimization API (Phase 31: MPT & Efficient Frontier)
-    from backend.api.portfolio_optimization_router import router as portfolio_opt_router
-    app.include_router(portfolio_opt_router)
-    logger.info("Portfolio Optimization router registered")
-    PORTFOLIO_OPT_AVAILABLE = True
-except ImportError as e:
-    PORTFOLIO_OPT_AVAILABLE = False
-    logger.warning(f"Portfolio Optimization router not available: {e}")
-
-try:
-    # 🆕 Failure Learning API (Phase 29 확장: Auto-Learning System)
-    from backend.api.failure_learning_router import router as failure_learning_router
-    app.include_router(failure_learning_router)
-    logger.info("Failure Learning router registered")
-    FAILURE_LEARNING_AVAILABLE = True
-except ImportError as e:
-    FAILURE_LEARNING_AVAILABLE = False
-    logger.warning(f"Failure Learning router not available: {e}")
-
-try:
-    # 🆕 Correlation API (Phase 32: Asset Correlation)
-    from backend.api.correlation_router import router as correlation_router
-    app.include_router(correlation_router)
-    logger.info("Correlation router registered")
-    CORRELATION_AVAILABLE = True
-except ImportError as e:
-    CORRELATION_AVAILABLE = False
-    logger.warning(f"Correlation router not available: {e}")
-
-if NOTIFICATIONS_AVAILABLE:
-    app.include_router(notifications_router)
-    logger.info("Notifications router registered")
-if BACKTEST_AVAILABLE:
-    app.include_router(backtest_router, prefix="/api")
-    logger.info("Backtest router registered")
-if CEO_ANALYSIS_AVAILABLE:
-    app.include_router(ceo_analysis_router)
-    logger.info("CEO Analysis router registered")
-if INCREMENTAL_AVAILABLE:
-    app.include_router(incremental_router)
-    logger.info("Incremental router registered")
-if REPORTS_AVAILABLE:
-    app.include_router(reports_router, prefix="/api")
-    logger.info("Reports router registered (/api/reports)")
-if REASONING_AVAILABLE:
-    app.include_router(reasoning_router)
-    logger.info("Reasoning router registered")
-if PHASE_AVAILABLE:
-    app.include_router(phase_router)
-    logger.info("Phase router registered")
-if KIS_AVAILABLE:
-    app.include_router(kis_router)
-    logger.info("KIS router registered")
-if AI_SIGNALS_AVAILABLE:
-    app.include_router(ai_signals_router)
-    logger.info("AI Signals router registered")
-if CONSENSUS_AVAILABLE:
-    app.include_router(consensus_router)
-    logger.info("Consensus router registered")
-if POSITION_AVAILABLE:
-    app.include_router(position_router)
-    logger.info("Position router registered")
-if GLOBAL_MACRO_AVAILABLE:
-    app.include_router(global_macro_router)
-    logger.info("Global Macro router registered")
-if AUTO_TRADE_AVAILABLE:
-    app.include_router(auto_trade_router)
-    logger.info("Auto Trade router registered")
-    
-# Emergency Detection
-from backend.api.emergency_router import router as emergency_router
-app.include_router(emergency_router, prefix="/api")
-logger.info("Emergency router registered")
-
-# Monitoring & Kill Switch
-try:
-    from backend.api.monitoring_router import router as monitoring_router
-    app.include_router(monitoring_router)
-    logger.info("Monitoring router registered")
-except Exception as e:
-    logger.warning(f"Monitoring router not available: {e}")
-
-# NEW: Briefing Router (Phase 3)
-try:
-    from backend.api.briefing_router import router as briefing_router
-    app.include_router(briefing_router)
-    logger.info("Briefing router registered")
-except Exception as e:
-    logger.warning(f"Briefing router not available: {e}")
-
-# 🆕 Shadow Router (Phase 4: Dashboard)
-try:
-    from backend.api.routers import shadow
-    app.include_router(shadow.router, prefix="/api/shadow")
-    logger.info("Shadow router registered")
-except Exception as e:
-    logger.warning(f"Shadow router not available: {e}")
-
-# Feedback Router (Frontend Integration Phase)
-try:
-    from backend.api.feedback_router import router as feedback_router
-    app.include_router(feedback_router)
-    logger.info("Feedback router registered")
-except Exception as e:
-    logger.warning(f"Feedback router not available: {e}")
-
-# Data Backfill (Historical Data Seeding)
-try:
-    from backend.api.data_backfill_router import router as data_backfill_router
-    app.include_router(data_backfill_router)
-    logger.info("Data Backfill router registered")
-except Exception as e:
-    logger.warning(f"Data Backfill router not available: {e}")
-
-# 🆕 Phase 4: Grand Unified Strategy APIs (2026-01-05)
-# Persona Router - Investment Mode Switching
-try:
-    from backend.api.persona_router import router as persona_router
-    app.include_router(persona_router)
-    logger.info("Persona router registered (Dividend/Long-Term/Trading/Aggressive modes)")
-except Exception as e:
-    logger.warning(f"Persona router not available: {e}")
-
-# Thesis Violation Detector - Investment Thesis Health Check
-try:
-    from backend.api.thesis_router import router as thesis_router
-    app.include_router(thesis_router)
-    logger.info("Thesis Violation router registered")
-except Exception as e:
-    logger.warning(f"Thesis Violation router not available: {e}")
-
-# Investment Journey Memory - Decision Tracking & Coaching
-try:
-    from backend.api.journey_router import router as journey_router
-    app.include_router(journey_router)
-    logger.info("Investment Journey Memory router registered")
-except Exception as e:
-    logger.warning(f"Investment Journey Memory router not available: {e}")
-
-# Account Partitioning - Virtual Wallet System (Core/Income/Satellite)
-try:
-    from backend.api.partitions_router import router as partitions_router
-    app.include_router(partitions_router)
-    logger.info("Account Partitioning router registered (Core/Income/Satellite wallets)")
-except Exception as e:
-    logger.warning(f"Account Partitioning router not available: {e}")
+    await trading_signal_manager.connect(websocket)
+    try:
+        while True:
+            # Keep connection alive
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        trading_signal_manager.disconnect(websocket)
 
-# Multi-Strategy Orchestration - Strategy Management API
-try:
-    from backend.api.strategy_router import strategy_router, ownership_router, conflict_router, conflict_ws_manager
-    app.include_router(strategy_router, prefix="/api/strategies", tags=["Multi-Strategy"])
-    app.include_router(ownership_router, prefix="/api/ownership", tags=["Multi-Strategy"])
-    app.include_router(conflict_router, prefix="/api/conflicts", tags=["Multi-Strategy"])
-
-    # WebSocket endpoint for real-time conflict alerts
-    @app.websocket("/api/conflicts/ws")
-    async def websocket_conflict_endpoint(websocket: WebSocket):
-        """
-        Real-time conflict alerts WebSocket endpoint.
-        Broadcasts CONFLICT_DETECTED events to all connected clients.
-        """
-        await conflict_ws_manager.connect(websocket)
-        try:
-            while True:
-                # Keep connection alive
-                await websocket.receive_text()
-        except WebSocketDisconnect:
-            conflict_ws_manager.disconnect(websocket)
+logger.info("WebSocket endpoint mounted at /api/signals/ws")
 
-    # Connect WebSocket manager to event subscribers
-    set_conflict_ws_manager(conflict_ws_manager)
+# Register routers (ROUTER_PROFILE selects groups, ROUTER_LAZY_LOADING=1 defers imports)
+router_registry = RouterRegistry(app)
+router_registry.extend(ROUTER_SPECS)
+router_registry.register_all()
 
-    logger.info("✅ Multi-Strategy Orchestration routers registered (Strategy/Ownership/Conflict)")
-    logger.info("✅ Conflict WebSocket endpoint mounted at /api/conflicts/ws")
-except Exception as e:
-    logger.warning(f"Multi-Strategy Orchestration routers not available: {e}")
+# Multi-Strategy Orchestration - Strategy Management API
+# (eager: the conflict WebSocket manager is wired into event subscribers at import)
+if router_registry.group_enabled("trading"):
+    try:
+        from backend.api.strategy_router import strategy_router, ownership_router, conflict_router, conflict_ws_manager
+        app.include_router(strategy_router, prefix="/api/strategies", tags=["Multi-Strategy"])
+        app.include_router(ownership_router, prefix="/api/ownership", tags=["Multi-Strategy"])
+        app.include_router(conflict_router, prefix="/api/conflicts", tags=["Multi-Strategy"])
+
+        # WebSocket endpoint for real-time conflict alerts
+        @app.websocket("/api/conflicts/ws")
+        async def websocket_conflict_endpoint(websocket: WebSocket):
+            """
+            Real-time conflict alerts WebSocket endpoint.
+            Broadcasts CONFLICT_DETECTED events to all connected clients.
+            """
+            await conflict_ws_manager.connect(websocket)
+            try:
+                while True:
+                    # Keep connection alive
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                conflict_ws_manager.disconnect(websocket)
+
+        # Connect WebSocket manager to event subscribers
+        set_conflict_ws_manager(conflict_ws_manager)
+
+        logger.info("✅ Multi-Strategy Orchestration routers registered (Strategy/Ownership/Conflict)")
+        logger.info("✅ Conflict WebSocket endpoint mounted at /api/conflicts/ws")
+    except Exception as e:
+        logger.warning(f"Multi-Strategy Orchestration routers not available: {e}")
 
 # System/Mock routers (no prefix)=============================================================================
 
@@ -1125,6 +874,15 @@ async def get_system_info():
     }
 
 
+@app.get("/api/system/startup", tags=["System"])
+async def get_startup_profile(top_n: int = 20):
+    """Startup profile: per-module import time, per-router and per-lifespan-step time."""
+    return {
+        **startup_profiler.report(top_n=top_n),
+        "routers": router_registry.get_status(),
+    }
+
+
 # AI Reviews Mock Endpoints
 @app.get("/api/ai-reviews", tags=["AI Reviews"])
 async def get_ai_reviews(limit: int = 50):
@@ -1271,17 +1029,3 @@ async def execute_trade(request: AnalyzeRequest):
             execution_data=execution,
         )
     return execution
-# MVP War Room (3+1 Agent System) - Phase: MVP Consolidation (2025-12-31)
-try:
-    from backend.routers.war_room_mvp_router import router as war_room_mvp_router
-    app.include_router(war_room_mvp_router)
-    logger.info("✅ War Room MVP router registered (3+1 Agent System)")
-except Exception as e:
-    logger.warning(f"❌ War Room MVP router not available: {e}")
-
-try:
-    from backend.api.feedback_router import router as feedback_router
-    app.include_router(feedback_router, prefix="/api")
-    logger.info("✅ Feedback router registered")
-except Exception as e:
-    logger.error(f"❌ Feedback router not available: {e}")
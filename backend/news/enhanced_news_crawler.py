@@ -212,10 +212,9 @@ class EnhancedNewsCrawler:
         # 2. 4-way 필터링
         if self.context_filter and tagged_articles:
             filtered_articles = []
+            risk_scores = self.context_filter.filter_news_batch(tagged_articles)
             
-            for article in tagged_articles:
-                risk_score = self.context_filter.filter_news(article)
-                
+            for article, risk_score in zip(tagged_articles, risk_scores):
                 if risk_score >= filter_threshold:
                     article['risk_score'] = risk_score
                     filtered_articles.append(article)
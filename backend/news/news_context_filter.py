@@ -8,6 +8,9 @@ GPT/Claude 제안 기능:
 - 기업별 감성 시계열
 
 통합: Enhanced News Crawler에 추가
+
+성능: 클러스터/섹터/패턴 벡터를 정규화된 하나의 행렬로 쌓아 두고,
+기사 배치 임베딩을 행렬곱 한 번으로 채점 (filter_news_batch)
 """
 
 import os
@@ -42,8 +45,21 @@ class NewsContextFilter:
         
         if risk_score > 0.7:
             # 진짜 리스크!
+        
+        # 5분 윈도우 기사 수백 건을 한 번에
+        risk_scores = filter.filter_news_batch(articles)
     """
     
+    # 티커 → 섹터 ETF (간단한 매핑)
+    TICKER_SECTOR_MAP = {
+        'AAPL': 'XLK', 'MSFT': 'XLK', 'GOOGL': 'XLK', 'NVDA': 'XLK',
+        'XOM': 'XLE', 'CVX': 'XLE',
+        'JPM': 'XLF', 'BAC': 'XLF',
+    }
+    
+    # 앙상블 가중치
+    WEIGHTS = {'cluster': 0.3, 'sector': 0.2, 'crash': 0.3, 'sentiment': 0.2}
+    
     def __init__(self, db_session=None):
         """
         Args:
@@ -63,8 +79,41 @@ class NewsContextFilter:
         # Sentiment trend cache
         self.sentiment_cache = {}
         
+        # 정규화된 참조 벡터 행렬
+        self.refresh_vectors()
+        
         logger.info("NewsContextFilter initialized with 4-way ensemble")
     
+    def refresh_vectors(self):
+        """
+        클러스터/섹터/패턴 벡터를 행 정규화된 하나의 행렬로 쌓기
+        
+        risk_clusters / sector_vectors / crash_patterns를 바꾼 뒤 호출
+        
+        행 배치: [클러스터 k개 | 섹터 s개 | 패턴 p개]
+        """
+        cluster_vecs = list(self.risk_clusters.values())
+        self._sector_index = {sector: i for i, sector in enumerate(self.sector_vectors)}
+        sector_vecs = list(self.sector_vectors.values())
+        
+        pattern_vecs = []
+        self._ticker_pattern_rows: Dict[str, List[int]] = defaultdict(list)
+        for ticker, patterns in self.crash_patterns.items():
+            for pattern in patterns:
+                self._ticker_pattern_rows[ticker].append(len(pattern_vecs))
+                pattern_vecs.append(pattern['pattern_vec'])
+        
+        vectors = cluster_vecs + sector_vecs + pattern_vecs
+        self._reference_matrix = (
+            self._normalize_rows(np.asarray(vectors, dtype=np.float32))
+            if vectors else None
+        )
+        
+        n_clusters, n_sectors = len(cluster_vecs), len(sector_vecs)
+        self._cluster_cols = slice(0, n_clusters)
+        self._sector_cols = slice(n_clusters, n_clusters + n_sectors)
+        self._pattern_cols = slice(n_clusters + n_sectors, len(vectors))
+    
     # ========================================
     # 1. 위험 클러스터 (30%)
     # ========================================
@@ -91,34 +140,20 @@ class NewsContextFilter:
             'operational_failure': np.random.rand(1536),
         }
     
-    def _cluster_risk_score(self, article: Dict) -> float:
+    def _cluster_risk_scores(self, similarities: np.ndarray) -> np.ndarray:
         """
-        뉴스가 위험 클러스터와 얼마나 가까운지 측정
+        뉴스가 위험 클러스터와 얼마나 가까운지 측정 (임베딩 있는 기사 배치)
         
         Args:
-            article: {
-                'title': str,
-                'content': str,
-                'embedding': np.ndarray (1536,)
-            }
+            similarities: (n, 참조 벡터 수) 코사인 유사도 행렬
         
         Returns:
-            risk_score (0-1)
+            기사별 max 클러스터 유사도 (0 하한)
         """
-        if 'embedding' not in article:
-            # Embedding 없으면 키워드 기반
-            return self._keyword_risk_score(article)
-        
-        embedding = article['embedding']
-        
-        # 각 클러스터와의 코사인 유사도
-        max_similarity = 0.0
-        
-        for cluster_name, centroid in self.risk_clusters.items():
-            similarity = self._cosine_similarity(embedding, centroid)
-            max_similarity = max(max_similarity, similarity)
-        
-        return max_similarity
+        cluster_sims = similarities[:, self._cluster_cols]
+        if cluster_sims.shape[1] == 0:
+            return np.zeros(len(similarities))
+        return np.maximum(cluster_sims.max(axis=1), 0.0)
     
     def _keyword_risk_score(self, article: Dict) -> float:
         """키워드 기반 리스크 스코어 (fallback)"""
@@ -158,43 +193,31 @@ class NewsContextFilter:
             for sector in sectors
         }
     
-    def _sector_risk_score(self, article: Dict) -> float:
+    def _sector_risk_scores(self, articles: List[Dict], similarities: np.ndarray) -> np.ndarray:
         """
-        뉴스가 어떤 섹터의 위험과 관련있는지
+        뉴스가 어떤 섹터의 위험과 관련있는지 (임베딩 있는 기사 배치)
         
         Args:
-            article: {
-                'tickers': ['AAPL', 'MSFT'],
-                'embedding': np.ndarray
-            }
+            articles: 기사 리스트 ('tickers')
+            similarities: (n, 참조 벡터 수) 코사인 유사도 행렬
         
         Returns:
-            sector_risk_score (0-1)
+            기사별 첫 티커 섹터 벡터와의 유사도 (티커 없으면 0.5 중립)
         """
-        # 티커에서 섹터 추론 (간단한 매핑)
-        ticker_sector_map = {
-            'AAPL': 'XLK', 'MSFT': 'XLK', 'GOOGL': 'XLK', 'NVDA': 'XLK',
-            'XOM': 'XLE', 'CVX': 'XLE',
-            'JPM': 'XLF', 'BAC': 'XLF',
-        }
-        
-        tickers = article.get('tickers', [])
-        if not tickers:
-            return 0.5  # 중립
-        
-        # 첫 번째 티커의 섹터
-        ticker = tickers[0]
-        sector = ticker_sector_map.get(ticker, 'XLK')  # 기본: Tech
-        
-        if 'embedding' not in article:
-            return 0.5
-        
-        embedding = article['embedding']
-        sector_vec = self.sector_vectors.get(sector, np.zeros(1536))
+        scores = np.full(len(articles), 0.5)
+        sector_sims = similarities[:, self._sector_cols]
         
-        similarity = self._cosine_similarity(embedding, sector_vec)
+        for i, article in enumerate(articles):
+            tickers = article.get('tickers', [])
+            if not tickers:
+                continue
+            
+            # 첫 번째 티커의 섹터 (기본: Tech)
+            sector = self.TICKER_SECTOR_MAP.get(tickers[0], 'XLK')
+            col = self._sector_index.get(sector)
+            scores[i] = sector_sims[i, col] if col is not None else 0.0
         
-        return similarity
+        return scores
     
     # ========================================
     # 3. 폭락 패턴 매칭 (30%)
@@ -231,40 +254,27 @@ class NewsContextFilter:
             ],
         }
     
-    def _crash_pattern_score(self, article: Dict) -> float:
+    def _crash_pattern_scores(self, articles: List[Dict], similarities: np.ndarray) -> np.ndarray:
         """
-        과거 폭락 때와 비슷한 뉴스인지
+        과거 폭락 때와 비슷한 뉴스인지 (임베딩 있는 기사 배치)
         
         Args:
-            article: {
-                'tickers': ['AAPL'],
-                'embedding': np.ndarray
-            }
+            articles: 기사 리스트 ('tickers')
+            similarities: (n, 참조 벡터 수) 코사인 유사도 행렬
         
         Returns:
-            crash_probability (0-1)
+            기사 티커들의 폭락 패턴과의 max 유사도 (0 하한)
         """
-        tickers = article.get('tickers', [])
-        if not tickers:
-            return 0.0
-        
-        if 'embedding' not in article:
-            return 0.0
-        
-        embedding = article['embedding']
+        pattern_sims = similarities[:, self._pattern_cols]
+        mask = np.zeros(pattern_sims.shape, dtype=bool)
         
-        max_similarity = 0.0
+        for i, article in enumerate(articles):
+            for ticker in article.get('tickers', []):
+                mask[i, self._ticker_pattern_rows.get(ticker, [])] = True
         
-        for ticker in tickers:
-            patterns = self.crash_patterns.get(ticker, [])
-            
-            for pattern in patterns:
-                pattern_vec = pattern['pattern_vec']
-                similarity = self._cosine_similarity(embedding, pattern_vec)
-                
-                max_similarity = max(max_similarity, similarity)
-        
-        return max_similarity
+        if pattern_sims.shape[1] == 0:
+            return np.zeros(len(articles))
+        return np.where(mask, pattern_sims, 0.0).max(axis=1).clip(min=0.0)
     
     # ========================================
     # 4. 감성 시계열 추적 (20%)
@@ -341,53 +351,85 @@ class NewsContextFilter:
             score > 0.7: 진짜 리스크 (필터 통과)
             score < 0.7: 노이즈 (제거)
         """
-        scores = {
-            'cluster': self._cluster_risk_score(article),
-            'sector': self._sector_risk_score(article),
-            'crash': self._crash_pattern_score(article),
-            'sentiment': self._sentiment_trend_score(article)
-        }
+        return self.filter_news_batch([article])[0]
+    
+    def filter_news_batch(self, articles: List[Dict]) -> List[float]:
+        """
+        4-way 앙상블 배치 필터링
+        
+        임베딩이 있는 기사들을 (n, d) 행렬로 쌓아 정규화한 뒤
+        참조 벡터 행렬과 행렬곱 한 번으로 클러스터/섹터/패턴 유사도를 모두 계산.
+        임베딩이 없는 기사는 키워드 스코어(클러스터), 0.5(섹터), 0(패턴) 사용.
+        
+        Args:
+            articles: filter_news와 같은 형식의 기사 리스트
+        
+        Returns:
+            기사별 final_risk_score (입력 순서)
+        """
+        n = len(articles)
+        if n == 0:
+            return []
+        
+        # 임베딩 없는 기사 기본값 (클러스터는 키워드 기반)
+        cluster = np.array([
+            0.0 if 'embedding' in a else self._keyword_risk_score(a) for a in articles
+        ])
+        sector = np.full(n, 0.5)
+        crash = np.zeros(n)
+        
+        embedded = [i for i, a in enumerate(articles) if 'embedding' in a]
+        if embedded:
+            embedded_articles = [articles[i] for i in embedded]
+            embeddings = self._normalize_rows(
+                np.asarray([a['embedding'] for a in embedded_articles], dtype=np.float32)
+            )
+            if self._reference_matrix is None:
+                similarities = np.zeros((len(embedded), 0), dtype=np.float32)
+            else:
+                similarities = embeddings @ self._reference_matrix.T
+            
+            cluster[embedded] = self._cluster_risk_scores(similarities)
+            sector[embedded] = self._sector_risk_scores(embedded_articles, similarities)
+            crash[embedded] = self._crash_pattern_scores(embedded_articles, similarities)
+        
+        sentiment = np.array([self._sentiment_trend_score(a) for a in articles])
         
         # 앙상블 (가중 평균)
-        final_score = (
-            0.3 * scores['cluster'] +
-            0.2 * scores['sector'] +
-            0.3 * scores['crash'] +
-            0.2 * scores['sentiment']
+        final = (
+            self.WEIGHTS['cluster'] * cluster +
+            self.WEIGHTS['sector'] * sector +
+            self.WEIGHTS['crash'] * crash +
+            self.WEIGHTS['sentiment'] * sentiment
         )
         
         # TEMPORARY FIX: Mock 모드에서는 티커가 있는 뉴스에 보너스
         # 실제 임베딩/벡터 DB 구현 후 제거할 것
-        if article.get('tickers') and len(article.get('tickers', [])) > 0:
-            final_score = max(final_score, 0.4)  # 최소 0.4점 보장
-            logger.debug(f"✅ Ticker bonus applied: {article.get('tickers')}")
-
-        logger.debug(
-            f"News filter: {article.get('title', '')[:50]}... "
-            f"-> final={final_score:.2f} "
-            f"(cluster={scores['cluster']:.2f}, "
-            f"sector={scores['sector']:.2f}, "
-            f"crash={scores['crash']:.2f}, "
-            f"sentiment={scores['sentiment']:.2f})"
-        )
-
-        return final_score
+        has_tickers = np.array([bool(a.get('tickers')) for a in articles])
+        final = np.where(has_tickers, np.maximum(final, 0.4), final)  # 최소 0.4점 보장
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, article in enumerate(articles):
+                logger.debug(
+                    f"News filter: {article.get('title', '')[:50]}... "
+                    f"-> final={final[i]:.2f} "
+                    f"(cluster={cluster[i]:.2f}, "
+                    f"sector={sector[i]:.2f}, "
+                    f"crash={crash[i]:.2f}, "
+                    f"sentiment={sentiment[i]:.2f})"
+                )
+        
+        return final.tolist()
     
     # ========================================
     # Utilities
     # ========================================
     
     @staticmethod
-    def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-        """코사인 유사도"""
-        dot = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        
-        return dot / (norm_a * norm_b)
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (영벡터 행은 0 유지 → 유사도 0)"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
 
 
 # ============================================================================
@@ -8,6 +8,7 @@ Features:
 2. Real-time embedding (3-minute polling)
 3. Deduplication (URL hash)
 4. Multi-source aggregation
+5. Batch mode: concurrent feed fetch, cross-ticker dedup, bulk embed/insert
 
 Workflow:
 1. Poll RSS feeds (Google News, Yahoo Finance, Reuters)
@@ -21,16 +22,19 @@ Cost:
 - Monthly cost: ~$0.03
 """
 
+import asyncio
 import logging
 import hashlib
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 import aiohttp
 import feedparser
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.ai.embedding_engine import EmbeddingEngine
+from backend.data.vector_store.embedder import EmbeddingBackend
+from backend.data.vector_store.embedding_cache import EmbeddingResultCache
 from backend.core.models.embedding_models import (
     DocumentEmbedding,
     EmbeddingCache,
@@ -64,16 +68,26 @@ class NewsEmbeddingPipeline:
         "cnbc_top": "https://www.cnbc.com/id/100003114/device/rss/rss.html",
     }
 
-    def __init__(self, db_session: AsyncSession, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        openai_api_key: Optional[str] = None,
+        embedding_backend: Optional[EmbeddingBackend] = None,
+        embedding_cache: Optional[EmbeddingResultCache] = None,
+    ):
         """
         Initialize news embedding pipeline.
 
         Args:
             db_session: SQLAlchemy async session
             openai_api_key: OpenAI API key
+            embedding_backend: Embedding backend (None = OpenAI API)
+            embedding_cache: Shared embedding result cache (None = disabled)
         """
         self.db = db_session
-        self.embedding_engine = EmbeddingEngine(db_session, openai_api_key)
+        self.embedding_engine = EmbeddingEngine(
+            db_session, openai_api_key, embedding_backend, embedding_cache
+        )
 
         logger.info("NewsEmbeddingPipeline initialized")
 
@@ -104,8 +118,31 @@ class NewsEmbeddingPipeline:
         )
         return result.scalar_one_or_none() is not None
 
+    async def _check_articles_exist(self, url_hashes: List[str]) -> Set[str]:
+        """
+        Check which articles have already been embedded (single query).
+
+        Args:
+            url_hashes: URL hashes
+
+        Returns:
+            Subset of url_hashes that already exist
+        """
+        if not url_hashes:
+            return set()
+
+        result = await self.db.execute(
+            select(EmbeddingCache.content_hash).where(
+                EmbeddingCache.content_hash.in_(url_hashes)
+            )
+        )
+        return set(result.scalars().all())
+
     async def _fetch_rss_articles(
-        self, feed_url: str, max_articles: int = 50
+        self,
+        feed_url: str,
+        max_articles: int = 50,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch articles from RSS feed.
@@ -113,14 +150,18 @@ class NewsEmbeddingPipeline:
         Args:
             feed_url: RSS feed URL
             max_articles: Max articles to fetch
+            session: Shared HTTP session (a temporary one is opened if None)
 
         Returns:
             List of article dicts
         """
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self._fetch_rss_articles(feed_url, max_articles, own_session)
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    content = await response.text()
+            async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                content = await response.text()
 
             # Parse RSS
             feed = feedparser.parse(content)
@@ -154,6 +195,114 @@ class NewsEmbeddingPipeline:
             logger.error(f"Error fetching RSS feed {feed_url}: {e}", exc_info=True)
             return []
 
+    async def _fetch_feeds(
+        self, feed_urls: List[str], max_concurrency: int = 8
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch several RSS feeds concurrently over one HTTP session.
+
+        Args:
+            feed_urls: Unique feed URLs
+            max_concurrency: Max in-flight requests
+
+        Returns:
+            Dict of feed URL -> articles
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with aiohttp.ClientSession() as session:
+
+            async def fetch(feed_url: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_rss_articles(feed_url, session=session)
+
+            results = await asyncio.gather(*(fetch(url) for url in feed_urls))
+
+        return dict(zip(feed_urls, results))
+
+    async def _embed_articles(
+        self, articles: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> Dict[str, float]:
+        """
+        Embed articles in maximal API batches and bulk-insert the vectors.
+
+        Args:
+            articles: (url_hash, ticker, article) tuples, url_hash unique
+
+        Returns:
+            Dict of url_hash -> embedding cost (USD)
+        """
+        engine = self.embedding_engine
+        texts: List[str] = []
+        token_counts: List[int] = []
+        rows: List[Dict[str, Any]] = []
+
+        for url_hash, ticker, article in articles:
+            content = f"{article['title']}\n\n{article['summary']}"
+            chunks = engine._chunk_content(content)
+
+            for chunk_index, chunk_text in enumerate(chunks):
+                token_count = engine._count_tokens(chunk_text)
+                texts.append(chunk_text)
+                token_counts.append(token_count)
+                rows.append({
+                    "url_hash": url_hash,
+                    "document_type": "news_article",
+                    "document_id": hash(article["url"]) % 2147483647,
+                    "ticker": ticker,
+                    "title": article["title"],
+                    "content_preview": chunk_text[:500],
+                    "chunk_index": chunk_index,
+                    "total_chunks": len(chunks),
+                    "embedding_model": engine.MODEL,
+                    "token_count": token_count,
+                    "source_date": article["published_date"],
+                    "doc_metadata": {
+                        "url": article["url"],
+                        "source": article["source"],
+                        "summary": article["summary"],
+                    },
+                })
+
+        if not rows:
+            return {}
+
+        vectors, cache_hits = await engine.embed_texts_with_hits(texts, token_counts)
+
+        url_hashes = [row.pop("url_hash") for row in rows]
+        for row, vector, cached in zip(rows, vectors, cache_hits):
+            row["embedding"] = vector
+            row["embedding_cost_usd"] = 0.0 if cached else (
+                row["token_count"] / 1_000_000
+            ) * engine.COST_PER_MILLION_TOKENS
+
+        result = await self.db.execute(
+            insert(DocumentEmbedding).returning(
+                DocumentEmbedding.id, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        embedding_ids = result.scalars().all()
+
+        # URL hash -> first chunk (one cache row per article)
+        costs: Dict[str, float] = {}
+        cache_rows = []
+        for url_hash, embedding_id, row in zip(url_hashes, embedding_ids, rows):
+            if url_hash not in costs:
+                costs[url_hash] = 0.0
+                cache_rows.append({"content_hash": url_hash, "embedding_id": embedding_id})
+            costs[url_hash] += row["embedding_cost_usd"]
+
+        await self.db.execute(insert(EmbeddingCache), cache_rows)
+        await self.db.commit()
+
+        logger.info(
+            f"Bulk-embedded {len(costs)} articles ({len(rows)} chunks, "
+            f"{sum(token_counts)} tokens)"
+        )
+
+        return costs
+
     def _extract_ticker_from_text(self, text: str, tickers: List[str]) -> Optional[str]:
         """
         Extract ticker from article text.
@@ -292,18 +441,33 @@ class NewsEmbeddingPipeline:
         return stats
 
     async def embed_batch_tickers_news(
-        self, tickers: List[str], hours: int = 24
+        self,
+        tickers: List[str],
+        hours: int = 24,
+        sources: Optional[List[str]] = None,
+        max_concurrency: int = 8,
     ) -> Dict[str, Any]:
         """
         Embed news for multiple tickers.
 
+        All feeds are fetched concurrently (each unique feed URL once) and
+        articles are deduplicated across tickers up front; the first ticker
+        in input order that surfaces an article owns it, same as serial
+        per-ticker processing. Existing articles are filtered with one bulk
+        query and the remainder is embedded in maximal API batches.
+
         Args:
             tickers: List of stock tickers
             hours: Look back hours
+            sources: RSS feed sources (default: all)
+            max_concurrency: Max concurrent feed requests
 
         Returns:
             Aggregate statistics
         """
+        if not sources:
+            sources = list(self.RSS_FEEDS.keys())
+
         total_stats = {
             "tickers_processed": 0,
             "total_articles_fetched": 0,
@@ -313,29 +477,78 @@ class NewsEmbeddingPipeline:
             "by_ticker": {},
         }
 
+        # 1. Fetch every unique feed URL concurrently
+        ticker_feeds: Dict[str, List[str]] = {}
         for ticker in tickers:
-            try:
-                stats = await self.embed_ticker_news(ticker=ticker, hours=hours)
+            ticker_feeds[ticker] = [
+                self.RSS_FEEDS[source].format(ticker=ticker)
+                for source in sources
+                if source in self.RSS_FEEDS
+            ]
 
-                # Aggregate
-                total_stats["tickers_processed"] += 1
-                total_stats["total_articles_fetched"] += stats["articles_fetched"]
-                total_stats["total_articles_embedded"] += stats["articles_embedded"]
-                total_stats["total_duplicates"] += stats["duplicates"]
-                total_stats["total_cost_usd"] += stats["total_cost_usd"]
-                total_stats["by_ticker"][ticker] = stats
+        feed_urls = list(dict.fromkeys(url for urls in ticker_feeds.values() for url in urls))
+        feeds = await self._fetch_feeds(feed_urls, max_concurrency=max_concurrency)
+
+        # 2. Dedupe URLs across tickers
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        candidates: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+        for ticker, urls in ticker_feeds.items():
+            stats = {
+                "ticker": ticker,
+                "articles_fetched": 0,
+                "articles_embedded": 0,
+                "duplicates": 0,
+                "total_cost_usd": 0.0,
+            }
+            total_stats["by_ticker"][ticker] = stats
+
+            for feed_url in urls:
+                for article in feeds.get(feed_url, []):
+                    if article["published_date"] < cutoff_time:
+                        continue
 
-                logger.info(
-                    f"News batch progress: {total_stats['tickers_processed']}/{len(tickers)} tickers"
-                )
+                    stats["articles_fetched"] += 1
+                    url_hash = self._compute_url_hash(article["url"])
 
-            except Exception as e:
-                logger.error(f"Error processing ticker {ticker}: {e}", exc_info=True)
-                continue
+                    if url_hash in candidates:
+                        stats["duplicates"] += 1
+                        continue
+
+                    candidates[url_hash] = (ticker, article)
+
+        # 3. One bulk existence check
+        for url_hash in await self._check_articles_exist(list(candidates)):
+            ticker, _ = candidates.pop(url_hash)
+            total_stats["by_ticker"][ticker]["duplicates"] += 1
+
+        # 4. Embed the unique remainder
+        try:
+            costs = await self._embed_articles(
+                [(url_hash, ticker, article) for url_hash, (ticker, article) in candidates.items()]
+            )
+        except Exception as e:
+            logger.error(f"Error bulk-embedding news batch: {e}", exc_info=True)
+            await self.db.rollback()
+            costs = {}
+
+        for url_hash, cost in costs.items():
+            stats = total_stats["by_ticker"][candidates[url_hash][0]]
+            stats["articles_embedded"] += 1
+            stats["total_cost_usd"] += cost
+
+        # Aggregate
+        for stats in total_stats["by_ticker"].values():
+            total_stats["tickers_processed"] += 1
+            total_stats["total_articles_fetched"] += stats["articles_fetched"]
+            total_stats["total_articles_embedded"] += stats["articles_embedded"]
+            total_stats["total_duplicates"] += stats["duplicates"]
+            total_stats["total_cost_usd"] += stats["total_cost_usd"]
 
         logger.info(
             f"News batch complete: "
             f"{total_stats['tickers_processed']} tickers, "
+            f"{len(feed_urls)} feeds, "
             f"{total_stats['total_articles_embedded']} articles, "
             f"${total_stats['total_cost_usd']:.5f}"
         )
@@ -29,6 +29,10 @@ from sqlalchemy import select, and_, not_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.ai.embedding_engine import EmbeddingEngine
+from backend.data.vector_store.embedder import EmbeddingBackend
+from backend.data.vector_store.embedding_cache import EmbeddingResultCache
+from backend.core.models.sec_models import SECSection
+from backend.data.sec_filing_store import SECFilingStore, get_sec_filing_store
 from backend.core.models.embedding_models import (
     DocumentEmbedding,
     EmbeddingSyncStatus,
@@ -60,19 +64,56 @@ class SECEmbeddingPipeline:
         )
     """
 
-    def __init__(self, db_session: AsyncSession, openai_api_key: Optional[str] = None):
+    # Sections read from the filing store (in priority order)
+    KEY_SECTIONS = [SECSection.MDA, SECSection.RISK_FACTORS, SECSection.BUSINESS]
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        openai_api_key: Optional[str] = None,
+        filing_store: Optional[SECFilingStore] = None,
+        embedding_backend: Optional[EmbeddingBackend] = None,
+        embedding_cache: Optional[EmbeddingResultCache] = None,
+    ):
         """
         Initialize SEC embedding pipeline.
 
         Args:
             db_session: SQLAlchemy async session
             openai_api_key: OpenAI API key
+            filing_store: Parsed filing store (default: the shared store, section-level reads by content hash)
+            embedding_backend: Embedding backend (None = OpenAI API)
+            embedding_cache: Shared embedding result cache (None = disabled)
         """
         self.db = db_session
-        self.embedding_engine = EmbeddingEngine(db_session, openai_api_key)
+        self.embedding_engine = EmbeddingEngine(
+            db_session, openai_api_key, embedding_backend, embedding_cache
+        )
+        self.filing_store = filing_store or get_sec_filing_store()
 
         logger.info("SECEmbeddingPipeline initialized")
 
+    def _get_key_content(self, filing: Dict[str, Any]) -> str:
+        """
+        Key sections for embedding.
+
+        Filings already indexed in the store (by content_hash) only decompress
+        the MD&A / Risk Factors / Business frames; others fall back to the
+        marker heuristic over the raw content (read from the store when the
+        filing dict carries no content, e.g. raw-only objects).
+        """
+        digest = filing.get("content_hash")
+        if digest and self.filing_store.has(digest):
+            text = self.filing_store.get_text(digest, self.KEY_SECTIONS)
+            if text:
+                return text
+
+        content = filing.get("content")
+        if content is None and digest and self.filing_store.contains(digest):
+            content = self.filing_store.get_raw(digest)
+
+        return self._extract_key_sections(content or "")
+
     def _extract_key_sections(self, filing_content: str) -> str:
         """
         Extract key sections from SEC filing for embedding.
@@ -193,7 +234,7 @@ class SECEmbeddingPipeline:
         for filing in unembedded_filings:
             try:
                 # Extract key sections
-                key_content = self._extract_key_sections(filing["content"])
+                key_content = self._get_key_content(filing)
 
                 # Generate embedding
                 embedding_ids = await self.embedding_engine.embed_document(
@@ -13,7 +13,7 @@ Date: 2025-12-04
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from backend.routing.intent_classifier import Intent
 
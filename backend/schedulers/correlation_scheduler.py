@@ -23,6 +23,7 @@ from sqlalchemy import and_
 
 from backend.database.repository import get_sync_session
 from backend.database.models_assets import Asset, AssetCorrelation
+from backend.analytics.covariance_service import correlation_pairs, get_covariance_service
 
 logger = logging.getLogger(__name__)
 
@@ -172,34 +173,36 @@ class CorrelationScheduler:
             "1y": {}
         }
 
-        # Download price data for each period
-        periods = {
-            "30d": self.fetch_price_data(symbols, period="30d"),
-            "90d": self.fetch_price_data(symbols, period="90d"),
-            "1y": self.fetch_price_data(symbols, period="1y")
-        }
-
-        # Calculate correlations for all pairs
-        total_pairs = len(assets) * (len(assets) - 1) // 2
-        calculated = 0
-
-        for i, asset1 in enumerate(assets):
-            for asset2 in assets[i + 1:]:
-                symbol1 = asset1.symbol
-                symbol2 = asset2.symbol
-
-                # Calculate for each period
-                for period_key, prices in periods.items():
-                    if prices.empty:
-                        continue
-
-                    corr = self.calculate_correlation(prices, symbol1, symbol2)
-                    if corr is not None:
-                        results[period_key][(symbol1, symbol2)] = corr
-
-                calculated += 1
-                if calculated % 10 == 0:
-                    logger.info(f"   Progress: {calculated}/{total_pairs} pairs")
+        # Download 1y once; 30d/90d windows are sliced from it
+        prices_1y = self.fetch_price_data(symbols, period="1y")
+        periods = {"1y": prices_1y}
+        for period_key, days in (("30d", 30), ("90d", 90)):
+            if prices_1y.empty:
+                periods[period_key] = prices_1y
+            else:
+                cutoff = prices_1y.index.max() - pd.Timedelta(days=days)
+                periods[period_key] = prices_1y[prices_1y.index > cutoff]
+
+        # Calculate correlations for all pairs (한 번의 행렬 연산, 페어별 최소 10개 관측)
+        for period_key, prices in periods.items():
+            if prices.empty:
+                continue
+
+            ordered = [symbol for symbol in symbols if symbol in prices.columns]
+            returns = prices[ordered].pct_change().iloc[1:]
+            corr_matrix = returns.corr(min_periods=10)
+
+            for pair in correlation_pairs(corr_matrix):
+                results[period_key][(pair["ticker1"], pair["ticker2"])] = pair["correlation"]
+
+        # 공유 EWMA 공분산 증분 갱신 (마지막 갱신 이후 거래일만 반영) + 스냅샷 저장
+        if not periods["1y"].empty:
+            try:
+                covariance_service = get_covariance_service()
+                if covariance_service.update_from_prices(periods["1y"]):
+                    covariance_service.save()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to update covariance cache: {e}")
 
         logger.info(f"✅ Calculated correlations:")
         for period, data in results.items():
@@ -30,6 +30,7 @@ import os
 from backend.core.database import get_db, init_db
 from backend.pipelines.sec_embedding_pipeline import SECEmbeddingPipeline
 from backend.pipelines.news_embedding_pipeline import NewsEmbeddingPipeline
+from backend.data.vector_store.embedding_cache import get_embedding_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -70,7 +71,7 @@ async def backfill_sec_filings(
     logger.info(f"Starting SEC backfill: {len(tickers)} tickers, {years} years")
 
     async with get_db() as db:
-        pipeline = SECEmbeddingPipeline(db)
+        pipeline = SECEmbeddingPipeline(db, embedding_cache=get_embedding_cache())
 
         stats = await pipeline.backfill_historical(
             tickers=tickers,
@@ -83,6 +84,7 @@ async def backfill_sec_filings(
             f"{stats['total_filings']} filings, "
             f"${stats['total_cost_usd']:.2f}"
         )
+        logger.info(f"Embedding cache: {get_embedding_cache().get_stats()}")
 
         return stats
 
@@ -103,7 +105,7 @@ async def backfill_news_articles(
     logger.info(f"Starting news backfill: {len(tickers)} tickers, {days} days")
 
     async with get_db() as db:
-        pipeline = NewsEmbeddingPipeline(db)
+        pipeline = NewsEmbeddingPipeline(db, embedding_cache=get_embedding_cache())
 
         stats = await pipeline.embed_batch_tickers_news(
             tickers=tickers, hours=days * 24
@@ -114,6 +116,7 @@ async def backfill_news_articles(
             f"{stats['total_articles_embedded']} articles, "
             f"${stats['total_cost_usd']:.5f}"
         )
+        logger.info(f"Embedding cache: {get_embedding_cache().get_stats()}")
 
         return stats
 
@@ -0,0 +1,220 @@
+"""
+Performance Benchmark: Streaming SEC Parser vs BeautifulSoup Parser.
+
+합성 10-K 코퍼스(목차 표, 인라인 XBRL 헤더, 대형 재무제표 표, ITEM 섹션)를 생성해
+문서당 파싱 시간 / 최대 메모리(tracemalloc)를 비교하고 프로세스 풀 처리량을 측정합니다.
+
+- legacy: BeautifulSoup 트리 + 섹션별 정규식 재스캔 (기존 SECParser 방식)
+- streaming: lxml 타깃 파서 + 단일 스캔 섹션 분할 (현재 SECParser)
+
+Usage:
+    python backend/scripts/benchmark_sec_parser.py
+    python backend/scripts/benchmark_sec_parser.py --filings 8 --size-mb 4 --corpus-dir data/sec_bench
+"""
+
+import argparse
+import random
+import re
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from bs4 import BeautifulSoup
+
+from backend.core.models.sec_models import FilingMetadata, FilingType
+from backend.data.sec_parser import SECParser, parse_filings
+
+WORDS = (
+    "revenue net income operating margin customers products services growth demand supply "
+    "chain risk regulation competition market share fiscal quarter guidance liquidity capital "
+    "expenditures cash flow inventory segment international currency exchange rates litigation "
+    "cybersecurity intellectual property manufacturing partners pricing costs investments"
+).split()
+
+ITEMS = [
+    ("1", "BUSINESS"),
+    ("1A", "RISK FACTORS"),
+    ("1B", "UNRESOLVED STAFF COMMENTS"),
+    ("2", "PROPERTIES"),
+    ("3", "LEGAL PROCEEDINGS"),
+    ("5", "MARKET FOR REGISTRANT'S COMMON EQUITY"),
+    ("7", "MANAGEMENT'S DISCUSSION AND ANALYSIS"),
+    ("7A", "QUANTITATIVE AND QUALITATIVE DISCLOSURES ABOUT MARKET RISK"),
+    ("8", "FINANCIAL STATEMENTS AND SUPPLEMENTARY DATA"),
+    ("9A", "CONTROLS AND PROCEDURES"),
+]
+
+
+# ============================================
+# 코퍼스
+# ============================================
+
+def _paragraph(rng: random.Random) -> str:
+    """EDGAR 인라인 XBRL 문서처럼 문단 = div, 문장 조각마다 스타일 span"""
+    span = '<span style="color:#000000;font-family:\'Times New Roman\',sans-serif;font-size:10pt;font-weight:400;line-height:120%">'
+    runs = [
+        span + " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))) + " </span>"
+        for _ in range(rng.randint(4, 10))
+    ]
+    fact = f'<ix:nonFraction name="us-gaap:Revenues" contextRef="FY" unitRef="usd" decimals="-6" scale="6">{rng.randint(1, 999)},{rng.randint(100, 999)}</ix:nonFraction>'
+    return f'<div style="margin-top:9pt;text-align:justify">{"".join(runs)}{span}of ${fact} million.</span></div>\n'
+
+
+def _table(rng: random.Random, rows: int) -> str:
+    body = "".join(
+        "<tr>" + "".join(f'<td style="padding:2px"><font size="1">{rng.randint(0, 99999):,}</font></td>' for _ in range(8)) + "</tr>\n"
+        for _ in range(rows)
+    )
+    return f'<table cellpadding="0" cellspacing="0" width="100%">{body}</table>\n'
+
+
+def build_filing(seed: int, size_mb: float) -> str:
+    """결정적 합성 10-K HTML (약 size_mb MB)"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+
+    header = "".join(
+        f'<ix:hidden><ix:nonNumeric name="dei:Fact{i}" contextRef="c{i}">hidden {i}</ix:nonNumeric></ix:hidden>'
+        for i in range(500)
+    )
+    toc = "".join(f"<tr><td>Item {num}.</td><td>{title.title()}</td><td>{i + 3}</td></tr>" for i, (num, title) in enumerate(ITEMS))
+    parts = [
+        "<html><head><title>10-K</title><style>p{margin:0}</style></head><body>",
+        f'<div style="display:none"><ix:header>{header}</ix:header></div>',
+        f"<table>{toc}</table>",
+    ]
+
+    per_item = target // len(ITEMS)
+    for num, title in ITEMS:
+        parts.append(f'<p style="font-weight:bold">ITEM {num}.&nbsp;&nbsp;{title}</p>\n')
+        size = 0
+        while size < per_item:
+            chunk = _table(rng, 40) if num == "8" and rng.random() < 0.6 else _paragraph(rng)
+            parts.append(chunk)
+            size += len(chunk)
+
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def load_corpus(filings: int, size_mb: float, corpus_dir: Path = None) -> List[str]:
+    """코퍼스 생성 (corpus_dir 지정 시 파일로 캐시)"""
+    corpus = []
+    for seed in range(filings):
+        path = corpus_dir / f"synthetic_10k_{seed}_{size_mb}mb.html" if corpus_dir else None
+        if path and path.exists():
+            corpus.append(path.read_text(encoding="utf-8"))
+            continue
+        html = build_filing(seed, size_mb)
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(html, encoding="utf-8")
+        corpus.append(html)
+    return corpus
+
+
+def _metadata(i: int) -> FilingMetadata:
+    return FilingMetadata(
+        ticker=f"T{i}",
+        cik=str(i).zfill(10),
+        company_name=f"Synthetic {i}",
+        filing_type=FilingType.FORM_10K,
+        filing_date=datetime(2026, 2, 1),
+        fiscal_period="FY2025",
+        accession_number=f"0000000000-26-{i:06d}",
+        filing_url="",
+        document_url="",
+    )
+
+
+# ============================================
+# 기존 방식 (비교 기준)
+# ============================================
+
+def legacy_parse(content: str) -> dict:
+    """BeautifulSoup 트리 + 섹션 패턴별 전체 재스캔"""
+    soup = BeautifulSoup(content, "html.parser")
+    for tag in soup(["script", "style", "table", "img"]):
+        tag.decompose()
+    text = soup.get_text(separator="\n")
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"\n\s*\n", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    text = text.replace("\xa0", " ").replace("​", "").strip()
+
+    sections = {}
+    for section_type, patterns in SECParser.SECTION_PATTERNS.items():
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if not match:
+                continue
+            start = match.start()
+            following = re.search(r"\n\s*ITEM\s+\d+[A-Z]?\.?\s+", text[start + 100:], re.IGNORECASE)
+            end = start + 100 + following.start() if following else len(text)
+            body = text[start:end].strip()
+            if len(body.split()) >= 50:
+                sections[section_type] = body
+                break
+    return sections
+
+
+# ============================================
+# 측정
+# ============================================
+
+def _measure(label: str, fn, corpus: List[str]) -> dict:
+    """문서별 시간(추적 없이)과 최대 메모리(tracemalloc, 별도 실행)"""
+    durations, peaks, sections = [], [], []
+    for content in corpus:
+        fn(content)  # warm-up (정규식 컴파일 등)
+        started = time.perf_counter()
+        result = fn(content)
+        durations.append(time.perf_counter() - started)
+        sections.append(len(result))
+
+        tracemalloc.start()
+        fn(content)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    stats = {
+        "method": label,
+        "avg_seconds": sum(durations) / len(durations),
+        "avg_peak_mb": sum(peaks) / len(peaks) / 1024 / 1024,
+        "sections": sections,
+    }
+    print(f"{label:<10} {stats['avg_seconds']:.3f}s/filing  peak {stats['avg_peak_mb']:.1f} MB  sections {sections}")
+    return stats
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--filings", type=int, default=4)
+    arg_parser.add_argument("--size-mb", type=float, default=3.0)
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--corpus-dir", type=Path, default=None)
+    args = arg_parser.parse_args()
+
+    corpus = load_corpus(args.filings, args.size_mb, args.corpus_dir)
+    print(f"Corpus: {len(corpus)} filings, {sum(map(len, corpus)) / 1024 / 1024:.1f} MB total")
+    print("=" * 60)
+
+    parser = SECParser()
+    legacy = _measure("legacy", legacy_parse, corpus)
+    streaming = _measure("streaming", lambda c: parser._extract_sections(parser._clean_html(c)), corpus)
+
+    print("=" * 60)
+    print(f"Speedup: {legacy['avg_seconds'] / streaming['avg_seconds']:.1f}x, "
+          f"memory: {legacy['avg_peak_mb'] / streaming['avg_peak_mb']:.1f}x lower")
+
+    items = [(_metadata(i), content) for i, content in enumerate(corpus)]
+    started = time.perf_counter()
+    parse_filings(items, max_workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"Process pool: {len(items)} filings in {elapsed:.2f}s ({len(items) / elapsed:.1f} filings/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,15 @@ AI가 매일 종목을 자동 발굴하는 Dynamic Screener
 
 from .scanner import DynamicScreener, ScreenerCandidate
 from .scheduler import ScreenerScheduler
+from .indicator_state import IndicatorState, get_indicator_state
 from .universe import get_universe, UniverseType
 
 __all__ = [
     "DynamicScreener",
     "ScreenerCandidate", 
     "ScreenerScheduler",
+    "IndicatorState",
+    "get_indicator_state",
     "get_universe",
     "UniverseType",
 ]
@@ -0,0 +1,344 @@
+"""
+Indicator State - 스캐너 지표 증분 상태 (종목별 롤링 합계, 실행 간 유지)
+
+핵심 원칙:
+- 종목별 링 버퍼 + 누적 합계로 20일 평균 거래량 / ATR-14 / RSI-14 / 5·20일 수익률 유지
+  (필터 정의가 단순 이동평균이므로 Wilder/EMA 대신 정확한 롤링 합계 사용 → 점수 동일)
+- 새 봉 1개 반영 비용 O(1)/종목 → 스캔당 O(유니버스) 산술
+- 같은 날짜 봉이 다시 들어오면 (장중 재스캔) 마지막 슬롯을 교체, 새 날짜면 추가
+- 디스크 스냅샷 (npz)으로 재시작 후에도 상태 유지
+
+사용법:
+    state = get_indicator_state()
+    state.ingest_panel(panel)                 # 웜업: 2개월 패널, 이후: 최근 며칠 패널
+    indicators = state.indicators(tickers)    # compute_indicators()와 같은 형식
+    state.save()
+
+작성일: 2026-10-18
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .panel import ATR_PERIOD, MIN_BARS, RSI_PERIOD, UniversePanel
+
+logger = logging.getLogger(__name__)
+
+VOLUME_WINDOW = 20
+CLOSE_WINDOW = 20  # close[-20]까지 필요 (20일 수익률)
+DEFAULT_STATE_PATH = "data/cache/scanner_indicator_state.npz"
+NO_DATE = np.datetime64("NaT", "D")
+
+# 스냅샷에 저장되는 배열
+_ARRAYS = (
+    "closes", "volumes", "trs", "gains", "losses",
+    "volume_sum", "tr_sum", "gain_sum", "loss_sum",
+    "last_high", "last_low", "counts", "last_dates",
+)
+
+
+class IndicatorState:
+    """
+    종목별 스캐너 지표 증분 상태
+
+    Args:
+        path: 스냅샷 경로 (기본: SCANNER_STATE_PATH 또는 data/cache/scanner_indicator_state.npz)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path or os.getenv("SCANNER_STATE_PATH", DEFAULT_STATE_PATH))
+        self._lock = threading.RLock()
+
+        self._tickers: List[str] = []
+        self._index: Dict[str, int] = {}
+
+        self.closes = np.zeros((0, CLOSE_WINDOW))
+        self.volumes = np.zeros((0, VOLUME_WINDOW))
+        self.trs = np.zeros((0, ATR_PERIOD))
+        self.gains = np.zeros((0, RSI_PERIOD))
+        self.losses = np.zeros((0, RSI_PERIOD))
+
+        self.volume_sum = np.zeros(0)
+        self.tr_sum = np.zeros(0)
+        self.gain_sum = np.zeros(0)
+        self.loss_sum = np.zeros(0)
+
+        self.last_high = np.zeros(0)
+        self.last_low = np.zeros(0)
+        self.counts = np.zeros(0, dtype=np.int64)         # 반영된 봉 수
+        self.last_dates = np.zeros(0, dtype="datetime64[D]")
+
+        self.bars_ingested = 0
+
+    # ================================================================
+    # 갱신
+    # ================================================================
+
+    def ingest_panel(self, panel: UniversePanel) -> int:
+        """
+        패널의 봉을 날짜 순으로 반영
+
+        종목별 마지막 반영 날짜보다 이전 봉은 무시, 같은 날짜는 교체, 이후 날짜는 추가합니다.
+
+        Returns:
+            반영된 (종목, 봉) 수
+        """
+        with self._lock:
+            self._ensure_tickers(panel.tickers)
+            idx = np.fromiter((self._index[t] for t in panel.tickers), dtype=np.int64, count=len(panel.tickers))
+            dates = np.asarray(panel.dates).astype("datetime64[D]")
+
+            applied = 0
+            for t in range(len(dates)):
+                close = panel.close[t]
+                has_bar = ~np.isnan(close) & ~np.isnan(panel.volume[t])
+                last = self.last_dates[idx]
+                fresh = np.isnat(last)
+
+                replace = has_bar & ~fresh & (last == dates[t])
+                append = has_bar & (fresh | (last < dates[t]))
+
+                if replace.any():
+                    self._apply(idx[replace], panel, t, replace, dates[t], replace_last=True)
+                if append.any():
+                    self._apply(idx[append], panel, t, append, dates[t], replace_last=False)
+                applied += int(replace.sum() + append.sum())
+
+            self.bars_ingested += applied
+            return applied
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._tickers)
+
+    def stale_tickers(self, tickers: Iterable[str], max_gap_days: int = 5) -> List[str]:
+        """웜업(전체 기간 다운로드)이 필요한 종목: 상태 없음 / 봉 부족 / 마지막 봉이 오래됨"""
+        today = np.datetime64("today", "D")
+        stale = []
+        with self._lock:
+            for ticker in tickers:
+                i = self._index.get(ticker)
+                if (
+                    i is None
+                    or self.counts[i] < MIN_BARS
+                    or (today - self.last_dates[i]).astype(int) > max_gap_days
+                ):
+                    stale.append(ticker)
+        return stale
+
+    def indicators(self, tickers: List[str]) -> Dict[str, np.ndarray]:
+        """compute_indicators()와 같은 키/의미의 지표 (없는 종목은 valid=False)"""
+        with self._lock:
+            known = np.array([t in self._index for t in tickers], dtype=bool)
+            idx = np.array([self._index.get(t, 0) for t in tickers], dtype=np.int64)
+            n = len(tickers)
+
+            def col(values: np.ndarray, fill=np.nan) -> np.ndarray:
+                out = np.full(n, fill, dtype=float)
+                out[known] = values[idx[known]]
+                return out
+
+            counts = col(self.counts, 0)
+            last_close = col(self._close_at(1))
+            prev_close = col(self._close_at(2))
+            close_5 = col(self._close_at(5))
+            close_20 = col(self._close_at(20))
+            current_volume = col(self._volume_at(1))
+
+            volume_n = np.minimum(counts, VOLUME_WINDOW)
+            tr_n = np.minimum(np.maximum(counts - 1, 0), ATR_PERIOD)
+            rsi_n = tr_n
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                avg_volume_20d = col(self.volume_sum) / volume_n
+                atr_14 = col(self.tr_sum) / tr_n
+                gain = col(self.gain_sum) / rsi_n
+                loss = col(self.loss_sum) / rsi_n
+
+                volume_ratio = np.where(avg_volume_20d > 0, current_volume / avg_volume_20d, 0.0)
+                atr_ratio = np.where(last_close > 0, atr_14 / last_close, 0.0)
+                breakout_ratio = np.where(atr_14 > 0, (col(self.last_high) - col(self.last_low)) / atr_14, 0.0)
+                price_change_pct = np.where(prev_close > 0, (last_close - prev_close) / prev_close * 100, 0.0)
+                return_5d = (last_close - close_5) / close_5 * 100
+                return_20d = (last_close - close_20) / close_20 * 100
+                rsi_14 = 100 - 100 / (1 + gain / loss)
+            rsi_14 = np.where(np.isnan(rsi_14), 50.0, rsi_14)
+
+        return {
+            "valid": known & (counts >= MIN_BARS),
+            "current_volume": current_volume,
+            "avg_volume_20d": avg_volume_20d,
+            "volume_ratio": volume_ratio,
+            "atr_14": atr_14,
+            "atr_ratio": atr_ratio,
+            "breakout_ratio": breakout_ratio,
+            "price_change_pct": price_change_pct,
+            "return_5d": return_5d,
+            "return_20d": return_20d,
+            "rsi_14": rsi_14,
+        }
+
+    def get_stats(self) -> Dict:
+        return {
+            "tickers": len(self._tickers),
+            "ready_tickers": int((self.counts >= MIN_BARS).sum()),
+            "bars_ingested": self.bars_ingested,
+            "last_date": str(self.last_dates.max()) if len(self.last_dates) else None,
+            "path": str(self.path),
+        }
+
+    # ================================================================
+    # 디스크 스냅샷
+    # ================================================================
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """스냅샷 저장 (임시 파일 → rename, 원자적 교체)"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with self._lock:
+            self._resync_sums()
+            with open(tmp_path, "wb") as f:
+                np.savez(f, tickers=np.array(self._tickers, dtype=str), **{name: getattr(self, name) for name in _ARRAYS})
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """스냅샷 로드 (파일 없거나 형식이 다르면 False)"""
+        path = Path(path or self.path)
+        if not path.exists():
+            return False
+
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name].copy() for name in _ARRAYS}
+                tickers = [str(t) for t in data["tickers"]]
+            if arrays["closes"].shape[1:] != (CLOSE_WINDOW,) or arrays["trs"].shape[1:] != (ATR_PERIOD,):
+                logger.warning(f"Scanner state {path} has different windows, ignoring")
+                return False
+        except Exception as e:
+            logger.error(f"Failed to load scanner state {path}: {e}")
+            return False
+
+        with self._lock:
+            for name, values in arrays.items():
+                setattr(self, name, values)
+            self._tickers = tickers
+            self._index = {t: i for i, t in enumerate(tickers)}
+
+        logger.info(f"Scanner indicator state loaded: {len(tickers)} tickers")
+        return True
+
+    # ================================================================
+    # Private 메서드 (lock 보유 상태에서 호출)
+    # ================================================================
+
+    def _resync_sums(self):
+        """누적 합계를 버퍼 합으로 재계산 (부동소수점 누적 오차 제거, 빈 슬롯은 0)"""
+        self.volume_sum = self.volumes.sum(axis=1)
+        self.tr_sum = self.trs.sum(axis=1)
+        self.gain_sum = self.gains.sum(axis=1)
+        self.loss_sum = self.losses.sum(axis=1)
+
+    def _close_at(self, k: int) -> np.ndarray:
+        """종목별 k번째 최근 종가 (k=1: 마지막), 봉 부족 시 NaN"""
+        pos = (self.counts - k) % CLOSE_WINDOW
+        values = self.closes[np.arange(len(self.counts)), pos]
+        return np.where(self.counts >= k, values, np.nan)
+
+    def _volume_at(self, k: int) -> np.ndarray:
+        pos = (self.counts - k) % VOLUME_WINDOW
+        values = self.volumes[np.arange(len(self.counts)), pos]
+        return np.where(self.counts >= k, values, np.nan)
+
+    def _apply(self, rows: np.ndarray, panel: UniversePanel, t: int, mask: np.ndarray, date, replace_last: bool):
+        """rows 종목에 봉 t 반영 (replace_last: 마지막 봉 교체)"""
+        close = panel.close[t, mask]
+        volume = panel.volume[t, mask]
+        high = np.where(np.isnan(panel.high[t, mask]), close, panel.high[t, mask])
+        low = np.where(np.isnan(panel.low[t, mask]), close, panel.low[t, mask])
+
+        if replace_last:
+            counts = self.counts[rows] - 1
+        else:
+            counts = self.counts[rows]
+
+        # 이전 종가 (교체 시에도 마지막 봉 직전 종가)
+        has_prev = counts >= 1
+        prev_close = self.closes[rows, (counts - 1) % CLOSE_WINDOW]
+
+        # 새 값
+        tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        delta = close - prev_close
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+
+        # 거래량 / 종가 링 버퍼 (교체 시 같은 슬롯, 추가 시 가장 오래된 슬롯을 덮어씀)
+        self._roll(self.volumes, self.volume_sum, rows, counts, VOLUME_WINDOW, volume, np.ones(len(rows), dtype=bool), replace_last)
+        self.closes[rows, counts % CLOSE_WINDOW] = close
+
+        # TR / 상승·하락폭 (두 번째 봉부터, 봉 번호 counts → 슬롯 (counts - 1))
+        self._roll(self.trs, self.tr_sum, rows, counts - 1, ATR_PERIOD, tr, has_prev, replace_last)
+        self._roll(self.gains, self.gain_sum, rows, counts - 1, RSI_PERIOD, gain, has_prev, replace_last)
+        self._roll(self.losses, self.loss_sum, rows, counts - 1, RSI_PERIOD, loss, has_prev, replace_last)
+
+        self.last_high[rows] = high
+        self.last_low[rows] = low
+        self.counts[rows] = counts + 1
+        self.last_dates[rows] = date
+
+    @staticmethod
+    def _roll(buffer, total, rows, positions, window, values, mask, replace_last):
+        """링 버퍼 슬롯 positions에 values 기록 + 누적 합계 보정 (mask=False 종목은 건너뜀)"""
+        if not mask.any():
+            return
+        rows, positions, values = rows[mask], positions[mask], values[mask]
+        slots = positions % window
+        # 추가: 윈도우가 찼을 때만 가장 오래된 값이 빠짐 / 교체: 같은 슬롯의 이전 값이 빠짐
+        outgoing = buffer[rows, slots]
+        leaving = replace_last | (positions >= window)
+        total[rows] += values - np.where(leaving, outgoing, 0.0)
+        buffer[rows, slots] = values
+
+    def _ensure_tickers(self, tickers: Iterable[str]):
+        new = [t for t in tickers if t not in self._index]
+        if not new:
+            return
+
+        k = len(new)
+        self.closes = np.vstack([self.closes, np.zeros((k, CLOSE_WINDOW))])
+        self.volumes = np.vstack([self.volumes, np.zeros((k, VOLUME_WINDOW))])
+        self.trs = np.vstack([self.trs, np.zeros((k, ATR_PERIOD))])
+        self.gains = np.vstack([self.gains, np.zeros((k, RSI_PERIOD))])
+        self.losses = np.vstack([self.losses, np.zeros((k, RSI_PERIOD))])
+        for name in ("volume_sum", "tr_sum", "gain_sum", "loss_sum", "last_high", "last_low"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(k)]))
+        self.counts = np.concatenate([self.counts, np.zeros(k, dtype=np.int64)])
+        self.last_dates = np.concatenate([self.last_dates, np.full(k, NO_DATE)])
+
+        for ticker in new:
+            self._index[ticker] = len(self._tickers)
+            self._tickers.append(ticker)
+
+
+# 싱글톤 인스턴스
+_indicator_state: Optional[IndicatorState] = None
+
+
+def get_indicator_state() -> IndicatorState:
+    """공유 지표 상태 (첫 호출 시 디스크 스냅샷 로드)"""
+    global _indicator_state
+    if _indicator_state is None:
+        _indicator_state = IndicatorState()
+        _indicator_state.load()
+    return _indicator_state
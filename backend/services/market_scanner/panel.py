@@ -0,0 +1,206 @@
+"""
+Universe Panel - 유니버스 전체 OHLCV 패널 기반 벡터화 지표 계산
+
+핵심 원칙:
+- 종목별 yf.Ticker().history() 대신 유니버스 전체를 1회 다운로드 (yf.download, (T, N) 배열)
+- 거래량 비율 / ATR / 돌파 / 5일·20일 수익률 / RSI를 전 종목 NumPy 연산으로 한 번에 계산
+- 점수/통과 규칙은 VolumeFilter / VolatilityFilter / MomentumFilter와 동일 (필터 인스턴스의 파라미터 사용)
+
+사용법:
+    panel = await download_universe_panel(tickers, period="2mo")
+    indicators = compute_indicators(panel)
+    scores = score_indicators(indicators, volume_filter, volatility_filter, momentum_filter)
+
+작성일: 2026-10-18
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+# 필터와 동일한 최소 데이터 길이 (VolumeFilter/MomentumFilter: 20일, VolatilityFilter: ATR 14 + 1)
+MIN_BARS = 20
+ATR_PERIOD = 14
+RSI_PERIOD = 14
+
+
+@dataclass
+class UniversePanel:
+    """(T, N) OHLCV 배열 (행: 날짜 오름차순, 열: tickers, 결측은 NaN)"""
+    tickers: List[str]
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "UniversePanel":
+        """
+        필드별 wide DataFrame (index: 날짜, columns: ticker) → 패널
+
+        yf.download(group_by="column") 결과나 PricePanel.pivot(field) 결과를 그대로 받습니다.
+        """
+        close = frames["close"].sort_index()
+        tickers = [str(t) for t in close.columns]
+        arrays = {
+            field: frames[field].sort_index().reindex(index=close.index, columns=close.columns).to_numpy(dtype=float)
+            for field in FIELDS
+        }
+        return cls(tickers=tickers, dates=close.index.to_numpy(), **arrays)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+async def download_universe_panel(tickers: List[str], period: str = "2mo") -> UniversePanel:
+    """유니버스 전체 일봉을 yf.download 1회로 조회 (블로킹 호출은 스레드에서 실행)"""
+    import yfinance as yf
+
+    logging.getLogger("yfinance").setLevel(logging.CRITICAL)
+
+    def _download() -> pd.DataFrame:
+        return yf.download(
+            tickers,
+            period=period,
+            interval="1d",
+            group_by="column",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+        )
+
+    df = await asyncio.to_thread(_download)
+    if df.empty:
+        empty = pd.DataFrame(columns=tickers, dtype=float)
+        return UniversePanel.from_frames({field: empty for field in FIELDS})
+
+    # 단일 종목이면 컬럼이 MultiIndex가 아님
+    if not isinstance(df.columns, pd.MultiIndex):
+        df = pd.concat({tickers[0]: df}, axis=1).swaplevel(axis=1)
+
+    frames = {field: df[field.capitalize()].reindex(columns=tickers) for field in FIELDS}
+    return UniversePanel.from_frames(frames)
+
+
+def compute_indicators(panel: UniversePanel) -> Dict[str, np.ndarray]:
+    """
+    전 종목 지표 (각 값은 길이 N 배열)
+
+    valid: 마지막 봉 존재 + 최소 MIN_BARS 봉 보유 종목
+    """
+    h, l, c, v = panel.high, panel.low, panel.close, panel.volume
+    n = len(panel)
+    if c.shape[0] < 2 or n == 0:
+        nan = np.full(n, np.nan)
+        return {
+            "valid": np.zeros(n, dtype=bool), "current_volume": nan, "avg_volume_20d": nan,
+            "volume_ratio": nan, "atr_14": nan, "atr_ratio": nan, "breakout_ratio": nan,
+            "price_change_pct": nan, "return_5d": nan, "return_20d": nan, "rsi_14": np.full(n, 50.0),
+        }
+
+    valid = (~np.isnan(c)).sum(axis=0) >= MIN_BARS
+    valid &= ~np.isnan(c[-1]) & ~np.isnan(v[-1])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 거래량: 오늘 / 최근 20일 평균 (오늘 포함, VolumeFilter와 동일)
+        current_volume = v[-1]
+        avg_volume_20d = np.nanmean(v[-20:], axis=0)
+        volume_ratio = np.where(avg_volume_20d > 0, current_volume / avg_volume_20d, 0.0)
+
+        # ATR-14 (True Range 단순 이동평균, VolatilityFilter와 동일)
+        prev_close = c[:-1]
+        tr = np.fmax(h[1:] - l[1:], np.fmax(np.abs(h[1:] - prev_close), np.abs(l[1:] - prev_close)))
+        atr_14 = np.nanmean(tr[-ATR_PERIOD:], axis=0)
+        atr_ratio = np.where(c[-1] > 0, atr_14 / c[-1], 0.0)
+        breakout_ratio = np.where(atr_14 > 0, (h[-1] - l[-1]) / atr_14, 0.0)
+        price_change_pct = np.where(c[-2] > 0, (c[-1] - c[-2]) / c[-2] * 100, 0.0)
+
+        # 수익률 (MomentumFilter와 동일한 기준 봉: iloc[-5], iloc[-20])
+        return_5d = (c[-1] - c[-5]) / c[-5] * 100 if c.shape[0] >= 5 else np.full(n, np.nan)
+        return_20d = (c[-1] - c[-20]) / c[-20] * 100 if c.shape[0] >= 20 else np.full(n, np.nan)
+
+        # RSI-14 (상승/하락폭 단순 이동평균)
+        delta = np.diff(c, axis=0)[-RSI_PERIOD:]
+        gain = np.nanmean(np.where(delta > 0, delta, 0.0), axis=0)
+        loss = np.nanmean(np.where(delta < 0, -delta, 0.0), axis=0)
+        rsi_14 = 100 - 100 / (1 + gain / loss)
+    rsi_14 = np.where(np.isnan(rsi_14), 50.0, rsi_14)
+
+    return {
+        "valid": valid,
+        "current_volume": current_volume,
+        "avg_volume_20d": avg_volume_20d,
+        "volume_ratio": volume_ratio,
+        "atr_14": atr_14,
+        "atr_ratio": atr_ratio,
+        "breakout_ratio": breakout_ratio,
+        "price_change_pct": price_change_pct,
+        "return_5d": return_5d,
+        "return_20d": return_20d,
+        "rsi_14": rsi_14,
+    }
+
+
+def _linear_score(value: np.ndarray, low: float, high: float) -> np.ndarray:
+    return np.clip((value - low) / (high - low) * 100, 0, 100)
+
+
+def score_indicators(indicators: Dict[str, np.ndarray], volume_filter, volatility_filter, momentum_filter) -> Dict[str, np.ndarray]:
+    """
+    필터 규칙을 전 종목에 벡터로 적용
+
+    Returns:
+        {volume|volatility|momentum}_{score|passed}, breakout_detected, momentum_signal
+    """
+    valid = indicators["valid"]
+
+    ratio = np.nan_to_num(indicators["volume_ratio"])
+    volume_passed = (
+        valid
+        & (np.nan_to_num(indicators["avg_volume_20d"]) >= volume_filter.min_volume)
+        & (ratio >= volume_filter.min_ratio)
+    )
+    volume_score = np.where(volume_passed, _linear_score(ratio, volume_filter.min_ratio, volume_filter.max_score_ratio), 0.0)
+
+    breakout = np.nan_to_num(indicators["breakout_ratio"])
+    breakout_detected = (
+        valid
+        & (np.nan_to_num(indicators["atr_ratio"]) >= volatility_filter.min_atr_percent)
+        & (breakout >= volatility_filter.min_breakout_ratio)
+    )
+    volatility_score = np.where(
+        breakout_detected,
+        _linear_score(breakout, volatility_filter.min_breakout_ratio, volatility_filter.max_score_ratio),
+        0.0,
+    )
+
+    r5 = np.nan_to_num(indicators["return_5d"])
+    rsi = indicators["rsi_14"]
+    momentum_passed = valid & (r5 >= momentum_filter.min_return_5d)
+    momentum_score = np.where(momentum_passed, np.clip(r5 / momentum_filter.max_score_return * 100, 0, 100), 0.0)
+    momentum_signal = np.select(
+        [(r5 >= 7) & (rsi > 60), r5 >= 3, (r5 <= -7) & (rsi < 40), r5 <= -3],
+        ["STRONG_UP", "UP", "STRONG_DOWN", "DOWN"],
+        default="NEUTRAL",
+    )
+
+    return {
+        "volume_score": volume_score,
+        "volume_passed": volume_passed,
+        "volatility_score": volatility_score,
+        "volatility_passed": breakout_detected,
+        "breakout_detected": breakout_detected,
+        "momentum_score": momentum_score,
+        "momentum_passed": momentum_passed,
+        "momentum_signal": momentum_signal,
+    }
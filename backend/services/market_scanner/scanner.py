@@ -9,6 +9,12 @@ AI가 분석할 종목 후보군을 자동 선정합니다.
 2. 변동성 돌파: ATR 기반 돌파 감지
 3. 모멘텀: 5일 수익률 + RSI
 4. 옵션 이상: Unusual Options Activity 감지
+
+스캔 모드:
+- panel (기본): 유니버스 OHLCV 패널 1회 다운로드 → 1~3번 지표를 전 종목 벡터 연산,
+  옵션 API는 상위 options_top_k 종목만 호출
+  (indicator_state 지정 시 종목별 증분 지표 상태에 최근 봉만 반영)
+- per_ticker: 종목마다 4개 필터를 개별 실행 (필터별 개별 다운로드)
 """
 
 from dataclasses import dataclass, field
@@ -17,7 +23,11 @@ from datetime import datetime
 import asyncio
 import logging
 
+import numpy as np
+
 from .filters import VolumeFilter, VolatilityFilter, MomentumFilter, OptionsFilter
+from .indicator_state import IndicatorState
+from .panel import UniversePanel, compute_indicators, download_universe_panel, score_indicators
 from .universe import get_universe, get_sector, UniverseType
 
 logger = logging.getLogger(__name__)
@@ -62,10 +72,21 @@ class DynamicScreener:
         min_market_cap: float = 1e9,  # 최소 시가총액 $1B
         min_volume: int = 500_000,  # 최소 일평균 거래량
         massive_api_client=None,  # Massive API 클라이언트
+        scan_mode: str = "panel",  # panel | per_ticker
+        options_top_k: Optional[int] = None,  # panel 모드 옵션 조회 종목 수 (기본: max_candidates × 3)
+        options_concurrency: int = 5,
+        indicator_state: Optional[IndicatorState] = None,  # panel 모드 증분 지표 상태
     ):
+        if scan_mode not in ("panel", "per_ticker"):
+            raise ValueError(f"Unknown scan_mode: {scan_mode}")
+
         self.max_candidates = max_candidates
         self.min_market_cap = min_market_cap
         self.min_volume = min_volume
+        self.scan_mode = scan_mode
+        self.options_top_k = options_top_k or max_candidates * 3
+        self.options_concurrency = options_concurrency
+        self.indicator_state = indicator_state
         
         # 필터 가중치
         self.weights = {
@@ -116,8 +137,35 @@ class DynamicScreener:
         
         logger.info(f"스캔 시작: {len(universe)}개 종목")
         
-        candidates: List[ScreenerCandidate] = []
         errors: List[str] = []
+        if self.scan_mode == "panel":
+            candidates = await self._scan_panel(universe, errors)
+        else:
+            candidates = await self._scan_per_ticker(universe, errors)
+        
+        # 점수 순으로 정렬하고 상위 N개 선택
+        candidates.sort(key=lambda x: x.score, reverse=True)
+        top_candidates = candidates[:self.max_candidates]
+        
+        scan_duration = (datetime.now() - start_time).total_seconds()
+        
+        result = ScanResult(
+            timestamp=datetime.now(),
+            total_scanned=len(universe),
+            candidates=top_candidates,
+            scan_duration_seconds=scan_duration,
+            errors=errors[:10],  # 최대 10개 에러만 저장
+        )
+        
+        self.last_scan_result = result
+        
+        logger.info(f"스캔 완료: {len(top_candidates)}개 후보 선정 ({scan_duration:.1f}초)")
+        
+        return result
+    
+    async def _scan_per_ticker(self, universe: List[str], errors: List[str]) -> List[ScreenerCandidate]:
+        """종목별 필터 실행 (per_ticker 모드)"""
+        candidates: List[ScreenerCandidate] = []
         
         # 병렬로 종목 분석 (배치로 처리하여 API 과부하 방지)
         batch_size = 10
@@ -136,25 +184,139 @@ class DynamicScreener:
             # API 레이트 리밋 방지
             await asyncio.sleep(0.5)
         
-        # 점수 순으로 정렬하고 상위 N개 선택
-        candidates.sort(key=lambda x: x.score, reverse=True)
-        top_candidates = candidates[:self.max_candidates]
+        return candidates
+    
+    async def _scan_panel(self, universe: List[str], errors: List[str]) -> List[ScreenerCandidate]:
+        """
+        유니버스 패널 스캔 (panel 모드)
         
-        scan_duration = (datetime.now() - start_time).total_seconds()
+        1. OHLCV 패널 1회 다운로드
+        2. 거래량/변동성/모멘텀 지표와 점수를 전 종목 벡터 연산
+        3. 하나 이상 통과한 종목 중 부분 점수 상위 options_top_k만 옵션 필터 호출
         
-        result = ScanResult(
-            timestamp=datetime.now(),
-            total_scanned=len(universe),
-            candidates=top_candidates,
-            scan_duration_seconds=scan_duration,
-            errors=errors[:10],  # 최대 10개 에러만 저장
+        indicator_state가 있으면 상태가 없거나 오래된 종목만 2개월 웜업,
+        나머지는 최근 5일 패널에서 새 봉(또는 당일 봉 갱신)만 반영합니다.
+        """
+        if self.indicator_state is None:
+            panel = await download_universe_panel(universe, period="2mo")
+            return await self._candidates_from_panel(panel, errors)
+        
+        stale = set(self.indicator_state.stale_tickers(universe))
+        recent = [t for t in universe if t not in stale]
+        if stale:
+            logger.info(f"지표 상태 웜업: {len(stale)}개 종목")
+            self.indicator_state.ingest_panel(await download_universe_panel(sorted(stale), period="2mo"))
+        if recent:
+            self.indicator_state.ingest_panel(await download_universe_panel(recent, period="5d"))
+        
+        indicators = self.indicator_state.indicators(universe)
+        return await self._candidates_from_indicators(universe, indicators, errors)
+    
+    async def _candidates_from_panel(self, panel: UniversePanel, errors: List[str]) -> List[ScreenerCandidate]:
+        indicators = compute_indicators(panel)
+        return await self._candidates_from_indicators(panel.tickers, indicators, errors)
+    
+    async def _candidates_from_indicators(
+        self,
+        tickers: List[str],
+        indicators: Dict[str, np.ndarray],
+        errors: List[str],
+    ) -> List[ScreenerCandidate]:
+        scores = score_indicators(indicators, self.volume_filter, self.volatility_filter, self.momentum_filter)
+        
+        invalid = int((~indicators["valid"]).sum())
+        if invalid:
+            errors.append(f"{invalid} tickers skipped: 데이터 부족/상장폐지 가능성")
+        
+        partial_score = (
+            scores["volume_score"] * self.weights["volume"] +
+            scores["volatility_score"] * self.weights["volatility"] +
+            scores["momentum_score"] * self.weights["momentum"]
         )
+        passed_any = scores["volume_passed"] | scores["volatility_passed"] | scores["momentum_passed"]
         
-        self.last_scan_result = result
+        survivors = np.flatnonzero(passed_any)
+        survivors = survivors[np.argsort(-partial_score[survivors], kind="stable")][:self.options_top_k]
         
-        logger.info(f"스캔 완료: {len(top_candidates)}개 후보 선정 ({scan_duration:.1f}초)")
+        # 옵션 API는 생존 종목만 (동시 호출 수 제한)
+        semaphore = asyncio.Semaphore(self.options_concurrency)
         
-        return result
+        async def check_options(ticker: str):
+            async with semaphore:
+                return await self.options_filter.check(ticker)
+        
+        options_results = await asyncio.gather(
+            *(check_options(tickers[i]) for i in survivors), return_exceptions=True
+        )
+        
+        candidates: List[ScreenerCandidate] = []
+        for i, options_result in zip(survivors, options_results):
+            ticker = tickers[i]
+            if isinstance(options_result, Exception):
+                errors.append(f"{ticker}: {options_result}")
+                continue
+            
+            total_score = float(partial_score[i] + options_result.score * self.weights["options"])
+            if total_score < 20:
+                continue
+            
+            candidates.append(self._panel_candidate(ticker, i, total_score, indicators, scores, options_result))
+        
+        return candidates
+    
+    def _panel_candidate(self, ticker, i, total_score, indicators, scores, options_result) -> ScreenerCandidate:
+        """벡터 지표 → ScreenerCandidate (필터별 사유 문자열은 개별 필터와 동일)"""
+        volume_ratio = float(indicators["volume_ratio"][i])
+        breakout_ratio = float(indicators["breakout_ratio"][i])
+        price_change_pct = float(indicators["price_change_pct"][i])
+        return_5d = float(indicators["return_5d"][i])
+        rsi_14 = float(indicators["rsi_14"][i])
+        
+        reasons = []
+        if scores["volume_passed"][i]:
+            reasons.append(f"거래량 급등 감지 ({volume_ratio:.1f}x)")
+        if scores["volatility_passed"][i]:
+            reasons.append(f"변동성 돌파 감지 ({breakout_ratio:.1f}x ATR, {price_change_pct:+.1f}%)")
+        if scores["momentum_passed"][i]:
+            reasons.append(f"강한 모멘텀 감지 (5일 {return_5d:+.1f}%, RSI {rsi_14:.0f})")
+        if options_result.passed:
+            reasons.append(options_result.reason)
+        
+        return ScreenerCandidate(
+            ticker=ticker,
+            score=total_score,
+            volume_score=float(scores["volume_score"][i]),
+            volatility_score=float(scores["volatility_score"][i]),
+            momentum_score=float(scores["momentum_score"][i]),
+            options_score=options_result.score,
+            volume_ratio=volume_ratio,
+            price_change_pct=price_change_pct,
+            sector=get_sector(ticker),
+            reasons=reasons,
+            filter_details={
+                "volume": {
+                    "current": int(indicators["current_volume"][i]),
+                    "avg_20d": float(indicators["avg_volume_20d"][i]),
+                    "ratio": volume_ratio,
+                },
+                "volatility": {
+                    "atr_14": float(indicators["atr_14"][i]),
+                    "breakout": bool(scores["breakout_detected"][i]),
+                },
+                "momentum": {
+                    "return_5d": return_5d,
+                    "return_20d": float(indicators["return_20d"][i]),
+                    "rsi_14": rsi_14,
+                    "signal": str(scores["momentum_signal"][i]),
+                },
+                "options": {
+                    "put_call_ratio": options_result.put_call_ratio,
+                    "unusual_volume": options_result.unusual_volume,
+                    "sentiment": options_result.options_sentiment,
+                    "whale_activity": options_result.whale_activity,
+                },
+            },
+        )
     
     async def _analyze_ticker(self, ticker: str) -> Optional[ScreenerCandidate]:
         """
@@ -4,6 +4,7 @@ Screener Scheduler
 매일 정해진 시간에 Dynamic Screener 실행
 - Pre-Market: 08:00 EST (종목 선정)
 - Mid-Day: 12:00 EST (재스캔)
+- Intraday (선택): intraday_interval_minutes 간격 재스캔 (증분 지표 상태 사용)
 """
 
 import asyncio
@@ -15,6 +16,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import pytz
 
+from .indicator_state import get_indicator_state
 from .scanner import DynamicScreener, ScanResult, ScreenerCandidate
 
 logger = logging.getLogger(__name__)
@@ -39,10 +41,12 @@ class ScreenerScheduler:
         screener: DynamicScreener = None,
         on_scan_complete: Callable[[ScanResult], Awaitable[None]] = None,
         redis_client=None,
+        intraday_interval_minutes: Optional[int] = None,
     ):
-        self.screener = screener or DynamicScreener()
+        self.screener = screener or DynamicScreener(indicator_state=get_indicator_state())
         self.on_scan_complete = on_scan_complete
         self.redis_client = redis_client
+        self.intraday_interval_minutes = intraday_interval_minutes
         
         self.scheduler = AsyncIOScheduler(timezone=EST)
         self.is_running = False
@@ -74,12 +78,23 @@ class ScreenerScheduler:
             kwargs={"scan_type": "midday"},
         )
         
+        # Intraday 재스캔 (증분 상태: 종목당 최근 봉만 반영)
+        if self.intraday_interval_minutes:
+            self.scheduler.add_job(
+                self._run_intraday_scan,
+                IntervalTrigger(minutes=self.intraday_interval_minutes),
+                id="intraday_scan",
+                name="Intraday Scan",
+            )
+        
         self.scheduler.start()
         self.is_running = True
         
         logger.info("스캐너 스케줄러 시작됨")
         logger.info("  - Pre-Market: 08:00 EST (월-금)")
         logger.info("  - Mid-Day: 12:00 EST (월-금)")
+        if self.intraday_interval_minutes:
+            logger.info(f"  - Intraday: {self.intraday_interval_minutes}분 간격 (장중)")
     
     def stop(self):
         """스케줄러 중지"""
@@ -90,19 +105,31 @@ class ScreenerScheduler:
         self.is_running = False
         logger.info("스캐너 스케줄러 중지됨")
     
-    async def _run_scan(self, scan_type: str = "manual"):
+    async def _run_intraday_scan(self):
+        """장중(09:30~16:00 EST, 월-금)에만 재스캔"""
+        now = datetime.now(EST)
+        if now.weekday() >= 5 or not (time(9, 30) <= now.time() <= time(16, 0)):
+            return None
+        return await self._run_scan(scan_type="intraday", force=True)
+    
+    async def _run_scan(self, scan_type: str = "manual", force: bool = False):
         """
         스캔 실행
         
         Args:
-            scan_type: premarket, midday, manual
+            scan_type: premarket, midday, intraday, manual
+            force: 스크리너 쿨다운 무시
         """
         logger.info(f"스캔 시작: {scan_type}")
         
         try:
-            result = await self.screener.scan()
+            result = await self.screener.scan(force=force)
             self.latest_results = result
             
+            # 증분 지표 상태 저장 (재시작 후 웜업 생략)
+            if self.screener.indicator_state is not None:
+                await asyncio.to_thread(self.screener.indicator_state.save)
+            
             logger.info(f"스캔 완료: {len(result.candidates)}개 후보 선정")
             
             # Redis에 캐싱
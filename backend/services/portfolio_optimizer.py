@@ -10,6 +10,14 @@ Modern Portfolio Theory implementation:
 - Minimum Variance Portfolio
 - Monte Carlo simulation
 - Risk Parity allocation
+
+Performance (2026-10-18):
+- Monte Carlo: random weights generated as a matrix, metrics computed in
+  chunked batches (no per-portfolio Python loop)
+- Efficient Frontier: SLSQP with analytic gradients, warm-started from the
+  previous frontier point
+- Optional Ledoit-Wolf covariance shrinkage (stable for many assets / short history)
+- Risk Parity: convex log-barrier formulation solved with L-BFGS-B
 """
 
 import logging
@@ -17,11 +25,48 @@ from typing import List, Dict, Tuple, Optional
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
-import yfinance as yf
 from datetime import datetime, timedelta
 
+try:
+    import yfinance as yf
+except ImportError:
+    yf = None
+
 logger = logging.getLogger(__name__)
 
+TRADING_DAYS = 252
+
+
+def ledoit_wolf_covariance(returns: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Ledoit-Wolf shrinkage of the sample covariance towards a scaled identity
+
+    Args:
+        returns: (T, N) array of asset returns
+
+    Returns:
+        (shrunk covariance, shrinkage intensity in [0, 1])
+    """
+    n_samples, n_features = returns.shape
+    X = returns - returns.mean(axis=0)
+
+    X2 = X ** 2
+    emp_cov_trace = X2.sum(axis=0) / n_samples
+    mu = emp_cov_trace.sum() / n_features
+
+    emp_cov = X.T @ X / n_samples
+    beta_ = float(np.sum(X2.T @ X2))
+    delta_ = float(np.sum(emp_cov ** 2))
+
+    beta = (beta_ / n_samples - delta_) / (n_features * n_samples)
+    delta = (delta_ - 2 * mu * emp_cov_trace.sum() + n_features * mu ** 2) / n_features
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta <= 0 or delta == 0 else beta / delta
+
+    shrunk = (1 - shrinkage) * emp_cov
+    shrunk.flat[::n_features + 1] += shrinkage * mu
+    return shrunk, shrinkage
+
 
 class PortfolioOptimizer:
     """
@@ -30,14 +75,27 @@ class PortfolioOptimizer:
     Implements various portfolio optimization strategies
     """
 
-    def __init__(self, risk_free_rate: float = 0.04):
+    def __init__(
+        self,
+        risk_free_rate: float = 0.04,
+        covariance_shrinkage: bool = False,
+        random_seed: Optional[int] = None,
+        covariance_service=None
+    ):
         """
         Initialize Portfolio Optimizer
 
         Args:
             risk_free_rate: Annual risk-free rate (default: 4%)
+            covariance_shrinkage: Use Ledoit-Wolf shrunk covariance instead of sample covariance
+            random_seed: Seed for Monte Carlo weight generation (None = random)
+            covariance_service: Shared EWMACovarianceService; when it covers all
+                assets, its EWMA covariance is used instead of re-estimating one
         """
         self.risk_free_rate = risk_free_rate
+        self.covariance_shrinkage = covariance_shrinkage
+        self.rng = np.random.default_rng(random_seed)
+        self.covariance_service = covariance_service
         self.logger = logger
 
     def fetch_price_data(
@@ -55,6 +113,10 @@ class PortfolioOptimizer:
         Returns:
             DataFrame with adjusted close prices or None
         """
+        if yf is None:
+            self.logger.error("yfinance not installed - cannot fetch price data")
+            return None
+
         try:
             raw_data = yf.download(symbols, period=period, progress=False)
 
@@ -90,6 +152,62 @@ class PortfolioOptimizer:
         self.logger.info(f"Calculated returns: {len(returns)} days")
         return returns
 
+    def estimate_moments(self, returns: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        Estimate mean returns and covariance matrix (daily)
+
+        Covariance source, in order: shared covariance service (if it covers
+        every asset), Ledoit-Wolf shrinkage (if enabled), sample covariance.
+
+        Args:
+            returns: DataFrame of asset returns
+
+        Returns:
+            (mean_returns, cov_matrix)
+        """
+        mean_returns = returns.mean()
+        symbols = list(returns.columns)
+
+        if self.covariance_service is not None and self.covariance_service.is_ready(symbols):
+            return mean_returns, self.covariance_service.get_covariance(symbols)
+
+        if not self.covariance_shrinkage:
+            return mean_returns, returns.cov()
+
+        cov, shrinkage = ledoit_wolf_covariance(returns.to_numpy(dtype=float))
+        self.logger.debug(f"Ledoit-Wolf shrinkage intensity: {shrinkage:.3f}")
+        return mean_returns, pd.DataFrame(cov, index=returns.columns, columns=returns.columns)
+
+    def batch_portfolio_metrics(
+        self,
+        weights: np.ndarray,
+        mean_returns: pd.Series,
+        cov_matrix: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate return, volatility and Sharpe for many portfolios at once
+
+        Args:
+            weights: (P, N) matrix, one portfolio per row
+            mean_returns: Mean returns for each asset
+            cov_matrix: Covariance matrix
+
+        Returns:
+            (annual_returns, annual_volatilities, sharpe_ratios), each of shape (P,)
+        """
+        weights = np.atleast_2d(weights)
+        mu = np.asarray(mean_returns, dtype=float) * TRADING_DAYS
+        cov = np.asarray(cov_matrix, dtype=float) * TRADING_DAYS
+
+        rets = weights @ mu
+        variances = np.einsum("ij,ij->i", weights @ cov, weights)
+        vols = np.sqrt(np.maximum(variances, 0.0))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpes = np.where(vols > 0, (rets - self.risk_free_rate) / vols, 0.0)
+
+        return rets, vols, sharpes
+
     def calculate_portfolio_metrics(
         self,
         weights: np.ndarray,
@@ -154,47 +272,37 @@ class PortfolioOptimizer:
         Returns:
             Dict with optimal weights, return, volatility, sharpe
         """
-        num_assets = len(returns.columns)
-        mean_returns = returns.mean()
-        cov_matrix = returns.cov()
+        mean_returns, cov_matrix = self.estimate_moments(returns)
+        mu, cov = self._annualized(mean_returns, cov_matrix)
+        num_assets = len(mu)
 
-        # Objective: Negative Sharpe (for minimization)
+        # Objective: Negative Sharpe (for minimization), with analytic gradient
         def neg_sharpe(weights):
-            return -self.sharpe_ratio(weights, mean_returns, cov_matrix)
-
-        # Constraints: weights sum to 1
-        constraints = ({'type': 'eq', 'fun': lambda w: np.sum(w) - 1})
+            ret = weights @ mu
+            cov_w = cov @ weights
+            vol = np.sqrt(max(weights @ cov_w, 1e-18))
+            excess = ret - self.risk_free_rate
+            grad = -(mu / vol - excess * cov_w / vol ** 3)
+            return -excess / vol, grad
 
-        # Bounds: 0 <= weight <= 1 (no short selling)
-        bounds = tuple((0, 1) for _ in range(num_assets))
-
-        # Initial guess: equal weights
-        init_guess = np.array([1/num_assets] * num_assets)
-
-        # Optimize
         result = minimize(
             neg_sharpe,
-            init_guess,
+            np.full(num_assets, 1.0 / num_assets),
             method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
+            jac=True,
+            bounds=self._long_only_bounds(num_assets),
+            constraints=self._budget_constraint()
         )
 
         if not result.success:
             self.logger.warning(f"Optimization did not converge: {result.message}")
 
-        optimal_weights = result.x
-        ret, vol = self.calculate_portfolio_metrics(optimal_weights, mean_returns, cov_matrix)
-        sharpe = self.sharpe_ratio(optimal_weights, mean_returns, cov_matrix)
-
-        self.logger.info(f"✅ Max Sharpe: {sharpe:.2f} (Return: {ret*100:.1f}%, Vol: {vol*100:.1f}%)")
-
-        return {
-            "weights": {symbol: float(w) for symbol, w in zip(returns.columns, optimal_weights)},
-            "annual_return": float(ret),
-            "annual_volatility": float(vol),
-            "sharpe_ratio": float(sharpe)
-        }
+        optimal = self._summarize(returns.columns, self._clean_weights(result.x), mean_returns, cov_matrix)
+        self.logger.info(
+            f"✅ Max Sharpe: {optimal['sharpe_ratio']:.2f} "
+            f"(Return: {optimal['annual_return']*100:.1f}%, Vol: {optimal['annual_volatility']*100:.1f}%)"
+        )
+        return optimal
 
     def optimize_min_variance(
         self,
@@ -209,38 +317,15 @@ class PortfolioOptimizer:
         Returns:
             Dict with optimal weights, return, volatility
         """
-        num_assets = len(returns.columns)
-        mean_returns = returns.mean()
-        cov_matrix = returns.cov()
-
-        # Objective: Portfolio variance
-        def portfolio_variance(weights):
-            return np.dot(weights.T, np.dot(cov_matrix, weights))
-
-        constraints = ({'type': 'eq', 'fun': lambda w: np.sum(w) - 1})
-        bounds = tuple((0, 1) for _ in range(num_assets))
-        init_guess = np.array([1/num_assets] * num_assets)
+        mean_returns, cov_matrix = self.estimate_moments(returns)
+        weights = self._min_variance_weights(*self._annualized(mean_returns, cov_matrix))
 
-        result = minimize(
-            portfolio_variance,
-            init_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
+        optimal = self._summarize(returns.columns, weights, mean_returns, cov_matrix)
+        self.logger.info(
+            f"✅ Min Variance: Vol: {optimal['annual_volatility']*100:.1f}% "
+            f"(Return: {optimal['annual_return']*100:.1f}%, Sharpe: {optimal['sharpe_ratio']:.2f})"
         )
-
-        optimal_weights = result.x
-        ret, vol = self.calculate_portfolio_metrics(optimal_weights, mean_returns, cov_matrix)
-        sharpe = self.sharpe_ratio(optimal_weights, mean_returns, cov_matrix)
-
-        self.logger.info(f"✅ Min Variance: Vol: {vol*100:.1f}% (Return: {ret*100:.1f}%, Sharpe: {sharpe:.2f})")
-
-        return {
-            "weights": {symbol: float(w) for symbol, w in zip(returns.columns, optimal_weights)},
-            "annual_return": float(ret),
-            "annual_volatility": float(vol),
-            "sharpe_ratio": float(sharpe)
-        }
+        return optimal
 
     def efficient_frontier(
         self,
@@ -250,6 +335,9 @@ class PortfolioOptimizer:
         """
         Calculate Efficient Frontier
 
+        Target returns are solved in increasing order, each warm-started from
+        the previous point's weights (neighbouring solutions are close).
+
         Args:
             returns: DataFrame of asset returns
             num_points: Number of points on frontier
@@ -257,58 +345,63 @@ class PortfolioOptimizer:
         Returns:
             DataFrame with columns [return, volatility, sharpe, weights]
         """
-        num_assets = len(returns.columns)
-        mean_returns = returns.mean()
-        cov_matrix = returns.cov()
-
         # Get min and max returns
         min_var_portfolio = self.optimize_min_variance(returns)
         max_sharpe_portfolio = self.optimize_sharpe_ratio(returns)
 
+        mean_returns, cov_matrix = self.estimate_moments(returns)
+        mu, cov = self._annualized(mean_returns, cov_matrix)
+        num_assets = len(mu)
+
         min_return = min_var_portfolio['annual_return']
         max_return = max_sharpe_portfolio['annual_return']
 
         # Target returns across the frontier
         target_returns = np.linspace(min_return, max_return, num_points)
 
-        frontier_points = []
+        def portfolio_variance(weights):
+            cov_w = cov @ weights
+            return weights @ cov_w, 2 * cov_w
 
-        for target_ret in target_returns:
-            # Objective: minimize variance
-            def portfolio_variance(weights):
-                return np.dot(weights.T, np.dot(cov_matrix, weights))
+        bounds = self._long_only_bounds(num_assets)
+        ones = np.ones(num_assets)
+        weights = np.array(list(min_var_portfolio['weights'].values()))
+        frontier_weights = []
 
+        for target_ret in target_returns:
             # Constraints: weights sum to 1, target return met
             constraints = (
-                {'type': 'eq', 'fun': lambda w: np.sum(w) - 1},
-                {'type': 'eq', 'fun': lambda w: np.sum(w * mean_returns) * 252 - target_ret}
+                {'type': 'eq', 'fun': lambda w: w.sum() - 1, 'jac': lambda w: ones},
+                {'type': 'eq', 'fun': lambda w, t=target_ret: w @ mu - t, 'jac': lambda w: mu},
             )
 
-            bounds = tuple((0, 1) for _ in range(num_assets))
-            init_guess = np.array([1/num_assets] * num_assets)
-
             result = minimize(
                 portfolio_variance,
-                init_guess,
+                weights,
                 method='SLSQP',
+                jac=True,
                 bounds=bounds,
                 constraints=constraints,
                 options={'disp': False}
             )
 
             if result.success:
-                weights = result.x
-                ret, vol = self.calculate_portfolio_metrics(weights, mean_returns, cov_matrix)
-                sharpe = self.sharpe_ratio(weights, mean_returns, cov_matrix)
-
-                frontier_points.append({
-                    'return': ret,
-                    'volatility': vol,
-                    'sharpe': sharpe,
-                    'weights': weights.tolist()
-                })
-
-        frontier_df = pd.DataFrame(frontier_points)
+                weights = self._clean_weights(result.x)
+                frontier_weights.append(weights)
+
+        if not frontier_weights:
+            self.logger.warning("Efficient Frontier: no frontier point converged")
+            return pd.DataFrame(columns=['return', 'volatility', 'sharpe', 'weights'])
+
+        weight_matrix = np.vstack(frontier_weights)
+        rets, vols, sharpes = self.batch_portfolio_metrics(weight_matrix, mean_returns, cov_matrix)
+
+        frontier_df = pd.DataFrame({
+            'return': rets,
+            'volatility': vols,
+            'sharpe': sharpes,
+            'weights': weight_matrix.tolist()
+        })
         self.logger.info(f"✅ Calculated Efficient Frontier ({len(frontier_df)} points)")
 
         return frontier_df
@@ -316,38 +409,51 @@ class PortfolioOptimizer:
     def monte_carlo_simulation(
         self,
         returns: pd.DataFrame,
-        num_simulations: int = 10000
+        num_simulations: int = 10000,
+        include_weights: bool = True,
+        chunk_size: int = 20000
     ) -> pd.DataFrame:
         """
         Monte Carlo simulation for random portfolios
 
+        Weights are drawn as a (chunk_size, N) matrix per batch, so memory stays
+        bounded for large universes (500 assets x 100k portfolios).
+
         Args:
             returns: DataFrame of asset returns
             num_simulations: Number of random portfolios
+            include_weights: Include per-portfolio weights column (disable for large runs)
+            chunk_size: Portfolios evaluated per batch
 
         Returns:
             DataFrame with columns [return, volatility, sharpe, weights]
         """
         num_assets = len(returns.columns)
-        mean_returns = returns.mean()
-        cov_matrix = returns.cov()
+        mean_returns, cov_matrix = self.estimate_moments(returns)
 
-        results = []
+        ret_chunks, vol_chunks, sharpe_chunks, weight_chunks = [], [], [], []
 
-        for _ in range(num_simulations):
-            # Random weights
-            weights = np.random.random(num_assets)
-            weights /= np.sum(weights)  # Normalize to sum=1
+        for start in range(0, num_simulations, chunk_size):
+            size = min(chunk_size, num_simulations - start)
 
-            ret, vol = self.calculate_portfolio_metrics(weights, mean_returns, cov_matrix)
-            sharpe = self.sharpe_ratio(weights, mean_returns, cov_matrix)
+            # Random weights, normalized to sum=1
+            weights = self.rng.random((size, num_assets))
+            weights /= weights.sum(axis=1, keepdims=True)
 
-            results.append({
-                'return': ret,
-                'volatility': vol,
-                'sharpe': sharpe,
-                'weights': weights.tolist()
-            })
+            rets, vols, sharpes = self.batch_portfolio_metrics(weights, mean_returns, cov_matrix)
+            ret_chunks.append(rets)
+            vol_chunks.append(vols)
+            sharpe_chunks.append(sharpes)
+            if include_weights:
+                weight_chunks.extend(weights.tolist())
+
+        results = {
+            'return': np.concatenate(ret_chunks) if ret_chunks else np.empty(0),
+            'volatility': np.concatenate(vol_chunks) if vol_chunks else np.empty(0),
+            'sharpe': np.concatenate(sharpe_chunks) if sharpe_chunks else np.empty(0),
+        }
+        if include_weights:
+            results['weights'] = weight_chunks
 
         results_df = pd.DataFrame(results)
         self.logger.info(f"✅ Monte Carlo: {num_simulations} random portfolios")
@@ -361,56 +467,102 @@ class PortfolioOptimizer:
         """
         Risk Parity allocation (equal risk contribution)
 
+        Solves the convex problem  min 0.5 y'Σy - (1/N) Σ log(y_i),  y > 0
+        whose normalized solution w = y / Σy has equal risk contributions.
+
         Args:
             returns: DataFrame of asset returns
 
         Returns:
             Dict with weights, return, volatility
         """
-        num_assets = len(returns.columns)
-        mean_returns = returns.mean()
-        cov_matrix = returns.cov()
+        mean_returns, cov_matrix = self.estimate_moments(returns)
+        _, cov = self._annualized(mean_returns, cov_matrix)
+        num_assets = len(cov)
+        budget = np.full(num_assets, 1.0 / num_assets)
+
+        def objective(y):
+            cov_y = cov @ y
+            return 0.5 * y @ cov_y - budget @ np.log(y), cov_y - budget / y
+
+        init_guess = budget / np.sqrt(np.diag(cov))
+        result = minimize(
+            objective,
+            init_guess,
+            method='L-BFGS-B',
+            jac=True,
+            bounds=[(1e-12, None)] * num_assets
+        )
 
-        # Objective: minimize difference between risk contributions
-        def risk_parity_objective(weights):
-            portfolio_variance = np.dot(weights.T, np.dot(cov_matrix, weights))
-            portfolio_vol = np.sqrt(portfolio_variance)
+        if not result.success:
+            self.logger.warning(f"Risk parity did not converge: {result.message}")
 
-            # Marginal contribution to risk
-            marginal_contrib = np.dot(cov_matrix, weights) / portfolio_vol
+        optimal_weights = result.x / result.x.sum()
+        optimal = self._summarize(returns.columns, optimal_weights, mean_returns, cov_matrix)
+        self.logger.info(
+            f"✅ Risk Parity: Vol: {optimal['annual_volatility']*100:.1f}% "
+            f"(Return: {optimal['annual_return']*100:.1f}%, Sharpe: {optimal['sharpe_ratio']:.2f})"
+        )
+        return optimal
 
-            # Risk contribution of each asset
-            risk_contrib = weights * marginal_contrib
+    # ================================================================
+    # Private helpers
+    # ================================================================
 
-            # Target: equal risk contribution
-            target_risk = portfolio_vol / num_assets
+    @staticmethod
+    def _annualized(mean_returns: pd.Series, cov_matrix: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        return (
+            np.asarray(mean_returns, dtype=float) * TRADING_DAYS,
+            np.asarray(cov_matrix, dtype=float) * TRADING_DAYS,
+        )
 
-            # Minimize sum of squared differences
-            return np.sum((risk_contrib - target_risk) ** 2)
+    @staticmethod
+    def _long_only_bounds(num_assets: int) -> Tuple[Tuple[float, float], ...]:
+        # Bounds: 0 <= weight <= 1 (no short selling)
+        return tuple((0.0, 1.0) for _ in range(num_assets))
 
-        constraints = ({'type': 'eq', 'fun': lambda w: np.sum(w) - 1})
-        bounds = tuple((0, 1) for _ in range(num_assets))
-        init_guess = np.array([1/num_assets] * num_assets)
+    @staticmethod
+    def _budget_constraint() -> Dict:
+        # Constraint: weights sum to 1
+        return {'type': 'eq', 'fun': lambda w: np.sum(w) - 1, 'jac': lambda w: np.ones_like(w)}
+
+    @staticmethod
+    def _clean_weights(weights: np.ndarray) -> np.ndarray:
+        """Clip solver noise (tiny negatives) and renormalize"""
+        weights = np.clip(weights, 0.0, None)
+        total = weights.sum()
+        return weights / total if total > 0 else weights
+
+    def _min_variance_weights(self, mu: np.ndarray, cov: np.ndarray) -> np.ndarray:
+        num_assets = len(mu)
+
+        def portfolio_variance(weights):
+            cov_w = cov @ weights
+            return weights @ cov_w, 2 * cov_w
 
         result = minimize(
-            risk_parity_objective,
-            init_guess,
+            portfolio_variance,
+            np.full(num_assets, 1.0 / num_assets),
             method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
+            jac=True,
+            bounds=self._long_only_bounds(num_assets),
+            constraints=self._budget_constraint()
         )
+        return self._clean_weights(result.x)
 
-        optimal_weights = result.x
-        ret, vol = self.calculate_portfolio_metrics(optimal_weights, mean_returns, cov_matrix)
-        sharpe = self.sharpe_ratio(optimal_weights, mean_returns, cov_matrix)
-
-        self.logger.info(f"✅ Risk Parity: Vol: {vol*100:.1f}% (Return: {ret*100:.1f}%, Sharpe: {sharpe:.2f})")
-
+    def _summarize(
+        self,
+        symbols,
+        weights: np.ndarray,
+        mean_returns: pd.Series,
+        cov_matrix: pd.DataFrame
+    ) -> Dict:
+        rets, vols, sharpes = self.batch_portfolio_metrics(weights, mean_returns, cov_matrix)
         return {
-            "weights": {symbol: float(w) for symbol, w in zip(returns.columns, optimal_weights)},
-            "annual_return": float(ret),
-            "annual_volatility": float(vol),
-            "sharpe_ratio": float(sharpe)
+            "weights": {symbol: float(w) for symbol, w in zip(symbols, weights)},
+            "annual_return": float(rets[0]),
+            "annual_volatility": float(vols[0]),
+            "sharpe_ratio": float(sharpes[0])
         }
 
 
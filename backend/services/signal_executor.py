@@ -22,6 +22,18 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# 신호에 손절 비율이 없을 때 사용 (StopLossMonitor 기본 -10% 손절로 보호)
+DEFAULT_STOP_LOSS_PCT = 0.10
+
+
+def _row_value(row: Any, *names: str) -> Any:
+    """KIS 응답 행(dict 또는 속성 객체)에서 첫 번째로 값이 있는 필드"""
+    for name in names:
+        value = row.get(name) if isinstance(row, dict) else getattr(row, name, None)
+        if value not in (None, ""):
+            return value
+    return None
+
 
 class OrderStatus(Enum):
     """주문 상태"""
@@ -83,7 +95,8 @@ class SignalExecutor:
         use_paper_trading: bool = True,
         max_retries: int = 3,
         enable_auto_execute: bool = False,
-        db_session: Optional[Any] = None
+        db_session: Optional[Any] = None,
+        pre_trade_risk: Optional[Any] = None,
     ):
         """
         Args:
@@ -91,6 +104,7 @@ class SignalExecutor:
             max_retries: 실패 시 재시도 횟수
             enable_auto_execute: 자동 실행 활성화 (신호의 auto_execute=True 일 때만)
             db_session: DB 세션 (OrderManager 사용 시 필수)
+            pre_trade_risk: PreTradeRiskEngine (기본: 공유 엔진)
         """
         self.use_paper_trading = use_paper_trading
         self.max_retries = max_retries
@@ -101,7 +115,14 @@ class SignalExecutor:
         self._order_manager = None
         if db_session:
             from backend.execution.order_manager import OrderManager
-            self._order_manager = OrderManager(db_session)
+            from backend.execution.transition_log import get_transition_log
+            self._order_manager = OrderManager(db_session, transition_log=get_transition_log())
+
+        # Pre-Trade 리스크 검증 (Hard Rules / Kill Switch / 섹터 한도)
+        if pre_trade_risk is None:
+            from backend.execution.pre_trade_risk import get_pre_trade_risk_engine
+            pre_trade_risk = get_pre_trade_risk_engine()
+        self.pre_trade_risk = pre_trade_risk
 
         # KIS Client (lazy loading)
         self._kis_client = None
@@ -314,6 +335,7 @@ class SignalExecutor:
         action = signal["action"]
         position_size = signal["position_size"]
         strategy_id = signal.get("strategy_id")
+        risk_approved = False
 
         try:
             # 0. Safety Guard (Pre-check)
@@ -330,8 +352,9 @@ class SignalExecutor:
                     error="PRICE_FETCH_FAILED"
                 )
 
-            # 2. 계좌 잔고 조회
-            balance = await self._get_account_balance(kis)
+            # 2. 계좌 잔고 / 보유 종목 조회
+            account = await self._get_account_snapshot(kis)
+            balance = account["available_cash"] if account else None
             if not balance:
                 return ExecutionResult(
                     success=False,
@@ -392,6 +415,7 @@ class SignalExecutor:
             
             if not is_safe:
                 logger.warning(f"Safety Guard rejected order for {ticker}: {reason}")
+                self._reject_db_order(db_order, f"Safety Guard Rejection: {reason}")
                 return ExecutionResult(
                     success=False,
                     status=OrderStatus.REJECTED,
@@ -399,6 +423,29 @@ class SignalExecutor:
                     error="SAFETY_GUARD_REJECTION"
                 )
 
+            # 3.6 Pre-Trade 리스크 검증 (누적 노출 / 블랙리스트 / 일일 한도)
+            # 브로커 보유 종목으로 장부 재구성 → 집중도/종목 수/섹터/총 노출이 실제 포트폴리오 기준
+            self._sync_pre_trade_risk(account)
+            risk_check = self.pre_trade_risk.validate({
+                "symbol": ticker,
+                "action": action.lower(),
+                "quantity": quantity,
+                "price": current_price,
+                "stop_loss_pct": signal.get("stop_loss_pct", DEFAULT_STOP_LOSS_PCT),
+            })
+
+            if not risk_check["can_execute"]:
+                reason = "; ".join(risk_check["violations"])
+                logger.warning(f"Pre-trade risk rejected order for {ticker}: {reason}")
+                self._reject_db_order(db_order, f"Pre-Trade Risk Rejection: {reason}")
+                return ExecutionResult(
+                    success=False,
+                    status=OrderStatus.REJECTED,
+                    message=f"Pre-Trade Risk Rejection: {reason}",
+                    error="PRE_TRADE_RISK_REJECTION"
+                )
+            risk_approved = True
+
             # 4. 주문 실행
             execution_type = signal.get("execution_type", "LIMIT")
 
@@ -422,6 +469,10 @@ class SignalExecutor:
                 # DB Update: SENT -> SUBMITTED
                 if db_order and self._order_manager:
                      self._order_manager.order_sent(db_order, order_result.get("order_id", "mock_id"))
+                     self._order_manager.flush()
+
+                # 리스크 엔진 노출 반영 (제출 시점 기준, 보수적)
+                self.pre_trade_risk.record_fill(ticker, action.lower(), quantity, current_price)
 
                 # 통계 업데이트
                 self.stats["total_volume"] += quantity * current_price
@@ -434,9 +485,14 @@ class SignalExecutor:
                     kis_response=order_result
                 )
             else:
+                # 재시도가 중복 주문으로 거부되지 않도록 승인 이력 해제
+                self.pre_trade_risk.release_order(ticker, action, quantity)
+                risk_approved = False
+
                 # DB Update: Failed
                 if db_order and self._order_manager:
                     self._order_manager.order_failed(db_order, order_result.get("message", "Execution failed"))
+                    self._order_manager.flush()
 
                 return ExecutionResult(
                     success=False,
@@ -448,6 +504,8 @@ class SignalExecutor:
             
         except Exception as e:
             logger.error(f"Order execution error: {e}", exc_info=True)
+            if risk_approved:
+                self.pre_trade_risk.release_order(ticker, action, quantity)
             return ExecutionResult(
                 success=False,
                 status=OrderStatus.FAILED,
@@ -475,8 +533,14 @@ class SignalExecutor:
             logger.error(f"Failed to get current price: {e}")
             return None
 
-    async def _get_account_balance(self, kis) -> Optional[float]:
-        """계좌 잔고 조회"""
+    async def _get_account_snapshot(self, kis) -> Optional[Dict[str, Any]]:
+        """
+        계좌 잔고 + 보유 종목 조회 (get_balance 1회)
+
+        Returns:
+            {'available_cash': float, 'positions': [{'symbol', 'quantity', 'current_price'}]}
+            (PreTradeRiskEngine.sync 입력 형식), 실패 시 None
+        """
         try:
             # KIS API 호출
             response = await asyncio.to_thread(
@@ -485,9 +549,23 @@ class SignalExecutor:
 
             if response and response.isOK():
                 body = response.getBody()
-                # 예수금 (주문 가능 금액)
-                balance = float(body.output2[0].dnca_tot_amt)
-                return balance
+                positions = []
+                # 잔고상세 (국내 pdno/hldg_qty/prpr, 해외 ovrs_pdno/ovrs_cblc_qty/now_pric2)
+                for row in getattr(body, "output1", None) or []:
+                    symbol = _row_value(row, "ovrs_pdno", "pdno")
+                    quantity = float(_row_value(row, "ovrs_cblc_qty", "hldg_qty") or 0)
+                    if symbol and quantity > 0:
+                        positions.append({
+                            "symbol": symbol,
+                            "quantity": quantity,
+                            "current_price": float(_row_value(row, "now_pric2", "prpr") or 0),
+                        })
+
+                return {
+                    # 예수금 (주문 가능 금액)
+                    "available_cash": float(body.output2[0].dnca_tot_amt),
+                    "positions": positions,
+                }
 
             return None
 
@@ -495,6 +573,31 @@ class SignalExecutor:
             logger.error(f"Failed to get account balance: {e}")
             return None
 
+    def _sync_pre_trade_risk(self, account: Dict[str, Any]):
+        """브로커 스냅샷으로 리스크 엔진 상태 재구성 (기준 자본 / 일일 손익은 유지)"""
+        state = {
+            "available_cash": account["available_cash"],
+            "positions": account.get("positions", []),
+            "daily_pnl": self.pre_trade_risk.daily_pnl,
+        }
+        if self.pre_trade_risk.initial_capital:
+            state["initial_capital"] = self.pre_trade_risk.initial_capital
+        self.pre_trade_risk.sync(state)
+
+    def _reject_db_order(self, db_order, reason: str):
+        """리스크 거부된 DB 주문을 종료 상태로 전이 후 flush (SIGNAL_RECEIVED/VALIDATING → REJECTED, ORDER_PENDING → FAILED)"""
+        if not (db_order and self._order_manager):
+            return
+
+        from backend.execution.state_machine import OrderState
+
+        current = OrderState(db_order.status)
+        if self._order_manager.sm.can_transition(current, OrderState.REJECTED):
+            self._order_manager.transition(db_order, OrderState.REJECTED, reason=reason)
+        elif self._order_manager.sm.can_transition(current, OrderState.FAILED):
+            self._order_manager.order_failed(db_order, reason)
+        self._order_manager.flush()
+
     def _calculate_quantity(
         self,
         balance: float,
@@ -5,8 +5,8 @@ Phase E + Option 2 통합
 실시간으로 포지션을 모니터링하고 손절 조건 체크
 
 핵심 기능:
-1. 주기적으로 모든 포지션 체크 (1분 간격)
-2. 손절 조건 체크 (손실률, 변동성, 시간 등)
+1. 틱 기반 트리거 (on_tick / on_quotes) - 손절가 이탈 즉시 실행
+2. 폴링 fallback: 주기적으로 전체 시세를 병렬 조회해 같은 엔진으로 평가 (1분 간격)
 3. Consensus 투표 (1/3 승인으로 즉시 실행)
 4. Auto Trader로 Stop-loss 주문 전달
 
@@ -15,39 +15,34 @@ Phase E + Option 2 통합
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set
 
 from backend.data.position_tracker import PositionTracker, Position
 from backend.ai.consensus.consensus_engine import ConsensusEngine
 from backend.automation.auto_trader import AutoTrader
 from backend.schemas.base_schema import MarketContext, NewsFeatures, MarketSegment
+from backend.services.stop_loss_trigger_engine import (
+    StopLossCondition,
+    StopLossTriggerEngine,
+    now_ms,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class StopLossCondition:
-    """손절 조건"""
-    ticker: str
-    triggered: bool
-    reason: str
-    current_price: float
-    avg_entry_price: float
-    loss_pct: float
-    threshold_pct: float
-
-
 class StopLossMonitor:
     """
     Stop-Loss 실시간 모니터링 서비스
 
-    Background task로 실행되며, 주기적으로 포지션 체크
+    틱 스트림(KIS 웹소켓 등)이 있으면 on_tick()으로 즉시 평가하고,
+    start_monitoring()은 폴링 fallback으로 전체 시세 스냅샷을 주기적으로 평가
 
     Usage:
         monitor = StopLossMonitor(position_tracker, consensus_engine, auto_trader)
         asyncio.create_task(monitor.start_monitoring())
+        await monitor.on_tick("NVDA", 134.2)   # 틱 수신 시
     """
 
     def __init__(
@@ -58,7 +53,8 @@ class StopLossMonitor:
         kis_broker=None,
         stop_loss_threshold_pct: float = -10.0,
         check_interval_seconds: int = 60,
-        enable_auto_execute: bool = False
+        enable_auto_execute: bool = False,
+        position_sync_interval_seconds: float = 5.0
     ):
         """
         Initialize Stop-Loss Monitor
@@ -71,6 +67,7 @@ class StopLossMonitor:
             stop_loss_threshold_pct: 손절 기준 (-10.0 = -10%)
             check_interval_seconds: 체크 간격 (초)
             enable_auto_execute: 자동 실행 여부
+            position_sync_interval_seconds: 틱 경로 손절가 인덱스 재동기화 간격 (초)
         """
         self.position_tracker = position_tracker
         self.consensus_engine = consensus_engine
@@ -79,6 +76,7 @@ class StopLossMonitor:
         self.stop_loss_threshold_pct = stop_loss_threshold_pct
         self.check_interval_seconds = check_interval_seconds
         self.enable_auto_execute = enable_auto_execute
+        self.position_sync_interval_seconds = position_sync_interval_seconds
 
         # 모니터링 상태
         self.is_running = False
@@ -88,6 +86,13 @@ class StopLossMonitor:
         # 트리거 이력
         self.trigger_history: List[StopLossCondition] = []
 
+        # 틱 트리거 엔진 (티커 → 손절가 인덱스)
+        self.trigger_engine = StopLossTriggerEngine(stop_loss_threshold_pct)
+        self._execution_tasks: Set[asyncio.Task] = set()
+        self.last_trigger_latency_ms: Optional[float] = None
+        self._last_sync = 0.0
+        self.sync_positions()
+
         logger.info(
             f"StopLossMonitor initialized: threshold={stop_loss_threshold_pct}%, "
             f"interval={check_interval_seconds}s, auto_execute={enable_auto_execute}"
@@ -120,71 +125,91 @@ class StopLossMonitor:
         logger.info("Stopping Stop-Loss monitoring...")
         self.is_running = False
 
-    async def _check_all_positions(self):
-        """
-        모든 포지션 체크
-
-        Internal method - 주기적으로 호출됨
-        """
-        self.check_count += 1
-        positions = self.position_tracker.get_all_positions()
+    # ================================================================
+    # 틱 기반 트리거
+    # ================================================================
 
-        if not positions:
-            logger.debug("No positions to monitor")
-            return
+    def sync_positions(self):
+        """포지션 변경(신규/DCA/청산) 후 손절가 인덱스 갱신"""
+        self.trigger_engine.rebuild(self.position_tracker.get_all_positions())
+        self._last_sync = time.monotonic()
 
-        logger.info(f"[Check #{self.check_count}] Monitoring {len(positions)} positions...")
+    def _maybe_sync_positions(self):
+        """틱 경로 주기적 재동기화 (폴링 루프 없이 틱만 들어와도 신규/DCA/청산 반영)"""
+        if time.monotonic() - self._last_sync >= self.position_sync_interval_seconds:
+            self.sync_positions()
 
-        for position in positions:
-            try:
-                await self._check_position(position)
-            except Exception as e:
-                logger.error(f"Error checking position {position.ticker}: {e}")
+    async def on_tick(self, ticker: str, price: float) -> Optional[StopLossCondition]:
+        """
+        체결 틱 평가 (KIS 웹소켓 등 틱 소스에서 호출)
 
-    async def _check_position(self, position: Position):
+        손절가 이탈 시 _execute_stop_loss를 별도 task로 즉시 실행하고 반환
         """
-        개별 포지션 체크
+        received_ms = now_ms()
+        self._maybe_sync_positions()
+        condition = self.trigger_engine.evaluate(ticker, price)
+        if condition is not None:
+            self._fire(condition, received_ms)
+        return condition
+
+    async def on_quotes(self, quotes: Dict[str, float]) -> List[StopLossCondition]:
+        """일괄 시세 스냅샷 평가"""
+        received_ms = now_ms()
+        self._maybe_sync_positions()
+        conditions = self.trigger_engine.evaluate_snapshot(quotes)
+        for condition in conditions:
+            self._fire(condition, received_ms)
+        return conditions
+
+    async def wait_for_executions(self):
+        """진행 중인 손절 실행 완료 대기 (종료/테스트용)"""
+        if self._execution_tasks:
+            await asyncio.gather(*list(self._execution_tasks), return_exceptions=True)
+
+    def _fire(self, condition: StopLossCondition, received_ms: float):
+        position = self.trigger_engine.get_position(condition.ticker)
+
+        logger.warning(f"STOP-LOSS TRIGGERED: {condition.ticker} ({condition.reason})")
+        self.trigger_history.append(condition)
+        self.stop_loss_triggered_count += 1
+
+        task = asyncio.create_task(self._run_stop_loss(position, condition))
+        self._execution_tasks.add(task)
+        task.add_done_callback(self._execution_tasks.discard)
+
+        self.last_trigger_latency_ms = now_ms() - received_ms
+
+    # ================================================================
+    # 폴링 fallback
+    # ================================================================
 
-        Args:
-            position: Position 객체
+    async def _check_all_positions(self):
         """
-        ticker = position.ticker
+        모든 포지션 체크 (틱 스트림이 없을 때의 fallback)
 
-        # 1. 현재 가격 조회
-        current_price = await self._get_current_price(ticker)
+        Internal method - 주기적으로 호출됨. 시세를 병렬 조회한 뒤 on_quotes로 평가
+        """
+        self.check_count += 1
+        self.sync_positions()
+        tickers = self.trigger_engine.tickers
 
-        if current_price is None:
-            logger.warning(f"Cannot get price for {ticker}, skipping")
+        if not tickers:
+            logger.debug("No positions to monitor")
             return
 
-        # 2. 손실률 계산
-        loss_pct = ((current_price - position.avg_entry_price) / position.avg_entry_price) * 100
-
-        # 3. 손절 조건 체크
-        condition = StopLossCondition(
-            ticker=ticker,
-            triggered=False,
-            reason="",
-            current_price=current_price,
-            avg_entry_price=position.avg_entry_price,
-            loss_pct=loss_pct,
-            threshold_pct=self.stop_loss_threshold_pct
-        )
-
-        if loss_pct < self.stop_loss_threshold_pct:
-            condition.triggered = True
-            condition.reason = f"Loss {loss_pct:.2f}% exceeds threshold {self.stop_loss_threshold_pct}%"
+        logger.info(f"[Check #{self.check_count}] Monitoring {len(tickers)} positions...")
 
-            logger.warning(f"STOP-LOSS TRIGGERED: {ticker} ({condition.reason})")
+        quotes = await self._get_current_prices(tickers)
+        for ticker in tickers:
+            if ticker not in quotes:
+                logger.warning(f"Cannot get price for {ticker}, skipping")
 
-            self.trigger_history.append(condition)
-            self.stop_loss_triggered_count += 1
+        await self.on_quotes(quotes)
 
-            # 4. Consensus 투표 + 자동 실행
-            await self._execute_stop_loss(position, condition)
-
-        else:
-            logger.debug(f"{ticker}: P&L {loss_pct:+.2f}% (OK)")
+    async def _get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """여러 티커 시세 병렬 조회 (실패한 티커는 제외)"""
+        prices = await asyncio.gather(*(self._get_current_price(t) for t in tickers))
+        return {t: p for t, p in zip(tickers, prices) if p is not None}
 
     async def _get_current_price(self, ticker: str) -> Optional[float]:
         """
@@ -201,20 +226,34 @@ class StopLossMonitor:
             return None
 
         try:
-            price_info = self.broker.get_price(ticker)
+            # 동기 broker 호출 → 스레드에서 실행 (이벤트 루프 블로킹 방지)
+            price_info = await asyncio.to_thread(self.broker.get_price, ticker)
             return price_info.get("current_price") if price_info else None
 
         except Exception as e:
             logger.error(f"Error getting price for {ticker}: {e}")
             return None
 
-    async def _execute_stop_loss(self, position: Position, condition: StopLossCondition):
+    async def _run_stop_loss(self, position: Position, condition: StopLossCondition):
+        """손절 실행 후 매도가 확정되지 않았으면 re-arm (다음 이탈 틱에서 재시도)"""
+        executed = False
+        try:
+            executed = await self._execute_stop_loss(position, condition)
+        finally:
+            if not executed:
+                logger.warning(f"STOP-LOSS not executed for {condition.ticker}, re-arming")
+                self.trigger_engine.rearm(condition.ticker)
+
+    async def _execute_stop_loss(self, position: Position, condition: StopLossCondition) -> bool:
         """
         Stop-Loss 실행
 
         Args:
             position: Position 객체
             condition: 손절 조건
+
+        Returns:
+            매도 확정(또는 DRY-RUN 처리) 여부 - False면 호출자가 re-arm
         """
         ticker = position.ticker
 
@@ -262,18 +301,18 @@ class StopLossMonitor:
 
                 if not consensus_result.approved:
                     logger.info(f"Consensus REJECTED stop-loss for {ticker}")
-                    return
+                    return False
 
                 logger.warning(f"Consensus APPROVED stop-loss for {ticker}")
 
             except Exception as e:
                 logger.error(f"Consensus voting error: {e}")
-                return
+                return False
 
         else:
             logger.warning("No Consensus Engine, skipping vote (risky!)")
             # Consensus 없으면 자동 승인 안 함 (안전)
-            return
+            return False
 
         # 2. Auto Trader로 실행
         if self.auto_trader and self.enable_auto_execute:
@@ -288,14 +327,18 @@ class StopLossMonitor:
 
                 if exec_result.get("executed"):
                     logger.warning(f"STOP-LOSS EXECUTED: {ticker}")
-                else:
-                    logger.error(f"STOP-LOSS FAILED: {ticker} - {exec_result.get('error')}")
+                    return True
+
+                logger.error(f"STOP-LOSS FAILED: {ticker} - {exec_result.get('error')}")
+                return False
 
             except Exception as e:
                 logger.error(f"Stop-loss execution error: {e}")
+                return False
 
-        else:
-            logger.info(f"[DRY-RUN] Would execute STOP-LOSS for {ticker}")
+        # DRY-RUN은 처리 완료로 간주 (회복 전까지 틱마다 재발동하지 않음)
+        logger.info(f"[DRY-RUN] Would execute STOP-LOSS for {ticker}")
+        return True
 
     def get_monitoring_summary(self) -> Dict[str, Any]:
         """
@@ -311,6 +354,8 @@ class StopLossMonitor:
             "current_positions": len(self.position_tracker.get_all_positions()),
             "stop_loss_threshold_pct": self.stop_loss_threshold_pct,
             "check_interval_seconds": self.check_interval_seconds,
+            "trigger_engine": self.trigger_engine.get_stats(),
+            "last_trigger_latency_ms": self.last_trigger_latency_ms,
             "recent_triggers": [
                 {
                     "ticker": t.ticker,
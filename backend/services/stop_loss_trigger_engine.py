@@ -0,0 +1,180 @@
+"""
+Stop-Loss Trigger Engine - 틱 기반 손절 트리거
+
+핵심 원칙:
+- 포지션별 손절가를 미리 계산 (avg_entry_price × (1 + threshold%))
+- 티커 → 손절 엔트리 인덱스로 틱당 O(1) 평가 (dict 조회 + 비교 1회)
+- 트리거 후 disarm → 손절가 위로 회복한 틱이 오면 re-arm (틱마다 중복 발동 방지)
+- 틱 소스 무관: KIS 웹소켓 체결 틱, 일괄 시세 스냅샷, 폴링 결과 모두 evaluate()로 전달
+
+작성일: 2026-10-18
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class StopLossCondition:
+    """손절 조건"""
+    ticker: str
+    triggered: bool
+    reason: str
+    current_price: float
+    avg_entry_price: float
+    loss_pct: float
+    threshold_pct: float
+
+
+@dataclass
+class StopEntry:
+    """인덱스 엔트리 (포지션 + 사전 계산된 손절가)"""
+    position: Any
+    stop_price: float
+    armed: bool = True
+
+
+class StopLossTriggerEngine:
+    """
+    티커별 손절가 인덱스
+
+    사용법:
+        engine = StopLossTriggerEngine(threshold_pct=-10.0)
+        engine.rebuild(position_tracker.get_open_positions())
+        condition = engine.evaluate("NVDA", 134.2)
+        if condition:
+            ...  # 손절 실행
+    """
+
+    def __init__(self, threshold_pct: float = -10.0):
+        self.threshold_pct = threshold_pct
+        self._entries: Dict[str, StopEntry] = {}
+
+        # 통계
+        self.ticks_evaluated = 0
+        self.triggers = 0
+
+    # ================================================================
+    # 인덱스 관리
+    # ================================================================
+
+    def stop_price_for(self, avg_entry_price: float) -> float:
+        return avg_entry_price * (1 + self.threshold_pct / 100)
+
+    def rebuild(self, positions: Iterable[Any]):
+        """
+        포지션 목록으로 인덱스 재구성
+
+        손절가가 바뀌지 않은 포지션은 armed 상태를 유지합니다.
+        """
+        previous = self._entries
+        self._entries = {}
+        for position in positions:
+            entry = self._make_entry(position)
+            if entry is None:
+                continue
+            old = previous.get(position.ticker)
+            if old is not None and old.stop_price == entry.stop_price:
+                entry.armed = old.armed
+            self._entries[position.ticker] = entry
+
+    def upsert(self, position: Any):
+        """포지션 추가/변경 (DCA로 평균 단가 변경 시 손절가 재계산 + re-arm)"""
+        entry = self._make_entry(position)
+        if entry is None:
+            self._entries.pop(position.ticker, None)
+        else:
+            self._entries[position.ticker] = entry
+
+    def remove(self, ticker: str):
+        self._entries.pop(ticker, None)
+
+    def get_stop_price(self, ticker: str) -> Optional[float]:
+        entry = self._entries.get(ticker)
+        return entry.stop_price if entry else None
+
+    def rearm(self, ticker: str):
+        entry = self._entries.get(ticker)
+        if entry is not None:
+            entry.armed = True
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._entries)
+
+    # ================================================================
+    # 평가
+    # ================================================================
+
+    def evaluate(self, ticker: str, price: float) -> Optional[StopLossCondition]:
+        """
+        틱 평가 (O(1))
+
+        Returns:
+            손절가 이탈 시 StopLossCondition (이미 발동된 포지션은 None)
+        """
+        self.ticks_evaluated += 1
+        entry = self._entries.get(ticker)
+        if entry is None or price is None or price <= 0:
+            return None
+
+        if price >= entry.stop_price:
+            entry.armed = True
+            return None
+
+        if not entry.armed:
+            return None
+
+        entry.armed = False
+        self.triggers += 1
+
+        avg_entry_price = entry.position.avg_entry_price
+        loss_pct = (price - avg_entry_price) / avg_entry_price * 100
+        return StopLossCondition(
+            ticker=ticker,
+            triggered=True,
+            reason=f"Loss {loss_pct:.2f}% exceeds threshold {self.threshold_pct}%",
+            current_price=price,
+            avg_entry_price=avg_entry_price,
+            loss_pct=loss_pct,
+            threshold_pct=self.threshold_pct,
+        )
+
+    def evaluate_snapshot(self, quotes: Dict[str, float]) -> List[StopLossCondition]:
+        """일괄 시세 스냅샷 평가 (인덱스된 티커만)"""
+        conditions = []
+        for ticker, price in quotes.items():
+            condition = self.evaluate(ticker, price)
+            if condition is not None:
+                conditions.append(condition)
+        return conditions
+
+    def get_position(self, ticker: str) -> Optional[Any]:
+        entry = self._entries.get(ticker)
+        return entry.position if entry else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "indexed_positions": len(self._entries),
+            "armed_positions": sum(1 for e in self._entries.values() if e.armed),
+            "ticks_evaluated": self.ticks_evaluated,
+            "triggers": self.triggers,
+        }
+
+    # ================================================================
+    # Private 메서드
+    # ================================================================
+
+    def _make_entry(self, position: Any) -> Optional[StopEntry]:
+        status = getattr(position, "status", None)
+        if status is not None and getattr(status, "value", status) != "open":
+            return None
+        if not position.avg_entry_price or position.avg_entry_price <= 0:
+            return None
+        return StopEntry(position=position, stop_price=self.stop_price_for(position.avg_entry_price))
+
+
+def now_ms() -> float:
+    """트리거 지연 측정용 단조 시계 (ms)"""
+    return time.perf_counter() * 1000
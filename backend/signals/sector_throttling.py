@@ -6,6 +6,8 @@ Features:
 - Tracks signals per sector with time windows
 - Configurable limits per sector
 - Correlation-based risk detection
+- Time-bucketed sliding-window counters (O(1) admit checks)
+- Optional Redis-backed counters shared across worker processes
 
 This prevents scenarios where multiple news articles about the same topic
 (e.g., "Semiconductor subsidies") generate 10+ BUY signals for related stocks,
@@ -15,15 +17,25 @@ Author: AI Trading System
 Date: 2025-11-15
 """
 
+import json
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from abc import ABC, abstractmethod
 from collections import defaultdict
-from dataclasses import dataclass, field
-from enum import Enum
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 
 # ============================================================================
 # Configuration
@@ -48,6 +60,9 @@ class SectorThrottleConfig:
     # Sector correlation limits
     max_correlated_sectors_per_day: int = 5  # Limit highly correlated sector trades
     
+    # Per-ticker limit (None = disabled)
+    max_trades_per_ticker_per_hour: Optional[int] = None
+    
     # Emergency brake
     enable_emergency_brake: bool = True
     emergency_brake_threshold: float = 0.3  # 30% portfolio in one sector = stop
@@ -115,21 +130,306 @@ CORRELATED_SECTORS: Dict[str, List[str]] = {
 
 
 # ============================================================================
-# Signal Tracking
+# Time-Bucketed Window Counters
 # ============================================================================
 
-@dataclass
-class SignalRecord:
-    """Record of a generated signal"""
-    ticker: str
-    sector: str
-    action: str  # BUY, SELL
-    timestamp: datetime
-    confidence: float
-    news_source_id: Optional[int] = None
-    executed: bool = False
+HOURLY = "hourly"
+DAILY = "daily"
+WEEKLY = "weekly"  # Retention window for summaries (replaces 7-day cleanup)
+
+SECTOR_PREFIX = "sector:"
+TICKER_PREFIX = "ticker:"
+EXECUTED_PREFIX = "executed:"
+TOTAL_KEY = "total"
+
+
+def _sector_key(sector: str) -> str:
+    return f"{SECTOR_PREFIX}{sector}"
+
+
+def _ticker_key(ticker: str) -> str:
+    return f"{TICKER_PREFIX}{ticker.upper()}"
+
+
+def _executed_key(sector: str) -> str:
+    return f"{EXECUTED_PREFIX}{sector}"
+
+
+def build_windows(config: SectorThrottleConfig) -> Dict[str, Tuple[int, int]]:
+    """Window name → (window_seconds, bucket_count)"""
+    return {
+        HOURLY: (config.hourly_window_minutes * 60, config.hourly_window_minutes),
+        DAILY: (config.daily_window_hours * 3600, config.daily_window_hours * 4),
+        WEEKLY: (7 * 24 * 3600, 7 * 24),
+    }
+
+
+class WindowCounterStore(ABC):
+    """
+    Sliding-window counters in fixed time buckets.
+
+    Each (window, key) pair keeps ``bucket_count`` buckets of
+    ``window_seconds / bucket_count`` seconds. A count covers the current
+    bucket plus the previous ``bucket_count - 1`` buckets, so windows are
+    accurate to one bucket width.
+    """
+
+    def __init__(self, windows: Dict[str, Tuple[int, int]]):
+        self.windows = windows
+
+    def _bucket(self, window: str, now: float) -> int:
+        window_seconds, bucket_count = self.windows[window]
+        return int(now // (window_seconds / bucket_count))
+
+    @abstractmethod
+    def increment(self, keys: List[str], now: float):
+        """Record one event for every key in every window"""
+
+    @abstractmethod
+    def get_counts(self, queries: List[Tuple[str, str]], now: float) -> List[int]:
+        """Counts for (key, window) queries, in order"""
+
+    @abstractmethod
+    def try_increment(
+        self,
+        checks: List[Tuple[str, str, int]],
+        keys: List[str],
+        now: float,
+    ) -> Tuple[bool, List[int]]:
+        """
+        Atomically increment ``keys`` only if every (key, window) count is
+        below its limit. Returns (allowed, counts before increment).
+        """
+
+    @abstractmethod
+    def active_keys(self, prefix: str) -> List[str]:
+        """Counter keys seen so far that start with ``prefix``"""
+
+
+class InMemoryWindowCounter(WindowCounterStore):
+    """
+    Per-process window counters (ring of buckets + running total per key).
+
+    increment / count are O(1) amortized: expired buckets are subtracted
+    from the running total as the ring advances.
+    """
+
+    def __init__(self, windows: Dict[str, Tuple[int, int]]):
+        super().__init__(windows)
+        # (window, key) → [bucket_counts, bucket_ids, total, last_bucket]
+        self._rings: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _advance(self, window: str, key: str, bucket: int) -> List[Any]:
+        """Expire buckets that left the window; ring[3] becomes the current bucket"""
+        ring = self._rings.get((window, key))
+        bucket_count = self.windows[window][1]
+        if ring is None:
+            ring = [[0] * bucket_count, [bucket] * bucket_count, 0, bucket]
+            self._rings[(window, key)] = ring
+            return ring
+
+        counts, ids, _, last_bucket = ring
+        for b in range(max(last_bucket + 1, bucket - bucket_count + 1), bucket + 1):
+            slot = b % bucket_count
+            if ids[slot] != b:
+                ring[2] -= counts[slot]
+                counts[slot] = 0
+                ids[slot] = b
+        ring[3] = max(last_bucket, bucket)
+        return ring
+
+    def _increment_locked(self, keys: List[str], now: float):
+        for window, (_, bucket_count) in self.windows.items():
+            bucket = self._bucket(window, now)
+            for key in keys:
+                ring = self._advance(window, key, bucket)
+                ring[0][ring[3] % bucket_count] += 1
+                ring[2] += 1
+
+    def _count_locked(self, key: str, window: str, now: float) -> int:
+        if (window, key) not in self._rings:
+            return 0
+        return self._advance(window, key, self._bucket(window, now))[2]
+
+    def increment(self, keys: List[str], now: float):
+        with self._lock:
+            self._increment_locked(keys, now)
+
+    def get_counts(self, queries: List[Tuple[str, str]], now: float) -> List[int]:
+        with self._lock:
+            return [self._count_locked(key, window, now) for key, window in queries]
+
+    def try_increment(
+        self,
+        checks: List[Tuple[str, str, int]],
+        keys: List[str],
+        now: float,
+    ) -> Tuple[bool, List[int]]:
+        with self._lock:
+            counts = [self._count_locked(key, window, now) for key, window, _ in checks]
+            if any(count >= limit for count, (_, _, limit) in zip(counts, checks)):
+                return False, counts
+            self._increment_locked(keys, now)
+            return True, counts
+
+    def active_keys(self, prefix: str) -> List[str]:
+        with self._lock:
+            return sorted({key for window, key in self._rings if key.startswith(prefix)})
+
+
+# Atomic check-and-increment across workers (bucket keys expire on their own).
+# Every key is passed in KEYS (all share the {prefix} hash tag → one cluster slot):
+#   KEYS[1] = key set, then each check's bucket keys, then one key per increment
+#   ARGV[1] = [[bucket key count, limit], ...], ARGV[2] = [ttl per increment key],
+#   ARGV[3] = counter keys to add to the key set
+_REDIS_TRY_INCREMENT = """
+local checks = cjson.decode(ARGV[1])
+local ttls = cjson.decode(ARGV[2])
+local members = cjson.decode(ARGV[3])
+
+local idx = 2
+local counts = {}
+local allowed = 1
+for i, c in ipairs(checks) do
+  local total = 0
+  for _, v in ipairs(redis.call('MGET', unpack(KEYS, idx, idx + c[1] - 1))) do
+    if v then total = total + tonumber(v) end
+  end
+  idx = idx + c[1]
+  counts[i] = total
+  if total >= tonumber(c[2]) then allowed = 0 end
+end
+if allowed == 0 then
+  return {0, cjson.encode(counts)}
+end
+
+for i, ttl in ipairs(ttls) do
+  local bucket_key = KEYS[idx + i - 1]
+  redis.call('INCR', bucket_key)
+  redis.call('EXPIRE', bucket_key, ttl)
+end
+if #members > 0 then
+  redis.call('SADD', KEYS[1], unpack(members))
+end
+return {1, cjson.encode(counts)}
+"""
 
 
+class RedisWindowCounter(WindowCounterStore):
+    """
+    Redis-backed window counters shared by all worker processes.
+
+    Key Schema ({prefix} is a hash tag, so every key lives in one cluster slot):
+        {{prefix}}:{window}:{counter_key}:{bucket_id} → INCR counter (TTL = window + 1 bucket)
+        {{prefix}}:keys → SET of counter keys seen
+
+    Counts are one MGET per (key, window); try_increment runs as a Lua
+    script so check-and-record is atomic across workers.
+    """
+
+    def __init__(
+        self,
+        windows: Dict[str, Tuple[int, int]],
+        redis_client,
+        prefix: str = "throttle",
+    ):
+        super().__init__(windows)
+        self.redis = redis_client
+        self.prefix = prefix
+        self._tag = f"{{{prefix}}}"
+        self._keys_set = f"{self._tag}:keys"
+        self._try_increment_script = self.redis.register_script(_REDIS_TRY_INCREMENT)
+
+    def _bucket_keys(self, key: str, window: str, now: float) -> List[str]:
+        bucket = self._bucket(window, now)
+        bucket_count = self.windows[window][1]
+        return [f"{self._tag}:{window}:{key}:{bucket - i}" for i in range(bucket_count)]
+
+    def _increments(self, keys: List[str], now: float) -> List[Tuple[str, int]]:
+        """(current bucket key, TTL) for every key × window"""
+        return [
+            (
+                f"{self._tag}:{window}:{key}:{self._bucket(window, now)}",
+                int(window_seconds + window_seconds / bucket_count) + 1,
+            )
+            for key in keys
+            for window, (window_seconds, bucket_count) in self.windows.items()
+        ]
+
+    def increment(self, keys: List[str], now: float):
+        pipe = self.redis.pipeline(transaction=False)
+        for bucket_key, ttl in self._increments(keys, now):
+            pipe.incr(bucket_key)
+            pipe.expire(bucket_key, ttl)
+        if keys:
+            pipe.sadd(self._keys_set, *keys)
+        pipe.execute()
+
+    def get_counts(self, queries: List[Tuple[str, str]], now: float) -> List[int]:
+        if not queries:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        for key, window in queries:
+            pipe.mget(self._bucket_keys(key, window, now))
+        return [sum(int(v) for v in values if v) for values in pipe.execute()]
+
+    def try_increment(
+        self,
+        checks: List[Tuple[str, str, int]],
+        keys: List[str],
+        now: float,
+    ) -> Tuple[bool, List[int]]:
+        check_keys = [self._bucket_keys(key, window, now) for key, window, _ in checks]
+        increments = self._increments(keys, now)
+
+        allowed, counts = self._try_increment_script(
+            keys=[self._keys_set]
+            + [bucket_key for group in check_keys for bucket_key in group]
+            + [bucket_key for bucket_key, _ in increments],
+            args=[
+                json.dumps([[len(group), limit] for group, (_, _, limit) in zip(check_keys, checks)]),
+                json.dumps([ttl for _, ttl in increments]),
+                json.dumps(keys),
+            ],
+        )
+        counts = json.loads(counts)
+        # cjson encodes an empty table as an object
+        return bool(int(allowed)), counts if isinstance(counts, list) else []
+
+    def active_keys(self, prefix: str) -> List[str]:
+        members = self.redis.smembers(self._keys_set)
+        keys = (m.decode() if isinstance(m, bytes) else m for m in members)
+        return sorted(k for k in keys if k.startswith(prefix))
+
+
+def create_counter_store(
+    config: SectorThrottleConfig,
+    redis_url: Optional[str] = None,
+) -> WindowCounterStore:
+    """
+    Create a counter store: Redis when a URL is configured and reachable
+    (SECTOR_THROTTLE_REDIS_URL), otherwise per-process memory.
+    """
+    windows = build_windows(config)
+    redis_url = redis_url or os.getenv("SECTOR_THROTTLE_REDIS_URL")
+
+    if redis_url and REDIS_AVAILABLE:
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            client.ping()
+            logger.info(f"Sector throttling counters shared via Redis: {redis_url}")
+            return RedisWindowCounter(windows, client)
+        except Exception as e:
+            logger.warning(f"Redis unavailable for sector throttling ({e}). Using in-memory counters.")
+
+    return InMemoryWindowCounter(windows)
+
+
+# ============================================================================
+# Signal Tracking
+# ============================================================================
+
 @dataclass
 class ThrottleDecision:
     """Decision from throttle system"""
@@ -146,13 +446,22 @@ class ThrottleDecision:
 class SectorSignalTracker:
     """
     Tracks signal generation per sector with time-based windows.
+
+    Counts live in a WindowCounterStore (fixed time buckets with running
+    totals), so admit checks cost O(1) in the number of recorded signals.
+    Pass a RedisWindowCounter (or set SECTOR_THROTTLE_REDIS_URL) to share
+    the counters across API worker processes.
     """
     
-    def __init__(self, config: Optional[SectorThrottleConfig] = None):
+    def __init__(
+        self,
+        config: Optional[SectorThrottleConfig] = None,
+        counter_store: Optional["WindowCounterStore"] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ):
         self.config = config or SectorThrottleConfig()
-        
-        # Signal history
-        self._signals: List[SignalRecord] = []
+        self.counters = counter_store or create_counter_store(self.config)
+        self._clock = clock or time.time
         
         # Statistics
         self.stats = {
@@ -165,13 +474,34 @@ class SectorSignalTracker:
         logger.info(
             f"SectorSignalTracker initialized: "
             f"max {self.config.max_trades_per_sector_per_hour}/hour, "
-            f"{self.config.max_trades_per_sector_per_day}/day per sector"
+            f"{self.config.max_trades_per_sector_per_day}/day per sector "
+            f"({type(self.counters).__name__})"
         )
     
     def get_ticker_sector(self, ticker: str) -> str:
         """Get sector for a ticker"""
         return SECTOR_MAPPING.get(ticker.upper(), "UNKNOWN")
     
+    def _resolve_sector(self, ticker: str, sectors_from_news: Optional[List[str]]) -> str:
+        if sectors_from_news and len(sectors_from_news) > 0:
+            # Use sector from news analysis if available
+            return sectors_from_news[0].upper()
+        return self.get_ticker_sector(ticker)
+    
+    def _limit_checks(self, sector: str, ticker: str) -> List[Tuple[str, str, int]]:
+        """(counter key, window, limit) checks in priority order"""
+        checks = [
+            (_sector_key(sector), HOURLY, self.config.max_trades_per_sector_per_hour),
+            (_sector_key(sector), DAILY, self.config.max_trades_per_sector_per_day),
+            (TOTAL_KEY, HOURLY, self.config.max_total_trades_per_hour),
+            (TOTAL_KEY, DAILY, self.config.max_total_trades_per_day),
+        ]
+        if self.config.max_trades_per_ticker_per_hour:
+            checks.append(
+                (_ticker_key(ticker), HOURLY, self.config.max_trades_per_ticker_per_hour)
+            )
+        return checks
+    
     def can_generate_signal(
         self,
         ticker: str,
@@ -189,133 +519,100 @@ class SectorSignalTracker:
         Returns:
             ThrottleDecision with allow/deny and reason
         """
-        now = datetime.now()
-        
-        # 1. Determine sector
-        sector = self.get_ticker_sector(ticker)
-        if sectors_from_news and len(sectors_from_news) > 0:
-            # Use sector from news analysis if available
-            sector = sectors_from_news[0].upper()
-        
-        # 2. Count signals in time windows
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        daily_cutoff = now - timedelta(hours=self.config.daily_window_hours)
-        
-        hourly_sector_count = sum(
-            1 for s in self._signals
-            if s.sector == sector and s.timestamp >= hourly_cutoff
-        )
+        sector = self._resolve_sector(ticker, sectors_from_news)
+        checks = self._limit_checks(sector, ticker)
+        counts = self.counters.get_counts([(key, window) for key, window, _ in checks], self._clock())
         
-        daily_sector_count = sum(
-            1 for s in self._signals
-            if s.sector == sector and s.timestamp >= daily_cutoff
-        )
-        
-        hourly_total_count = sum(
-            1 for s in self._signals
-            if s.timestamp >= hourly_cutoff
-        )
+        return self._decide(sector, checks, counts)
+    
+    def admit_signal(
+        self,
+        ticker: str,
+        action: str,
+        confidence: float,
+        sectors_from_news: Optional[List[str]] = None,
+        executed: bool = False,
+    ) -> ThrottleDecision:
+        """
+        Atomically check limits and record the signal if allowed.
         
-        daily_total_count = sum(
-            1 for s in self._signals
-            if s.timestamp >= daily_cutoff
+        Unlike can_generate_signal() followed by record_signal(), two workers
+        racing for the last slot in a window cannot both be admitted.
+        """
+        sector = self._resolve_sector(ticker, sectors_from_news)
+        checks = self._limit_checks(sector, ticker)
+        allowed, counts = self.counters.try_increment(
+            checks, self._record_keys(sector, ticker, executed), self._clock()
         )
         
-        # 3. Check limits
-        
-        # Check hourly sector limit
-        if hourly_sector_count >= self.config.max_trades_per_sector_per_hour:
-            self.stats["throttled_signals"] += 1
-            self.stats["throttle_by_sector"][sector] += 1
-            return ThrottleDecision(
-                allowed=False,
-                reason=f"Sector hourly limit reached: {sector}",
-                sector=sector,
-                current_count_hourly=hourly_sector_count,
-                current_count_daily=daily_sector_count,
-                limit_hourly=self.config.max_trades_per_sector_per_hour,
-                limit_daily=self.config.max_trades_per_sector_per_day,
-                recommendation=f"Wait {self.config.hourly_window_minutes} minutes or diversify to other sectors",
-            )
-        
-        # Check daily sector limit
-        if daily_sector_count >= self.config.max_trades_per_sector_per_day:
-            self.stats["throttled_signals"] += 1
-            self.stats["throttle_by_sector"][sector] += 1
-            return ThrottleDecision(
-                allowed=False,
-                reason=f"Sector daily limit reached: {sector}",
-                sector=sector,
-                current_count_hourly=hourly_sector_count,
-                current_count_daily=daily_sector_count,
-                limit_hourly=self.config.max_trades_per_sector_per_hour,
-                limit_daily=self.config.max_trades_per_sector_per_day,
-                recommendation=f"Daily limit for {sector} reached. Resume tomorrow.",
-            )
+        decision = self._decide(sector, checks, counts)
+        if allowed:
+            self._count_recorded(ticker, action, sector, confidence, executed)
+        return decision
+    
+    def _decide(
+        self,
+        sector: str,
+        checks: List[Tuple[str, str, int]],
+        counts: List[int],
+    ) -> ThrottleDecision:
+        hourly_sector_count, daily_sector_count = counts[0], counts[1]
         
-        # Check total hourly limit
-        if hourly_total_count >= self.config.max_total_trades_per_hour:
-            self.stats["throttled_signals"] += 1
+        def decision(allowed: bool, reason: str, recommendation: str = "") -> ThrottleDecision:
             return ThrottleDecision(
-                allowed=False,
-                reason="Total hourly trade limit reached",
+                allowed=allowed,
+                reason=reason,
                 sector=sector,
                 current_count_hourly=hourly_sector_count,
                 current_count_daily=daily_sector_count,
                 limit_hourly=self.config.max_trades_per_sector_per_hour,
                 limit_daily=self.config.max_trades_per_sector_per_day,
-                recommendation="Too many trades this hour. Wait or review strategy.",
+                recommendation=recommendation,
             )
         
-        # Check total daily limit
-        if daily_total_count >= self.config.max_total_trades_per_day:
-            self.stats["throttled_signals"] += 1
-            return ThrottleDecision(
-                allowed=False,
-                reason="Total daily trade limit reached",
-                sector=sector,
-                current_count_hourly=hourly_sector_count,
-                current_count_daily=daily_sector_count,
-                limit_hourly=self.config.max_trades_per_sector_per_hour,
-                limit_daily=self.config.max_trades_per_sector_per_day,
-                recommendation="Daily trade limit reached. Resume tomorrow.",
-            )
+        messages = [
+            (f"Sector hourly limit reached: {sector}",
+             f"Wait {self.config.hourly_window_minutes} minutes or diversify to other sectors"),
+            (f"Sector daily limit reached: {sector}",
+             f"Daily limit for {sector} reached. Resume tomorrow."),
+            ("Total hourly trade limit reached",
+             "Too many trades this hour. Wait or review strategy."),
+            ("Total daily trade limit reached",
+             "Daily trade limit reached. Resume tomorrow."),
+            ("Ticker hourly limit reached",
+             f"Wait {self.config.hourly_window_minutes} minutes before another signal on this ticker"),
+        ]
+        
+        # Check limits
+        for i, (_, _, limit) in enumerate(checks):
+            if counts[i] >= limit:
+                self.stats["throttled_signals"] += 1
+                if i < 2:
+                    self.stats["throttle_by_sector"][sector] += 1
+                reason, recommendation = messages[i]
+                return decision(False, reason, recommendation)
         
         # Check correlated sectors
         correlated = CORRELATED_SECTORS.get(sector, [])
-        for corr_sector in correlated:
-            corr_hourly = sum(
-                1 for s in self._signals
-                if s.sector == corr_sector and s.timestamp >= hourly_cutoff
+        if correlated:
+            corr_counts = self.counters.get_counts(
+                [(_sector_key(s), HOURLY) for s in correlated], self._clock()
             )
-            if corr_hourly >= self.config.max_trades_per_sector_per_hour:
-                logger.warning(
-                    f"Correlated sector {corr_sector} is at limit, "
-                    f"reducing priority for {sector}"
-                )
-                # Don't block, but warn
-                return ThrottleDecision(
-                    allowed=True,
-                    reason=f"Allowed but correlated sector {corr_sector} is near limit",
-                    sector=sector,
-                    current_count_hourly=hourly_sector_count,
-                    current_count_daily=daily_sector_count,
-                    limit_hourly=self.config.max_trades_per_sector_per_hour,
-                    limit_daily=self.config.max_trades_per_sector_per_day,
-                    recommendation=f"Consider reducing position size due to {corr_sector} exposure",
-                )
+            for corr_sector, corr_hourly in zip(correlated, corr_counts):
+                if corr_hourly >= self.config.max_trades_per_sector_per_hour:
+                    logger.warning(
+                        f"Correlated sector {corr_sector} is at limit, "
+                        f"reducing priority for {sector}"
+                    )
+                    # Don't block, but warn
+                    return decision(
+                        True,
+                        f"Allowed but correlated sector {corr_sector} is near limit",
+                        f"Consider reducing position size due to {corr_sector} exposure",
+                    )
         
         # All checks passed
-        return ThrottleDecision(
-            allowed=True,
-            reason="Signal allowed",
-            sector=sector,
-            current_count_hourly=hourly_sector_count,
-            current_count_daily=daily_sector_count,
-            limit_hourly=self.config.max_trades_per_sector_per_hour,
-            limit_daily=self.config.max_trades_per_sector_per_day,
-            recommendation="",
-        )
+        return decision(True, "Signal allowed")
     
     def record_signal(
         self,
@@ -337,21 +634,25 @@ class SectorSignalTracker:
             news_source_id: ID of source news article
             executed: Whether signal was actually executed
         """
-        sector = self.get_ticker_sector(ticker)
-        if sectors_from_news and len(sectors_from_news) > 0:
-            sector = sectors_from_news[0].upper()
-        
-        record = SignalRecord(
-            ticker=ticker,
-            sector=sector,
-            action=action,
-            timestamp=datetime.now(),
-            confidence=confidence,
-            news_source_id=news_source_id,
-            executed=executed,
-        )
-        
-        self._signals.append(record)
+        sector = self._resolve_sector(ticker, sectors_from_news)
+        self.counters.increment(self._record_keys(sector, ticker, executed), self._clock())
+        self._count_recorded(ticker, action, sector, confidence, executed)
+    
+    @staticmethod
+    def _record_keys(sector: str, ticker: str, executed: bool) -> List[str]:
+        keys = [_sector_key(sector), _ticker_key(ticker), TOTAL_KEY]
+        if executed:
+            keys.append(_executed_key(sector))
+        return keys
+    
+    def _count_recorded(
+        self,
+        ticker: str,
+        action: str,
+        sector: str,
+        confidence: float,
+        executed: bool,
+    ):
         self.stats["total_signals"] += 1
         if executed:
             self.stats["executed_signals"] += 1
@@ -360,18 +661,13 @@ class SectorSignalTracker:
             f"Recorded signal: {action} {ticker} ({sector}) "
             f"confidence={confidence:.2f} executed={executed}"
         )
-        
-        # Cleanup old signals (older than 7 days)
-        self._cleanup_old_signals()
     
-    def _cleanup_old_signals(self):
-        """Remove signals older than 7 days to prevent memory bloat"""
-        cutoff = datetime.now() - timedelta(days=7)
-        initial_count = len(self._signals)
-        self._signals = [s for s in self._signals if s.timestamp >= cutoff]
-        removed = initial_count - len(self._signals)
-        if removed > 0:
-            logger.debug(f"Cleaned up {removed} old signal records")
+    def get_ticker_counts(self, ticker: str) -> Dict[str, int]:
+        """Get hourly/daily signal counts for a ticker"""
+        hourly, daily = self.counters.get_counts(
+            [(_ticker_key(ticker), HOURLY), (_ticker_key(ticker), DAILY)], self._clock()
+        )
+        return {"hourly_count": hourly, "daily_count": daily}
     
     def get_sector_summary(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -380,22 +676,24 @@ class SectorSignalTracker:
         Returns:
             Dictionary with sector statistics
         """
-        now = datetime.now()
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        daily_cutoff = now - timedelta(hours=self.config.daily_window_hours)
-        
-        summary = {}
-        
-        # Get all unique sectors
-        sectors = set(s.sector for s in self._signals)
+        now = self._clock()
+        sectors = [k[len(SECTOR_PREFIX):] for k in self.counters.active_keys(SECTOR_PREFIX)]
         
+        queries = []
         for sector in sectors:
-            sector_signals = [s for s in self._signals if s.sector == sector]
-            
-            hourly_count = sum(1 for s in sector_signals if s.timestamp >= hourly_cutoff)
-            daily_count = sum(1 for s in sector_signals if s.timestamp >= daily_cutoff)
-            
-            executed_count = sum(1 for s in sector_signals if s.executed)
+            queries += [
+                (_sector_key(sector), HOURLY),
+                (_sector_key(sector), DAILY),
+                (_sector_key(sector), WEEKLY),
+                (_executed_key(sector), WEEKLY),
+            ]
+        counts = self.counters.get_counts(queries, now)
+        
+        summary = {}
+        for i, sector in enumerate(sectors):
+            hourly_count, daily_count, total_count, executed_count = counts[4 * i:4 * i + 4]
+            if total_count == 0:
+                continue
             
             summary[sector] = {
                 "hourly_count": hourly_count,
@@ -404,7 +702,7 @@ class SectorSignalTracker:
                 "daily_limit": self.config.max_trades_per_sector_per_day,
                 "hourly_remaining": max(0, self.config.max_trades_per_sector_per_hour - hourly_count),
                 "daily_remaining": max(0, self.config.max_trades_per_sector_per_day - daily_count),
-                "total_signals": len(sector_signals),
+                "total_signals": total_count,
                 "executed_signals": executed_count,
             }
         
@@ -417,16 +715,17 @@ class SectorSignalTracker:
         Returns:
             List of (sector, count) tuples sorted by activity
         """
-        now = datetime.now()
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        
-        sector_counts = defaultdict(int)
-        for signal in self._signals:
-            if signal.timestamp >= hourly_cutoff:
-                sector_counts[signal.sector] += 1
+        sectors = [k[len(SECTOR_PREFIX):] for k in self.counters.active_keys(SECTOR_PREFIX)]
+        counts = self.counters.get_counts(
+            [(_sector_key(s), HOURLY) for s in sectors], self._clock()
+        )
         
         # Sort by count, descending
-        hot_sectors = sorted(sector_counts.items(), key=lambda x: x[1], reverse=True)
+        hot_sectors = sorted(
+            ((s, c) for s, c in zip(sectors, counts) if c > 0),
+            key=lambda x: x[1],
+            reverse=True,
+        )
         
         return hot_sectors
 
@@ -0,0 +1,147 @@
+"""
+BulkLoader 테스트 (COPY → 스테이징 → ON CONFLICT 병합, 배치 스트리밍)
+
+작성일: 2026-10-18
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from backend.database.bulk_loader import BulkLoader, iter_batches, news_row, price_row
+
+
+class FakeConnection:
+    """asyncpg Connection 대역: 실행 SQL과 COPY 레코드 기록"""
+
+    def __init__(self):
+        self.statements = []
+        self.copies = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql):
+        self.statements.append(sql)
+        if sql.startswith("INSERT"):
+            return f"INSERT 0 {len(self.copies[-1][1])}"
+        return "CREATE TABLE AS"
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copies.append((table, list(records), columns))
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.released = False
+
+    async def acquire(self):
+        return self.conn
+
+    async def release(self, conn):
+        self.released = True
+
+
+def _price(ticker, day, close):
+    return {
+        "ticker": ticker, "date": datetime(2026, 1, day), "open": close, "high": close,
+        "low": close, "close": close, "volume": 100, "adj_close": close,
+    }
+
+
+async def test_iter_batches_bounds_batch_size():
+    async def agen():
+        for i in range(7):
+            yield {"i": i}
+
+    sync_sizes = [len(b) async for b in iter_batches(({"i": i} for i in range(7)), 3)]
+    async_sizes = [len(b) async for b in iter_batches(agen(), 3)]
+
+    assert sync_sizes == [3, 3, 1]
+    assert async_sizes == [3, 3, 1]
+
+
+async def test_load_prices_copies_batches_and_merges_on_conflict():
+    pool = FakePool()
+    loader = BulkLoader(pool=pool, batch_size=2)
+
+    records = (_price("AAPL", d, 100.0 + d) for d in range(1, 6))
+    result = await loader.load_prices(records)
+
+    assert result.received == 5
+    assert result.written == 5
+    assert result.batches == 3
+    assert pool.released
+
+    conn = pool.conn
+    assert [len(rows) for _, rows, _ in conn.copies] == [2, 2, 1]
+    assert conn.copies[0][0] == "_stage_stock_prices"
+    assert conn.copies[0][1][0] == ("AAPL", datetime(2026, 1, 1), 101.0, 101.0, 101.0, 101.0, 100, 101.0)
+
+    merges = [s for s in conn.statements if s.startswith("INSERT")]
+    assert len(merges) == 3
+    assert "ON CONFLICT (ticker, time) DO UPDATE SET" in merges[0]
+    assert "close = EXCLUDED.close" in merges[0]
+
+
+async def test_duplicate_keys_in_batch_keep_last_value():
+    pool = FakePool()
+    loader = BulkLoader(pool=pool, batch_size=10)
+
+    result = await loader.load_prices([_price("AAPL", 1, 100.0), _price("AAPL", 1, 105.0)])
+
+    rows = pool.conn.copies[0][1]
+    assert result.received == 2
+    assert len(rows) == 1
+    assert rows[0][5] == 105.0
+
+
+def test_news_row_serializes_metadata_and_hash():
+    row = news_row({
+        "title": "Chip demand", "content": "...", "url": "https://x/1", "source": "Reuters",
+        "published_at": datetime(2026, 1, 1), "metadata": {"author": "A"}, "embedding": (0.1, 0.2),
+    })
+
+    assert len(row[7]) == 32             # md5 content_hash 생성
+    assert row[10] == [0.1, 0.2]
+    assert row[15] == '{"author": "A"}'
+    assert price_row(_price("MSFT", 2, 50.0))[0] == "MSFT"
+
+
+async def test_invalid_records_are_skipped_before_copy():
+    pool = FakePool()
+    loader = BulkLoader(pool=pool, batch_size=10)
+
+    bad = {"ticker": "AAPL", "open": 1.0}                    # time/OHLC 누락
+    result = await loader.load_prices([_price("AAPL", 1, 100.0), bad, _price("AAPL", 2, 101.0)])
+
+    assert result.received == 3
+    assert result.rejected == 1
+    assert result.written == 2
+    assert len(pool.conn.copies[0][1]) == 2
+
+
+class FailingCopyConnection(FakeConnection):
+    """COPY 배치는 실패, 행 단위 INSERT는 close <= 0 행만 실패"""
+
+    async def copy_records_to_table(self, table, records, columns):
+        raise RuntimeError("invalid input syntax")
+
+    async def execute(self, sql, *args):
+        if args:
+            if args[5] <= 0:
+                raise RuntimeError("check constraint violated")
+            return "INSERT 0 1"
+        return await super().execute(sql)
+
+
+async def test_copy_failure_falls_back_to_row_inserts():
+    pool = FakePool()
+    pool.conn = FailingCopyConnection()
+    loader = BulkLoader(pool=pool, batch_size=10)
+
+    result = await loader.load_prices([_price("AAPL", 1, 100.0), _price("AAPL", 2, -1.0), _price("AAPL", 3, 102.0)])
+
+    assert result.written == 2
+    assert result.rejected == 1
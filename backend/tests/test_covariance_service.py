@@ -0,0 +1,88 @@
+"""
+Covariance Service - Unit Tests
+
+Tests for analytics/covariance_service.py (incremental EWMA covariance,
+sub-matrix lookup, disk snapshot)
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.analytics.covariance_service import EWMACovarianceService, correlation_pairs
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    market = rng.normal(0, 0.01, (120, 1))
+    returns = market + rng.normal(0, 0.008, (120, 4))
+    index = pd.date_range("2026-01-01", periods=121, freq="B")
+    levels = 100 * np.vstack([np.ones(4), np.cumprod(1 + returns, axis=0)])
+    return pd.DataFrame(levels, index=index, columns=["AAPL", "MSFT", "NVDA", "TLT"])
+
+
+def _reference_ewma(prices, decay):
+    returns = prices.pct_change().iloc[1:].to_numpy()
+    cov = np.outer(returns[0], returns[0])
+    for r in returns[1:]:
+        cov = decay * cov + (1 - decay) * np.outer(r, r)
+    return cov
+
+
+def test_incremental_update_matches_reference_ewma(prices, tmp_path):
+    service = EWMACovarianceService(path=tmp_path / "cov.npz")
+    assert service.update_from_prices(prices) == len(prices)
+
+    expected = _reference_ewma(prices, service.decay)
+    np.testing.assert_allclose(service.get_covariance(list(prices.columns)).to_numpy(), expected)
+
+    # 부분 행렬은 순서를 그대로 따름
+    sub = service.get_covariance(["NVDA", "AAPL"]).to_numpy()
+    np.testing.assert_allclose(sub, expected[np.ix_([2, 0], [2, 0])])
+
+    # 이미 반영된 날짜는 건너뜀
+    assert service.update_from_prices(prices) == 0
+
+
+def test_snapshot_roundtrip(prices, tmp_path):
+    service = EWMACovarianceService(path=tmp_path / "cov.npz")
+    service.update_from_prices(prices.iloc[:60])
+    service.save()
+
+    restored = EWMACovarianceService(path=tmp_path / "cov.npz")
+    assert restored.load()
+    assert restored.as_of == service.as_of
+
+    service.update_from_prices(prices)
+    restored.update_from_prices(prices)
+    tickers = list(prices.columns)
+    np.testing.assert_allclose(restored.get_covariance(tickers), service.get_covariance(tickers))
+
+
+def test_new_ticker_joins_universe(prices, tmp_path):
+    service = EWMACovarianceService(path=tmp_path / "cov.npz", min_observations=20)
+    service.update_from_prices(prices[["AAPL", "MSFT"]])
+    assert not service.is_ready(["AAPL", "NVDA"])
+    with pytest.raises(KeyError):
+        service.get_covariance(["NVDA"])
+
+    last = prices.index[-1].date()
+    service.update({"AAPL": 100.0, "NVDA": 50.0}, as_of=last + timedelta(days=1))
+    service.update({"AAPL": 101.0, "NVDA": 49.0}, as_of=last + timedelta(days=2))
+    cov = service.get_covariance(["AAPL", "NVDA"]).to_numpy()
+    assert cov[1, 1] == pytest.approx(0.02 ** 2)
+    assert cov[0, 1] == pytest.approx(0.01 * -0.02)
+
+
+def test_correlation_pairs_upper_triangle():
+    corr = pd.DataFrame(
+        [[1.0, 0.8, np.nan], [0.8, 1.0, -0.3], [np.nan, -0.3, 1.0]],
+        index=list("ABC"), columns=list("ABC"),
+    )
+    assert correlation_pairs(corr) == [
+        {"ticker1": "A", "ticker2": "B", "correlation": 0.8},
+        {"ticker1": "B", "ticker2": "C", "correlation": -0.3},
+    ]
@@ -0,0 +1,72 @@
+"""
+EmbeddingResultCache 테스트 (콘텐츠 해시 키, 배치 조회, 절감 비용 통계)
+
+작성일: 2026-10-18
+"""
+
+import numpy as np
+
+from backend.data.vector_store.embedder import DocumentEmbedder, EmbeddingBackend, EmbeddingResult
+from backend.data.vector_store.embedding_cache import CachedEmbedding, EmbeddingResultCache, content_hash
+
+
+class CountingBackend(EmbeddingBackend):
+    """원격 API 대역: 텍스트당 토큰 10개, 호출별 입력 기록"""
+
+    remote = True
+
+    def __init__(self, model="fake-embed", dimension=4):
+        self.model = model
+        self.dimension = dimension
+        self.calls = []
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return [
+            EmbeddingResult(embedding=[float(len(t))] * self.dimension, tokens=10, cost=0.5)
+            for t in texts
+        ]
+
+
+async def test_batch_embeds_only_unique_misses_and_persists(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    backend = CountingBackend()
+    embedder = DocumentEmbedder(backend=backend, cache=EmbeddingResultCache(path))
+
+    first = await embedder.embed_batch(["alpha", "beta", "alpha"], show_progress=False)
+
+    assert backend.calls == [["alpha", "beta"]]
+    assert [r.embedding[0] for r in first] == [5.0, 4.0, 5.0]
+    assert embedder.total_cost == 1.0
+
+    # 재시작 후에도 디스크 캐시에서 조회 (API 호출 없음, 비용 0)
+    reopened = EmbeddingResultCache(path)
+    again = DocumentEmbedder(backend=backend, cache=reopened)
+    second = await again.embed_batch(["beta", "gamma"], show_progress=False)
+    single = await again.embed_text("alpha")
+
+    assert backend.calls[1:] == [["gamma"]]
+    assert second[0].cost == 0.0 and second[1].cost == 0.5
+    assert single.cost == 0.0 and single.embedding == [5.0] * 4
+    assert again.get_stats()["cache"] == {
+        "lookups": 3,
+        "hits": 2,
+        "hit_rate": 0.667,
+        "stored": 1,
+        "tokens_avoided": 20,
+        "cost_avoided_usd": 1.0,
+    }
+
+
+def test_keys_are_scoped_by_model_and_dimension(tmp_path):
+    cache = EmbeddingResultCache(tmp_path / "cache.sqlite3")
+    digest = content_hash("same text")
+    cache.put_many("model-a", 3, {digest: CachedEmbedding([1.0, 2.0, 3.0], tokens=3, cost=0.1)})
+
+    assert cache.get_many("model-b", 3, [digest]) == {}
+    assert cache.get_many("model-a", 1536, [digest]) == {}
+
+    hit = cache.get_many("model-a", 3, [digest, digest])[digest]
+    assert hit.cached and np.allclose(hit.embedding, [1.0, 2.0, 3.0])
+    assert cache.get_stats()["hits"] == 2 and len(cache) == 1
+
@@ -0,0 +1,148 @@
+"""
+Event Bus - Unit Tests
+
+Tests for events/event_bus.py (ring-buffer history, queued dispatch,
+backpressure) and events/event_journal.py (per-day journal)
+"""
+
+import asyncio
+from datetime import datetime
+
+from backend.events import EventBus, EventType
+
+
+def test_history_is_bounded_per_event_type():
+    bus = EventBus(max_history=5)
+    for i in range(20):
+        bus.publish(EventType.MARKET_DATA_RECEIVED, {"ticker": "AAPL", "seq": i})
+    bus.publish(EventType.ORDER_FILLED, {"order_id": 1})
+
+    ticks = bus.get_history(EventType.MARKET_DATA_RECEIVED, limit=3)
+    assert [e["data"]["seq"] for e in ticks] == [17, 18, 19]
+    # 틱 폭주가 다른 타입의 이력을 밀어내지 않음
+    assert len(bus.get_history(EventType.ORDER_FILLED)) == 1
+    assert len(bus.get_history()) == 5
+
+
+def test_publish_without_loop_runs_sync_handlers_inline():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventType.ORDER_FILLED, received.append)
+    bus.publish(EventType.ORDER_FILLED, {"order_id": 1})
+    assert received == [{"order_id": 1}]
+
+
+async def test_publish_does_not_wait_for_slow_handlers():
+    bus = EventBus()
+    received = []
+
+    async def slow_handler(data):
+        await asyncio.sleep(0.05)
+        received.append(data["order_id"])
+
+    def failing_handler(data):
+        raise RuntimeError("boom")
+
+    bus.subscribe(EventType.ORDER_FILLED, slow_handler)
+    bus.subscribe(EventType.ORDER_FILLED, failing_handler)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(3):
+        bus.publish(EventType.ORDER_FILLED, {"order_id": i})
+    assert loop.time() - start < 0.01
+    assert received == []
+
+    await bus.drain(timeout=2)
+    assert received == [0, 1, 2]
+    stats = {s["handler"]: s for s in bus.get_stats()["subscribers"]}
+    assert stats["failing_handler"]["failed"] == 3
+    await bus.stop()
+
+
+async def test_drop_oldest_backpressure_keeps_latest_ticks():
+    bus = EventBus()
+    received = []
+    gate = asyncio.Event()
+
+    async def on_tick(data):
+        await gate.wait()
+        received.append(data["price"])
+
+    bus.subscribe(EventType.MARKET_DATA_RECEIVED, on_tick, queue_size=3)
+    for price in range(10):
+        bus.publish(EventType.MARKET_DATA_RECEIVED, {"ticker": "NVDA", "price": price})
+        await asyncio.sleep(0)
+
+    gate.set()
+    await bus.drain(timeout=2)
+    # 첫 틱은 worker가 이미 꺼냈고, 큐에는 최신 3개만 남음
+    assert received == [0, 7, 8, 9]
+    assert bus.get_stats()["subscribers"][0]["dropped"] == 6
+    await bus.stop()
+
+
+async def test_block_overflow_applies_backpressure_to_publish_async():
+    bus = EventBus()
+    gate = asyncio.Event()
+
+    async def consumer(data):
+        await gate.wait()
+
+    bus.subscribe(EventType.ORDER_SENT, consumer, queue_size=1, overflow="block")
+    await bus.publish_async(EventType.ORDER_SENT, {"order_id": 1})
+    await asyncio.sleep(0)  # worker가 첫 이벤트를 꺼냄
+    await bus.publish_async(EventType.ORDER_SENT, {"order_id": 2})
+
+    blocked = asyncio.create_task(bus.publish_async(EventType.ORDER_SENT, {"order_id": 3}))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    gate.set()
+    await asyncio.wait_for(blocked, 1)
+    await bus.stop()
+
+
+async def test_order_events_are_not_dropped_by_default():
+    bus = EventBus(queue_size=2)
+    received = []
+    gate = asyncio.Event()
+
+    async def on_fill(data):
+        await gate.wait()
+        received.append(data["order_id"])
+
+    bus.subscribe(EventType.ORDER_FILLED, on_fill)
+    for i in range(10):
+        bus.publish(EventType.ORDER_FILLED, {"order_id": i})
+
+    gate.set()
+    await bus.drain(timeout=2)
+    assert received == list(range(10))
+    assert bus.get_stats()["subscribers"][0]["overflow"] == "block"
+    await bus.stop()
+
+
+async def test_stop_closes_journal(tmp_path):
+    bus = EventBus(journal_dir=str(tmp_path))
+    bus.publish(EventType.ORDER_FILLED, {"order_id": 1})
+    await bus.stop()
+
+    assert not bus._journal._thread.is_alive()
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    assert [e["order_id"] for e in bus.reconstruct_day(today)] == [1]
+
+
+def test_journal_reconstructs_day(tmp_path):
+    bus = EventBus(max_history=2, journal_dir=str(tmp_path))
+    for i in range(5):
+        bus.publish(EventType.ORDER_FILLED, {"order_id": i, "filled_at": datetime(2026, 10, 18)})
+
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    events = bus.reconstruct_day(today)
+
+    # 메모리 이력은 2개뿐이지만 저널에는 전부 남음
+    assert [e["order_id"] for e in events] == [0, 1, 2, 3, 4]
+    assert (tmp_path / f"{today}.jsonl").exists()
+    assert bus.reconstruct_day("2000-01-01") == []
+    bus._journal.close()
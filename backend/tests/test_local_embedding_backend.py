@@ -0,0 +1,65 @@
+"""
+LocalEmbeddingBackend 테스트 (동적 배칭, 차원 패딩, 처리량 통계)
+
+실제 모델 대신 SentenceTransformer.encode() 인터페이스를 가진 인코더를 주입합니다.
+
+작성일: 2026-10-18
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+
+from backend.data.vector_store.embedder import DocumentEmbedder, LocalEmbeddingBackend
+
+
+class CountingEncoder:
+    """텍스트 길이 기반 결정적 3차원 벡터, encode() 호출별 배치 크기 기록"""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings, show_progress_bar):
+        self.batches.append(len(texts))
+        self.threads.add(threading.current_thread().name)
+        vectors = np.array([[len(t), 1.0, 0.0] for t in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def test_concurrent_callers_share_batches_in_order():
+    encoder = CountingEncoder()
+    backend = LocalEmbeddingBackend(model=encoder, max_batch_size=16, max_wait_ms=20, num_workers=2)
+
+    queries = [f"query {'x' * i}" for i in range(40)]
+    results = await asyncio.gather(*(backend.embed([q]) for q in queries))
+
+    assert sum(encoder.batches) == 40
+    assert len(encoder.batches) <= 4 and max(encoder.batches) == 16
+    assert all(name.startswith("local-embed") for name in encoder.threads)
+    for query, (result,) in zip(queries, results):
+        assert np.isclose(result.embedding[0] / result.embedding[1], len(query))
+        assert result.cost == 0.0
+
+    stats = backend.get_stats()
+    assert stats["total_docs"] == 40 and stats["docs_per_sec"] > 0
+    await backend.close()
+
+
+async def test_document_embedder_pads_to_schema_dimension():
+    backend = LocalEmbeddingBackend(model=CountingEncoder(), output_dimension=8)
+    embedder = DocumentEmbedder(backend=backend)
+
+    single = await embedder.embed_text("abc")
+    batch = await embedder.embed_batch(["a", "bb", "ccc"], batch_size=1, show_progress=False)
+
+    assert embedder.dimension == 8
+    assert len(single.embedding) == 8 and single.embedding[3:] == [0.0] * 5
+    assert [len(r.embedding) for r in batch] == [8, 8, 8]
+    assert np.isclose(np.linalg.norm(batch[2].embedding), 1.0)
+    assert embedder.get_stats()["backend"]["total_docs"] == 4
+    await backend.close()
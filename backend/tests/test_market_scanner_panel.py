@@ -0,0 +1,66 @@
+"""
+Market Scanner 패널 스캔 테스트 (벡터 지표 + 상위 종목만 옵션 조회)
+
+작성일: 2026-10-18
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("yfinance")
+
+from backend.services.market_scanner.filters.options_filter import OptionsFilterResult
+from backend.services.market_scanner.panel import FIELDS, UniversePanel, compute_indicators
+from backend.services.market_scanner.scanner import DynamicScreener
+
+
+def _panel(n_tickers=6, n_days=40):
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, (n_days, n_tickers)), axis=0))
+    volume = np.full((n_days, n_tickers), 1_000_000.0)
+
+    # T0: 거래량 급등 + 5일 급등, T1: 데이터 부족
+    close[-5:, 0] *= np.linspace(1.0, 1.12, 5)
+    volume[-1, 0] = 4_000_000
+    close[:-10, 1] = np.nan
+
+    tickers = [f"T{i}" for i in range(n_tickers)]
+    index = pd.date_range("2026-01-01", periods=n_days)
+    arrays = {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": volume}
+    return UniversePanel.from_frames({f: pd.DataFrame(arrays[f], index=index, columns=tickers) for f in FIELDS})
+
+
+class CountingOptionsFilter:
+    def __init__(self):
+        self.calls = []
+
+    async def check(self, ticker):
+        self.calls.append(ticker)
+        return OptionsFilterResult(
+            ticker=ticker, score=0, put_call_ratio=1.0, unusual_volume=False, implied_volatility=None,
+            options_sentiment="NEUTRAL", whale_activity=False, passed=False, reason="",
+        )
+
+
+def test_compute_indicators_vectorized():
+    indicators = compute_indicators(_panel())
+
+    assert indicators["valid"].tolist() == [True, False, True, True, True, True]
+    assert indicators["volume_ratio"][0] == pytest.approx(4_000_000 / 1_150_000)
+    assert indicators["return_5d"][0] > 10
+    assert 0 <= indicators["rsi_14"][2] <= 100
+
+
+async def test_panel_scan_calls_options_only_for_survivors():
+    screener = DynamicScreener(max_candidates=5, options_top_k=2)
+    screener.options_filter = CountingOptionsFilter()
+    errors = []
+
+    candidates = await screener._candidates_from_panel(_panel(), errors)
+
+    assert screener.options_filter.calls == ["T0"]
+    assert [c.ticker for c in candidates] == ["T0"]
+    assert candidates[0].volume_score > 0 and candidates[0].momentum_score > 0
+    assert candidates[0].filter_details["momentum"]["signal"] in ("UP", "STRONG_UP")
+    assert errors == ["1 tickers skipped: 데이터 부족/상장폐지 가능성"]
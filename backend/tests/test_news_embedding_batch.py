@@ -0,0 +1,97 @@
+"""
+NewsEmbeddingPipeline 배치 모드 테스트
+
+- 피드 URL 단위 1회 조회 (일반 피드는 종목 간 공유)
+- 종목 간 URL 중복 제거 + 단일 존재 여부 조회
+- 최대 배치 임베딩 + 벌크 INSERT
+
+작성일: 2026-10-18
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("feedparser")
+pytest.importorskip("tiktoken")
+
+from backend.pipelines.news_embedding_pipeline import NewsEmbeddingPipeline
+
+
+class FakeResult:
+    def __init__(self, values):
+        self.values = values
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: list(self.values))
+
+
+class FakeSession:
+    """AsyncSession 대역: 실행 문장 기록, 기존 URL 해시 / 생성 ID 반환"""
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        if params is None:
+            return FakeResult(self.existing)
+        return FakeResult(range(1, len(params) + 1))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _article(url, title):
+    return {
+        "title": title,
+        "url": url,
+        "summary": f"{title} summary",
+        "source": "Feed",
+        "published_date": datetime.now(),
+    }
+
+
+async def test_batch_fetches_each_feed_once_and_dedupes_across_tickers():
+    db = FakeSession(existing=[])
+    pipeline = NewsEmbeddingPipeline(db, openai_api_key="test")
+    db.existing = {pipeline._compute_url_hash("https://news/old")}
+
+    fetched = []
+
+    async def fake_fetch(feed_url, max_articles=50, session=None):
+        fetched.append(feed_url)
+        if feed_url == pipeline.RSS_FEEDS["cnbc_top"]:
+            return [_article("https://news/shared", "Chips rally"), _article("https://news/old", "Old")]
+        return [_article(f"https://news/{feed_url[-4:]}", "Ticker story")]
+
+    calls = []
+
+    async def fake_generate(texts):
+        calls.append(list(texts))
+        return [[0.0] * 3 for _ in texts]
+
+    pipeline._fetch_rss_articles = fake_fetch
+    pipeline.embedding_engine._generate_embeddings = fake_generate
+
+    stats = await pipeline.embed_batch_tickers_news(
+        ["AAPL", "MSFT"], sources=["yahoo_finance", "cnbc_top"]
+    )
+
+    assert len(fetched) == 3 and len(set(fetched)) == 3
+    assert stats["by_ticker"]["AAPL"]["articles_fetched"] == 3
+    assert stats["by_ticker"]["AAPL"]["duplicates"] == 1
+    assert stats["by_ticker"]["MSFT"]["duplicates"] == 2
+    assert stats["total_articles_embedded"] == 3
+    assert len(calls) == 1 and len(calls[0]) == 3
+
+    inserts = [params for _, params in db.statements if params is not None]
+    assert [len(p) for p in inserts] == [3, 3]
+    assert {row["ticker"] for row in inserts[0]} == {"AAPL", "MSFT"}
+    assert db.commits == 1
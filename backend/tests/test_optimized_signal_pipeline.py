@@ -0,0 +1,219 @@
+"""
+Optimized Signal Pipeline - Unit Tests
+
+Tests for services/optimized_signal_pipeline.py (provider worker pools,
+budget-aware prioritized news analysis)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.optimized_signal_pipeline import (
+    OptimizedSignalPipeline,
+    ProviderLimits,
+    ProviderWorkerPool,
+    article_priority,
+)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def _article(article_id, title, relevance=0.0, ticker="AAPL"):
+    return SimpleNamespace(
+        id=article_id,
+        title=title,
+        content="body",
+        ticker_relevances=[SimpleNamespace(ticker=ticker, relevance_score=relevance)],
+    )
+
+
+def _routing(cost=0.01, provider="gemini"):
+    return SimpleNamespace(
+        intent="news_analysis", provider=provider, model="flash",
+        estimated_tokens=500, estimated_cost_usd=cost,
+    )
+
+
+class FakeRouter:
+    async def route(self, request):
+        return _routing()
+
+    def get_statistics(self):
+        return {}
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.setattr(
+        "backend.services.optimized_signal_pipeline.get_semantic_router",
+        lambda **kwargs: FakeRouter(),
+    )
+    return OptimizedSignalPipeline(
+        signal_generator=object(),
+        provider_limits={"gemini": ProviderLimits(max_concurrency=3, requests_per_minute=1000)},
+    )
+
+
+def test_article_priority_prefers_urgent_and_relevant():
+    routine = _article(1, "Company hosts annual picnic", relevance=0.9)
+    urgent = _article(2, "Trading halt after fraud investigation", relevance=0.2)
+    watched = _article(3, "Company hosts annual picnic", relevance=0.9, ticker="NVDA")
+
+    assert article_priority(urgent) > article_priority(routine)
+    assert article_priority(watched, {"NVDA"}) > article_priority(routine, {"NVDA"})
+
+
+async def test_worker_pool_halves_concurrency_and_retries_on_429():
+    pool = ProviderWorkerPool("gemini", ProviderLimits(max_concurrency=8, requests_per_minute=1000, backoff_seconds=0))
+    calls = {"n": 0}
+
+    async def flaky():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RateLimitError("Too Many Requests")
+        return "ok"
+
+    assert await pool.run(flaky) == "ok"
+    assert pool.concurrency == 4
+    assert pool.stats["rate_limited"] == 1 and pool.stats["retries"] == 1
+
+
+async def test_worker_pool_bounds_in_flight_calls():
+    pool = ProviderWorkerPool("gemini", ProviderLimits(max_concurrency=2, requests_per_minute=1000))
+    peak = {"now": 0, "max": 0}
+
+    async def work():
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.01)
+        peak["now"] -= 1
+
+    await asyncio.gather(*(pool.run(work) for _ in range(6)))
+
+    assert peak["max"] == 2
+
+
+async def test_batch_analysis_runs_concurrently_within_budget(pipeline, monkeypatch):
+    pipeline.cycle_budget_usd = 0.03
+    active = {"now": 0, "max": 0}
+    analyzed = []
+
+    async def fake_analyze(article, routing):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        analyzed.append(article.id)
+        return {"article_id": article.id, "trading_actionable": True}
+
+    monkeypatch.setattr(pipeline, "_analyze_with_routing", fake_analyze)
+
+    articles = [
+        _article(1, "Company hosts annual picnic"),
+        _article(2, "Bankruptcy filing expected", relevance=0.9),
+        _article(3, "Earnings guidance raised", relevance=0.5),
+        _article(4, "New office opens"),
+    ]
+    results = await pipeline._analyze_news_batch_optimized(db=None, articles=articles)
+
+    assert [r["article_id"] for r in results] == [2, 3, 1]
+    assert set(analyzed) == {1, 2, 3}
+    assert active["max"] > 1
+    assert pipeline.stats["news_deferred_budget"] == 1
+    assert pipeline.stats["total_cost_usd"] == pytest.approx(0.03)
+
+
+async def test_gemini_analysis_runs_in_worker_session_with_article_id(pipeline, monkeypatch):
+    calls = []
+
+    def fake_analyze_in_session(article_id):
+        calls.append(article_id)
+        return {"sentiment_overall": "positive", "trading_actionable": True}
+
+    monkeypatch.setattr(
+        "backend.services.optimized_signal_pipeline._analyze_article_in_session",
+        fake_analyze_in_session,
+    )
+
+    article = _article(7, "Earnings beat", relevance=0.8)
+    article.source, article.published_at = "wire", None
+    article.ticker_relevances[0].sentiment_for_ticker = 0.5
+
+    result = await pipeline._analyze_with_gemini(article, _routing())
+
+    assert calls == [7]  # only the id crosses into the worker thread
+    assert result["sentiment_overall"] == "positive"
+    assert result["related_tickers"] == [
+        {"ticker_symbol": "AAPL", "relevance_score": 0.8, "sentiment": 0.5}
+    ]
+
+
+class FakeQuery:
+    def __init__(self, article):
+        self.article = article
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self.article
+
+
+class FakeSession:
+    def __init__(self, article):
+        self.article = article
+
+    def query(self, model):
+        return FakeQuery(self.article)
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def refresh(self, obj):
+        pass
+
+    def close(self):
+        pass
+
+
+async def test_http_429_from_real_analyzer_throttles_pool(pipeline, monkeypatch):
+    # settings / LLM client deps (cryptography, sentence_transformers, ...)
+    news_analyzer = pytest.importorskip("backend.data.news_analyzer")
+
+    article = _article(9, "Chipmaker guidance raised", relevance=0.9)
+    article.analysis, article.summary, article.keywords = None, None, []
+    article.source, article.published_date, article.published_at = "wire", None, None
+    article.content = "Guidance raised on strong data center demand. " * 3
+    article.ticker_relevances[0].sentiment_for_ticker = 0.5
+
+    responses = [
+        SimpleNamespace(status_code=429, text="Too Many Requests"),
+        SimpleNamespace(status_code=200, text="", json=lambda: {"response": '{"sentiment": "positive", "actionable": true}'}),
+    ]
+    monkeypatch.setattr("httpx.post", lambda *args, **kwargs: responses.pop(0))
+    monkeypatch.setattr(news_analyzer, "get_ollama_client", lambda: SimpleNamespace(
+        base_url="http://ollama", model="llama", check_health=lambda: True,
+    ))
+    monkeypatch.setattr(
+        "backend.services.optimized_signal_pipeline.SessionLocal", lambda: FakeSession(article)
+    )
+    pipeline.provider_limits["gemini"] = ProviderLimits(
+        max_concurrency=4, requests_per_minute=1000, backoff_seconds=0
+    )
+
+    result = await pipeline._analyze_in_pool(article, _routing())
+
+    pool = pipeline.worker_pools["gemini"]
+    assert pool.stats["rate_limited"] == 1 and pool.stats["retries"] == 1
+    assert pool.concurrency == 2
+    assert result["sentiment_overall"] == "positive" and result["trading_actionable"] is True
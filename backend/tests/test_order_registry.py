@@ -0,0 +1,101 @@
+"""
+Order Registry & Transition Log - Unit Tests
+
+Tests for execution/order_registry.py, execution/transition_log.py
+"""
+
+import threading
+
+import pytest
+
+from backend.execution.order_registry import LiveOrder, OrderRegistry
+from backend.execution.state_machine import InvalidStateTransitionError, OrderState
+from backend.execution.transition_log import TransitionLog
+
+
+def _live(order_id, ticker="NVDA", status=OrderState.ORDER_PENDING):
+    return LiveOrder(id=order_id, ticker=ticker, action="BUY", quantity=10, status=status)
+
+
+def test_registry_indexes_follow_transitions():
+    registry = OrderRegistry()
+    registry.upsert(_live(1))
+    registry.upsert(_live(2, ticker="AAPL"))
+
+    registry.apply_transition(1, OrderState.ORDER_SENT, broker_order_id="KIS-1")
+
+    assert registry.get_by_broker_id("KIS-1").id == 1
+    assert [o.id for o in registry.by_state(OrderState.ORDER_SENT)] == [1]
+    assert sorted(registry.pending_ids()) == [1, 2]
+    assert [o.id for o in registry.by_ticker("AAPL")] == [2]
+
+    registry.apply_transition(1, OrderState.FULLY_FILLED, filled_price=101.5)
+    assert registry.get(1).filled_price == 101.5
+    assert registry.pending_ids() == [2]
+
+    assert registry.evict_terminal() == 1
+    assert registry.get_by_broker_id("KIS-1") is None
+    assert len(registry) == 1
+
+
+def test_registry_rejects_invalid_transition():
+    registry = OrderRegistry()
+    registry.upsert(_live(1, status=OrderState.FULLY_FILLED))
+
+    with pytest.raises(InvalidStateTransitionError):
+        registry.apply_transition(1, OrderState.ORDER_SENT)
+
+
+def test_transition_log_batches_and_replays(tmp_path):
+    path = tmp_path / "transitions.jsonl"
+    wal = TransitionLog(str(path), batch_size=3, flush_interval_seconds=60)
+
+    assert wal.append({"order_id": 1, "to": "order_pending"}) is False
+    assert wal.append({"order_id": 1, "to": "order_sent", "broker_order_id": "KIS-1"}) is False
+    assert wal.append({"order_id": 2, "to": "order_pending"}) is True
+    assert not path.exists()
+
+    assert wal.flush() == 3
+    assert wal.flush_count == 1
+
+    latest = TransitionLog(str(path)).latest_states()
+    assert latest[1]["to"] == "order_sent"
+    assert latest[1]["broker_order_id"] == "KIS-1"
+    assert latest[2]["to"] == "order_pending"
+
+
+def test_transition_log_compact_and_seq(tmp_path):
+    path = tmp_path / "transitions.jsonl"
+    wal = TransitionLog(str(path))
+    for order_id in (1, 2, 3):
+        wal.append({"order_id": order_id, "to": "order_pending"})
+
+    assert wal.compact({2}) == 1
+    assert [e["order_id"] for e in wal.replay()] == [2]
+
+    # Sequence numbers keep increasing after reopening
+    reopened = TransitionLog(str(path))
+    reopened.append({"order_id": 2, "to": "order_sent"})
+    reopened.flush()
+    assert [e["seq"] for e in reopened.replay()] == [2, 3]
+
+
+def test_transition_log_background_flush_runs_callbacks_after_write(tmp_path):
+    path = tmp_path / "transitions.jsonl"
+    wal = TransitionLog(str(path), batch_size=100, flush_interval_seconds=0.01)
+    durable = threading.Event()
+    seen_on_disk = []
+
+    def on_durable():
+        seen_on_disk.append(len(list(wal.replay())))
+        durable.set()
+
+    # 배치 미달 꼬리 엔트리도 타이머가 기록
+    assert wal.append({"order_id": 1, "to": "order_sent"}, on_durable=on_durable) is False
+    assert durable.wait(timeout=2)
+    assert seen_on_disk == [1]
+    assert wal.pending == 0
+
+    wal.append({"order_id": 1, "to": "fully_filled"})
+    wal.close()
+    assert [e["to"] for e in wal.replay()] == ["order_sent", "fully_filled"]
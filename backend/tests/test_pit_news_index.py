@@ -0,0 +1,70 @@
+"""
+PointInTimeNewsIndex 테스트 (이진 탐색 슬라이스, 분석 가용 시각, 디스크 스냅샷)
+
+작성일: 2026-10-18
+"""
+
+from datetime import datetime, timedelta
+
+from backend.backtesting.pit_news_index import PointInTimeNewsIndex
+
+START = datetime(2026, 1, 1)
+END = datetime(2026, 1, 2)
+
+
+def _index():
+    articles, analyses = [], []
+    for hour in (5, 1, 3):  # 정렬되지 않은 입력
+        articles.append({
+            "id": hour, "title": f"news {hour}", "url": f"https://x/{hour}", "source": "Reuters",
+            "published_at": START, "crawled_at": START + timedelta(hours=hour),
+            "content_summary": None, "keywords": ["chips"],
+        })
+        analyses.append({
+            "sentiment_overall": "positive", "sentiment_score": 0.8, "sentiment_confidence": 0.9,
+            "urgency": "high", "impact_magnitude": 0.9, "risk_category": "none",
+            "trading_actionable": True, "affected_sectors": [], "key_facts": [], "key_warnings": [],
+            "analyzed_at": START + timedelta(hours=hour + 1),
+        } if hour != 5 else None)
+    return PointInTimeNewsIndex(START, END, articles, analyses)
+
+
+def test_slice_uses_crawled_at_bounds_and_gates_analysis():
+    index = _index()
+
+    step = index.slice(START + timedelta(hours=1), START + timedelta(hours=3))
+    assert [a["id"] for a in step] == [3]
+    assert step[0]["analysis"] is None  # 분석은 4시에 완료 → 3시 스텝에서는 미노출
+
+    later = index.slice(START, START + timedelta(hours=6))
+    assert [a["id"] for a in later] == [1, 3, 5]
+    assert later[0]["analysis"]["trading_actionable"] is True
+    assert set(later[0]["analysis"]) == {
+        "sentiment_overall", "sentiment_score", "impact_magnitude", "risk_category",
+        "trading_actionable", "affected_sectors",
+    }
+    assert later[2]["analysis"] is None
+
+
+def test_window_is_descending_and_inclusive():
+    index = _index()
+
+    recent = index.window(START + timedelta(hours=5), lookback_hours=2)
+
+    assert [a["id"] for a in recent] == [5, 3]
+    assert recent[1]["analysis"]["urgency"] == "high"
+    assert recent[1]["keywords"] == ["chips"]
+
+
+def test_snapshot_roundtrip_and_lookup(tmp_path):
+    index = _index()
+    path = index.save(tmp_path)
+
+    found = PointInTimeNewsIndex.find_snapshot(tmp_path, START + timedelta(hours=2), END - timedelta(hours=1))
+    assert found == path
+
+    loaded = PointInTimeNewsIndex.load(found)
+    assert loaded.covers(START, END)
+    assert loaded.slice(START, END) == index.slice(START, END)
+    assert loaded.window(END, 24) == index.window(END, 24)
+    assert PointInTimeNewsIndex.find_snapshot(tmp_path, START - timedelta(days=1), END) is None
@@ -0,0 +1,212 @@
+"""
+Pre-Trade Risk Engine - Unit Tests
+
+Tests for execution/pre_trade_risk.py
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.execution.order_validator import OrderValidator
+from backend.execution.pre_trade_risk import PreTradeLimits, PreTradeRiskEngine
+
+
+SECTORS = {"NVDA": "SEMICONDUCTORS", "AMD": "SEMICONDUCTORS", "JPM": "FINANCE", "XOM": "ENERGY"}
+
+
+def _engine(**limit_overrides):
+    limits = PreTradeLimits.from_components(validator=OrderValidator())
+    for key, value in limit_overrides.items():
+        setattr(limits, key, value)
+    engine = PreTradeRiskEngine(limits=limits, sector_map=SECTORS)
+    engine.sync({
+        "available_cash": 80000,
+        "positions": [{"symbol": "NVDA", "quantity": 20, "current_price": 1000}],
+    })
+    return engine
+
+
+def _buy(symbol, quantity, price, stop_loss_pct=0.02):
+    return {"symbol": symbol, "action": "buy", "quantity": quantity,
+            "price": price, "stop_loss_pct": stop_loss_pct}
+
+
+def test_limits_loaded_from_validator():
+    validator = OrderValidator()
+    validator.add_to_blacklist("GME")
+    limits = PreTradeLimits.from_components(validator=validator)
+
+    assert limits.max_position_pct == validator.HARD_RULES["max_position_size_pct"]
+    assert "GME" in limits.blacklist
+
+
+def test_batch_accumulates_exposure_in_order():
+    engine = _engine()
+
+    # NVDA already 20% of $100k; two $6k buys push it to 26% then 32%
+    results = engine.validate_batch([
+        _buy("NVDA", 6, 1000),
+        _buy("NVDA", 7, 1000, stop_loss_pct=0.03),
+        _buy("JPM", 10, 200, stop_loss_pct=0.0),
+    ])
+
+    assert results[0]["can_execute"]
+    assert not results[1]["can_execute"]
+    assert any("Position size" in v for v in results[1]["violations"])
+    assert any("Stop loss required" in v for v in results[2]["violations"])
+
+
+def test_sector_limit_and_duplicates():
+    engine = _engine()
+
+    results = engine.validate_batch([_buy("AMD", 60, 200)])
+    assert not results[0]["can_execute"]
+    assert any("Sector exposure" in v for v in results[0]["violations"])
+
+    assert engine.validate(_buy("XOM", 10, 100))["can_execute"]
+    duplicate = engine.validate(_buy("XOM", 10, 100))
+    assert duplicate["violations"] == ["Duplicate order"]
+
+
+def test_record_fill_updates_state_incrementally():
+    engine = _engine()
+    engine.record_fill("JPM", "buy", 50, 200)
+
+    assert engine.cash == pytest.approx(70000)
+    assert engine.position_value("JPM") == pytest.approx(10000)
+    assert engine.total_value == pytest.approx(100000)
+
+    engine.update_price("JPM", 220)
+    assert engine.total_value == pytest.approx(101000)
+
+    engine.record_fill("JPM", "sell", 50, 220)
+    assert engine.position_value("JPM") == 0
+    assert engine.cash == pytest.approx(81000)
+
+
+@pytest.mark.performance
+def test_batch_validation_is_sub_millisecond_per_order():
+    engine = _engine(max_daily_trades=10_000, max_sector_trades_per_day=10_000)
+    orders = [_buy(sym, i % 7 + 1, 10 + i % 13) for i, sym in
+              enumerate(["NVDA", "AMD", "JPM", "XOM"] * 250)]
+
+    start = time.perf_counter()
+    results = engine.validate_batch(orders)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert len(results) == 1000
+    assert elapsed_ms / len(orders) < 1.0
+    assert engine.get_status()["latency"]["p99_ms"] < 1.0
+
+
+def test_component_limits_are_read_live():
+    validator = OrderValidator()
+    engine = PreTradeRiskEngine.from_components(validator=validator, sector_map=SECTORS)
+    engine.sync({"available_cash": 100000, "positions": []})
+
+    assert engine.validate(_buy("XOM", 10, 100))["can_execute"]
+
+    validator.add_to_blacklist("JPM")
+    assert engine.validate(_buy("JPM", 10, 100))["violations"] == ["Symbol is blacklisted"]
+
+
+@pytest.mark.asyncio
+async def test_signal_executor_routes_orders_through_pre_trade_risk():
+    from backend.services.signal_executor import OrderStatus, SignalExecutor
+
+    validator = OrderValidator()
+    validator.add_to_blacklist("XOM")
+    engine = PreTradeRiskEngine.from_components(validator=validator, sector_map=SECTORS)
+    executor = SignalExecutor(pre_trade_risk=engine, max_retries=1)
+    submitted = []
+
+    # SafetyGuard 주문 금액 한도($1,000) 이내 규모
+    async def price(kis, ticker):
+        return 10.0
+
+    async def account(kis):
+        return {"available_cash": 2000.0, "positions": []}
+
+    async def limit_order(kis, ticker, action, quantity, price):
+        submitted.append((ticker, quantity))
+        return {"success": True, "order_id": f"KIS-{ticker}"}
+
+    executor._get_current_price = price
+    executor._get_account_snapshot = account
+    executor._limit_order = limit_order
+
+    signal = {"ticker": "JPM", "action": "BUY", "position_size": 0.1, "confidence": 0.8}
+    approved = await executor._execute_order(kis=None, signal=signal)
+    assert engine.position_value("JPM") == 200.0
+    blocked = await executor._execute_order(kis=None, signal={**signal, "ticker": "XOM"})
+    oversized = await executor._execute_order(kis=None, signal={**signal, "ticker": "NVDA", "position_size": 0.45})
+
+    assert approved.success and submitted == [("JPM", 20)]
+    assert blocked.status == OrderStatus.REJECTED and "blacklisted" in blocked.message
+    assert oversized.status == OrderStatus.REJECTED and "Position size" in oversized.message
+
+
+class FakeOrderManager:
+    """OrderManager 대역: 생성 주문은 ORDER_PENDING, 전이/flush 기록"""
+
+    def __init__(self):
+        from backend.execution.state_machine import OrderStateMachine
+
+        self.sm = OrderStateMachine()
+        self.flushes = 0
+
+    def create_order(self, ticker, action, quantity, strategy_id=None, metadata=None):
+        return SimpleNamespace(id=1, ticker=ticker, status="order_pending", error_message=None)
+
+    def transition(self, order, target, reason=None, metadata=None):
+        order.status = target.value
+        return True
+
+    def order_failed(self, order, error):
+        order.error_message = error
+        order.status = "failed"
+        return True
+
+    def flush(self):
+        self.flushes += 1
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_signal_executor_checks_against_broker_holdings():
+    from backend.services.signal_executor import OrderStatus, SignalExecutor
+
+    engine = PreTradeRiskEngine.from_components(validator=OrderValidator(), sector_map=SECTORS)
+    executor = SignalExecutor(pre_trade_risk=engine, max_retries=1)
+    executor._order_manager = FakeOrderManager()
+    orders = []
+    create_order = executor._order_manager.create_order
+
+    def track_order(**kwargs):
+        orders.append(create_order(**kwargs))
+        return orders[-1]
+
+    async def price(kis, ticker):
+        return 10.0
+
+    async def account(kis):
+        # 반도체 $700 보유 + 현금 $2,000 → AMD $200 추가 시 섹터 33% (한도 30%)
+        return {"available_cash": 2000.0, "positions": [{"symbol": "NVDA", "quantity": 70, "current_price": 10.0}]}
+
+    async def limit_order(kis, ticker, action, quantity, price):
+        return {"success": True, "order_id": f"KIS-{ticker}"}
+
+    executor._order_manager.create_order = track_order
+    executor._get_current_price = price
+    executor._get_account_snapshot = account
+    executor._limit_order = limit_order
+
+    signal = {"ticker": "AMD", "action": "BUY", "position_size": 0.1, "confidence": 0.8}
+    result = await executor._execute_order(kis=None, signal=signal)
+
+    assert result.status == OrderStatus.REJECTED and "Sector" in result.message
+    assert engine.position_value("NVDA") == 700.0
+    assert orders[0].status == "failed" and "Pre-Trade Risk Rejection" in orders[0].error_message
+    assert executor._order_manager.flushes == 1
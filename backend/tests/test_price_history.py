@@ -0,0 +1,84 @@
+"""
+PriceHistoryReader / PricePanel 테스트
+
+작성일: 2026-10-18
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from backend.database.price_history import PriceHistoryReader
+from backend.database.query_cache import QueryCache
+
+CSV_ROWS = (
+    b"AAPL,2026-01-02 00:00:00,1,2,0.5,1.5,100,1.5\n"
+    b"AAPL,2026-01-05 00:00:00,1.5,2.5,1,2,200,2\n"
+    b"MSFT,2026-01-02 00:00:00,10,11,9,10.5,300,10.5\n"
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+
+    async def copy_from_query(self, sql, *args, output, format):
+        self.queries.append((sql, args))
+        output.write(CSV_ROWS)
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    async def acquire(self):
+        return self.conn
+
+    async def release(self, conn):
+        pass
+
+
+async def test_panel_is_columnar_and_sliced_by_ticker():
+    pool = FakePool()
+    reader = PriceHistoryReader(pool=pool, cache=QueryCache())
+
+    panel = await reader.get_panel(["MSFT", "AAPL"], datetime(2026, 1, 1), datetime(2026, 2, 1), interval="1d")
+
+    sql, args = pool.conn.queries[0]
+    assert "FROM stock_prices_1d" in sql
+    assert args[0] == ["AAPL", "MSFT"]
+
+    assert len(panel) == 3
+    assert panel.offsets == {"AAPL": (0, 2), "MSFT": (2, 3)}
+    aapl = panel.for_ticker("AAPL")
+    np.testing.assert_array_equal(aapl["close"], [1.5, 2.0])
+    assert aapl["time"].dtype == np.dtype("datetime64[ns]")
+
+    closes = panel.pivot("close")
+    assert list(closes.columns) == ["AAPL", "MSFT"]
+    assert np.isnan(closes.loc["2026-01-05", "MSFT"])
+
+
+async def test_panel_cache_hit_and_invalidation():
+    pool = FakePool()
+    cache = QueryCache()
+    reader = PriceHistoryReader(pool=pool, cache=cache)
+    start, end = datetime(2025, 1, 1), datetime(2025, 6, 1)
+
+    await reader.get_panel(["AAPL"], start, end)
+    await reader.get_panel(["AAPL"], start, end)
+    assert len(pool.conn.queries) == 1
+
+    cache.invalidate_tables("stock_prices")
+    await reader.get_panel(["AAPL"], start, end)
+    assert len(pool.conn.queries) == 2
+
+
+async def test_sql_fallback_when_aggregates_missing():
+    reader = PriceHistoryReader(pool=FakePool(), cache=QueryCache())
+    reader.aggregates_available = False
+
+    sql = reader._build_query("1w")
+
+    assert "date_trunc('week', time)" in sql
+    assert "GROUP BY ticker, bucket" in sql
@@ -0,0 +1,116 @@
+"""
+Query Cache - Unit Tests
+
+Tests for database/query_cache.py (LRU + TTL bounds, detached snapshots,
+table invalidation)
+"""
+
+import pickle
+import time
+
+import pytest
+from sqlalchemy import Column, Float, Integer, String, create_engine, func
+from sqlalchemy.orm import Session, declarative_base
+
+from backend.database.query_cache import CachedRecord, QueryCache, cached_query, invalidates
+
+Base = declarative_base()
+
+
+class Signal(Base):
+    __tablename__ = "trading_signals"
+
+    id = Column(Integer, primary_key=True)
+    ticker = Column(String(10))
+    confidence = Column(Float)
+
+
+cache = QueryCache(max_entries=8)
+
+
+class SignalRepo:
+    def __init__(self, session):
+        self.session = session
+        self.queries = 0
+
+    @cached_query(60, tables=("trading_signals",), cache=cache)
+    def get_signals(self, min_confidence: float = 0.0):
+        self.queries += 1
+        return self.session.query(Signal).filter(Signal.confidence >= min_confidence).all()
+
+    @cached_query(60, tables=("trading_signals",), cache=cache)
+    def get_top_tickers(self, limit: int = 10):
+        self.queries += 1
+        return (
+            self.session.query(Signal.ticker, func.count(Signal.id))
+            .group_by(Signal.ticker)
+            .order_by(func.count(Signal.id).desc())
+            .limit(limit)
+            .all()
+        )
+
+    @invalidates("trading_signals", cache=cache)
+    def create_signal(self, ticker: str, confidence: float):
+        self.session.add(Signal(ticker=ticker, confidence=confidence))
+        self.session.commit()
+
+
+@pytest.fixture
+def repo():
+    cache.clear()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    repo = SignalRepo(session)
+    repo.create_signal("NVDA", 0.9)
+    repo.create_signal("AAPL", 0.7)
+    yield repo
+    session.close()
+
+
+def test_hit_returns_detached_snapshots_after_session_close(repo):
+    first = repo.get_signals(0.5)
+    repo.session.close()
+
+    second = repo.get_signals(min_confidence=0.5)  # 위치/키워드 인자는 같은 키
+    assert repo.queries == 1
+    assert second == first
+    assert isinstance(second[0], CachedRecord)
+    assert {s.ticker for s in second} == {"NVDA", "AAPL"}
+    assert pickle.loads(pickle.dumps(second)) == second
+    with pytest.raises(AttributeError):
+        second[0].ticker = "MSFT"
+
+    # 반환 리스트를 수정해도 캐시는 영향 없음
+    second.clear()
+    assert len(repo.get_signals(0.5)) == 2
+
+
+def test_write_invalidates_dependent_entries(repo):
+    assert len(repo.get_top_tickers()) == 2
+    queries = repo.queries
+
+    repo.create_signal("NVDA", 0.8)
+    top = repo.get_top_tickers()
+    assert repo.queries == queries + 1
+    assert top[0] == ("NVDA", 2)
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_lru_and_ttl_bounds():
+    lru = QueryCache(max_entries=2, default_ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == (True, 1)  # a가 최근 사용
+    lru.set("c", 3)
+    assert lru.get("b") == (False, None)
+    assert len(lru) == 2 and lru.evictions == 1
+
+    lru.set("short", 4, ttl_seconds=0.01, tables=("news_articles",))
+    time.sleep(0.02)
+    assert lru.get("short") == (False, None)
+    assert lru.expirations == 1
+    assert lru.invalidate_tables("news_articles") == 0
+
+    stats = lru.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
@@ -0,0 +1,59 @@
+"""
+Risk Analytics - Unit Tests
+
+Tests for analytics/risk_analytics.py correlation risk backed by the
+EWMA covariance service (trade P&L fallback until the service is ready)
+"""
+
+import sys
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy.orm import declarative_base
+
+try:
+    import backend.core.database  # noqa: F401
+except Exception:
+    # The engine is built from DATABASE_URL at import; conftest points it at
+    # sync sqlite, which create_async_engine rejects. The models only need Base.
+    _database = ModuleType("backend.core.database")
+    _database.Base = declarative_base()
+    sys.modules["backend.core.database"] = _database
+
+from backend.analytics.covariance_service import EWMACovarianceService
+from backend.analytics.risk_analytics import RiskAnalyzer
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    market = rng.normal(0, 0.01, (120, 1))
+    returns = market + rng.normal(0, 0.008, (120, 4))
+    index = pd.date_range("2026-01-01", periods=121, freq="B")
+    levels = 100 * np.vstack([np.ones(4), np.cumprod(1 + returns, axis=0)])
+    return pd.DataFrame(levels, index=index, columns=["AAPL", "MSFT", "NVDA", "TLT"])
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, stmt):
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.rows))
+
+
+async def test_correlation_risk_prefers_covariance_service(prices, tmp_path):
+    trades = [SimpleNamespace(ticker=t, pnl_pct=p) for t in ("AAPL", "MSFT") for p in (1, 2, 3, 4, 6)]
+    service = EWMACovarianceService(path=tmp_path / "cov.npz")
+
+    fallback = await RiskAnalyzer(FakeSession(trades), covariance_service=service).analyze_correlation_risk()
+    assert fallback["source"] == "trade_pnl"
+    assert fallback["highly_correlated"][0]["correlation"] == pytest.approx(1.0)
+
+    service.update_from_prices(prices)
+    result = await RiskAnalyzer(FakeSession(trades), covariance_service=service).analyze_correlation_risk()
+    expected = service.get_correlation(["AAPL", "MSFT"]).iloc[0, 1]
+    assert result["source"] == "ewma_price_returns"
+    assert result["avg_absolute_correlation"] == pytest.approx(abs(expected))
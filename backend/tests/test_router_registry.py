@@ -0,0 +1,112 @@
+"""
+Router Registry / Startup Profiler - Unit Tests
+
+Tests for core/router_registry.py (profiles, lazy loading) and
+core/startup_profiler.py (step timing)
+"""
+
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.router_registry import RouterRegistry, RouterSpec, resolve_profile
+from backend.core.startup_profiler import StartupProfiler
+
+
+@pytest.fixture
+def fake_router_modules(monkeypatch):
+    """Register two in-memory router modules."""
+    def make_module(name, prefix):
+        router = APIRouter(prefix=prefix)
+
+        @router.get("/ping")
+        async def ping():
+            return {"router": name}
+
+        module = types.ModuleType(f"fake_{name}_router")
+        module.router = router
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return module
+
+    make_module("orders", "/api/orders")
+    make_module("news", "/news")
+
+
+def _specs():
+    return [
+        RouterSpec("Orders", "fake_orders_router", path="/api/orders", groups=("trading",)),
+        RouterSpec("News", "fake_news_router", prefix="/api", path="/api/news", groups=("news",)),
+        RouterSpec("Missing", "fake_missing_router", path="/api/missing", groups=("core",)),
+    ]
+
+
+def test_profile_selects_router_groups(fake_router_modules):
+    app = FastAPI()
+    registry = RouterRegistry(app, profile="trading", lazy=False, profiler=StartupProfiler(enabled=False))
+    registry.extend(_specs())
+    registry.register_all()
+
+    client = TestClient(app)
+    assert client.get("/api/orders/ping").json() == {"router": "orders"}
+    assert client.get("/api/news/ping").status_code == 404
+    assert registry.skipped == ["News"]
+    assert "Missing" in registry.failed
+
+
+def test_lazy_router_loads_on_first_matching_request(fake_router_modules):
+    app = FastAPI()
+
+    @app.get("/api/orders/{anything}")
+    async def catch_all(anything: str):
+        return {"router": "app"}
+
+    registry = RouterRegistry(app, profile="all", lazy=True, profiler=StartupProfiler(enabled=False))
+    registry.extend(_specs())
+    registry.register_all()
+    assert set(registry.pending) == {"Orders", "News", "Missing"}
+
+    client = TestClient(app)
+    # Lazily loaded routes take precedence, as if registered eagerly before app routes
+    assert client.get("/api/orders/ping").json() == {"router": "orders"}
+    assert "Orders" in registry.loaded and "News" in registry.pending
+
+    client.get("/openapi.json")
+    assert registry.pending == []
+    assert client.get("/api/news/ping").json() == {"router": "news"}
+
+
+def test_resolve_profile_accepts_group_list():
+    assert resolve_profile("all") is None
+    assert resolve_profile("core, news") == frozenset({"core", "news"})
+
+
+async def test_run_steps_times_each_step_and_isolates_failures():
+    profiler = StartupProfiler(enabled=False)
+
+    async def ok():
+        return "done"
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    results = await profiler.run_steps({"ok": ok, "broken": broken})
+
+    assert results == {"ok": "done", "broken": None}
+    assert {"ok", "broken", "_total"} <= set(profiler.report()["timings_ms"]["lifespan"])
+
+
+def test_import_hook_records_module_times(tmp_path, monkeypatch):
+    (tmp_path / "profiled_mod_for_test.py").write_text("VALUE = sum(range(1000))\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = StartupProfiler(enabled=True)
+    profiler.install_import_hook()
+    try:
+        import profiled_mod_for_test  # noqa: F401
+    finally:
+        profiler.uninstall_import_hook()
+        sys.modules.pop("profiled_mod_for_test", None)
+
+    assert "profiled_mod_for_test" in profiler.import_times
@@ -0,0 +1,85 @@
+"""
+스캐너 증분 지표 상태 테스트 (전체 패널 계산과 동일 결과, 장중 봉 교체, 스냅샷)
+
+작성일: 2026-10-18
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("yfinance")
+
+from backend.services.market_scanner.indicator_state import IndicatorState
+from backend.services.market_scanner.panel import FIELDS, UniversePanel, compute_indicators
+
+KEYS = (
+    "current_volume", "avg_volume_20d", "volume_ratio", "atr_14", "atr_ratio", "breakout_ratio",
+    "price_change_pct", "return_5d", "return_20d", "rsi_14",
+)
+
+
+def _frames(n_days=45, n_tickers=4, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_days, n_tickers)), axis=0))
+    high = close * (1 + rng.uniform(0, 0.02, close.shape))
+    low = close * (1 - rng.uniform(0, 0.02, close.shape))
+    volume = rng.integers(100_000, 2_000_000, close.shape).astype(float)
+    index = pd.date_range("2026-01-01", periods=n_days)
+    tickers = [f"T{i}" for i in range(n_tickers)]
+    arrays = {"open": close, "high": high, "low": low, "close": close, "volume": volume}
+    return {f: pd.DataFrame(arrays[f], index=index, columns=tickers) for f in FIELDS}
+
+
+def _slice(frames, start, end):
+    return UniversePanel.from_frames({f: df.iloc[start:end] for f, df in frames.items()})
+
+
+def _assert_same(actual, expected):
+    assert actual["valid"].tolist() == expected["valid"].tolist()
+    for key in KEYS:
+        np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, err_msg=key)
+
+
+def test_incremental_matches_full_panel(tmp_path):
+    frames = _frames()
+    expected = compute_indicators(_slice(frames, 0, 45))
+
+    state = IndicatorState(path=tmp_path / "state.npz")
+    state.ingest_panel(_slice(frames, 0, 30))
+    state.ingest_panel(_slice(frames, 25, 40))  # 겹치는 구간: 이전 날짜는 무시, 같은 날짜는 교체
+    for day in range(40, 45):
+        state.ingest_panel(_slice(frames, day, day + 1))
+
+    _assert_same(state.indicators(list(frames["close"].columns)), expected)
+
+
+def test_intraday_bar_is_replaced_not_appended(tmp_path):
+    frames = _frames()
+    state = IndicatorState(path=tmp_path / "state.npz")
+    state.ingest_panel(_slice(frames, 0, 44))
+
+    partial = {f: df.iloc[44:45].copy() for f, df in frames.items()}
+    partial["close"] *= 0.9
+    partial["volume"] *= 0.3
+    state.ingest_panel(UniversePanel.from_frames(partial))
+    state.ingest_panel(_slice(frames, 44, 45))  # 장 마감 봉으로 갱신
+
+    assert state.counts.tolist() == [45] * 4
+    _assert_same(state.indicators(list(frames["close"].columns)), compute_indicators(_slice(frames, 0, 45)))
+
+
+def test_snapshot_roundtrip_and_unknown_tickers(tmp_path):
+    frames = _frames()
+    state = IndicatorState(path=tmp_path / "state.npz")
+    state.ingest_panel(_slice(frames, 0, 45))
+    state.save()
+
+    loaded = IndicatorState(path=tmp_path / "state.npz")
+    assert loaded.load()
+
+    tickers = ["T0", "NEW", "T3"]
+    indicators = loaded.indicators(tickers)
+    assert indicators["valid"].tolist() == [True, False, True]
+    np.testing.assert_allclose(indicators["rsi_14"][[0, 2]], state.indicators(["T0", "T3"])["rsi_14"])
+    assert "NEW" in loaded.stale_tickers(tickers)
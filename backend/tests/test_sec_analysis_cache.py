@@ -0,0 +1,85 @@
+"""
+CachedSECAnalyzer 테스트
+
+- force_refresh 분석 결과도 조회와 같은 원문 해시 키로 저장
+- 최신 공시 조회는 호출당 1회 (캐시 확인에 쓴 공시를 분석에 그대로 전달)
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from backend.core.models.sec_analysis_models import RiskLevel, SECAnalysisResult
+from backend.core.models.sec_models import FilingMetadata, FilingType
+from backend.data.sec_analysis_cache import CachedSECAnalyzer, SECAnalysisCache
+from backend.data.sec_filing_store import SECFilingStore
+
+FILING = FilingMetadata(
+    ticker="AAPL",
+    cik="0000320193",
+    company_name="Apple Inc.",
+    filing_type=FilingType.FORM_10K,
+    filing_date=datetime(2026, 2, 1),
+    fiscal_period="FY2025",
+    accession_number="0000320193-26-000001",
+    filing_url="",
+    document_url="",
+)
+
+
+class FakeSECClient:
+    def __init__(self):
+        self.lookups = 0
+
+    async def get_latest_filing(self, ticker, filing_type):
+        self.lookups += 1
+        return FILING
+
+
+class FakeAnalyzer:
+    """SECAnalyzer 대역: 분석 중 원문을 저장소에 넣음"""
+
+    def __init__(self, store):
+        self.filing_store = store
+        self.sec_client = FakeSECClient()
+        self.calls = 0
+
+    async def analyze_ticker(self, request, filing=None):
+        self.calls += 1
+        if filing is None:
+            filing = await self.sec_client.get_latest_filing(request.ticker, request.filing_type)
+        self.filing_store.put(FILING, "<p>ITEM 1A. RISK FACTORS</p><p>risk text</p>")
+        return SECAnalysisResult(
+            ticker="AAPL",
+            filing_type="10-K",
+            fiscal_period="FY2025",
+            overall_risk_level=RiskLevel.MEDIUM,
+            overall_risk_score=0.5,
+            investment_signal="HOLD",
+        )
+
+
+async def test_force_refresh_result_is_cached_under_content_hash(tmp_path):
+    store = SECFilingStore(tmp_path / "store", codec="zlib")
+    analyzer = FakeAnalyzer(store)
+    cached = CachedSECAnalyzer(analyzer, SECAnalysisCache(tmp_path / "cache"))
+
+    await cached.analyze_ticker(SimpleNamespace(ticker="AAPL", filing_type="10-K", force_refresh=True))
+    result = await cached.analyze_ticker(SimpleNamespace(ticker="AAPL", filing_type="10-K", force_refresh=False))
+
+    digest = store.resolve("AAPL", "10-K", "FY2025")
+    assert (tmp_path / "cache" / f"{digest}.json").exists()
+    assert result.investment_signal == "HOLD"
+    assert analyzer.calls == 1
+    # force_refresh: 분석기 조회 1회, 캐시 적중: 캐시 확인용 1회
+    assert analyzer.sec_client.lookups == 2
+
+
+async def test_cache_miss_passes_looked_up_filing_to_analyzer(tmp_path):
+    store = SECFilingStore(tmp_path / "store", codec="zlib")
+    analyzer = FakeAnalyzer(store)
+    cached = CachedSECAnalyzer(analyzer, SECAnalysisCache(tmp_path / "cache"))
+
+    await cached.analyze_ticker(SimpleNamespace(ticker="AAPL", filing_type="10-K", force_refresh=False))
+
+    assert analyzer.calls == 1
+    assert analyzer.sec_client.lookups == 1
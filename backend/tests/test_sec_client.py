@@ -0,0 +1,117 @@
+"""
+SECClient HTTP 계층 테스트 (로컬 aiohttp 서버)
+
+- 공유 세션 + 조건부 요청 (ETag → 304)
+- 슬라이딩 윈도우 레이트 리미터 (임의의 1초에 10개)
+- 다종목 일괄 조회
+"""
+
+import time
+
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+from aiohttp.test_utils import TestServer
+
+from backend.core.models.sec_models import FilingType
+from backend.data.sec_client import SECClient, SlidingWindowLimiter
+
+
+COMPANY_TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "Microsoft Corp"},
+}
+
+
+def _submissions(name):
+    return {
+        "name": name,
+        "filings": {
+            "recent": {
+                "form": ["10-Q", "8-K", "10-K"],
+                "filingDate": ["2026-08-01", "2026-07-15", "2026-02-01"],
+                "accessionNumber": ["0000000000-26-000003", "0000000000-26-000002", "0000000000-26-000001"],
+            }
+        },
+    }
+
+
+@pytest.fixture
+async def edgar(tmp_path):
+    calls = {"tickers": 0, "submissions": 0, "not_modified": 0}
+
+    async def company_tickers(request):
+        calls["tickers"] += 1
+        return web.json_response(COMPANY_TICKERS)
+
+    async def submissions(request):
+        calls["submissions"] += 1
+        etag = f'"{request.match_info["cik"]}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            calls["not_modified"] += 1
+            return web.Response(status=304)
+        name = "Apple Inc." if request.match_info["cik"] == "0000320193" else "Microsoft Corp"
+        return web.json_response(_submissions(name), headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_get("/files/company_tickers.json", company_tickers)
+    app.router.add_get("/submissions/CIK{cik}.json", submissions)
+
+    server = TestServer(app)
+    await server.start_server()
+
+    client = SECClient(cache_dir=tmp_path, submissions_ttl=0)
+    client.BASE_URL = str(server.make_url("")).rstrip("/")
+    try:
+        yield client, calls
+    finally:
+        await client.close()
+        await server.close()
+
+
+async def test_conditional_request_reuses_cached_submissions(edgar, tmp_path):
+    client, calls = edgar
+
+    first = await client.get_recent_filings("AAPL", FilingType.FORM_10K)
+    session = client._session
+    second = await client.get_recent_filings("AAPL", FilingType.FORM_10K)
+
+    assert [f.accession_number for f in first] == [f.accession_number for f in second]
+    assert first[0].company_name == "Apple Inc."
+    assert client._session is session
+    assert calls["submissions"] == 2 and calls["not_modified"] == 1
+    assert (tmp_path / "submissions" / "CIK0000320193.json").exists()
+
+    # 새 클라이언트도 디스크의 ETag로 재검증
+    restarted = SECClient(cache_dir=tmp_path, submissions_ttl=0)
+    restarted.BASE_URL = client.BASE_URL
+    try:
+        info = await restarted.get_company_info("AAPL")
+    finally:
+        await restarted.close()
+    assert info.company_name == "Apple Inc."
+    assert calls["not_modified"] == 2
+
+
+async def test_recent_filings_many_loads_cik_map_once(edgar):
+    client, calls = edgar
+
+    filings = await client.get_recent_filings_many(["aapl", "MSFT", "NOPE"], FilingType.FORM_10Q)
+
+    assert set(filings) == {"AAPL", "MSFT"}
+    assert filings["MSFT"][0].company_name == "Microsoft Corp"
+    assert calls["tickers"] == 1
+
+
+async def test_sliding_window_caps_starts_in_any_window():
+    limiter = SlidingWindowLimiter(max_requests=5, window=0.1)
+
+    starts = []
+    for _ in range(15):
+        await limiter.acquire()
+        starts.append(time.monotonic())
+
+    assert starts[4] - starts[0] < 0.05
+    # 어느 0.1초 구간에도 시작은 5개 이하 (유휴 후 버스트 + 보충 중첩 없음)
+    for i in range(len(starts) - 5):
+        assert starts[i + 5] - starts[i] >= 0.1 * 0.99
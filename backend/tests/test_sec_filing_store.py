@@ -0,0 +1,97 @@
+"""
+SECFilingStore 테스트
+
+- 원문 해시 기반 중복 제거 (참조만 추가)
+- 섹션 지연 로딩: 접근한 섹션 프레임만 압축 해제
+- 파서 헬퍼(get_text_summary / extract_risk_factors)가 저장소 결과에서 동일하게 동작
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.core.models.sec_models import FilingMetadata, FilingType, SECSection
+from backend.data.sec_filing_store import SECFilingStore, content_hash
+from backend.data.sec_parser import SECParser
+
+
+def _paragraphs(word: str, n: int = 3) -> str:
+    return "".join(
+        f"<p>- {' '.join(f'{word}{j}_{i}' for j in range(30))}</p>" for i in range(n)
+    )
+
+
+FILING_HTML = f"""
+<html><body>
+<div>ITEM 1. BUSINESS</div>{_paragraphs("biz")}
+<div>ITEM 1A. RISK FACTORS</div>{_paragraphs("risk")}
+<div>ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS</div>{_paragraphs("mda")}
+</body></html>
+"""
+
+
+def _metadata(ticker: str = "AAPL", period: str = "FY2025") -> FilingMetadata:
+    return FilingMetadata(
+        ticker=ticker,
+        cik="0000320193",
+        company_name="Apple Inc.",
+        filing_type=FilingType.FORM_10K,
+        filing_date=datetime(2026, 2, 1),
+        fiscal_period=period,
+        accession_number="0000320193-26-000001",
+        filing_url="",
+        document_url="",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SECFilingStore(tmp_path / "store", codec="zlib")
+
+
+def test_put_deduplicates_by_content_hash(store):
+    digest = store.put(_metadata("AAPL"), FILING_HTML)
+    again = store.put(_metadata("AAPL.OLD", "FY2025"), FILING_HTML)
+
+    assert digest == again == content_hash(FILING_HTML)
+    assert store.stats == {"objects_written": 1, "dedup_hits": 1, "frames_read": 0}
+    assert store.resolve("AAPL", "10-K", "FY2025") == digest
+    assert store.resolve("AAPL.OLD", "10-K", "FY2025") == digest
+    assert store.get_raw(digest) == FILING_HTML
+
+    index = store.get_index(digest)
+    assert set(index["sections"]) == {
+        "full_text", SECSection.BUSINESS.value, SECSection.RISK_FACTORS.value, SECSection.MDA.value,
+    }
+
+
+def test_sections_load_lazily_and_match_parser(store):
+    parser = SECParser()
+    original = parser.parse(_metadata(), FILING_HTML)
+    digest = store.put(_metadata(), FILING_HTML, parsed=original)
+
+    parsed = store.load_parsed(digest)
+    assert parsed.total_words == original.total_words
+    assert parsed.full_text == ""
+    assert set(parsed.sections) == set(original.sections)
+    assert store.stats["frames_read"] == 0
+
+    risks = parser.extract_risk_factors(parsed)
+    assert store.stats["frames_read"] == 1
+    assert risks == parser.extract_risk_factors(original)
+
+    assert parser.get_text_summary(parsed) == parser.get_text_summary(original)
+    assert store.stats["frames_read"] == 2
+
+    assert store.get_text(digest, [SECSection.MDA, SECSection.LEGAL]) == original.sections[SECSection.MDA].content
+    assert store.load_parsed(digest, include_full_text=True).full_text == original.full_text
+
+
+def test_zstd_codec_roundtrip(tmp_path):
+    pytest.importorskip("zstandard")
+    store = SECFilingStore(tmp_path / "zstd")
+
+    digest = store.put(_metadata(), FILING_HTML)
+
+    assert store.get_index(digest)["codec"] == "zstd"
+    assert store.get_section(digest, SECSection.BUSINESS).content.startswith("- biz0_0")
@@ -0,0 +1,111 @@
+"""
+Sector Throttling - Unit Tests
+
+Tests for signals/sector_throttling.py (time-bucketed counters)
+"""
+
+from backend.signals.sector_throttling import (
+    HOURLY,
+    InMemoryWindowCounter,
+    SectorSignalTracker,
+    SectorThrottleConfig,
+    build_windows,
+)
+
+
+class FakeClock:
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+def _tracker(clock, **overrides):
+    config = SectorThrottleConfig(**overrides)
+    return SectorSignalTracker(config, InMemoryWindowCounter(build_windows(config)), clock=clock)
+
+
+def test_window_counter_expires_buckets():
+    counter = InMemoryWindowCounter({HOURLY: (3600, 60)})
+    t0 = 1_700_000_000.0
+
+    counter.increment(["a"], t0)
+    counter.increment(["a"], t0 + 1800)
+    assert counter.get_counts([("a", HOURLY)], t0 + 1800) == [2]
+
+    assert counter.get_counts([("a", HOURLY)], t0 + 3600) == [1]
+    assert counter.get_counts([("a", HOURLY)], t0 + 10 * 3600) == [0]
+
+
+def test_hourly_sector_limit_then_recovers():
+    clock = FakeClock()
+    tracker = _tracker(clock, max_trades_per_sector_per_hour=3)
+
+    for ticker in ["NVDA", "AMD", "INTC"]:
+        assert tracker.can_generate_signal(ticker, "BUY").allowed
+        tracker.record_signal(ticker, "BUY", 0.8, executed=True)
+
+    decision = tracker.can_generate_signal("QCOM", "BUY")
+    assert not decision.allowed
+    assert decision.current_count_hourly == 3
+    assert decision.current_count_daily == 3
+    assert tracker.stats["throttle_by_sector"]["SEMICONDUCTORS"] == 1
+
+    clock.now += 3601
+    assert tracker.can_generate_signal("QCOM", "BUY").allowed
+
+
+def test_admit_signal_is_check_and_record():
+    clock = FakeClock()
+    tracker = _tracker(clock, max_trades_per_sector_per_hour=2, max_trades_per_ticker_per_hour=1)
+
+    assert tracker.admit_signal("JPM", "BUY", 0.9).allowed
+    assert tracker.admit_signal("JPM", "BUY", 0.9).reason == "Ticker hourly limit reached"
+    assert tracker.admit_signal("BAC", "BUY", 0.9).allowed
+    assert not tracker.admit_signal("GS", "BUY", 0.9).allowed
+
+    assert tracker.get_ticker_counts("JPM") == {"hourly_count": 1, "daily_count": 1}
+
+
+def test_summary_and_hot_sectors():
+    clock = FakeClock()
+    tracker = _tracker(clock)
+
+    tracker.record_signal("XOM", "BUY", 0.8, executed=True)
+    tracker.record_signal("CVX", "BUY", 0.8)
+    tracker.record_signal("JPM", "BUY", 0.8)
+
+    summary = tracker.get_sector_summary()
+    assert summary["ENERGY"]["hourly_count"] == 2
+    assert summary["ENERGY"]["executed_signals"] == 1
+    assert summary["FINANCE"]["total_signals"] == 1
+    assert tracker.get_hot_sectors() == [("ENERGY", 2), ("FINANCE", 1)]
+
+    clock.now += 2 * 3600
+    assert tracker.get_hot_sectors() == []
+    assert tracker.get_sector_summary()["ENERGY"]["daily_count"] == 2
+
+
+def test_redis_counters_shared_between_trackers():
+    import pytest
+
+    fakeredis = pytest.importorskip("fakeredis")
+    from backend.signals.sector_throttling import RedisWindowCounter
+
+    clock = FakeClock()
+    config = SectorThrottleConfig(max_trades_per_sector_per_hour=2)
+    client = fakeredis.FakeRedis()
+
+    # Two "workers" sharing one Redis
+    workers = [
+        SectorSignalTracker(config, RedisWindowCounter(build_windows(config), client), clock=clock)
+        for _ in range(2)
+    ]
+
+    assert workers[0].admit_signal("NVDA", "BUY", 0.8).allowed
+    assert workers[1].admit_signal("AMD", "BUY", 0.8).allowed
+    assert not workers[0].admit_signal("INTC", "BUY", 0.8).allowed
+    assert workers[1].get_hot_sectors() == [("SEMICONDUCTORS", 2)]
+    # Every key carries the {prefix} hash tag (single Redis Cluster slot)
+    assert all(key.startswith(b"{throttle}:") for key in client.keys("*"))
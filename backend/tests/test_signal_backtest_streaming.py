@@ -0,0 +1,136 @@
+"""
+SignalBacktestEngine 스트리밍 입력 테스트
+
+- dict 입력 / PricePanel 소스 / 청크 스트리밍 소스 결과 동일
+- run_stream: 분석 1회 소비 (async 이터러블 포함), 일 인덱스 → 날짜 문자열 일괄 변환
+
+작성일: 2026-10-18
+"""
+
+import random
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from backend.backtesting.backtest_data_source import (
+    DictPriceSource,
+    PricePanelSource,
+    PriceStoreSource,
+)
+from backend.backtesting.signal_backtest_engine import NewsAnalysis, SignalBacktestEngine
+from backend.database.price_history import PricePanel
+
+START = datetime(2024, 1, 1, 9, 30)
+END = START + timedelta(days=40)
+TICKERS = ["AAPL", "MSFT", "NVDA", "TSLA"]
+
+
+def make_analyses(seed=3, count=30):
+    rng = random.Random(seed)
+    analyses = []
+    for i in range(count):
+        crawled = START + timedelta(hours=rng.randint(-24, 24 * 38))
+        score = rng.uniform(-1, 1)
+        analyses.append(NewsAnalysis(
+            id=f"analysis_{i}",
+            article_id=f"article_{i}",
+            crawled_at=crawled,
+            analyzed_at=crawled + timedelta(minutes=rng.randint(1, 300)),
+            sentiment_overall="POSITIVE" if score > 0.2 else "NEGATIVE" if score < -0.2 else "NEUTRAL",
+            sentiment_score=score,
+            sentiment_confidence=rng.uniform(0.6, 1.0),
+            urgency=rng.choice(["IMMEDIATE", "SHORT_TERM"]),
+            impact_magnitude=rng.uniform(0.3, 1.0),
+            risk_category=rng.choice(["LOW", "MEDIUM", "HIGH"]),
+            key_facts=[],
+            related_tickers=[{"ticker_symbol": rng.choice(TICKERS), "relevance_score": 90}],
+        ))
+    return analyses
+
+
+def make_prices(seed=3):
+    """{date_str: {ticker: price}} (휴장일/종목 결측 포함)"""
+    rng = random.Random(seed)
+    price_data = {}
+    for day in range(45):
+        if rng.random() < 0.25:
+            continue
+        date_str = (START + timedelta(days=day)).strftime("%Y-%m-%d")
+        price_data[date_str] = {t: 100 * (1 + rng.gauss(0, 0.04)) for t in TICKERS if rng.random() > 0.1}
+    return price_data
+
+
+def to_panel(price_data):
+    rows = [
+        {"ticker": ticker, "time": pd.Timestamp(date), "open": p, "high": p, "low": p,
+         "close": p, "volume": 0.0, "adjusted_close": p}
+        for date, prices in price_data.items() for ticker, p in prices.items()
+    ]
+    return PricePanel.from_frame(pd.DataFrame(rows), "1d")
+
+
+class FakeReader:
+    """PriceHistoryReader.get_panel 대역: 요청 구간 [start, end) 행만 반환"""
+
+    def __init__(self, panel):
+        self.frame = panel.to_frame()
+        self.windows = []
+
+    async def get_panel(self, tickers, start, end=None, interval="1d"):
+        self.windows.append((start, end))
+        frame = self.frame[(self.frame["time"] >= start) & (self.frame["time"] < end)]
+        return PricePanel.from_frame(frame, interval)
+
+
+def comparable(result):
+    data = asdict(result)
+    for trade in data["trades"]:
+        trade.pop("signal_id")  # 생성 시각 포함
+    return data
+
+
+async def test_price_sources_match_legacy_dict_input():
+    price_data = make_prices()
+    panel = to_panel(price_data)
+    reader = FakeReader(panel)
+
+    expected = comparable(await SignalBacktestEngine().run(make_analyses(), price_data, START, END))
+    from_panel = comparable(await SignalBacktestEngine().run(make_analyses(), PricePanelSource(panel), START, END))
+    streamed = comparable(await SignalBacktestEngine().run(
+        make_analyses(), PriceStoreSource(reader, TICKERS, chunk_days=7), START, END
+    ))
+
+    assert expected["total_signals"] > 0 and expected["daily_values"]
+    assert from_panel == expected
+    assert streamed == expected
+    # 7일 청크 6개 (41일), 각 청크만 적재
+    assert len(reader.windows) == 6
+    assert all(end - start <= timedelta(days=7) for start, end in reader.windows)
+
+
+async def test_run_stream_consumes_each_analysis_once():
+    analyses = sorted(make_analyses(), key=lambda a: max(a.crawled_at, a.analyzed_at))
+    consumed = []
+
+    async def stream():
+        for analysis in analyses:
+            consumed.append(analysis.id)
+            yield analysis
+
+    engine = SignalBacktestEngine()
+    processed = []
+    original = engine._process_analysis
+
+    async def track(analysis, current_time, current_prices):
+        assert max(analysis.crawled_at, analysis.analyzed_at) <= current_time
+        processed.append(analysis.id)
+        await original(analysis, current_time, current_prices)
+
+    engine._process_analysis = track
+    result = await engine.run_stream(DictPriceSource(make_prices()), stream(), START, END)
+
+    assert sorted(set(processed)) == sorted(processed)
+    assert consumed == [a.id for a in analyses]
+    assert result.total_signals <= len(analyses)
+    assert [d["date"] for d in result.daily_values] == sorted(make_prices())[:len(result.daily_values)]
@@ -0,0 +1,113 @@
+"""
+SmartExecutor staged batch pipeline - Unit Tests
+
+Tests for execution/smart_executor.py (process_batch)
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from backend.execution.smart_executor import (
+    SimpleRiskManager,
+    SmartExecutor,
+    StageLatencyHistogram,
+)
+
+
+@dataclass
+class FakeDecision:
+    ticker: str
+    action: str
+    conviction: float = 0.8
+    position_size: float = 2.0
+
+
+class FakeAgent:
+    """Always buys; tracks how many analyses run at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def analyze(self, ticker, portfolio_context, market_context):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if ticker == "BAD":
+            raise RuntimeError("analysis failed")
+        return FakeDecision(ticker=ticker, action="BUY")
+
+
+def test_histogram_percentiles():
+    histogram = StageLatencyHistogram(buckets_ms=(1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.observe(value)
+
+    stats = histogram.to_dict()
+    assert stats["count"] == 5
+    assert stats["max_ms"] == 500
+    assert histogram.percentile(50) == 10
+    assert histogram.percentile(100) == 500
+    assert stats["buckets"]["le_inf"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_batch_stages():
+    agent = FakeAgent()
+    executor = SmartExecutor(trading_agent=agent)
+    tickers = ["NVDA", "AAPL", "BAD", "MSFT"]
+
+    results = await executor.process_batch(
+        tickers, urgency="CRITICAL", max_concurrent=2
+    )
+
+    assert [r["ticker"] for r in results] == tickers
+    assert results[2]["status"] == "ERROR"
+    assert all(r["status"] == "SUCCESS" for i, r in enumerate(results) if i != 2)
+    assert results[0]["execution"]["avg_price"] == pytest.approx(875.50, rel=0.01)
+
+    # Decisions ran concurrently but bounded
+    assert agent.max_in_flight == 2
+
+    latency = executor.get_stage_latency()
+    assert latency["prefetch"]["count"] == 1
+    assert latency["decision"]["count"] == 4
+    assert latency["commit"]["count"] == 3
+    assert executor.last_batch_timings["tickers"] == 4
+
+
+@pytest.mark.asyncio
+async def test_commit_stage_sees_prior_commits():
+    executor = SmartExecutor(
+        trading_agent=FakeAgent(),
+        risk_manager=SimpleRiskManager(max_positions=2),
+    )
+
+    results = await executor.process_batch(
+        ["NVDA", "AAPL", "MSFT"], urgency="CRITICAL", max_concurrent=3
+    )
+
+    statuses = [r["status"] for r in results]
+    assert statuses == ["SUCCESS", "SUCCESS", "BLOCKED"]
+    assert executor.portfolio_manager.get_context()["num_positions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_price_failure_only_fails_that_ticker():
+    class FlakyPriceExecutor(SmartExecutor):
+        async def _get_current_price(self, ticker):
+            if ticker == "AAPL":
+                raise ConnectionError("quote timeout")
+            return await super()._get_current_price(ticker)
+
+    agent = FakeAgent()
+    executor = FlakyPriceExecutor(trading_agent=agent)
+
+    results = await executor.process_batch(["NVDA", "AAPL", "MSFT"], urgency="CRITICAL")
+
+    assert [r["status"] for r in results] == ["SUCCESS", "ERROR", "SUCCESS"]
+    assert results[1]["message"] == "Price prefetch failed: quote timeout"
+    assert executor.get_stage_latency()["decision"]["count"] == 2
@@ -0,0 +1,57 @@
+"""
+Stop-Loss Monitor - Unit Tests
+
+Tests for services/stop_loss_monitor.py (re-arm after a stop-loss that was
+not executed, periodic position resync on the tick path)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from backend.services.stop_loss_monitor import StopLossMonitor
+
+
+def _position(ticker, avg_entry_price):
+    return SimpleNamespace(ticker=ticker, company_name=ticker, avg_entry_price=avg_entry_price, status="open")
+
+
+class FakeTracker:
+    def __init__(self, positions):
+        self.positions = positions
+
+    def get_all_positions(self):
+        return list(self.positions)
+
+
+class RejectingConsensus:
+    def __init__(self):
+        self.votes = 0
+
+    async def vote_on_signal(self, **kwargs):
+        self.votes += 1
+        return SimpleNamespace(approved=False, approve_count=0, total_votes=3)
+
+
+async def test_rejected_stop_loss_is_rearmed():
+    consensus = RejectingConsensus()
+    monitor = StopLossMonitor(FakeTracker([_position("NVDA", 100.0)]), consensus_engine=consensus)
+
+    assert await monitor.on_tick("NVDA", 89.0) is not None
+    await monitor.wait_for_executions()
+
+    # 매도 미확정 → 회복 틱 없이도 다음 이탈 틱에서 재시도
+    assert await monitor.on_tick("NVDA", 88.0) is not None
+    await monitor.wait_for_executions()
+    assert consensus.votes == 2
+
+
+async def test_tick_path_resyncs_positions_on_interval():
+    tracker = FakeTracker([])
+    monitor = StopLossMonitor(tracker, position_sync_interval_seconds=0)
+
+    tracker.positions.append(_position("AAPL", 200.0))
+    assert await monitor.on_tick("AAPL", 170.0) is not None
+    await monitor.wait_for_executions()
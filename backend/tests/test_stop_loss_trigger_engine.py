@@ -0,0 +1,62 @@
+"""
+Stop-Loss Trigger Engine - Unit Tests
+
+Tests for services/stop_loss_trigger_engine.py (per-ticker stop index,
+tick evaluation, disarm / re-arm)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.stop_loss_trigger_engine import StopLossTriggerEngine
+
+
+def _position(ticker, avg_entry_price, status="open"):
+    return SimpleNamespace(ticker=ticker, avg_entry_price=avg_entry_price, status=status)
+
+
+@pytest.fixture
+def engine():
+    engine = StopLossTriggerEngine(threshold_pct=-10.0)
+    engine.rebuild([_position("NVDA", 100.0), _position("AAPL", 200.0)])
+    return engine
+
+
+def test_stop_price_is_precomputed(engine):
+    assert engine.get_stop_price("NVDA") == pytest.approx(90.0)
+    assert engine.get_stop_price("AAPL") == pytest.approx(180.0)
+    assert engine.evaluate("NVDA", 95.0) is None
+    assert engine.evaluate("MSFT", 1.0) is None
+
+
+def test_trigger_fires_once_until_price_recovers(engine):
+    condition = engine.evaluate("NVDA", 89.0)
+    assert condition.triggered
+    assert condition.loss_pct == pytest.approx(-11.0)
+
+    # 손절가 아래 추가 틱은 재발동하지 않음
+    assert engine.evaluate("NVDA", 88.0) is None
+
+    # 회복 후 재이탈 시 다시 발동
+    assert engine.evaluate("NVDA", 91.0) is None
+    assert engine.evaluate("NVDA", 89.5) is not None
+    assert engine.triggers == 2
+
+
+def test_snapshot_evaluates_only_breached_tickers(engine):
+    conditions = engine.evaluate_snapshot({"NVDA": 95.0, "AAPL": 170.0, "TSLA": 1.0})
+    assert [c.ticker for c in conditions] == ["AAPL"]
+
+
+def test_rebuild_keeps_disarmed_state_and_skips_closed(engine):
+    engine.evaluate("NVDA", 85.0)
+
+    engine.rebuild([_position("NVDA", 100.0), _position("AAPL", 200.0, status="closed")])
+    assert engine.tickers == ["NVDA"]
+    assert engine.evaluate("NVDA", 84.0) is None
+
+    # DCA로 평균 단가가 바뀌면 새 손절가로 re-arm
+    engine.upsert(_position("NVDA", 90.0))
+    assert engine.get_stop_price("NVDA") == pytest.approx(81.0)
+    assert engine.evaluate("NVDA", 80.0) is not None
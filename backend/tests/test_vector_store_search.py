@@ -0,0 +1,108 @@
+"""
+Vector Store Search - Unit Tests
+
+Tests for data/vector_store/store.py (query embedding cache, batch search,
+index-friendly filter SQL)
+"""
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("openai")
+
+from backend.data.vector_store.embedder import EmbeddingResult
+from backend.data.vector_store.store import QueryEmbeddingCache, VectorStore
+
+
+class CountingEmbedder:
+    model = "counting-model"
+
+    def __init__(self):
+        self.single_calls = 0
+        self.batch_calls = 0
+
+    async def embed_text(self, text):
+        self.single_calls += 1
+        return EmbeddingResult([float(len(text)), 1.0], tokens=1, cost=0.0)
+
+    async def embed_batch(self, texts, **kwargs):
+        self.batch_calls += 1
+        return [EmbeddingResult([float(len(t)), 1.0], tokens=1, cost=0.0) for t in texts]
+
+
+class FakePool:
+    def __init__(self, search_rows):
+        self.search_rows = search_rows
+        self.queries = []
+
+    async def fetch(self, sql, *params):
+        self.queries.append((sql, params))
+        if "FROM document_tags" in sql:
+            return [
+                {"document_id": doc_id, "tag_type": "sector", "tag_value": "Technology", "confidence": 1.0}
+                for doc_id in params[0]
+            ]
+        return self.search_rows
+
+
+def _row(doc_id, similarity, query_idx=None):
+    row = {
+        "id": doc_id, "ticker": "AAPL", "doc_type": "news", "content": f"doc {doc_id}",
+        "metadata": {}, "document_date": None, "created_at": None, "similarity": similarity,
+    }
+    if query_idx is not None:
+        row["query_idx"] = query_idx
+    return row
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryEmbeddingCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") == [1.0]
+
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_filter_sql_avoids_tag_join():
+    sql, params = VectorStore._build_search_sql(
+        ticker="AAPL", tags={"sector": ["Technology", "Energy"], "topic": ["supply_chain"]}
+    )
+
+    assert "JOIN" not in sql and "GROUP BY" not in sql
+    assert sql.count("tag_keys &&") == 2
+    assert params == ["AAPL", ["sector:Technology", "sector:Energy"], ["topic:supply_chain"]]
+
+
+async def test_search_similar_caches_query_and_over_fetches_top_k():
+    embedder = CountingEmbedder()
+    pool = FakePool([_row(1, 0.9), _row(2, 0.5)])
+    store = VectorStore(pool, embedder)
+
+    first = await store.search_similar("supply chain", top_k=2, min_similarity=0.7)
+    await store.search_similar("supply chain", top_k=2, min_similarity=0.7)
+
+    assert embedder.single_calls == 1
+    assert [r["id"] for r in first] == [1]
+    assert first[0]["tags"] == [{"type": "sector", "value": "Technology", "confidence": 1.0}]
+    search_sql, search_params = pool.queries[0]
+    assert search_params[1] == 4  # 2x candidates, trimmed to top_k after the threshold
+    assert "de.embedding_model = $3" in search_sql and search_params[2] == "counting-model"
+
+
+async def test_search_similar_batch_groups_results_per_query():
+    embedder = CountingEmbedder()
+    pool = FakePool([_row(1, 0.9, query_idx=1), _row(2, 0.8, query_idx=2), _row(3, 0.1, query_idx=2)])
+    store = VectorStore(pool, embedder)
+    await store.search_similar("cached", top_k=1, min_similarity=2.0)
+
+    results = await store.search_similar_batch(["cached", "new one", "new two"], top_k=2)
+
+    assert embedder.batch_calls == 1
+    assert [[r["id"] for r in group] for group in results] == [[1], [2], []]
+    batch_sql = pool.queries[-2][0]
+    assert "CROSS JOIN LATERAL" in batch_sql